@@ -1,11 +1,38 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Tuple, List
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 import math
 
-@dataclass
+from .math_utils import GearMath
+
+# Champs numériques normalisés à la construction (égalité et hachage canoniques)
+_FLOAT_FIELDS = ('module', 'pressure_angle', 'helix_angle', 'profile_shift',
+                 'backlash', 'face_width', 'pitch_angle', 'shaft_angle',
+                 'rolling_circle_ratio', 'rim_diameter', 'rack_length', 'rack_height')
+_INT_FIELDS = ('teeth', 'mate_teeth', 'leads')
+
+def _canonical_float(value):
+    """float, avec -0.0 ramené à 0.0"""
+    if value is None:
+        return None
+    value = float(value)
+    return 0.0 if value == 0 else value
+
+def _canonical_int(value):
+    """int pour les valeurs entières (20.0 -> 20), inchangé sinon"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+@dataclass(frozen=True, slots=True)
 class GearParams:
-    """Paramètres d'engrenage de base"""
+    """
+    Paramètres d'engrenage de base (immuables)
+    
+    Les valeurs numériques sont normalisées à la construction : deux jeux
+    de paramètres égaux ont le même hachage et peuvent servir de clé de
+    cache. Utiliser derive() pour obtenir une copie modifiée.
+    """
     name: str
     module: float
     teeth: int
@@ -19,6 +46,28 @@ class GearParams:
     shaft_angle: Optional[float] = None  # Pour engrenages coniques
     mate_teeth: Optional[int] = None  # Nombre de dents de l'engrenage conjugué
     leads: Optional[int] = None  # Nombre de filetages pour vis sans fin
+    rolling_circle_ratio: Optional[float] = None  # Cercle roulant / rayon primitif (cycloïdal)
+    rim_diameter: Optional[float] = None  # Diamètre de jante (couronne intérieure)
+    rack_length: Optional[float] = None  # Longueur de crémaillère
+    rack_height: Optional[float] = None  # Hauteur de crémaillère, du dos à la tête
+    
+    def __post_init__(self):
+        for name in _FLOAT_FIELDS:
+            object.__setattr__(self, name, _canonical_float(getattr(self, name)))
+        for name in _INT_FIELDS:
+            object.__setattr__(self, name, _canonical_int(getattr(self, name)))
+    
+    def derive(self, **overrides) -> 'GearParams':
+        """Copie avec les champs donnés remplacés"""
+        unknown = set(overrides) - self.field_names()
+        if unknown:
+            raise ValueError(f"Paramètres inconnus: {sorted(unknown)}")
+        return replace(self, **overrides)
+    
+    @classmethod
+    def field_names(cls) -> frozenset:
+        """Noms des champs"""
+        return _FIELD_NAMES
     
     def validate(self):
         """Validation des paramètres de base"""
@@ -29,6 +78,9 @@ class GearParams:
         if not (14 <= self.pressure_angle <= 25):
             raise ValueError(f"Angle de pression doit être entre 14° et 25°, got {self.pressure_angle}")
 
+# Noms des champs, calculés une fois (derive, create_gear, chargement en masse)
+_FIELD_NAMES = frozenset(f.name for f in fields(GearParams))
+
 class Gear(ABC):
     """Classe abstraite pour tous les types d'engrenages"""
     
@@ -37,6 +89,10 @@ class Gear(ABC):
         self.params.validate()
         self._calculate_geometry()
     
+    def derive(self, **changes) -> 'Gear':
+        """Copie de l'engrenage aux paramètres modifiés (GearParams.derive)"""
+        return type(self)(self.params.derive(**changes))
+    
     @abstractmethod
     def _calculate_geometry(self):
         """Calculer la géométrie spécifique"""
@@ -50,27 +106,27 @@ class Gear(ABC):
     @property
     def pitch_diameter(self) -> float:
         """Diamètre primitif"""
-        return self.params.module * self.params.teeth
+        return GearMath.pitch_diameter(self.params.module, self.params.teeth)
     
     @property
     def addendum(self) -> float:
         """Hauteur de tête"""
-        return self.params.module
+        return GearMath.addendum(self.params.module)
     
     @property
     def dedendum(self) -> float:
         """Hauteur de pied"""
-        return 1.25 * self.params.module
+        return GearMath.dedendum(self.params.module)
     
     @property
     def outside_diameter(self) -> float:
         """Diamètre extérieur"""
-        return self.pitch_diameter + 2 * self.addendum
+        return GearMath.outside_diameter(self.pitch_diameter, self.addendum)
     
     @property
     def root_diameter(self) -> float:
         """Diamètre de pied"""
-        return self.pitch_diameter - 2 * self.dedendum
+        return GearMath.root_diameter(self.pitch_diameter, self.dedendum)
     
     @property
     def contact_ratio(self) -> float:
@@ -0,0 +1,399 @@
+"""
+Chargement en flux de catalogues d'engrenages (JSONL et CSV)
+
+Les lignes sont lues une à une et regroupées en blocs de taille fixe : la
+mémoire occupée dépend de la taille des blocs, pas de celle du fichier.
+Chaque bloc est converti soit en objets Gear (GearFactory), soit en
+colonnes calculées par GearKernel. Une ligne invalide produit un
+enregistrement d'erreur dans son bloc sans interrompre le flux.
+
+Format d'une ligne : mêmes clés que GearFactory.from_dict ('type' et les
+champs de GearParams, à plat ou sous 'params'). En CSV, une colonne par clé ;
+les cellules vides prennent la valeur par défaut.
+"""
+import csv
+import io
+import json
+import os
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .base_gear import GearParams, _FLOAT_FIELDS, _INT_FIELDS
+from .gear_factory import GearFactory
+from .gear_kernel import GearKernel, TYPE_CODES
+from .rule_engine import ERROR, RuleEngine
+
+# Nombre de lignes source par bloc
+CHUNK_SIZE = 1000
+
+# Valeurs par défaut des champs absents d'un enregistrement
+_DEFAULTS = {f.name: f.default for f in fields(GearParams)}
+
+# Extensions reconnues
+FORMATS = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv',
+}
+
+Source = Union[str, os.PathLike, io.IOBase, Iterable[str]]
+
+
+class BulkLoader:
+    """Lecture en flux et conversion par blocs de définitions d'engrenages"""
+
+    @staticmethod
+    def records(source: Source,
+                format: Optional[str] = None) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+        """
+        Lire les enregistrements bruts un à un
+
+        Args:
+            source: chemin, fichier ouvert ou itérable de lignes
+            format: 'jsonl' ou 'csv' (déduit de l'extension si absent)
+
+        Yields:
+            (numéro de ligne, enregistrement ou None, erreur de lecture ou None)
+        """
+        format = BulkLoader._format(source, format)
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding='utf-8', newline='') as handle:
+                yield from BulkLoader._read(handle, format)
+        else:
+            yield from BulkLoader._read(source, format)
+
+    @staticmethod
+    def _format(source: Source, format: Optional[str]) -> str:
+        if format is None:
+            name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', '')
+            format = FORMATS.get(os.path.splitext(str(name))[1].lower())
+            if format is None:
+                raise ValueError(
+                    f"Format non déterminé pour '{name}'. "
+                    f"Formats disponibles: {sorted(set(FORMATS.values()))}"
+                )
+        format = format.lower()
+        if format not in FORMATS.values():
+            raise ValueError(
+                f"Format '{format}' non supporté. "
+                f"Formats disponibles: {sorted(set(FORMATS.values()))}"
+            )
+        return format
+
+    @staticmethod
+    def _read(lines: Iterable[str], format: str):
+        if format == 'csv':
+            reader = csv.DictReader(lines)
+            for record in reader:
+                # Colonnes excédentaires (clé None) ignorées
+                record.pop(None, None)
+                yield reader.line_num, record, None
+            return
+
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield number, None, f"JSON invalide: {e.msg} (colonne {e.colno})"
+                continue
+            if not isinstance(record, dict):
+                yield number, None, f"Objet JSON attendu, got {type(record).__name__}"
+                continue
+            yield number, record, None
+
+    @staticmethod
+    def parse(record: Dict[str, Any], row: int = 0,
+              strict: bool = False) -> Tuple[str, GearParams]:
+        """
+        Convertir un enregistrement en (type, GearParams)
+
+        Les valeurs textuelles (CSV) sont converties selon le type du champ ;
+        les champs entiers doivent être entiers. Les clés inconnues sont
+        ignorées, ou refusées si strict.
+        """
+        gear_type, values = GearFactory.split_config(record)
+        gear_type = str(gear_type or 'spur').strip().lower()
+
+        names = GearParams.field_names()
+        if strict:
+            unknown = set(values) - names
+            if unknown:
+                raise ValueError(f"Paramètres inconnus: {sorted(unknown)}")
+
+        kwargs = {}
+        for name, value in values.items():
+            if name not in names or value is None:
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+                if not value:
+                    continue
+            kwargs[name] = BulkLoader._convert(name, value)
+
+        for required in ('module', 'teeth'):
+            if required not in kwargs:
+                raise ValueError(f"Paramètre '{required}' requis")
+        kwargs.setdefault('name', f"{gear_type}_{row}")
+        return gear_type, GearParams(**kwargs)
+
+    @staticmethod
+    def _convert(name: str, value: Any) -> Any:
+        """Convertir une valeur selon le champ de GearParams"""
+        if name in _FLOAT_FIELDS:
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{name} doit être un nombre, got {value!r}")
+        if name in _INT_FIELDS:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{name} doit être un entier, got {value!r}")
+            if not number.is_integer():
+                raise ValueError(f"{name} doit être un entier, got {value!r}")
+            return int(number)
+        return str(value)
+
+    @staticmethod
+    def _chunks(source: Source, format: Optional[str], chunk_size: int):
+        """Regrouper les enregistrements bruts en listes de chunk_size"""
+        if chunk_size < 1:
+            raise ValueError(f"Taille de bloc doit être >= 1, got {chunk_size}")
+        chunk = []
+        for item in BulkLoader.records(source, format):
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _error(row: int, message: str, record: Optional[Dict],
+               code: Optional[str] = None) -> Dict[str, Any]:
+        error = {'row': row, 'error': message, 'record': record}
+        if code is not None:
+            error['code'] = code
+        return error
+
+    @staticmethod
+    def iter_gears(source: Source,
+                   format: Optional[str] = None,
+                   chunk_size: int = CHUNK_SIZE,
+                   strict: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Construire les engrenages bloc par bloc
+
+        Yields:
+            {'gears': [Gear], 'rows': numéros de ligne des engrenages,
+             'errors': [{'row', 'error', 'record'}]}
+        """
+        for chunk in BulkLoader._chunks(source, format, chunk_size):
+            gears, rows, errors = [], [], []
+            for row, record, error in chunk:
+                if error is None:
+                    try:
+                        gear_type, params = BulkLoader.parse(record, row, strict)
+                        gears.append(GearFactory.create_gear(gear_type, params))
+                        rows.append(row)
+                        continue
+                    except Exception as e:
+                        error = str(e)
+                errors.append(BulkLoader._error(row, error, record))
+            yield {'gears': gears, 'rows': np.asarray(rows, dtype=np.int64), 'errors': errors}
+
+    @staticmethod
+    def iter_columns(source: Source,
+                     format: Optional[str] = None,
+                     chunk_size: int = CHUNK_SIZE,
+                     strict: bool = False,
+                     rules: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Calculer les colonnes GearKernel bloc par bloc, sans objets Gear
+
+        Les contrôles de validité sont évalués sur tout le bloc
+        (GearKernel.row_errors, et RuleEngine si rules) ; seules les lignes
+        valides sont calculées.
+
+        Yields:
+            {'columns': {champ: tableau}, 'names': [str], 'rows': numéros de
+             ligne, 'errors': [{'row', 'error', 'record'}]}
+        """
+        for chunk in BulkLoader._chunks(source, format, chunk_size):
+            rows, types, values, errors = BulkLoader.parse_chunk(
+                chunk, strict, list(TYPE_CODES), rules)
+            yield {
+                'columns': BulkLoader._compute(types, values),
+                'names': values['name'],
+                'rows': np.asarray(rows, dtype=np.int64),
+                'errors': errors,
+            }
+
+    @staticmethod
+    def parse_chunk(chunk: List[Tuple[int, Optional[Dict], Optional[str]]],
+                    strict: bool = False,
+                    gear_types: Optional[Sequence[str]] = None,
+                    rules: bool = False):
+        """
+        Convertir un bloc d'enregistrements bruts en colonnes et écarter les
+        lignes invalides
+
+        Aucun GearParams n'est construit : les valeurs sont converties
+        colonne par colonne (ligne par ligne seulement pour une colonne
+        contenant une valeur non numérique) et les contrôles de
+        GearParams.validate() (et du rapport de cercle roulant) sont évalués
+        en une passe sur le bloc (GearKernel.row_errors).
+
+        Args:
+            gear_types: types admis (par défaut ceux de GearFactory)
+            rules: appliquer aussi les règles de RuleEngine ; une anomalie de
+                gravité 'error' écarte la ligne (erreur avec clé 'code')
+
+        Returns:
+            (numéros de ligne, types, colonnes {champ de GearParams: tableau
+             (NaN pour un champ optionnel absent) ou liste de chaînes},
+             erreurs triées par ligne)
+        """
+        if gear_types is None:
+            gear_types = GearFactory.get_available_types()
+        names = GearParams.field_names()
+        # Valeurs brutes rangées par champ (clés de premier niveau prioritaires,
+        # comme GearFactory.split_config), puis converties par colonne
+        raw = {name: [None] * len(chunk) for name in _DEFAULTS}
+        rows, records, types, errors = [], [], [], []
+        for row, record, error in chunk:
+            if error is None:
+                try:
+                    gear_type = str(record.get('type') or 'spur').strip().lower()
+                    nested = record.get('params') or {}
+                    if strict:
+                        unknown = (set(nested) | set(record) - {'type', 'params'}) - names
+                        if unknown:
+                            raise ValueError(f"Paramètres inconnus: {sorted(unknown)}")
+                    if gear_type not in gear_types:
+                        raise ValueError(
+                            f"Type d'engrenage '{gear_type}' non supporté. "
+                            f"Types disponibles: {list(gear_types)}"
+                        )
+                    index = len(rows)
+                    for source in (nested, record):
+                        for name, value in source.items():
+                            column = raw.get(name)
+                            if column is not None:
+                                column[index] = value
+                    rows.append(row)
+                    records.append(record)
+                    types.append(gear_type)
+                    continue
+                except Exception as e:
+                    error = str(e)
+            errors.append(BulkLoader._error(row, error, record))
+        raw = {name: values[:len(rows)] for name, values in raw.items()}
+
+        messages: List[Optional[str]] = [None] * len(rows)
+        columns = {name: BulkLoader._convert_column(name, raw[name], messages)
+                   for name in _FLOAT_FIELDS + _INT_FIELDS}
+        for required in ('module', 'teeth'):
+            for index in np.flatnonzero(np.isnan(columns[required])):
+                messages[index] = messages[index] or f"Paramètre '{required}' requis"
+        for name, values in columns.items():
+            if _DEFAULTS[name] is not None:
+                columns[name] = np.where(np.isnan(values), _DEFAULTS[name], values)
+        for name in ('name', 'material'):
+            columns[name] = [BulkLoader._text(value) for value in raw[name]]
+        columns['name'] = [value or f"{gear_type}_{row}"
+                           for value, gear_type, row in zip(columns['name'], types, rows)]
+        columns['material'] = [value or _DEFAULTS['material'] for value in columns['material']]
+
+        def reject(messages, codes=None):
+            # Écarter les lignes dont le message n'est pas None
+            keep = [i for i, message in enumerate(messages) if message is None]
+            errors.extend(BulkLoader._error(rows[i], message, records[i],
+                                            None if codes is None else codes[i])
+                          for i, message in enumerate(messages) if message is not None)
+            if len(keep) < len(messages):
+                for values in (rows, records, types, columns['name'], columns['material']):
+                    values[:] = [values[i] for i in keep]
+                for name in _FLOAT_FIELDS + _INT_FIELDS:
+                    columns[name] = columns[name][keep]
+
+        reject(messages)
+        if rows:
+            # Types hors noyau : contrôles communs seulement
+            reject(GearKernel.row_errors(
+                [t if t in TYPE_CODES else 'spur' for t in types],
+                columns['module'], columns['teeth'],
+                columns['pressure_angle'], columns['rolling_circle_ratio'],
+            ))
+
+        if rows and rules:
+            issues = RuleEngine.check_gears(
+                {**columns, 'gear_type': [t if t in TYPE_CODES else 'spur' for t in types]})
+            issues = issues[issues['severity'] == ERROR]
+            rule_messages = {rule.code: rule.message for rule in RuleEngine.rules('gear')}
+            # Première anomalie de chaque ligne
+            first: List[Optional[str]] = [None] * len(rows)
+            for index, code in zip(issues['index'].tolist(), issues['code'].tolist()):
+                if first[index] is None:
+                    first[index] = str(code)
+            reject([None if code is None else rule_messages[code] for code in first], first)
+
+        errors.sort(key=lambda e: e['row'])
+        return rows, types, columns, errors
+
+    @staticmethod
+    def _convert_column(name: str, values: List[Any], messages: List[Optional[str]]) -> np.ndarray:
+        """
+        Colonne float d'un champ numérique (NaN si absent)
+
+        Conversion NumPy d'un bloc ; en cas d'échec, conversion ligne par
+        ligne (_convert) et message d'erreur pour les lignes fautives.
+        """
+        try:
+            column = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            column = None
+        if column is None or column.ndim != 1:
+            column = np.full(len(values), np.nan)
+            for index, value in enumerate(values):
+                value = BulkLoader._text(value) if isinstance(value, str) else value
+                if value is None or value == '':
+                    continue
+                try:
+                    column[index] = BulkLoader._convert(name, value)
+                except ValueError as e:
+                    messages[index] = messages[index] or str(e)
+        if name in _INT_FIELDS:
+            with np.errstate(invalid='ignore'):
+                fractional = ~np.isnan(column) & (np.mod(column, 1) != 0)
+            for index in np.flatnonzero(fractional):
+                messages[index] = messages[index] or \
+                    f"{name} doit être un entier, got {values[index]!r}"
+        # -0.0 ramené à 0.0, comme GearParams
+        return column + 0.0
+
+    @staticmethod
+    def _text(value: Any) -> Optional[str]:
+        """Chaîne nettoyée (None si absente ou vide)"""
+        if value is None:
+            return None
+        value = str(value).strip()
+        return value or None
+
+    @staticmethod
+    def _compute(types: List[str], columns: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Colonnes GearKernel d'un bloc (vides si aucune ligne valide)"""
+        if types:
+            return GearKernel.compute(
+                types, columns['module'], columns['teeth'],
+                **{name: columns[name] for name in (
+                    'pressure_angle', 'helix_angle', 'profile_shift', 'face_width',
+                    'pitch_angle', 'shaft_angle', 'mate_teeth', 'leads',
+                    'rolling_circle_ratio')})
+        columns = GearKernel.compute(['spur'], [1.0], [20])
+        return {name: values[:0] for name, values in columns.items()}
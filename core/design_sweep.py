@@ -0,0 +1,242 @@
+"""
+Balayage vectorisé de l'espace de conception avec filtrage de Pareto
+
+Les candidats (module, dents, angle de pression, déport, angle d'hélice,
+largeur) sont générés en grille ou aléatoirement, évalués par blocs avec
+GearKernel et MeshKernel, contrôlés par RuleEngine (sous-dépouille et
+interférence calculées), puis
+réduits au front de Pareto des objectifs choisis.
+"""
+import math
+from typing import Dict, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .gear_kernel import GearKernel, TYPE_CODES
+from .mesh_kernel import MeshKernel
+from .rule_engine import RuleEngine, MAX_HELIX_ANGLE
+
+# Paramètres de conception balayés et valeurs par défaut
+PARAMETERS = {
+    'module': 2.0,
+    'teeth': 20,
+    'pressure_angle': 20.0,
+    'profile_shift': 0.0,
+    'helix_angle': 0.0,
+    'face_width': 10.0,
+}
+
+# Sens par défaut des objectifs
+OBJECTIVES = {
+    'outside_diameter': 'min',
+    'center_distance': 'min',
+    'volume': 'min',
+    'face_width': 'min',
+    'contact_ratio': 'max',
+    'overlap_ratio': 'max',
+}
+
+# Taille des blocs évalués en une passe (limite la mémoire)
+CHUNK_SIZE = 200_000
+
+
+class DesignSweep:
+    """Exploration vectorisée de l'espace de conception"""
+
+    @staticmethod
+    def grid(**values: Sequence) -> Dict[str, np.ndarray]:
+        """
+        Produit cartésien des valeurs données par paramètre
+
+        Les paramètres absents prennent leur valeur par défaut (PARAMETERS).
+        """
+        DesignSweep._check_names(values)
+        axes = [np.atleast_1d(np.asarray(values.get(name, default), dtype=float))
+                for name, default in PARAMETERS.items()]
+        mesh = np.meshgrid(*axes, indexing='ij')
+        return {name: axis.ravel() for name, axis in zip(PARAMETERS, mesh)}
+
+    @staticmethod
+    def random(count: int, bounds: Dict[str, Tuple[float, float]],
+               seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Échantillonnage uniforme dans des bornes (min, max) par paramètre
+
+        Le nombre de dents est tiré en entier, bornes incluses.
+        """
+        DesignSweep._check_names(bounds)
+        rng = np.random.default_rng(seed)
+        candidates = {}
+        for name, default in PARAMETERS.items():
+            if name not in bounds:
+                candidates[name] = np.full(count, default, dtype=float)
+            elif name == 'teeth':
+                low, high = bounds[name]
+                candidates[name] = rng.integers(int(low), int(high) + 1, count).astype(float)
+            else:
+                low, high = bounds[name]
+                candidates[name] = rng.uniform(low, high, count)
+        return candidates
+
+    @staticmethod
+    def _check_names(names):
+        unknown = set(names) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(
+                f"Paramètres inconnus {sorted(unknown)}. "
+                f"Paramètres disponibles: {list(PARAMETERS)}"
+            )
+
+    @staticmethod
+    def evaluate(candidates: Dict[str, np.ndarray],
+                 ratio: float = 1.0) -> Dict[str, np.ndarray]:
+        """
+        Évaluer des candidats (pignon engrenant avec une roue de rapport ratio)
+
+        Returns:
+            Colonnes des paramètres, de la géométrie, de l'engrènement et des
+            contrôles ; 'valid' combine tous les contrôles.
+        """
+        module = np.asarray(candidates['module'], dtype=float)
+        teeth = np.asarray(candidates['teeth'], dtype=float)
+        alpha = np.asarray(candidates['pressure_angle'], dtype=float)
+        shift = np.asarray(candidates['profile_shift'], dtype=float)
+        beta = np.asarray(candidates['helix_angle'], dtype=float)
+        width = np.asarray(candidates['face_width'], dtype=float)
+        size = module.shape[0]
+
+        # Contrôles de GearParams.validate / GearValidator.validate_gear_params
+        params_ok = (module > 0) & (teeth >= 1) & (alpha >= 14) & (alpha <= 25)
+        helix_ok = np.abs(beta) <= MAX_HELIX_ANGLE
+
+        # Les lignes rejetées sont évaluées sur un candidat neutre puis masquées
+        module_s = np.where(params_ok, module, PARAMETERS['module'])
+        teeth_s = np.where(params_ok, teeth, PARAMETERS['teeth'])
+        alpha_s = np.where(params_ok, alpha, PARAMETERS['pressure_angle'])
+        codes = np.where(beta == 0, TYPE_CODES['spur'], TYPE_CODES['helical'])
+        mate_teeth = np.maximum(np.round(teeth_s * ratio), 1)
+
+        pinion = GearKernel.compute(codes, module_s, teeth_s, alpha_s, beta, shift, width)
+        wheel = GearKernel.compute(codes, module_s, mate_teeth, alpha_s, -beta, 0.0, width)
+        mesh = MeshKernel.analyze(pinion, wheel)
+
+        # Limites calculées de sous-dépouille (pignon) et d'interférence (paire)
+        pinion_rules = {'gear_type': codes, 'module': module_s, 'teeth': teeth_s,
+                        'pressure_angle': alpha_s, 'helix_angle': beta,
+                        'profile_shift': shift, 'face_width': width}
+        wheel_rules = dict(pinion_rules, teeth=mate_teeth, helix_angle=-beta, profile_shift=0.0)
+        undercut = RuleEngine.mask(
+            RuleEngine.check_gears(pinion_rules, codes=('undercut',)), size)
+        interference = RuleEngine.mask(
+            RuleEngine.check_pairs(pinion_rules, wheel_rules, codes=('pair.interference',)), size)
+
+        valid = params_ok & helix_ok & ~interference & ~undercut & mesh['valid']
+
+        outside_diameter = pinion['outside_diameter']
+        return {
+            'module': module,
+            'teeth': teeth,
+            'pressure_angle': alpha,
+            'profile_shift': pinion['profile_shift'],
+            'helix_angle': beta,
+            'face_width': width,
+            'mate_teeth': mate_teeth,
+            'pitch_diameter': pinion['pitch_diameter'],
+            'outside_diameter': outside_diameter,
+            'center_distance': mesh['center_distance'],
+            'volume': math.pi / 4 * outside_diameter**2 * width,
+            'contact_ratio': mesh['contact_ratio'],
+            'overlap_ratio': mesh['overlap_ratio'],
+            'params_ok': params_ok,
+            'helix_ok': helix_ok,
+            'interference': interference,
+            'undercut': undercut,
+            'valid': valid,
+        }
+
+    @staticmethod
+    def pareto_front(objectives: np.ndarray) -> np.ndarray:
+        """
+        Indices des points non dominés (toutes les colonnes à minimiser)
+
+        Args:
+            objectives: tableau (N, K)
+        """
+        objectives = np.asarray(objectives, dtype=float)
+        if objectives.ndim != 2:
+            raise ValueError(f"Tableau (N, K) attendu, got {objectives.shape}")
+        if objectives.shape[0] == 0:
+            return np.zeros(0, dtype=np.intp)
+
+        # Tri lexicographique : le premier point restant est toujours non dominé
+        order = np.lexsort(objectives.T[::-1])
+        points = objectives[order]
+
+        if points.shape[1] == 2:
+            # Deux objectifs : minimum cumulé du second
+            best = np.minimum.accumulate(points[:, 1])
+            keep = np.empty(len(points), dtype=bool)
+            keep[0] = True
+            keep[1:] = points[1:, 1] < best[:-1]
+            return np.sort(order[keep])
+
+        front = []
+        remaining = np.arange(len(points))
+        while remaining.size:
+            head = remaining[0]
+            front.append(head)
+            rest = points[remaining[1:]]
+            dominated = np.all(rest >= points[head], axis=1)
+            remaining = remaining[1:][~dominated]
+        return np.sort(order[np.asarray(front, dtype=np.intp)])
+
+    @staticmethod
+    def run(candidates: Dict[str, np.ndarray],
+            objectives: Union[Sequence[str], Dict[str, str]] = ('volume', 'contact_ratio'),
+            ratio: float = 1.0,
+            chunk_size: int = CHUNK_SIZE) -> Dict[str, np.ndarray]:
+        """
+        Évaluer par blocs, écarter les candidats invalides et retourner le
+        front de Pareto
+
+        Args:
+            objectives: noms (sens par défaut de OBJECTIVES) ou {nom: 'min'|'max'}
+
+        Returns:
+            Colonnes évaluées des candidats du front et leur 'index' d'origine
+        """
+        if not isinstance(objectives, dict):
+            objectives = {name: OBJECTIVES.get(name, 'min') for name in objectives}
+        for name, sense in objectives.items():
+            if sense not in ('min', 'max'):
+                raise ValueError(f"Sens d'objectif '{sense}' invalide pour '{name}'")
+
+        size = np.asarray(candidates['module']).shape[0]
+        kept = []
+        for start in range(0, size, chunk_size):
+            chunk = {name: np.asarray(values)[start:start + chunk_size]
+                     for name, values in candidates.items()}
+            columns = DesignSweep.evaluate(chunk, ratio)
+            mask = columns['valid']
+            block = {name: values[mask] for name, values in columns.items()}
+            block['index'] = np.flatnonzero(mask) + start
+            # Pré-filtrage par bloc : un point dominé localement l'est globalement
+            front = DesignSweep.pareto_front(DesignSweep._objective_matrix(block, objectives))
+            kept.append({name: values[front] for name, values in block.items()})
+
+        if not kept:
+            return {}
+        merged = {name: np.concatenate([block[name] for block in kept]) for name in kept[0]}
+        front = DesignSweep.pareto_front(DesignSweep._objective_matrix(merged, objectives))
+        return {name: values[front] for name, values in merged.items()}
+
+    @staticmethod
+    def _objective_matrix(columns: Dict[str, np.ndarray],
+                          objectives: Dict[str, str]) -> np.ndarray:
+        """Matrice (N, K) à minimiser (objectifs 'max' négativés)"""
+        missing = set(objectives) - set(columns)
+        if missing:
+            raise ValueError(f"Objectifs inconnus {sorted(missing)}")
+        return np.column_stack([
+            -columns[name] if sense == 'max' else columns[name]
+            for name, sense in objectives.items()
+        ])
@@ -1,41 +1,296 @@
-from typing import Dict, Type, Any
+import os
+from collections import OrderedDict
+from importlib import import_module
+from threading import RLock
+from typing import Dict, Type, Any, List, Optional, Tuple
 from .base_gear import Gear, GearParams
 
 
+# Variable d'environnement donnant la taille du cache des interfaces (0 : désactivé)
+CACHE_SIZE_ENV = 'GEAR_CACHE_SIZE'
+
+# Types intégrés, déclarés par chemin 'module:Classe' et importés au premier usage
+BUILTIN_GEAR_TYPES = {
+    'spur': 'gears.spur:SpurGear',
+    'helical': 'gears.helical:HelicalGear',
+    'herringbone': 'gears.helical:HerringboneGear',
+    'bevel': 'gears.bevel:BevelGear',
+    'worm': 'gears.worm:WormGear',
+    'rack': 'gears.rack:RackGear',
+    'internal': 'gears.internal:InternalGear',
+    'cycloidal': 'gears.cycloidal:CycloidalGear',
+}
+
+# Groupe de points d'entrée des types fournis par des paquets tiers
+ENTRY_POINT_GROUP = 'gear_engine.gear_types'
+
+
+class _CacheEntry:
+    """Engrenage interné et son get_info() mémorisé"""
+
+    __slots__ = ('gear', 'info')
+
+    def __init__(self, gear: Gear):
+        self.gear = gear
+        self.info: Optional[Dict[str, Any]] = None
+
+
 class GearFactory:
     """Fabrique pour créer différents types d'engrenages"""
 
     _gear_types: Dict[str, Type[Gear]] = {}
+    # Types déclarés mais pas encore importés : nom -> 'module:Classe'
+    _lazy_types: Dict[str, str] = {}
+    # Groupes de points d'entrée à parcourir avant la prochaine recherche de type
+    _pending_entry_points: List[str] = []
+
+    # Cache LRU optionnel : (type, GearParams) -> _CacheEntry
+    _cache: Optional[OrderedDict] = None
+    _cache_maxsize: int = 0
+    _cache_by_gear: Dict[int, _CacheEntry] = {}
+    _cache_stats: Dict[str, int] = {'hits': 0, 'misses': 0, 'evictions': 0}
+    _cache_lock = RLock()
 
     @classmethod
     def register_gear(cls, name: str, gear_class: Type[Gear]):
         """Enregistrer un nouveau type d'engrenage"""
-        cls._gear_types[name.lower()] = gear_class
+        name = name.lower()
+        if cls._gear_types.get(name) is not gear_class:
+            cls.invalidate(name)
+        cls._lazy_types.pop(name, None)
+        cls._gear_types[name] = gear_class
 
     @classmethod
-    def create_gear(cls, gear_type: str, params: GearParams, **kwargs) -> Gear:
-        """Créer un engrenage du type spécifié"""
-        gear_type_lower = gear_type.lower()
+    def register_lazy(cls, name: str, target: str):
+        """
+        Déclarer un type par son chemin 'module:Classe', importé seulement
+        au premier engrenage créé de ce type
+        """
+        if ':' not in target:
+            raise ValueError(f"Chemin 'module:Classe' attendu, got '{target}'")
+        name = name.lower()
+        resolved = cls._gear_types.get(name)
+        if resolved is not None and cls._target(resolved) == target:
+            return
+        if resolved is not None:
+            del cls._gear_types[name]
+            cls.invalidate(name)
+        cls._lazy_types[name] = target
+
+    @classmethod
+    def register_builtin_types(cls, entry_points: bool = True):
+        """
+        Déclarer les types intégrés (sans import) ; les points d'entrée ne
+        sont parcourus qu'à la première liste des types ou au premier type
+        inconnu
+        """
+        for name, target in BUILTIN_GEAR_TYPES.items():
+            if name not in cls._gear_types and name not in cls._lazy_types:
+                cls.register_lazy(name, target)
+        if entry_points and ENTRY_POINT_GROUP not in cls._pending_entry_points:
+            cls._pending_entry_points.append(ENTRY_POINT_GROUP)
+
+    @classmethod
+    def _load_pending_entry_points(cls):
+        while cls._pending_entry_points:
+            cls.load_entry_points(cls._pending_entry_points.pop())
+
+    @classmethod
+    def load_entry_points(cls, group: str = ENTRY_POINT_GROUP) -> int:
+        """
+        Déclarer les types publiés par des paquets installés, par exemple
+        [project.entry-points."gear_engine.gear_types"] mon_type = "pkg.mod:MaClasse"
+
+        Returns:
+            Nombre de types déclarés
+        """
+        from importlib.metadata import entry_points
+        found = entry_points(group=group)
+        for entry in found:
+            cls.register_lazy(entry.name, entry.value)
+        return len(found)
+
+    @staticmethod
+    def _target(gear_class: Type[Gear]) -> str:
+        return f"{gear_class.__module__}:{gear_class.__qualname__}"
 
-        if gear_type_lower not in cls._gear_types:
-            available = list(cls._gear_types.keys())
+    @classmethod
+    def get_gear_class(cls, gear_type: str) -> Type[Gear]:
+        """Classe d'un type, importée si elle n'a été que déclarée"""
+        name = gear_type.lower()
+        gear_class = cls._gear_types.get(name)
+        if gear_class is not None:
+            return gear_class
+        if name not in cls._lazy_types:
+            cls._load_pending_entry_points()
+        target = cls._lazy_types.get(name)
+        if target is None:
             raise ValueError(
                 f"Type d'engrenage '{gear_type}' non supporté. "
-                f"Types disponibles: {available}"
+                f"Types disponibles: {cls.get_available_types()}"
             )
+        module_name, _, class_name = target.partition(':')
+        try:
+            gear_class = import_module(module_name)
+            for attribute in class_name.split('.'):
+                gear_class = getattr(gear_class, attribute)
+        except (ImportError, AttributeError) as e:
+            raise ImportError(f"Type d'engrenage '{name}': import de '{target}' impossible ({e})") from e
+        cls.register_gear(name, gear_class)
+        return gear_class
+
+    @classmethod
+    def enable_cache(cls, maxsize: int = 512):
+        """
+        Activer le cache LRU des engrenages construits (maxsize <= 0 le désactive)
 
-        # Mettre à jour les paramètres avec les kwargs
-        for key, value in kwargs.items():
-            if hasattr(params, key):
-                setattr(params, key, value)
+        Les engrenages et leur get_info() sont partagés entre appels pour des
+        paramètres égaux : ne pas les modifier.
+        """
+        with cls._cache_lock:
+            if maxsize <= 0:
+                cls.disable_cache()
+                return
+            if cls._cache is None:
+                cls._cache = OrderedDict()
+            cls._cache_maxsize = maxsize
+            cls._evict()
 
-        gear_class = cls._gear_types[gear_type_lower]
-        return gear_class(params)
+    @classmethod
+    def configure_cache_from_env(cls):
+        """Activer le cache selon la variable GEAR_CACHE_SIZE (désactivé par défaut)"""
+        value = os.environ.get(CACHE_SIZE_ENV, '').strip()
+        try:
+            maxsize = int(value) if value else 0
+        except ValueError:
+            raise ValueError(f"{CACHE_SIZE_ENV} doit être un entier, got '{value}'")
+        cls.enable_cache(maxsize)
+
+    @classmethod
+    def disable_cache(cls):
+        """Désactiver et vider le cache"""
+        with cls._cache_lock:
+            cls._cache = None
+            cls._cache_maxsize = 0
+            cls._cache_by_gear = {}
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, Any]:
+        """Compteurs du cache (hits, misses, evictions, taille)"""
+        with cls._cache_lock:
+            return {
+                'enabled': cls._cache is not None,
+                'maxsize': cls._cache_maxsize,
+                'size': len(cls._cache) if cls._cache is not None else 0,
+                **cls._cache_stats,
+            }
+
+    @classmethod
+    def reset_cache_stats(cls):
+        """Remettre les compteurs à zéro"""
+        with cls._cache_lock:
+            cls._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @classmethod
+    def invalidate(cls, gear_type: Optional[str] = None,
+                   params: Optional[GearParams] = None) -> int:
+        """
+        Retirer des entrées du cache
+
+        Sans argument, vide tout ; avec gear_type, les entrées de ce type ;
+        avec gear_type et params, une seule entrée.
+
+        Returns:
+            Nombre d'entrées retirées
+        """
+        with cls._cache_lock:
+            if cls._cache is None:
+                return 0
+            if gear_type is None:
+                keys = list(cls._cache)
+            elif params is None:
+                keys = [key for key in cls._cache if key[0] == gear_type.lower()]
+            else:
+                key = (gear_type.lower(), params)
+                keys = [key] if key in cls._cache else []
+            for key in keys:
+                entry = cls._cache.pop(key)
+                cls._cache_by_gear.pop(id(entry.gear), None)
+            return len(keys)
+
+    @classmethod
+    def _evict(cls):
+        """Retirer les entrées les moins récemment utilisées au-delà de maxsize"""
+        while len(cls._cache) > cls._cache_maxsize:
+            _, entry = cls._cache.popitem(last=False)
+            cls._cache_by_gear.pop(id(entry.gear), None)
+            cls._cache_stats['evictions'] += 1
+
+    @classmethod
+    def get_info(cls, gear: Gear) -> Dict[str, Any]:
+        """get_info() d'un engrenage, mémorisé s'il provient du cache"""
+        with cls._cache_lock:
+            entry = cls._cache_by_gear.get(id(gear))
+            if entry is None or entry.gear is not gear:
+                return gear.get_info()
+            if entry.info is None:
+                entry.info = gear.get_info()
+            return dict(entry.info)
+
+    @classmethod
+    def create_gear(cls, gear_type: str, params: GearParams, **kwargs) -> Gear:
+        """Créer un engrenage du type spécifié"""
+        gear_type_lower = gear_type.lower()
+        gear_class = cls.get_gear_class(gear_type_lower)
+
+        # Dériver les paramètres avec les kwargs (sans modifier l'original)
+        overrides = {key: value for key, value in kwargs.items()
+                     if key in GearParams.field_names()}
+        if overrides:
+            params = params.derive(**overrides)
+
+        if cls._cache is None:
+            return gear_class(params)
+
+        key = (gear_type_lower, params)
+        with cls._cache_lock:
+            if cls._cache is not None and key in cls._cache:
+                cls._cache.move_to_end(key)
+                cls._cache_stats['hits'] += 1
+                return cls._cache[key].gear
+
+        # Construction hors verrou ; une construction concurrente identique
+        # garde la première entrée insérée
+        gear = gear_class(params)
+        with cls._cache_lock:
+            if cls._cache is None:
+                return gear
+            cls._cache_stats['misses'] += 1
+            entry = cls._cache.get(key)
+            if entry is None:
+                entry = _CacheEntry(gear)
+                cls._cache[key] = entry
+                cls._cache_by_gear[id(gear)] = entry
+                cls._evict()
+            return entry.gear
+
+    @classmethod
+    def get_type_name(cls, gear: Gear) -> str:
+        """Nom enregistré de la classe d'un engrenage"""
+        for name, gear_class in cls._gear_types.items():
+            if type(gear) is gear_class:
+                return name
+        target = cls._target(type(gear))
+        for name, lazy_target in cls._lazy_types.items():
+            if lazy_target == target:
+                return name
+        raise ValueError(f"Classe {type(gear).__name__} non enregistrée")
 
     @classmethod
     def get_available_types(cls) -> list:
-        """Retourne la liste des types d'engrenages disponibles"""
-        return list(cls._gear_types.keys())
+        """Retourne la liste des types d'engrenages disponibles (importés ou déclarés)"""
+        cls._load_pending_entry_points()
+        return list(dict.fromkeys([*cls._gear_types, *cls._lazy_types]))
 
     @classmethod
     def from_dict(cls, config: Dict[str, Any]) -> Gear:
@@ -44,20 +299,22 @@ class GearFactory:
         Tous les paramètres spécifiques (bevel, worm, etc.)
         sont portés par GearParams.
         """
-        config = config.copy()
-
-        gear_type = config.pop("type", "spur")
-        
-        # Extraire les paramètres s'ils sont dans une clé 'params'
-        if 'params' in config:
-            params_dict = config.pop('params')
-            params_dict.update({k: v for k, v in config.items() 
-                               if k not in ['type']})
-        else:
-            params_dict = config
+        gear_type, params_dict = cls.split_config(config)
 
         # Création des paramètres (inclut mate_teeth, shaft_angle, etc.)
         params = GearParams(**params_dict)
 
         return cls.create_gear(gear_type, params)
 
+    @staticmethod
+    def split_config(config: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Séparer le type et les paramètres d'une configuration
+
+        Les paramètres peuvent être à plat ou dans une clé 'params' ; les
+        clés de premier niveau l'emportent. La configuration n'est pas modifiée.
+        """
+        params_dict = dict(config.get('params') or {})
+        params_dict.update((key, value) for key, value in config.items()
+                           if key not in ('type', 'params'))
+        return config.get('type', 'spur'), params_dict
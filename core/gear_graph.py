@@ -0,0 +1,262 @@
+"""
+Graphe de dépendances incrémental des grandeurs dérivées d'un engrenage
+
+Chaque grandeur de get_info() est un nœud qui déclare ses dépendances
+(paramètres d'entrée préfixés par '@', ou autres nœuds). Une modification
+de paramètres n'invalide que les nœuds en aval ; ils sont recalculés à la
+demande et update() retourne le delta des sorties modifiées.
+"""
+import math
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Set, Tuple
+
+from .base_gear import GearParams
+from .gear_kernel import CLASS_NAMES, GearKernel
+from .math_utils import GearMath
+from standards.iso_21771 import ISO21771
+
+# Spécification d'un nœud : (nom, dépendances, fonction)
+NodeSpec = Tuple[str, Tuple[str, ...], Callable]
+
+INPUT_PREFIX = '@'
+
+
+# Les fonctions des nœuds sont les formules scalaires de GearMath (et
+# ISO21771) appelées par les classes d'engrenages, avec les mêmes défauts
+BASE_NODES: List[NodeSpec] = [
+    ('pitch_diameter', ('@module', '@teeth'), GearMath.pitch_diameter),
+    ('addendum', ('@module',), GearMath.addendum),
+    ('dedendum', ('@module',), GearMath.dedendum),
+    ('outside_diameter', ('pitch_diameter', 'addendum'), GearMath.outside_diameter),
+    ('root_diameter', ('pitch_diameter', 'dedendum'), GearMath.root_diameter),
+]
+
+# Nœuds propres à chaque type (remplacent les nœuds de base de même nom)
+TYPE_NODES: Dict[str, List[NodeSpec]] = {
+    'spur': [
+        ('base_diameter', ('pitch_diameter', '@pressure_angle'), GearMath.base_diameter),
+        ('circular_pitch', ('@module',), GearMath.circular_pitch),
+        ('contact_ratio', ('@teeth',), GearMath.estimated_contact_ratio),
+        ('profile_shift', ('@teeth', '@profile_shift', '@pressure_angle'),
+         GearMath.auto_profile_shift),
+    ],
+    'helical': [
+        ('transverse_module', ('@module', '@helix_angle'), GearMath.transverse_module),
+        ('pitch_diameter', ('transverse_module', '@teeth'), GearMath.pitch_diameter),
+        ('axial_pitch', ('@module', '@helix_angle'), GearMath.axial_pitch),
+        ('normal_pitch', ('@module',), GearMath.normal_pitch),
+        ('transverse_pressure_angle', ('@pressure_angle', '@helix_angle'),
+         ISO21771.transverse_pressure_angle),
+        ('lead', ('pitch_diameter', '@helix_angle'), GearMath.lead),
+        ('overlap_ratio', ('@face_width', '@helix_angle', '@module'),
+         ISO21771.overlap_ratio),
+        ('contact_ratio', ('@teeth', 'overlap_ratio'), GearMath.helical_contact_ratio),
+    ],
+    'bevel': [
+        ('pitch_angle', ('@pitch_angle', '@teeth', '@mate_teeth'), GearMath.bevel_pitch_angle),
+        ('shaft_angle', ('@shaft_angle',), GearMath.bevel_shaft_angle),
+        ('back_angle', ('shaft_angle', 'pitch_angle'), GearMath.back_angle),
+        ('cone_distance', ('pitch_diameter', 'pitch_angle'), GearMath.cone_distance),
+        ('mean_pitch_radius', ('pitch_diameter', 'pitch_angle'), GearMath.mean_pitch_radius),
+        ('outside_diameter', ('pitch_diameter', '@module', 'pitch_angle'),
+         GearMath.bevel_outside_diameter),
+        ('root_diameter', ('pitch_diameter', '@module', 'pitch_angle'),
+         GearMath.bevel_root_diameter),
+        ('face_angle', ('pitch_angle', '@module', 'cone_distance'), GearMath.face_angle),
+        ('root_angle', ('pitch_angle', '@module', 'cone_distance'), GearMath.root_angle),
+    ],
+    'worm': [
+        ('leads', ('@leads',), GearMath.worm_leads),
+        ('worm_diameter', ('@module',), GearMath.worm_diameter),
+        ('pitch_diameter', ('worm_diameter',), float),
+        ('outside_diameter', ('worm_diameter', 'addendum'), GearMath.outside_diameter),
+        ('root_diameter', ('worm_diameter', 'dedendum'), GearMath.root_diameter),
+        ('axial_pitch', ('@module',), GearMath.circular_pitch),
+        ('lead', ('leads', 'axial_pitch'), GearMath.worm_lead),
+        ('lead_angle', ('lead', 'worm_diameter'), GearMath.lead_angle),
+    ],
+    'rack': [
+        ('pitch_diameter', (), lambda: float('inf')),
+        ('tooth_height', ('@module',), GearMath.tooth_height),
+        ('tooth_thickness', ('@module',), GearMath.tooth_thickness),
+        ('circular_pitch', ('@module',), GearMath.circular_pitch),
+    ],
+    'internal': [
+        ('profile_shift', ('@teeth', '@profile_shift'), GearMath.internal_profile_shift),
+        ('outside_diameter', ('pitch_diameter', 'addendum'),
+         GearMath.internal_outside_diameter),
+        ('root_diameter', ('pitch_diameter', 'dedendum'), GearMath.internal_root_diameter),
+        ('base_diameter', ('pitch_diameter', '@pressure_angle'), GearMath.base_diameter),
+        ('is_internal', (), lambda: True),
+    ],
+    'cycloidal': [
+        ('circular_pitch', ('@module',), GearMath.circular_pitch),
+        ('rolling_circle_ratio', ('@rolling_circle_ratio',), GearMath.rolling_circle_ratio),
+        ('rolling_radius', ('rolling_circle_ratio', 'pitch_diameter'), GearMath.rolling_radius),
+    ],
+}
+
+
+@lru_cache(maxsize=None)
+def _graph_spec(gear_type: str):
+    """
+    Nœuds d'un type dans l'ordre topologique, et pour chaque entrée ou nœud,
+    la liste ordonnée des nœuds en aval
+    """
+    if gear_type not in TYPE_NODES:
+        raise ValueError(
+            f"Type d'engrenage '{gear_type}' non supporté. "
+            f"Types disponibles: {list(TYPE_NODES)}"
+        )
+    nodes = {name: (deps, func) for name, deps, func in BASE_NODES}
+    nodes.update({name: (deps, func) for name, deps, func in TYPE_NODES[gear_type]})
+
+    # Tri topologique (parcours en profondeur)
+    order: List[str] = []
+    state: Dict[str, int] = {}
+
+    def visit(name):
+        if state.get(name) == 2:
+            return
+        if state.get(name) == 1:
+            raise ValueError(f"Dépendance circulaire sur '{name}'")
+        state[name] = 1
+        for dep in nodes[name][0]:
+            if not dep.startswith(INPUT_PREFIX):
+                visit(dep)
+        state[name] = 2
+        order.append(name)
+
+    for name in nodes:
+        visit(name)
+
+    # Nœuds en aval, dans l'ordre topologique
+    dependents: Dict[str, Set[str]] = {}
+    for name in order:
+        for dep in nodes[name][0]:
+            dependents.setdefault(dep, set()).add(name)
+    rank = {name: i for i, name in enumerate(order)}
+    downstream: Dict[str, Tuple[str, ...]] = {}
+    for source in list(dependents):
+        seen: Set[str] = set()
+        stack = list(dependents[source])
+        while stack:
+            name = stack.pop()
+            if name not in seen:
+                seen.add(name)
+                stack.extend(dependents.get(name, ()))
+        downstream[source] = tuple(sorted(seen, key=rank.get))
+
+    return nodes, tuple(order), downstream
+
+
+class GearGraph:
+    """Évaluation paresseuse et incrémentale des grandeurs d'un engrenage"""
+
+    def __init__(self, gear_type: str, params: GearParams):
+        self.gear_type = gear_type.lower()
+        self._nodes, self._order, self._downstream = _graph_spec(self.gear_type)
+        params.validate()
+        self._params = params
+        self._values: Dict[str, Any] = {}
+        self._dirty: Set[str] = set(self._nodes)
+        self.evaluations = 0
+
+    @property
+    def params(self) -> GearParams:
+        """Paramètres courants"""
+        return self._params
+
+    @property
+    def outputs(self) -> List[str]:
+        """Grandeurs exposées : champs de get_info() puis nœuds supplémentaires"""
+        fields = [f for f in GearKernel.fields(self.gear_type)
+                  if f not in ('name', 'type', 'gear_type')]
+        return fields + [name for name in self._order if name not in fields]
+
+    def get(self, name: str) -> Any:
+        """Valeur d'un nœud (ou d'un paramètre), recalculée si nécessaire"""
+        if name.startswith(INPUT_PREFIX):
+            return getattr(self._params, name[len(INPUT_PREFIX):])
+        if name not in self._nodes:
+            return getattr(self._params, name)
+        if name in self._dirty:
+            deps, func = self._nodes[name]
+            self._values[name] = func(*(self.get(dep) for dep in deps))
+            self._dirty.discard(name)
+            self.evaluations += 1
+        return self._values[name]
+
+    def set(self, **changes) -> Set[str]:
+        """
+        Modifier des paramètres sans recalcul
+
+        Returns:
+            Ensemble des nœuds invalidés
+        """
+        params = self._params.derive(**changes)
+        params.validate()
+        invalidated: Set[str] = set()
+        for key in changes:
+            if getattr(params, key) != getattr(self._params, key):
+                invalidated.update(self._downstream.get(INPUT_PREFIX + key, ()))
+        self._params = params
+        self._dirty |= invalidated
+        return invalidated
+
+    def update(self, **changes) -> Dict[str, Any]:
+        """
+        Modifier des paramètres et recalculer uniquement l'aval
+
+        La modification est annulée si un recalcul échoue.
+
+        Returns:
+            Delta {sortie: nouvelle valeur} des sorties dont la valeur change
+        """
+        previous_params = self._params
+        previous_values = dict(self._values)
+        previous_dirty = set(self._dirty)
+
+        invalidated = self.set(**changes)
+        try:
+            for name in self._order:
+                if name in invalidated:
+                    self.get(name)
+        except Exception:
+            self._params = previous_params
+            self._values = previous_values
+            self._dirty = previous_dirty
+            raise
+
+        delta: Dict[str, Any] = {}
+        outputs = set(self.outputs)
+        for key in changes:
+            if key in outputs and key not in self._nodes and \
+                    getattr(previous_params, key) != getattr(self._params, key):
+                delta[key] = getattr(self._params, key)
+        for name in invalidated:
+            value = self._values[name]
+            if name not in previous_values or not _same(previous_values[name], value):
+                delta[name] = value
+        return {name: delta[name] for name in self.outputs if name in delta}
+
+    def get_info(self) -> Dict[str, Any]:
+        """Dictionnaire identique à Gear.get_info() du type"""
+        info: Dict[str, Any] = {}
+        for field in GearKernel.fields(self.gear_type):
+            if field == 'name':
+                info[field] = self._params.name
+            elif field == 'type':
+                info[field] = CLASS_NAMES[self.gear_type]
+            elif field == 'gear_type':
+                info[field] = self.gear_type
+            else:
+                info[field] = self.get(field)
+        return info
+
+
+def _same(a, b) -> bool:
+    """Égalité tolérant NaN"""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b
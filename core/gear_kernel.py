@@ -0,0 +1,368 @@
+"""
+Noyau colonnaire : géométrie dérivée de N engrenages en une passe NumPy
+
+Les paramètres sont fournis colonne par colonne (structure de tableaux) et
+chaque champ exposé par get_info() des classes d'engrenages est retourné
+sous forme de colonne. Les formules reprennent GearMath, ISO21771 et les
+surcharges propres à chaque type ; un champ sans objet pour un type donné
+vaut NaN.
+"""
+import math
+from typing import Dict, Any, List, Optional, Sequence
+import numpy as np
+
+from .base_gear import GearParams
+
+# Codes de type (ordre stable : sert d'index dans les tableaux)
+TYPE_CODES = {
+    'spur': 0,
+    'helical': 1,
+    'bevel': 2,
+    'worm': 3,
+    'rack': 4,
+    'internal': 5,
+    'cycloidal': 6,
+}
+TYPE_NAMES = tuple(sorted(TYPE_CODES, key=TYPE_CODES.get))
+
+# Nom de classe retourné par get_info()['type']
+CLASS_NAMES = {
+    'spur': 'SpurGear',
+    'helical': 'HelicalGear',
+    'bevel': 'BevelGear',
+    'worm': 'WormGear',
+    'rack': 'RackGear',
+    'internal': 'InternalGear',
+    'cycloidal': 'CycloidalGear',
+}
+
+# Champs communs (Gear.get_info)
+BASE_FIELDS = ['module', 'teeth', 'pitch_diameter', 'outside_diameter',
+               'root_diameter', 'addendum', 'dedendum', 'face_width']
+
+# Champs spécifiques, dans l'ordre de chaque get_info()
+TYPE_FIELDS = {
+    'spur': ['base_diameter', 'circular_pitch', 'contact_ratio', 'profile_shift'],
+    'helical': ['transverse_module', 'axial_pitch', 'normal_pitch',
+                'transverse_pressure_angle', 'helix_angle', 'lead'],
+    'bevel': ['pitch_angle', 'back_angle', 'cone_distance', 'mean_pitch_radius',
+              'face_angle', 'root_angle'],
+    'worm': ['leads', 'worm_diameter', 'axial_pitch', 'lead', 'lead_angle'],
+    'rack': ['tooth_height', 'tooth_thickness', 'circular_pitch'],
+    'internal': ['base_diameter', 'is_internal'],
+    'cycloidal': ['circular_pitch', 'rolling_circle_ratio', 'rolling_radius'],
+}
+
+# Champs entiers (restitués en int par row_info)
+INT_FIELDS = {'teeth', 'leads'}
+
+# Valeurs par défaut reprises des classes d'engrenages
+DEFAULT_ROLLING_RATIO = 0.5
+WORM_DIAMETER_FACTOR = 10.0
+
+
+def type_codes(gear_types) -> np.ndarray:
+    """Convertir des noms ('spur', ...) ou des codes en tableau de codes"""
+    arr = np.asarray(gear_types)
+    if arr.dtype.kind in 'iu':
+        codes = arr.astype(np.int8)
+        if np.any((codes < 0) | (codes >= len(TYPE_NAMES))):
+            raise ValueError(f"Code de type inconnu dans {np.unique(codes).tolist()}")
+        return codes
+    names = np.char.lower(arr.astype(str))
+    codes = np.full(names.shape, -1, dtype=np.int8)
+    for name, code in TYPE_CODES.items():
+        codes[names == name] = code
+    if np.any(codes < 0):
+        unknown = sorted(set(names[codes < 0].tolist()))
+        raise ValueError(
+            f"Type d'engrenage {unknown} non supporté. "
+            f"Types disponibles: {list(TYPE_CODES)}"
+        )
+    return codes
+
+
+def _column(value, size: int, default: float = np.nan) -> np.ndarray:
+    """Diffuser un scalaire ou une séquence (None -> défaut) en colonne float"""
+    if value is None:
+        return np.full(size, default, dtype=float)
+    if isinstance(value, (list, tuple)):
+        value = [default if v is None else v for v in value]
+    return np.broadcast_to(np.asarray(value, dtype=float), (size,)).copy()
+
+
+def effective_profile_shift(codes: np.ndarray, teeth: np.ndarray,
+                            profile_shift: np.ndarray) -> np.ndarray:
+    """Déport après correction automatique (SpurGear / InternalGear)"""
+    spur_shift = np.where(teeth < 17, (17 - teeth) / 17, 0.0)
+    shift = np.where((codes == TYPE_CODES['spur']) & (profile_shift == 0),
+                     spur_shift, profile_shift)
+    return np.where((codes == TYPE_CODES['internal']) & (teeth < 32), 0.5, shift)
+
+
+def kernel_type(gear) -> Optional[str]:
+    """Type du noyau d'un objet Gear (classe intégrée ou dérivée), None sinon"""
+    names = {class_name: name for name, class_name in CLASS_NAMES.items()}
+    for cls in type(gear).__mro__:
+        if cls.__name__ in names:
+            return names[cls.__name__]
+    return None
+
+
+class GearKernel:
+    """Calcul vectorisé de la géométrie dérivée d'un catalogue d'engrenages"""
+
+    @staticmethod
+    def compute(gear_type, module, teeth,
+                pressure_angle=20.0,
+                helix_angle=0.0,
+                profile_shift=0.0,
+                face_width=10.0,
+                pitch_angle=None,
+                shaft_angle=None,
+                mate_teeth=None,
+                leads=None,
+                rolling_circle_ratio=None) -> Dict[str, np.ndarray]:
+        """
+        Calculer toutes les colonnes dérivées
+
+        Args:
+            gear_type: noms ou codes de type (voir TYPE_CODES)
+            module, teeth: colonnes obligatoires
+            autres: scalaires ou colonnes ; None/NaN = valeur par défaut du type
+
+        Returns:
+            Dictionnaire nom de champ -> tableau (N,)
+        """
+        module = np.atleast_1d(np.asarray(module, dtype=float))
+        size = module.shape[0]
+        codes = np.broadcast_to(type_codes(gear_type), (size,))
+        teeth = np.broadcast_to(np.asarray(teeth, dtype=float), (size,))
+        alpha_deg = _column(pressure_angle, size)
+        beta_deg = _column(helix_angle, size)
+        shift = _column(profile_shift, size)
+        width = _column(face_width, size)
+        ratio = _column(rolling_circle_ratio, size)
+        ratio = np.where(np.isnan(ratio), DEFAULT_ROLLING_RATIO, ratio)
+
+        GearKernel._validate(codes, module, teeth, alpha_deg, ratio)
+
+        is_spur = codes == TYPE_CODES['spur']
+        is_helical = codes == TYPE_CODES['helical']
+        is_bevel = codes == TYPE_CODES['bevel']
+        is_worm = codes == TYPE_CODES['worm']
+        is_rack = codes == TYPE_CODES['rack']
+        is_internal = codes == TYPE_CODES['internal']
+        is_cycloidal = codes == TYPE_CODES['cycloidal']
+
+        alpha = np.radians(alpha_deg)
+        beta = np.radians(beta_deg)
+        nan = np.full(size, np.nan)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shift = effective_profile_shift(codes, teeth, shift)
+
+            # Module apparent (ISO 21771 Éq. 2)
+            transverse_module = np.where(beta_deg == 0, module, module / np.cos(beta))
+
+            # Vis sans fin
+            lead_count = _column(leads, size, 1.0)
+            lead_count = np.where(np.isnan(lead_count), 1.0, lead_count)
+            worm_diameter = module * WORM_DIAMETER_FACTOR
+
+            # Diamètre primitif
+            pitch_diameter = module * teeth
+            pitch_diameter = np.where(is_helical, transverse_module * teeth, pitch_diameter)
+            pitch_diameter = np.where(is_worm, worm_diameter, pitch_diameter)
+            pitch_diameter = np.where(is_rack, np.inf, pitch_diameter)
+
+            addendum = module.copy()
+            dedendum = 1.25 * module
+
+            # Engrenage conique : angle primitif et distance conique
+            shaft = _column(shaft_angle, size)
+            shaft = np.where(np.isnan(shaft) | (shaft == 0), 90.0, shaft)
+            mate = _column(mate_teeth, size)
+            delta = _column(pitch_angle, size)
+            delta = np.where(np.isnan(delta),
+                             np.where(np.isnan(mate), 45.0,
+                                      np.degrees(np.arctan(teeth / mate))),
+                             delta)
+            delta_rad = np.radians(delta)
+            sin_delta = np.sin(delta_rad)
+            cone_distance = np.where(sin_delta > 0, pitch_diameter / (2 * sin_delta), np.inf)
+
+            # Diamètres de tête et de pied
+            outside_diameter = pitch_diameter + 2 * addendum
+            root_diameter = pitch_diameter - 2 * dedendum
+            outside_diameter = np.where(
+                is_bevel, pitch_diameter + 2 * module * np.cos(delta_rad), outside_diameter)
+            root_diameter = np.where(
+                is_bevel, pitch_diameter - 2 * dedendum * np.cos(delta_rad), root_diameter)
+            outside_diameter = np.where(
+                is_internal, pitch_diameter - 2 * module, outside_diameter)
+            root_diameter = np.where(
+                is_internal, pitch_diameter + 2 * dedendum, root_diameter)
+
+            base_diameter = pitch_diameter * np.cos(alpha)
+            circular_pitch = math.pi * module
+
+            # Hélicoïdal
+            tan_beta = np.tan(beta)
+            helical_axial_pitch = np.where(beta_deg == 0, np.inf, circular_pitch / tan_beta)
+            helical_lead = np.where(beta_deg == 0, np.inf,
+                                    math.pi * pitch_diameter / tan_beta)
+            transverse_pressure_angle = np.degrees(np.arctan(np.tan(alpha) / np.cos(beta)))
+
+            # Vis : pas axial, pas de l'hélice, angle d'hélice
+            worm_lead = lead_count * circular_pitch
+            lead_angle = np.degrees(np.arctan(worm_lead / (math.pi * worm_diameter)))
+
+            columns = {
+                'type_code': codes.copy(),
+                'module': module,
+                'teeth': teeth.copy(),
+                'pressure_angle': alpha_deg,
+                'pitch_diameter': pitch_diameter,
+                'outside_diameter': outside_diameter,
+                'root_diameter': root_diameter,
+                'addendum': addendum,
+                'dedendum': dedendum,
+                'face_width': width,
+                'base_diameter': np.where(is_spur | is_internal, base_diameter, nan),
+                'circular_pitch': np.where(is_spur | is_rack | is_cycloidal,
+                                           circular_pitch, nan),
+                'contact_ratio': np.where(is_spur, 1.4 + teeth / 100, nan),
+                'profile_shift': shift,
+                'transverse_module': np.where(is_helical, transverse_module, nan),
+                'axial_pitch': np.where(is_helical, helical_axial_pitch,
+                                        np.where(is_worm, circular_pitch, nan)),
+                'normal_pitch': np.where(is_helical, circular_pitch, nan),
+                'transverse_pressure_angle': np.where(is_helical,
+                                                      transverse_pressure_angle, nan),
+                'helix_angle': beta_deg,
+                'lead': np.where(is_helical, helical_lead,
+                                 np.where(is_worm, worm_lead, nan)),
+                'pitch_angle': np.where(is_bevel, delta, nan),
+                'back_angle': np.where(is_bevel, shaft - delta, nan),
+                'cone_distance': np.where(is_bevel, cone_distance, nan),
+                'mean_pitch_radius': np.where(is_bevel,
+                                              pitch_diameter / 2 * np.cos(delta_rad), nan),
+                'face_angle': np.where(is_bevel, delta + np.degrees(
+                    np.arctan(module / cone_distance)), nan),
+                'root_angle': np.where(is_bevel, delta - np.degrees(
+                    np.arctan(dedendum / cone_distance)), nan),
+                'leads': np.where(is_worm, lead_count, nan),
+                'worm_diameter': np.where(is_worm, worm_diameter, nan),
+                'lead_angle': np.where(is_worm, lead_angle, nan),
+                'tooth_height': np.where(is_rack, 2.25 * module, nan),
+                'tooth_thickness': np.where(is_rack, circular_pitch / 2, nan),
+                'is_internal': is_internal.copy(),
+                'rolling_circle_ratio': np.where(is_cycloidal, ratio, nan),
+                'rolling_radius': np.where(is_cycloidal, ratio * pitch_diameter / 2, nan),
+            }
+
+        return columns
+
+    @staticmethod
+    def _checks(codes: np.ndarray, module: np.ndarray, teeth: np.ndarray,
+                pressure_angle: np.ndarray, rolling_ratio: np.ndarray):
+        """
+        Contrôles de GearParams.validate() et des constructeurs, sur toutes
+        les lignes : (masque des lignes fautives, message, valeurs)
+        """
+        with np.errstate(invalid='ignore'):
+            return (
+                (~(module > 0), "Module doit être > 0", module),
+                (~(teeth >= 1), "Nombre de dents doit être >= 1", teeth),
+                (~((pressure_angle >= 14) & (pressure_angle <= 25)),
+                 "Angle de pression doit être entre 14° et 25°", pressure_angle),
+                ((codes == TYPE_CODES['cycloidal']) & ~((rolling_ratio > 0) & (rolling_ratio < 1)),
+                 "Le rapport du cercle roulant doit être entre 0 et 1", rolling_ratio),
+            )
+
+    @staticmethod
+    def _validate(codes, module, teeth, pressure_angle, rolling_ratio):
+        """Lever ValueError sur la première ligne invalide"""
+        for mask, message, values in GearKernel._checks(codes, module, teeth,
+                                                        pressure_angle, rolling_ratio):
+            if np.any(mask):
+                index = int(np.flatnonzero(mask)[0])
+                raise ValueError(f"{message}, got {values[index]} (ligne {index})")
+
+    @staticmethod
+    def row_errors(gear_type, module, teeth, pressure_angle=20.0,
+                   rolling_circle_ratio=None) -> List[Optional[str]]:
+        """
+        Message d'erreur de chaque ligne (None si valide), sans lever :
+        permet d'écarter les lignes invalides avant compute()
+        """
+        module = np.atleast_1d(np.asarray(module, dtype=float))
+        size = module.shape[0]
+        codes = np.broadcast_to(type_codes(gear_type), (size,))
+        teeth = np.broadcast_to(np.asarray(teeth, dtype=float), (size,))
+        ratio = _column(rolling_circle_ratio, size)
+        ratio = np.where(np.isnan(ratio), DEFAULT_ROLLING_RATIO, ratio)
+        errors: List[Optional[str]] = [None] * size
+        checks = GearKernel._checks(codes, module, teeth, _column(pressure_angle, size), ratio)
+        # Premier contrôle en échec par ligne, comme _validate
+        for mask, message, values in reversed(checks):
+            for index in np.flatnonzero(mask):
+                errors[index] = f"{message}, got {values[index]}"
+        return errors
+
+    @staticmethod
+    def from_params(gear_types: Sequence, params: Sequence[GearParams]) -> Dict[str, np.ndarray]:
+        """Calculer les colonnes à partir d'une liste de GearParams"""
+        def field(name):
+            return [getattr(p, name) for p in params]
+
+        return GearKernel.compute(
+            gear_types,
+            field('module'),
+            field('teeth'),
+            pressure_angle=field('pressure_angle'),
+            helix_angle=field('helix_angle'),
+            profile_shift=field('profile_shift'),
+            face_width=field('face_width'),
+            pitch_angle=field('pitch_angle'),
+            shaft_angle=field('shaft_angle'),
+            mate_teeth=field('mate_teeth'),
+            leads=field('leads'),
+            rolling_circle_ratio=field('rolling_circle_ratio'),
+        )
+
+    @staticmethod
+    def row_info(columns: Dict[str, np.ndarray], index: int,
+                 name: Optional[str] = None) -> Dict[str, Any]:
+        """Reconstituer le dictionnaire get_info() d'une ligne"""
+        gear_type = TYPE_NAMES[int(columns['type_code'][index])]
+        info: Dict[str, Any] = {
+            'name': name,
+            'type': CLASS_NAMES[gear_type],
+        }
+        for key in BASE_FIELDS + TYPE_FIELDS[gear_type]:
+            info[key] = GearKernel._scalar(key, columns[key][index])
+        info['gear_type'] = gear_type
+        if gear_type == 'internal':
+            # get_info() place gear_type avant is_internal
+            info['is_internal'] = info.pop('is_internal')
+        return info
+
+    @staticmethod
+    def _scalar(key: str, value) -> Any:
+        """Convertir un élément de colonne en scalaire Python"""
+        if key == 'is_internal':
+            return bool(value)
+        if key in INT_FIELDS:
+            return int(value)
+        return float(value)
+
+    @staticmethod
+    def fields(gear_type: str) -> List[str]:
+        """Liste ordonnée des champs get_info() d'un type"""
+        extra = [key for key in TYPE_FIELDS[gear_type] if key != 'is_internal']
+        fields = ['name', 'type'] + BASE_FIELDS + extra + ['gear_type']
+        if gear_type == 'internal':
+            fields.append('is_internal')
+        return fields
@@ -0,0 +1,365 @@
+"""
+Table d'engrenages à colonnes NumPy
+
+Un catalogue est stocké colonne par colonne (un tableau par champ de
+GearParams) au lieu d'une liste d'objets Gear portant chacun ses
+paramètres et son profil. Les objets Gear ne sont construits qu'à l'accès
+à une ligne, via le registre de GearFactory : tout type enregistré peut
+figurer dans la table.
+
+Le type et le matériau sont codés en catégories (entier + liste de noms),
+les champs optionnels absents valent NaN. Les colonnes dérivées
+(diamètres, pas, ...) sont calculées à la demande par GearKernel pour les
+types qu'il connaît, et par les objets Gear pour les autres.
+"""
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .base_gear import Gear, GearParams, _FLOAT_FIELDS, _INT_FIELDS
+from .gear_factory import GearFactory
+from .gear_kernel import GearKernel, TYPE_CODES
+
+# Colonnes catégorielles (codes int16 + noms)
+CATEGORY_FIELDS = ('gear_type', 'material')
+
+# Champs entiers obligatoires stockés en entier ; les optionnels en float (NaN)
+_REQUIRED_INT_FIELDS = ('teeth',)
+
+_PARAM_DEFAULTS = {f.name: f.default for f in fields(GearParams)}
+
+
+class GearTable:
+    """Catalogue d'engrenages stocké en colonnes"""
+
+    def __init__(self, data: Dict[str, np.ndarray],
+                 categories: Dict[str, Tuple[str, ...]]):
+        """
+        Utiliser plutôt from_params, from_columns, from_records, from_gears ou load
+
+        Args:
+            data: colonnes de paramètres (codes pour les catégories)
+            categories: noms des catégories par colonne catégorielle
+        """
+        self._data = data
+        self._categories = categories
+        self._derived: Optional[Dict[str, np.ndarray]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_params(cls, gear_types: Sequence[str],
+                    params: Sequence[GearParams]) -> 'GearTable':
+        """Table à partir de types et de GearParams"""
+        if len(gear_types) != len(params):
+            raise ValueError(
+                f"{len(gear_types)} types pour {len(params)} jeux de paramètres"
+            )
+        return cls.from_columns(gear_types, {
+            name: [getattr(p, name) for p in params] for name in GearParams.field_names()})
+
+    @classmethod
+    def from_columns(cls, gear_types: Sequence[str],
+                     columns: Dict[str, Sequence]) -> 'GearTable':
+        """
+        Table à partir de types et de colonnes de champs de GearParams
+
+        Toutes les colonnes sont requises (None pour un champ optionnel
+        absent), comme produites par BulkLoader.parse_chunk.
+        """
+        size = len(gear_types)
+        data: Dict[str, np.ndarray] = {}
+        categories = {}
+
+        types = [str(t).lower() for t in gear_types]
+        available = GearFactory.get_available_types()
+        unknown = sorted(set(types) - set(available))
+        if unknown:
+            raise ValueError(
+                f"Type d'engrenage {unknown} non supporté. "
+                f"Types disponibles: {available}"
+            )
+        for name, values in (('gear_type', types), ('material', columns['material'])):
+            labels, codes = np.unique(np.asarray(values, dtype=object).astype(str),
+                                      return_inverse=True)
+            categories[name] = tuple(labels.tolist())
+            data[name] = codes.astype(np.int16).reshape(size)
+
+        data['name'] = np.array(columns['name'], dtype=object).reshape(size)
+        for name in _REQUIRED_INT_FIELDS:
+            data[name] = np.fromiter(columns[name], dtype=np.int64, count=size)
+        for name in _FLOAT_FIELDS + tuple(f for f in _INT_FIELDS
+                                          if f not in _REQUIRED_INT_FIELDS):
+            data[name] = np.fromiter(
+                (np.nan if value is None else value for value in columns[name]),
+                dtype=float, count=size)
+
+        table = cls(data, categories)
+        table._validate()
+        return table
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'GearTable':
+        """Table à partir de dictionnaires au format de GearFactory.from_dict"""
+        types, params = [], []
+        for record in records:
+            gear_type, params_dict = GearFactory.split_config(record)
+            types.append(gear_type)
+            params.append(GearParams(**params_dict))
+        return cls.from_params(types, params)
+
+    @classmethod
+    def from_gears(cls, gears: Iterable[Gear]) -> 'GearTable':
+        """Table à partir d'objets Gear (types lus dans le registre)"""
+        gears = list(gears)
+        return cls.from_params([GearFactory.get_type_name(g) for g in gears],
+                               [g.params for g in gears])
+
+    @classmethod
+    def load(cls, source, format: Optional[str] = None,
+             chunk_size: int = 10_000,
+             strict: bool = False,
+             rules: bool = False) -> Tuple['GearTable', List[Dict[str, Any]]]:
+        """
+        Charger un catalogue JSONL/CSV en flux (voir BulkLoader)
+
+        Avec rules, les lignes en erreur selon RuleEngine sont écartées.
+
+        Seules les colonnes sont conservées : la mémoire crête reste de
+        l'ordre d'un bloc en plus de la table.
+
+        Returns:
+            (table des lignes valides, enregistrements d'erreur)
+        """
+        from .bulk_loader import BulkLoader
+
+        tables, errors = [], []
+        for chunk in BulkLoader._chunks(source, format, chunk_size):
+            _, types, columns, chunk_errors = BulkLoader.parse_chunk(
+                chunk, strict, rules=rules)
+            errors.extend(chunk_errors)
+            if types:
+                tables.append(cls.from_columns(types, columns))
+        return cls.concat(tables), errors
+
+    @classmethod
+    def concat(cls, tables: Sequence['GearTable']) -> 'GearTable':
+        """Concaténer des tables (catégories fusionnées)"""
+        if not tables:
+            return cls.from_params([], [])
+        categories = {}
+        remapped = [dict(table._data) for table in tables]
+        for name in CATEGORY_FIELDS:
+            labels = sorted(set().union(*(t._categories[name] for t in tables)))
+            categories[name] = tuple(labels)
+            lookup = {label: code for code, label in enumerate(labels)}
+            for data, table in zip(remapped, tables):
+                mapping = np.array([lookup[label] for label in table._categories[name]],
+                                   dtype=np.int16)
+                data[name] = mapping[table._data[name]] if len(mapping) else table._data[name]
+        data = {name: np.concatenate([d[name] for d in remapped]) for name in tables[0]._data}
+        return cls(data, categories)
+
+    def _validate(self):
+        """Contrôles de GearParams.validate() sur toutes les lignes"""
+        types = self.column('gear_type')
+        # Les types hors noyau reçoivent les contrôles communs
+        kernel_types = np.where(np.isin(types, list(TYPE_CODES)), types, 'spur')
+        errors = GearKernel.row_errors(
+            kernel_types.astype(str) if len(types) else np.zeros(0, dtype=np.int8),
+            self._data['module'], self._data['teeth'],
+            self._data['pressure_angle'], self._data['rolling_circle_ratio'],
+        )
+        for index, message in enumerate(errors):
+            if message is not None:
+                raise ValueError(f"{message} (ligne {index}, '{self._data['name'][index]}')")
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._data['name'])
+
+    @property
+    def columns(self) -> List[str]:
+        """Colonnes de paramètres"""
+        return list(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les colonnes (chaînes de noms comprises)"""
+        total = sum(values.nbytes for values in self._data.values())
+        total += sum(len(name) for name in self._data['name'])
+        if self._derived is not None:
+            total += sum(values.nbytes for values in self._derived.values())
+        return total
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Colonne de paramètres ou colonne dérivée (pitch_diameter, ...)
+
+        Les catégories sont restituées en tableau de noms.
+        """
+        if name in CATEGORY_FIELDS:
+            labels = np.array(self._categories[name] or ('',), dtype=object)
+            return labels[self._data[name]]
+        if name in self._data:
+            return self._data[name]
+        return self._derived_column(name)
+
+    def params(self, index: int) -> GearParams:
+        """GearParams d'une ligne"""
+        index = self._index(index)
+        values = {}
+        for name in GearParams.field_names():
+            value = self._data[name][index] if name not in CATEGORY_FIELDS else None
+            if name == 'material':
+                value = self._categories['material'][self._data['material'][index]]
+            elif name == 'name':
+                value = str(value)
+            elif name in _REQUIRED_INT_FIELDS:
+                value = int(value)
+            elif np.isnan(value):
+                value = _PARAM_DEFAULTS[name]
+            elif name in _INT_FIELDS:
+                value = int(value)
+            else:
+                value = float(value)
+            values[name] = value
+        return GearParams(**values)
+
+    def gear_type(self, index: int) -> str:
+        """Type d'une ligne"""
+        return self._categories['gear_type'][self._data['gear_type'][self._index(index)]]
+
+    def gear(self, index: int) -> Gear:
+        """Construire l'objet Gear d'une ligne (GearFactory, cache compris)"""
+        return GearFactory.create_gear(self.gear_type(index), self.params(index))
+
+    def info(self, index: int) -> Dict[str, Any]:
+        """get_info() d'une ligne, sans objet Gear pour les types du noyau"""
+        index = self._index(index)
+        gear_type = self.gear_type(index)
+        if gear_type in TYPE_CODES:
+            return GearKernel.row_info(self._kernel_columns(), index,
+                                       str(self._data['name'][index]))
+        return GearFactory.get_info(self.gear(index))
+
+    def __getitem__(self, key) -> Union[Gear, np.ndarray, 'GearTable']:
+        """
+        table[i] -> Gear ; table['colonne'] -> tableau ;
+        table[tranche | masque | indices] -> GearTable
+        """
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, (int, np.integer)):
+            return self.gear(key)
+        return self.take(key)
+
+    def __iter__(self) -> Iterator[Gear]:
+        for index in range(len(self)):
+            yield self.gear(index)
+
+    def _index(self, index: int) -> int:
+        size = len(self)
+        if not -size <= index < size:
+            raise IndexError(f"Ligne {index} hors de la table ({size} lignes)")
+        return int(index) % size
+
+    # ------------------------------------------------------------------
+    # Sélection
+    # ------------------------------------------------------------------
+
+    def take(self, selection) -> 'GearTable':
+        """Sous-table (tranche, masque booléen ou indices)"""
+        if not isinstance(selection, slice):
+            selection = np.asarray(selection)
+            if selection.dtype == bool and selection.shape != (len(self),):
+                raise ValueError(f"Masque de {selection.shape} pour {len(self)} lignes")
+        data = {name: values[selection] for name, values in self._data.items()}
+        derived = None if self._derived is None else \
+            {name: values[selection] for name, values in self._derived.items()}
+        table = GearTable(data, self._categories)
+        table._derived = derived
+        return table
+
+    def filter(self, mask=None, **equals) -> 'GearTable':
+        """
+        Lignes vérifiant un masque et des égalités de colonnes
+
+        Exemple: table.filter(table['module'] >= 2, gear_type='spur')
+        """
+        keep = np.ones(len(self), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        for name, value in equals.items():
+            if name in CATEGORY_FIELDS:
+                labels = self._categories[name]
+                if value not in labels:
+                    keep = np.zeros(len(self), dtype=bool)
+                    continue
+                keep = keep & (self._data[name] == labels.index(value))
+            else:
+                keep = keep & (self.column(name) == value)
+        return self.take(keep)
+
+    def sort(self, by: Union[str, Sequence[str]], descending: bool = False) -> 'GearTable':
+        """Trier (stable) sur une ou plusieurs colonnes, la première prioritaire"""
+        keys = [by] if isinstance(by, str) else list(by)
+        order = np.lexsort([self.column(name) if name not in CATEGORY_FIELDS
+                            else self.column(name).astype(str)
+                            for name in reversed(keys)])
+        if descending:
+            order = order[::-1]
+        return self.take(order)
+
+    # ------------------------------------------------------------------
+    # Colonnes dérivées
+    # ------------------------------------------------------------------
+
+    def _kernel_columns(self) -> Dict[str, np.ndarray]:
+        """Colonnes GearKernel de toute la table (NaN pour les types hors noyau)"""
+        if self._derived is None:
+            types = self.column('gear_type')
+            in_kernel = np.isin(types, list(TYPE_CODES)) if len(self) else \
+                np.zeros(0, dtype=bool)
+            optional = {name: self._data[name] for name in
+                        ('pitch_angle', 'shaft_angle', 'mate_teeth', 'leads',
+                         'rolling_circle_ratio')}
+            columns = GearKernel.compute(
+                np.where(in_kernel, types, 'spur').astype(str) if len(self)
+                else np.zeros(0, dtype=np.int8),
+                self._data['module'], self._data['teeth'],
+                pressure_angle=self._data['pressure_angle'],
+                helix_angle=self._data['helix_angle'],
+                profile_shift=self._data['profile_shift'],
+                face_width=self._data['face_width'],
+                **optional,
+            )
+            if not in_kernel.all():
+                # Copies : certaines colonnes partagent la mémoire de self._data
+                columns = {name: np.where(in_kernel, values, np.nan)
+                           if values.dtype.kind == 'f' else values
+                           for name, values in columns.items()}
+            self._derived = columns
+        return self._derived
+
+    def _derived_column(self, name: str) -> np.ndarray:
+        columns = self._kernel_columns()
+        if name not in columns:
+            raise KeyError(f"Colonne '{name}' inconnue")
+        values = columns[name]
+        others = np.flatnonzero(~np.isin(self.column('gear_type'), list(TYPE_CODES)))
+        if len(others) and values.dtype.kind == 'f':
+            # Types enregistrés hors noyau : valeurs lues sur les objets Gear
+            values = values.copy()
+            for index in others:
+                value = GearFactory.get_info(self.gear(index)).get(name)
+                values[index] = np.nan if value is None else value
+        return values
+
+    def __repr__(self) -> str:
+        types = ', '.join(self._categories['gear_type'])
+        return f"GearTable({len(self)} engrenages: {types})"
@@ -0,0 +1,427 @@
+"""
+Modèle de boîte de vitesses à étages multiples (graphe d'engrenages)
+
+Les engrenages sont des nœuds montés sur des arbres ; deux engrenages
+d'un même arbre tournent ensemble (étage composé), un arbre portant un
+seul engrenage engrené deux fois est un pignon fou. Les engrènements
+sont les arêtes. À partir de l'arbre d'entrée (vitesse et couple), un
+parcours en largeur propage vitesse, couple, rendement cumulé et inertie
+ramenée à l'entrée : chaque arbre et chaque engrènement est visité une
+fois.
+
+Les résultats sont conservés ; la modification d'un engrenage ne
+recalcule que les arbres en aval de ses engrènements (sous-arbre du
+parcours), et l'inertie de son propre arbre.
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .base_gear import Gear
+from .gear_kernel import kernel_type
+from .rule_engine import COMPATIBLE_PAIRS
+from standards.iso_6336 import ISO6336
+
+# Rendement par engrènement (hors vis sans fin)
+MESH_EFFICIENCY = {
+    'spur': 0.99,
+    'helical': 0.985,
+    'cycloidal': 0.98,
+    'bevel': 0.98,
+    'internal': 0.995,
+}
+
+# Coefficient de frottement utilisé pour WormGear.efficiency
+WORM_FRICTION = 0.05
+
+# Engrènements extérieurs à axes parallèles : inversion du sens de rotation
+_REVERSING = {'spur', 'helical', 'cycloidal'}
+
+# Tolérance relative sur les vitesses d'une boucle d'engrènements
+_LOOP_TOLERANCE = 1e-9
+
+
+@dataclass
+class _Mesh:
+    """Engrènement entre deux engrenages nommés"""
+    first: str
+    second: str
+    efficiency: Optional[float] = None
+
+
+class Gearbox:
+    """Graphe arbres / engrenages / engrènements avec propagation en cache"""
+
+    def __init__(self):
+        self._shaft_inertia: Dict[str, float] = {}
+        self._shaft_gears: Dict[str, List[str]] = {}
+        self._gears: Dict[str, Gear] = {}
+        self._gear_shaft: Dict[str, str] = {}
+        self._gear_inertia: Dict[str, Optional[float]] = {}
+        self._meshes: List[_Mesh] = []
+        self._gear_meshes: Dict[str, List[int]] = {}
+        self._input: Optional[Tuple[str, float, float]] = None
+
+        # Parcours : arête d'arrivée et enfants de chaque arbre atteint
+        self._parent: Dict[str, Optional[Tuple[int, str, str]]] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._depth: Dict[str, int] = {}
+        self._loops: List[int] = []
+
+        self._results: Dict[str, Dict[str, float]] = {}
+        self._inertia: Dict[str, float] = {}
+        self._total_inertia = 0.0
+        self._stale = True
+        self._dirty_shafts: Set[str] = set()
+        self._dirty_inertia: Set[str] = set()
+        self.evaluations = 0
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def add_shaft(self, name: str, inertia: float = 0.0):
+        """Ajouter un arbre (inertie propre en kg·m², hors engrenages)"""
+        if name in self._shaft_inertia:
+            raise ValueError(f"Arbre '{name}' déjà défini")
+        if inertia < 0:
+            raise ValueError("L'inertie doit être positive ou nulle")
+        self._shaft_inertia[name] = float(inertia)
+        self._shaft_gears[name] = []
+        self._stale = True
+
+    def add_gear(self, name: str, gear: Gear, shaft: str,
+                 inertia: Optional[float] = None):
+        """
+        Monter un engrenage sur un arbre (créé au besoin)
+
+        Args:
+            inertia: inertie en kg·m² (par défaut calculée, voir gear_inertia)
+        """
+        if name in self._gears:
+            raise ValueError(f"Engrenage '{name}' déjà défini")
+        gear_type = kernel_type(gear)
+        if gear_type is None or gear_type == 'rack':
+            raise ValueError(
+                f"{type(gear).__name__} ne peut pas être monté sur un arbre tournant"
+            )
+        if shaft not in self._shaft_inertia:
+            self.add_shaft(shaft)
+        self._gears[name] = gear
+        self._gear_shaft[name] = shaft
+        self._gear_inertia[name] = inertia
+        self._gear_meshes[name] = []
+        self._shaft_gears[shaft].append(name)
+        self._stale = True
+
+    def add_mesh(self, first: str, second: str, efficiency: Optional[float] = None):
+        """
+        Engrener deux engrenages montés sur des arbres différents
+
+        Args:
+            efficiency: rendement imposé (par défaut selon les types,
+                WormGear.efficiency pour une vis sans fin)
+        """
+        for name in (first, second):
+            if name not in self._gears:
+                raise KeyError(f"Engrenage '{name}' inconnu")
+        if self._gear_shaft[first] == self._gear_shaft[second]:
+            raise ValueError("Deux engrenages d'un même arbre ne peuvent pas s'engrener")
+        if efficiency is not None and not 0 < efficiency <= 1:
+            raise ValueError("Le rendement doit être dans ]0, 1]")
+        self._check_pair(self._gears[first], self._gears[second])
+        self._meshes.append(_Mesh(first, second, efficiency))
+        index = len(self._meshes) - 1
+        self._gear_meshes[first].append(index)
+        self._gear_meshes[second].append(index)
+        self._stale = True
+
+    def set_input(self, shaft: str, speed: float, torque: float):
+        """Arbre moteur : vitesse (tr/min) et couple (N·m)"""
+        if shaft not in self._shaft_inertia:
+            raise KeyError(f"Arbre '{shaft}' inconnu")
+        if self._input is not None and self._input[0] == shaft and not self._stale:
+            # Même topologie : seules les valeurs changent
+            self._dirty_shafts.add(shaft)
+        else:
+            self._stale = True
+        self._input = (shaft, float(speed), float(torque))
+
+    @staticmethod
+    def _check_pair(first: Gear, second: Gear):
+        types = (kernel_type(first), kernel_type(second))
+        if types not in COMPATIBLE_PAIRS and types[::-1] not in COMPATIBLE_PAIRS:
+            raise ValueError(
+                f"{type(first).__name__} et {type(second).__name__} ne peuvent pas s'engrener"
+            )
+        if abs(first.params.module - second.params.module) > 0.001:
+            raise ValueError("Les modules doivent être identiques")
+
+    # ------------------------------------------------------------------
+    # Modification incrémentale
+    # ------------------------------------------------------------------
+
+    def update_gear(self, name: str, **changes) -> Gear:
+        """
+        Remplacer un engrenage par une copie aux paramètres modifiés
+
+        La copie (Gear.derive) garde les arguments propres au type, comme
+        le diamètre de vis, et l'inertie imposée est conservée.
+        """
+        return self.replace_gear(name, self._gears[name].derive(**changes))
+
+    def replace_gear(self, name: str, gear: Gear,
+                     inertia: Optional[float] = None) -> Gear:
+        """
+        Remplacer un engrenage sans changer la topologie
+
+        Seuls les arbres en aval de ses engrènements sont recalculés.
+
+        Args:
+            inertia: nouvelle inertie imposée en kg·m² (par défaut,
+                l'inertie imposée au montage est conservée)
+        """
+        if name not in self._gears:
+            raise KeyError(f"Engrenage '{name}' inconnu")
+        for index in self._gear_meshes[name]:
+            mesh = self._meshes[index]
+            other = mesh.second if mesh.first == name else mesh.first
+            self._check_pair(gear, self._gears[other])
+        if kernel_type(gear) != kernel_type(self._gears[name]):
+            self._stale = True
+        self._gears[name] = gear
+        if inertia is not None:
+            self._gear_inertia[name] = inertia
+        if self._stale:
+            return gear
+
+        shaft = self._gear_shaft[name]
+        self._dirty_inertia.add(shaft)
+        for index in self._gear_meshes[name]:
+            mesh = self._meshes[index]
+            for candidate in (self._gear_shaft[mesh.first], self._gear_shaft[mesh.second]):
+                parent = self._parent.get(candidate)
+                if parent is not None and parent[0] == index:
+                    self._dirty_shafts.add(candidate)
+        return gear
+
+    # ------------------------------------------------------------------
+    # Résultats
+    # ------------------------------------------------------------------
+
+    def solve(self) -> Dict[str, Dict[str, float]]:
+        """
+        Propager depuis l'arbre d'entrée (recalcul limité aux éléments modifiés)
+
+        Returns:
+            {arbre: {'speed', 'torque', 'power', 'efficiency', 'ratio',
+                     'inertia', 'reflected_inertia'}} pour les arbres reliés
+        """
+        if self._input is None:
+            raise ValueError("Arbre d'entrée non défini (set_input)")
+        if self._stale:
+            self._rebuild()
+        else:
+            self._refresh()
+        return self._results
+
+    def shaft(self, name: str) -> Dict[str, float]:
+        """Résultats d'un arbre"""
+        results = self.solve()
+        if name not in results:
+            raise KeyError(f"Arbre '{name}' non relié à l'arbre d'entrée")
+        return results[name]
+
+    def reflected_inertia(self) -> float:
+        """Inertie totale ramenée à l'arbre d'entrée (kg·m²)"""
+        self.solve()
+        return self._total_inertia
+
+    @staticmethod
+    def gear_inertia(gear: Gear) -> float:
+        """
+        Inertie d'un engrenage plein (disque au diamètre primitif) en kg·m²
+
+        Couronne intérieure : anneau entre le cercle de tête et la jante.
+        """
+        density = ISO6336.material(gear.params.material).get('density', 7850.0)
+        width = gear.params.face_width / 1000
+        outer = gear.pitch_diameter / 1000
+        inner = 0.0
+        if kernel_type(gear) == 'internal':
+            inner = gear.outside_diameter / 1000
+            outer = gear.rim_diameter / 1000
+        return density * math.pi * width * (outer**4 - inner**4) / 32
+
+    def _shaft_inertia_value(self, shaft: str) -> float:
+        total = self._shaft_inertia[shaft]
+        for name in self._shaft_gears[shaft]:
+            inertia = self._gear_inertia[name]
+            total += self.gear_inertia(self._gears[name]) if inertia is None else inertia
+        return total
+
+    def _transfer(self, index: int, driver: str, driven: str) -> Tuple[float, float]:
+        """Rapport de vitesse ω_mené / ω_menant et rendement d'un engrènement"""
+        mesh = self._meshes[index]
+        gear, other = self._gears[driver], self._gears[driven]
+        kinds = (kernel_type(gear), kernel_type(other))
+
+        if kinds[0] == 'worm':
+            ratio = gear.leads / other.params.teeth
+            efficiency = gear.efficiency(WORM_FRICTION)
+        elif kinds[1] == 'worm':
+            # Roue menant la vis : rendement inverse (nul si irréversible)
+            ratio = gear.params.teeth / other.leads
+            efficiency = self._worm_reverse_efficiency(other)
+        else:
+            ratio = gear.params.teeth / other.params.teeth
+            if 'internal' in kinds:
+                efficiency = MESH_EFFICIENCY['internal']
+            else:
+                efficiency = MESH_EFFICIENCY.get(kinds[0], MESH_EFFICIENCY['spur'])
+                if kinds[0] in _REVERSING:
+                    ratio = -ratio
+        if mesh.efficiency is not None:
+            efficiency = mesh.efficiency
+        return ratio, efficiency
+
+    @staticmethod
+    def _worm_reverse_efficiency(worm: Gear,
+                                 friction_coefficient: float = WORM_FRICTION) -> float:
+        """Rendement roue -> vis (même modèle que WormGear.efficiency)"""
+        lead_angle = math.radians(worm.lead_angle)
+        mu = friction_coefficient
+        efficiency = (math.cos(lead_angle) - mu / math.tan(lead_angle)) / \
+            (math.cos(lead_angle) + mu * math.tan(lead_angle))
+        return max(0.0, min(1.0, efficiency))
+
+    # ------------------------------------------------------------------
+    # Propagation
+    # ------------------------------------------------------------------
+
+    def _rebuild(self):
+        """Parcours complet : arbre de propagation, valeurs et inerties"""
+        shaft, speed, torque = self._input
+        self._parent = {shaft: None}
+        self._children = {shaft: []}
+        self._depth = {shaft: 0}
+        self._loops = []
+        self._results = {}
+        self._inertia = {}
+        self._total_inertia = 0.0
+
+        self._set_values(shaft, speed, torque, 1.0)
+        queue = [shaft]
+        for current in queue:
+            for name in self._shaft_gears[current]:
+                for index in self._gear_meshes[name]:
+                    mesh = self._meshes[index]
+                    other = mesh.second if mesh.first == name else mesh.first
+                    target = self._gear_shaft[other]
+                    if target in self._parent:
+                        parent = self._parent[current]
+                        if (parent is None or parent[0] != index) and index not in self._loops:
+                            self._loops.append(index)
+                        continue
+                    self._parent[target] = (index, name, other)
+                    self._children[target] = []
+                    self._children[current].append(target)
+                    self._depth[target] = self._depth[current] + 1
+                    self._propagate(target)
+                    queue.append(target)
+
+        for current in queue:
+            self._set_inertia(current)
+        self._check_loops()
+        self._stale = False
+        self._dirty_shafts.clear()
+        self._dirty_inertia.clear()
+
+    def _refresh(self):
+        """Recalcul des sous-arbres et inerties invalidés"""
+        if not self._dirty_shafts and not self._dirty_inertia:
+            return
+        shaft, speed, torque = self._input
+        done: Set[str] = set()
+        roots = [name for name in self._dirty_shafts if name in self._parent]
+        for root in sorted(roots, key=self._depth.get):
+            if root in done:
+                continue
+            queue = [root]
+            for current in queue:
+                if current == shaft:
+                    self._set_values(shaft, speed, torque, 1.0)
+                else:
+                    self._propagate(current)
+                done.add(current)
+                queue.extend(self._children[current])
+
+        for current in done | self._dirty_inertia:
+            if current in self._parent:
+                self._set_inertia(current)
+        self._dirty_shafts.clear()
+        self._dirty_inertia.clear()
+        self._check_loops()
+
+    def _propagate(self, shaft: str):
+        """Valeurs d'un arbre à partir de celles de son arbre parent"""
+        index, driver, driven = self._parent[shaft]
+        source = self._results[self._gear_shaft[driver]]
+        ratio, efficiency = self._transfer(index, driver, driven)
+        self._set_values(shaft, source['speed'] * ratio,
+                         source['torque'] * efficiency / ratio,
+                         source['efficiency'] * efficiency)
+
+    def _set_values(self, shaft: str, speed: float, torque: float, efficiency: float):
+        input_speed = self._input[1]
+        self._results[shaft] = {
+            'speed': speed,
+            'torque': torque,
+            'power': torque * speed * 2 * math.pi / 60,
+            'efficiency': efficiency,
+            'ratio': input_speed / speed if speed else math.inf,
+            'inertia': self._results.get(shaft, {}).get('inertia', 0.0),
+            'reflected_inertia': 0.0,
+        }
+        self.evaluations += 1
+
+    def _set_inertia(self, shaft: str):
+        """Inertie de l'arbre et inertie ramenée (mise à jour du total)"""
+        result = self._results[shaft]
+        inertia = self._shaft_inertia_value(shaft)
+        input_speed = self._input[1]
+        scale = (result['speed'] / input_speed) ** 2 if input_speed else 0.0
+        reflected = inertia * scale
+        self._total_inertia += reflected - self._inertia.get(shaft, 0.0)
+        self._inertia[shaft] = reflected
+        result['inertia'] = inertia
+        result['reflected_inertia'] = reflected
+
+    def _check_loops(self):
+        """Les engrènements hors parcours doivent être cinématiquement compatibles"""
+        for index in self._loops:
+            mesh = self._meshes[index]
+            first, second = self._gear_shaft[mesh.first], self._gear_shaft[mesh.second]
+            ratio, _ = self._transfer(index, mesh.first, mesh.second)
+            expected = self._results[first]['speed'] * ratio
+            actual = self._results[second]['speed']
+            if abs(expected - actual) > _LOOP_TOLERANCE * max(abs(expected), abs(actual), 1.0):
+                raise ValueError(
+                    f"Vitesses incompatibles entre '{first}' et '{second}' "
+                    f"({actual:.6g} != {expected:.6g} tr/min) : boucle d'engrènements bloquée"
+                )
+
+    def get_info(self) -> Dict[str, Any]:
+        """Résumé : rapport global, rendement et inertie ramenée"""
+        results = self.solve()
+        shaft = self._input[0]
+        ends = [name for name, children in self._children.items()
+                if not children and name != shaft]
+        return {
+            'input_shaft': shaft,
+            'shafts': len(self._shaft_inertia),
+            'gears': len(self._gears),
+            'meshes': len(self._meshes),
+            'outputs': {name: results[name] for name in ends},
+            'reflected_inertia': self._total_inertia,
+        }
@@ -0,0 +1,402 @@
+"""
+Index de compatibilité d'engrènement
+
+Répond à « quels engrenages du catalogue s'engrènent avec celui-ci ? »
+sans parcourir toutes les paires. Les engrenages sont regroupés en seaux
+par (type, module, angle de pression, angle d'hélice) ; pour un engrenage
+donné, seuls les seaux des types compatibles (méthodes mesh_with, voir
+COMPATIBLE_PAIRS) de même module, même angle de pression et hélice de sens
+opposé sont consultés. Dans un seau, les lignes sont triées par nombre de
+dents (filets pour une vis) : les fenêtres de rapport et d'entraxe
+deviennent des intervalles de dents (recherche dichotomique), puis un
+filtre exact est appliqué au seul intervalle retenu.
+
+Les insertions sont incrémentales : les nouvelles lignes sont mises en
+attente dans leur seau et fusionnées à la première requête qui le lit.
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base_gear import GearParams
+from .gear_kernel import GearKernel, TYPE_CODES, type_codes
+from .rule_engine import COMPATIBLE_PAIRS
+
+# Pas des clés (mêmes tolérances que les règles de paire)
+MODULE_STEP = 1e-3
+ANGLE_STEP = 0.1
+
+# Tolérance sur la somme des angles primitifs des engrenages coniques
+BEVEL_ANGLE_TOLERANCE = 0.1
+
+# Écart admissible entre cercles roulants de deux engrenages cycloïdaux (mm)
+ROLLING_RADIUS_TOLERANCE = 1e-3
+
+# Colonnes conservées pour le filtre exact
+_COLUMNS = ('module', 'pressure_angle', 'helix_angle', 'teeth', 'ratio_teeth',
+            'pitch_diameter', 'cone_distance', 'pitch_angle', 'rolling_radius')
+
+# Largeur en bits des champs de la clé de seau (module, angle de pression, hélice)
+_KEY_BITS = (24, 12, 12)
+
+# Types dont le diamètre primitif est proportionnel au nombre de dents
+_PROPORTIONAL = {TYPE_CODES[name] for name in
+                 ('spur', 'helical', 'bevel', 'internal', 'cycloidal')}
+
+_MATE_TYPES = {
+    code: tuple(sorted({TYPE_CODES[b] for a, b in COMPATIBLE_PAIRS if TYPE_CODES[a] == code}
+                       | {TYPE_CODES[a] for a, b in COMPATIBLE_PAIRS if TYPE_CODES[b] == code}))
+    for code in TYPE_CODES.values()
+}
+
+Window = Optional[Tuple[float, float]]
+
+
+class _Bucket:
+    """Lignes d'une même clé, triées par dents du rapport"""
+
+    __slots__ = ('teeth', 'ids', 'pending', 'scale_min', 'scale_max')
+
+    def __init__(self):
+        self.teeth = np.empty(0, dtype=float)
+        self.ids = np.empty(0, dtype=np.int64)
+        self.pending: List[np.ndarray] = []
+        # Bornes du rapport diamètre primitif / dents
+        self.scale_min = np.inf
+        self.scale_max = -np.inf
+
+    def add(self, ids: np.ndarray, scale: np.ndarray):
+        self.pending.append(ids)
+        finite = scale[np.isfinite(scale)]
+        if len(finite):
+            self.scale_min = min(self.scale_min, float(finite.min()))
+            self.scale_max = max(self.scale_max, float(finite.max()))
+
+    def flush(self, teeth: np.ndarray):
+        """Fusionner les lignes en attente (teeth : colonne de tri globale)"""
+        if not self.pending:
+            return
+        ids = np.concatenate([self.ids] + self.pending)
+        self.pending = []
+        order = np.argsort(teeth[ids], kind='stable')
+        self.ids = ids[order]
+        self.teeth = teeth[self.ids]
+
+    def __len__(self) -> int:
+        return len(self.ids) + sum(len(ids) for ids in self.pending)
+
+
+class MateIndex:
+    """Index des engrenages par compatibilité d'engrènement"""
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._codes = np.empty(capacity, dtype=np.int8)
+        self._columns = {name: np.empty(capacity, dtype=float) for name in _COLUMNS}
+        self._buckets: Dict[int, _Bucket] = {}
+
+    @classmethod
+    def from_table(cls, table) -> 'MateIndex':
+        """
+        Indexer une GearTable ; les identifiants sont les numéros de ligne
+
+        Les types hors noyau (enregistrés dans GearFactory sans règles
+        d'engrènement connues) sont conservés mais jamais proposés.
+        """
+        index = cls(capacity=max(len(table), 1))
+        if not len(table):
+            return index
+        types = table.column('gear_type')
+        in_kernel = np.isin(types, list(TYPE_CODES))
+        codes = np.full(len(table), -1, dtype=np.int8)
+        codes[in_kernel] = type_codes(types[in_kernel])
+        derived = table._kernel_columns()
+        index._append(codes, {
+            'module': table.column('module'),
+            'teeth': table.column('teeth'),
+            **{name: derived[name] for name in (
+                'pressure_angle', 'helix_angle', 'leads', 'pitch_diameter',
+                'cone_distance', 'pitch_angle', 'rolling_radius')}})
+        return index
+
+    # ------------------------------------------------------------------
+    # Insertion
+    # ------------------------------------------------------------------
+
+    def insert(self, gear_type: str, params: GearParams) -> int:
+        """Ajouter un engrenage ; retourne son identifiant"""
+        return int(self.insert_many([gear_type], [params])[0])
+
+    def insert_many(self, gear_types: Sequence[str],
+                    params: Sequence[GearParams]) -> np.ndarray:
+        """Ajouter des engrenages ; retourne leurs identifiants"""
+        if len(gear_types) != len(params):
+            raise ValueError(
+                f"{len(gear_types)} types pour {len(params)} jeux de paramètres"
+            )
+        if not params:
+            return np.empty(0, dtype=np.int64)
+
+        def field(name):
+            return [getattr(p, name) for p in params]
+
+        return self.insert_columns({
+            'gear_type': list(gear_types),
+            **{name: field(name) for name in (
+                'module', 'teeth', 'pressure_angle', 'helix_angle', 'pitch_angle',
+                'shaft_angle', 'mate_teeth', 'leads', 'rolling_circle_ratio')},
+        })
+
+    def insert_columns(self, columns: Dict[str, Any]) -> np.ndarray:
+        """
+        Ajouter des engrenages donnés en colonnes (clés de GearKernel.compute)
+
+        Returns:
+            Identifiants attribués (consécutifs)
+        """
+        derived = GearKernel.compute(
+            columns['gear_type'], columns['module'], columns['teeth'],
+            pressure_angle=columns.get('pressure_angle', 20.0),
+            helix_angle=columns.get('helix_angle', 0.0),
+            pitch_angle=columns.get('pitch_angle'),
+            shaft_angle=columns.get('shaft_angle'),
+            mate_teeth=columns.get('mate_teeth'),
+            leads=columns.get('leads'),
+            rolling_circle_ratio=columns.get('rolling_circle_ratio'),
+        )
+        return self._append(derived['type_code'], {
+            name: derived[name] for name in (
+                'module', 'pressure_angle', 'helix_angle', 'teeth', 'leads',
+                'pitch_diameter', 'cone_distance', 'pitch_angle', 'rolling_radius')})
+
+    def _append(self, codes: np.ndarray, values: Dict[str, np.ndarray]) -> np.ndarray:
+        count = len(codes)
+        start = self._size
+        self._reserve(start + count)
+        ids = np.arange(start, start + count, dtype=np.int64)
+        values = {name: np.asarray(column, dtype=float) for name, column in values.items()}
+
+        # Dents du rapport : filets pour une vis, indéfini pour une crémaillère
+        ratio_teeth = np.where(codes == TYPE_CODES['worm'], values['leads'], values['teeth'])
+        values['ratio_teeth'] = np.where(codes == TYPE_CODES['rack'], np.nan, ratio_teeth)
+
+        self._codes[start:start + count] = codes
+        for name in _COLUMNS:
+            self._columns[name][start:start + count] = values[name]
+        self._size += count
+
+        # Regroupement par seau : tri d'une clé entière par ligne
+        indexed = np.flatnonzero(codes >= 0)
+        keys = self._bucket_key(codes[indexed], values['module'][indexed],
+                                values['pressure_angle'][indexed],
+                                values['helix_angle'][indexed])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = values['pitch_diameter'][indexed] / values['teeth'][indexed]
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else []
+        for first, last in zip(starts, list(starts[1:]) + [len(keys)]):
+            key = int(keys[first])
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket()
+            rows = order[first:last]
+            bucket.add(ids[indexed[rows]], scale[rows])
+        return ids
+
+    @staticmethod
+    def _bucket_key(codes, module, pressure_angle, helix_angle) -> np.ndarray:
+        """Clé de seau entière : type, module, angles de pression et d'hélice arrondis"""
+        fields = (np.rint(np.asarray(module, dtype=float) / MODULE_STEP),
+                  np.rint(np.asarray(pressure_angle, dtype=float) / ANGLE_STEP),
+                  np.rint(np.asarray(helix_angle, dtype=float) / ANGLE_STEP)
+                  + (1 << (_KEY_BITS[2] - 1)))
+        key = np.asarray(codes, dtype=np.int64)
+        for bits, values in zip(_KEY_BITS, fields):
+            key = (key << bits) | (values.astype(np.int64) & ((1 << bits) - 1))
+        return key
+
+    def _reserve(self, size: int):
+        capacity = len(self._codes)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        codes = np.empty(capacity, dtype=np.int8)
+        codes[:self._size] = self._codes[:self._size]
+        self._codes = codes
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=float)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def mates(self, gear_type: str, params: GearParams,
+              ratio: Window = None,
+              center_distance: Window = None) -> Dict[str, np.ndarray]:
+        """
+        Engrenages de l'index qui s'engrènent avec un engrenage donné
+
+        Args:
+            ratio: fenêtre (min, max) du rapport z_conjugué / z (filets pour
+                une vis ; une crémaillère n'a pas de rapport)
+            center_distance: fenêtre (min, max) d'entraxe en mm (calculé
+                comme par mesh_with)
+
+        Returns:
+            {'index', 'ratio', 'center_distance'} triés par entraxe
+        """
+        probe = MateIndex(capacity=1)
+        probe.insert(gear_type, params)
+        return self._search(probe._query(0), ratio, center_distance)
+
+    def mates_of(self, index: int, ratio: Window = None,
+                 center_distance: Window = None) -> Dict[str, np.ndarray]:
+        """Comme mates, pour un engrenage déjà indexé (exclu du résultat)"""
+        if not 0 <= index < self._size:
+            raise IndexError(f"Identifiant {index} hors de l'index ({self._size})")
+        result = self._search(self._query(index), ratio, center_distance)
+        keep = result['index'] != index
+        return {name: values[keep] for name, values in result.items()}
+
+    def _query(self, index: int) -> Dict[str, float]:
+        query = {name: float(column[index]) for name, column in self._columns.items()}
+        query['code'] = int(self._codes[index])
+        return query
+
+    def _search(self, query: Dict[str, float], ratio: Window,
+                center_distance: Window) -> Dict[str, np.ndarray]:
+        parts = []
+        code = query['code']
+        if code >= 0:
+            for mate_code in _MATE_TYPES[code]:
+                key = int(self._bucket_key(mate_code, query['module'],
+                                           query['pressure_angle'], -query['helix_angle']))
+                bucket = self._buckets.get(key)
+                if bucket is not None and len(bucket):
+                    parts.append(self._search_bucket(query, mate_code, bucket,
+                                                     ratio, center_distance))
+        if not parts:
+            return {'index': np.empty(0, dtype=np.int64),
+                    'ratio': np.empty(0), 'center_distance': np.empty(0)}
+
+        result = {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+        order = np.lexsort((result['index'], result['center_distance']))
+        return {name: values[order] for name, values in result.items()}
+
+    @staticmethod
+    def _teeth_window(query: Dict[str, float], mate_code: int, bucket: _Bucket,
+                      ratio: Window, center_distance: Window) -> Tuple[float, float]:
+        """Intervalle de la colonne de tri du seau compatible avec les fenêtres"""
+        code = query['code']
+        low, high = -np.inf, np.inf
+
+        # Rapport : la colonne de tri est celle des dents du rapport
+        if ratio is not None:
+            if np.isnan(query['ratio_teeth']) or mate_code == TYPE_CODES['rack']:
+                return np.inf, -np.inf
+            low, high = ratio[0] * query['ratio_teeth'], ratio[1] * query['ratio_teeth']
+
+        if center_distance is None:
+            return low, high
+        c_low, c_high = 2 * center_distance[0], 2 * center_distance[1]
+        d = query['pitch_diameter']
+        if mate_code == TYPE_CODES['rack']:
+            # Entraxe fixé par la requête : tout ou rien
+            return (low, high) if c_low <= d <= c_high else (np.inf, -np.inf)
+        if mate_code not in _PROPORTIONAL:
+            return low, high
+
+        # Entraxe -> diamètre primitif du conjugué -> nombre de dents
+        if code == TYPE_CODES['rack']:
+            d_low, d_high = c_low, c_high
+        elif code == TYPE_CODES['internal']:
+            d_low, d_high = d - c_high, d - c_low
+        elif mate_code == TYPE_CODES['internal']:
+            d_low, d_high = c_low + d, c_high + d
+        elif code == TYPE_CODES['bevel']:
+            # Distance conique R = d / (2 sin δ), δ conjugué voisin de 90° - δ
+            delta = 90.0 - query['pitch_angle']
+            sines = [math.sin(math.radians(min(max(a, 0.0), 90.0)))
+                     for a in (delta - BEVEL_ANGLE_TOLERANCE, delta + BEVEL_ANGLE_TOLERANCE)]
+            d_low = 2 * (c_low - query['cone_distance']) * min(sines)
+            d_high = 2 * (c_high - query['cone_distance']) * max(sines)
+        else:
+            d_low, d_high = c_low - d, c_high - d
+        margin = 1e-9
+        return (max(low, d_low / bucket.scale_max * (1 - margin)),
+                min(high, d_high / bucket.scale_min * (1 + margin)))
+
+    def _search_bucket(self, query: Dict[str, float], mate_code: int, bucket: _Bucket,
+                       ratio: Window, center_distance: Window) -> Dict[str, np.ndarray]:
+        bucket.flush(self._columns['ratio_teeth' if mate_code == TYPE_CODES['worm']
+                                   else 'teeth'])
+        low, high = self._teeth_window(query, mate_code, bucket, ratio, center_distance)
+        start = np.searchsorted(bucket.teeth, low, side='left')
+        stop = np.searchsorted(bucket.teeth, high, side='right')
+        ids = bucket.ids[start:max(start, stop)]
+
+        columns = {name: self._columns[name][ids] for name in
+                   ('teeth', 'ratio_teeth', 'pitch_diameter', 'cone_distance', 'pitch_angle',
+                    'rolling_radius')}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pair_ratio = columns['ratio_teeth'] / query['ratio_teeth']
+        distance, valid = self._pair_geometry(query, mate_code, columns)
+
+        if ratio is not None:
+            valid &= (pair_ratio >= ratio[0]) & (pair_ratio <= ratio[1])
+        if center_distance is not None:
+            valid &= (distance >= center_distance[0]) & (distance <= center_distance[1])
+        return {'index': ids[valid], 'ratio': pair_ratio[valid],
+                'center_distance': distance[valid]}
+
+    @staticmethod
+    def _pair_geometry(query: Dict[str, float], mate_code: int,
+                       columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Entraxe (comme mesh_with) et conditions propres au couple de types"""
+        code = query['code']
+        d, mate_d = query['pitch_diameter'], columns['pitch_diameter']
+        valid = np.ones(len(mate_d), dtype=bool)
+        if code == TYPE_CODES['rack']:
+            distance = mate_d / 2
+        elif mate_code == TYPE_CODES['rack']:
+            distance = np.full(len(mate_d), d / 2)
+        elif code == TYPE_CODES['internal']:
+            # Le pignon doit avoir moins de dents que la couronne
+            distance = (d - mate_d) / 2
+            valid &= (columns['teeth'] < query['teeth']) & \
+                MateIndex._internal_profile(d, query['module'], query['pressure_angle'])
+        elif mate_code == TYPE_CODES['internal']:
+            distance = (mate_d - d) / 2
+            valid &= (columns['teeth'] > query['teeth']) & \
+                MateIndex._internal_profile(mate_d, query['module'], query['pressure_angle'])
+        elif code == TYPE_CODES['bevel']:
+            # Axes orthogonaux : somme des angles primitifs de 90°
+            distance = (query['cone_distance'] + columns['cone_distance']) / 2
+            valid &= np.abs(query['pitch_angle'] + columns['pitch_angle'] - 90) \
+                <= BEVEL_ANGLE_TOLERANCE
+        else:
+            distance = (d + mate_d) / 2
+            if code == TYPE_CODES['cycloidal']:
+                # Profils conjugués : même cercle roulant
+                valid &= np.abs(query['rolling_radius'] - columns['rolling_radius']) \
+                    <= ROLLING_RADIUS_TOLERANCE
+        return distance, valid
+
+    @staticmethod
+    def _internal_profile(pitch_diameter, module: float, pressure_angle: float):
+        """
+        Cercle de tête d'une couronne hors du cercle de base
+
+        Sinon la longueur d'action n'est pas définie et mesh_with échoue
+        (peu de dents : z < 2 / (1 - cos α)).
+        """
+        tip_radius = np.asarray(pitch_diameter) / 2 - module
+        base_radius = np.asarray(pitch_diameter) / 2 * math.cos(math.radians(pressure_angle))
+        return tip_radius >= base_radius
@@ -28,6 +28,177 @@ class GearMath:
         """Pas normal"""
         return math.pi * module
     
+    # Grandeurs scalaires par type, partagées par les classes d'engrenages
+    # (gears/*.py) et le graphe de dépendances (core.gear_graph)
+    
+    @staticmethod
+    def pitch_diameter(module: float, teeth: float) -> float:
+        """Diamètre primitif (module apparent pour une denture hélicoïdale)"""
+        return module * teeth
+    
+    @staticmethod
+    def addendum(module: float) -> float:
+        """Hauteur de tête"""
+        return module
+    
+    @staticmethod
+    def dedendum(module: float) -> float:
+        """Hauteur de pied"""
+        return 1.25 * module
+    
+    @staticmethod
+    def outside_diameter(pitch_diameter: float, addendum: float) -> float:
+        """Diamètre extérieur (denture extérieure)"""
+        return pitch_diameter + 2 * addendum
+    
+    @staticmethod
+    def root_diameter(pitch_diameter: float, dedendum: float) -> float:
+        """Diamètre de pied (denture extérieure)"""
+        return pitch_diameter - 2 * dedendum
+    
+    @staticmethod
+    def circular_pitch(module: float) -> float:
+        """Pas circonférentiel"""
+        return math.pi * module
+    
+    @staticmethod
+    def estimated_contact_ratio(teeth: float) -> float:
+        """Rapport de conduite estimé d'une denture droite"""
+        return 1.4 + teeth / 100
+    
+    @staticmethod
+    def auto_profile_shift(teeth: int, profile_shift: float,
+                           pressure_angle: float = 20.0) -> float:
+        """Déport automatique des petits pignons (sans déport imposé)"""
+        if teeth < 17 and profile_shift == 0:
+            return GearMath.profile_shift_coefficient(teeth, pressure_angle)
+        return profile_shift
+    
+    @staticmethod
+    def lead(pitch_diameter: float, helix_angle: float) -> float:
+        """Pas de l'hélice"""
+        if helix_angle == 0:
+            return float('inf')
+        return math.pi * pitch_diameter / math.tan(math.radians(helix_angle))
+    
+    @staticmethod
+    def helical_contact_ratio(teeth: float, overlap_ratio: float) -> float:
+        """Rapport de conduite total estimé (apparent + recouvrement)"""
+        return GearMath.estimated_contact_ratio(teeth) + overlap_ratio
+    
+    @staticmethod
+    def bevel_shaft_angle(shaft_angle: Optional[float]) -> float:
+        """Angle entre axes (90° par défaut)"""
+        return shaft_angle or 90.0
+    
+    @staticmethod
+    def bevel_pitch_angle(pitch_angle: Optional[float], teeth: int,
+                          mate_teeth: Optional[int]) -> float:
+        """Angle primitif donné, déduit du conjugué (axes orthogonaux), ou 45°"""
+        if pitch_angle is not None:
+            return pitch_angle
+        if mate_teeth is not None:
+            return math.degrees(math.atan(teeth / mate_teeth))
+        return 45.0
+    
+    @staticmethod
+    def back_angle(shaft_angle: float, pitch_angle: float) -> float:
+        """Angle primitif du conjugué"""
+        return shaft_angle - pitch_angle
+    
+    @staticmethod
+    def cone_distance(pitch_diameter: float, pitch_angle: float) -> float:
+        """Génératrice du cône primitif (sommet - cercle primitif)"""
+        sin_pitch = math.sin(math.radians(pitch_angle))
+        return pitch_diameter / (2 * sin_pitch) if sin_pitch > 0 else float('inf')
+    
+    @staticmethod
+    def mean_pitch_radius(pitch_diameter: float, pitch_angle: float) -> float:
+        """Rayon primitif moyen"""
+        return pitch_diameter / 2 * math.cos(math.radians(pitch_angle))
+    
+    @staticmethod
+    def bevel_outside_diameter(pitch_diameter: float, module: float,
+                               pitch_angle: float) -> float:
+        """Diamètre extérieur au grand bout"""
+        return pitch_diameter + 2 * GearMath.addendum(module) * math.cos(
+            math.radians(pitch_angle))
+    
+    @staticmethod
+    def bevel_root_diameter(pitch_diameter: float, module: float,
+                            pitch_angle: float) -> float:
+        """Diamètre de pied au grand bout"""
+        return pitch_diameter - 2 * GearMath.dedendum(module) * math.cos(
+            math.radians(pitch_angle))
+    
+    @staticmethod
+    def face_angle(pitch_angle: float, module: float, cone_distance: float) -> float:
+        """Angle de tête (primitif + angle de saillie)"""
+        return pitch_angle + math.degrees(math.atan(GearMath.addendum(module) / cone_distance))
+    
+    @staticmethod
+    def root_angle(pitch_angle: float, module: float, cone_distance: float) -> float:
+        """Angle de pied (primitif - angle de creux)"""
+        return pitch_angle - math.degrees(math.atan(GearMath.dedendum(module) / cone_distance))
+    
+    @staticmethod
+    def worm_leads(leads: Optional[int]) -> int:
+        """Nombre de filets (1 par défaut)"""
+        return leads if leads is not None else 1
+    
+    @staticmethod
+    def worm_diameter(module: float, worm_diameter: Optional[float] = None) -> float:
+        """Diamètre primitif de la vis (10 modules par défaut)"""
+        return worm_diameter or module * 10
+    
+    @staticmethod
+    def worm_lead(leads: int, axial_pitch: float) -> float:
+        """Pas de la vis"""
+        return leads * axial_pitch
+    
+    @staticmethod
+    def lead_angle(lead: float, worm_diameter: float) -> float:
+        """Angle d'hélice de la vis"""
+        return math.degrees(math.atan(lead / (math.pi * worm_diameter)))
+    
+    @staticmethod
+    def tooth_height(module: float) -> float:
+        """Hauteur totale de la dent (tête + pied)"""
+        return 2.25 * module
+    
+    @staticmethod
+    def tooth_thickness(module: float) -> float:
+        """Épaisseur de la dent sur le primitif"""
+        return math.pi * module / 2
+    
+    @staticmethod
+    def internal_profile_shift(teeth: int, profile_shift: float) -> float:
+        """Déport recommandé des petites couronnes (interférence)"""
+        return 0.5 if teeth < 32 else profile_shift
+    
+    @staticmethod
+    def internal_outside_diameter(pitch_diameter: float, addendum: float) -> float:
+        """Diamètre de tête d'une denture intérieure"""
+        return pitch_diameter - 2 * addendum
+    
+    @staticmethod
+    def internal_root_diameter(pitch_diameter: float, dedendum: float) -> float:
+        """Diamètre de pied d'une denture intérieure"""
+        return pitch_diameter + 2 * dedendum
+    
+    @staticmethod
+    def rolling_circle_ratio(ratio: Optional[float], default: float = 0.5) -> float:
+        """Rapport du cercle roulant cycloïdal, validé"""
+        ratio = default if ratio is None else ratio
+        if not 0 < ratio < 1:
+            raise ValueError(f"Le rapport du cercle roulant doit être entre 0 et 1, got {ratio}")
+        return ratio
+    
+    @staticmethod
+    def rolling_radius(rolling_circle_ratio: float, pitch_diameter: float) -> float:
+        """Rayon du cercle roulant cycloïdal"""
+        return rolling_circle_ratio * pitch_diameter / 2
+    
     @staticmethod
     def center_distance(gear1, gear2) -> float:
         """Distance entre centres"""
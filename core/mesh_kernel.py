@@ -0,0 +1,167 @@
+"""
+Analyse d'engrènement par lots sur des tableaux de paires d'engrenages
+
+Chaque paire (premier, second) reproduit premier.mesh_with(second) :
+mêmes règles de compatibilité que les
+méthodes mesh_with() des classes droites, hélicoïdales, intérieures et
+crémaillères. Les paires incompatibles sont marquées invalides (valid =
+False) et leurs résultats valent NaN au lieu de lever une exception.
+"""
+import math
+from typing import Dict, Iterator, Optional
+import numpy as np
+
+from .gear_kernel import TYPE_CODES
+
+# Tolérance sur la somme des angles d'hélice (HelicalGear.mesh_with)
+HELIX_SUM_TOLERANCE = 0.1
+
+# Nombre de paires évaluées par bloc de lignes dans all_pairs (limite la mémoire)
+CHUNK_PAIRS = 200_000
+
+# Colonnes GearKernel lues par analyze
+_ANALYZED_COLUMNS = ('type_code', 'teeth', 'module', 'pressure_angle', 'helix_angle',
+                     'face_width', 'pitch_diameter', 'outside_diameter')
+
+
+def _base_path_ratio(pd1, pd2, od1, od2, module, pressure_angle):
+    """GearMath.contact_ratio_base_path vectorisé"""
+    alpha = np.radians(pressure_angle)
+    cos_alpha = np.cos(alpha)
+    rb1 = pd1 / 2 * cos_alpha
+    rb2 = pd2 / 2 * cos_alpha
+    ra1 = od1 / 2
+    ra2 = od2 / 2
+    a = (pd1 + pd2) / 2
+    g_alpha = (np.sqrt(ra1**2 - rb1**2) +
+               np.sqrt(ra2**2 - rb2**2) -
+               a * np.sin(alpha))
+    p_b = math.pi * module * cos_alpha
+    return np.where(p_b != 0, g_alpha / p_b, 0.0)
+
+
+class MeshKernel:
+    """Calcul vectorisé des paramètres d'engrènement"""
+
+    @staticmethod
+    def analyze(first: Dict[str, np.ndarray],
+                second: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Analyser des paires alignées ligne à ligne
+
+        Args:
+            first, second: colonnes GearKernel de même longueur
+
+        Returns:
+            Colonnes center_distance, transverse_contact_ratio,
+            overlap_ratio, contact_ratio, transmission_ratio et valid
+        """
+        code1 = first['type_code']
+        code2 = second['type_code']
+        size = code1.shape[0]
+        z1, z2 = first['teeth'], second['teeth']
+        pd1, pd2 = first['pitch_diameter'], second['pitch_diameter']
+        module = first['module']
+        alpha = first['pressure_angle']
+
+        spur1 = code1 == TYPE_CODES['spur']
+        spur2 = code2 == TYPE_CODES['spur']
+        helical1 = code1 == TYPE_CODES['helical']
+        helical2 = code2 == TYPE_CODES['helical']
+        internal1 = code1 == TYPE_CODES['internal']
+        rack1 = code1 == TYPE_CODES['rack']
+
+        helix_sum = np.abs(first['helix_angle'] + second['helix_angle'])
+
+        is_spur_pair = spur1 & spur2
+        is_helical_pair = helical1 & helical2 & (helix_sum <= HELIX_SUM_TOLERANCE)
+        is_internal_pair = internal1 & spur2 & (z2 < z1)
+        is_rack_pair = rack1 & spur2
+        valid = is_spur_pair | is_helical_pair | is_internal_pair | is_rack_pair
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            transverse = _base_path_ratio(
+                pd1, pd2, first['outside_diameter'], second['outside_diameter'],
+                module, alpha
+            )
+            transverse = np.where(is_internal_pair, np.maximum(0.0, transverse), transverse)
+            transverse = np.where(is_rack_pair, 1.4 + z2 / 100, transverse)
+
+            overlap = np.where(
+                is_helical_pair,
+                first['face_width'] * np.tan(np.radians(first['helix_angle'])) /
+                (math.pi * module),
+                0.0
+            )
+
+            center_distance = (pd1 + pd2) / 2
+            center_distance = np.where(is_internal_pair, (pd1 - pd2) / 2, center_distance)
+            center_distance = np.where(is_rack_pair, pd2 / 2, center_distance)
+
+            transmission_ratio = z2 / z1
+
+        nan = np.full(size, np.nan)
+        return {
+            'center_distance': np.where(valid, center_distance, nan),
+            'transverse_contact_ratio': np.where(valid, transverse, nan),
+            'overlap_ratio': np.where(valid, overlap, nan),
+            'contact_ratio': np.where(valid, transverse + overlap, nan),
+            'transmission_ratio': np.where(valid, transmission_ratio, nan),
+            'valid': valid,
+        }
+
+    @staticmethod
+    def analyze_pairs(columns: Dict[str, np.ndarray],
+                      first_index, second_index) -> Dict[str, np.ndarray]:
+        """Analyser des paires désignées par indices dans un même catalogue"""
+        first_index = np.asarray(first_index, dtype=np.intp)
+        second_index = np.asarray(second_index, dtype=np.intp)
+        first = {key: columns[key][first_index] for key in _ANALYZED_COLUMNS}
+        second = {key: columns[key][second_index] for key in _ANALYZED_COLUMNS}
+        result = MeshKernel.analyze(first, second)
+        result['first_index'] = first_index
+        result['second_index'] = second_index
+        return result
+
+    @staticmethod
+    def iter_pairs(columns: Dict[str, np.ndarray],
+                   only_valid: bool = True,
+                   chunk_size: Optional[int] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Cribler les combinaisons ordonnées (i, j), i != j, par blocs de lignes i
+
+        Chaque bloc de chunk_size lignes (par défaut CHUNK_PAIRS paires au
+        plus) est analysé puis produit, sans masque n × n.
+        """
+        size = columns['type_code'].shape[0]
+        if chunk_size is None:
+            chunk_size = max(1, CHUNK_PAIRS // max(size, 1))
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size doit être >= 1, got {chunk_size}")
+        others = np.arange(size)
+        for start in range(0, size, chunk_size):
+            rows = np.arange(start, min(start + chunk_size, size))
+            first_index = np.repeat(rows, size)
+            second_index = np.tile(others, len(rows))
+            distinct = first_index != second_index
+            result = MeshKernel.analyze_pairs(columns, first_index[distinct],
+                                              second_index[distinct])
+            if only_valid:
+                keep = result['valid']
+                result = {key: value[keep] for key, value in result.items()}
+            yield result
+
+    @staticmethod
+    def all_pairs(columns: Dict[str, np.ndarray],
+                  only_valid: bool = True,
+                  chunk_size: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Cribler toutes les combinaisons ordonnées (i, j), i != j, d'un catalogue
+
+        Avec only_valid, seules les paires engrenables sont conservées
+        (blocs de iter_pairs concaténés).
+        """
+        blocks = list(MeshKernel.iter_pairs(columns, only_valid, chunk_size))
+        if not blocks:
+            return MeshKernel.analyze_pairs(columns, [], [])
+        return {key: np.concatenate([block[key] for block in blocks]) for key in blocks[0]}
@@ -0,0 +1,229 @@
+"""
+Synthèse de trains planétaires simples : recherche des nombres de dents
+(soleil, satellite, couronne) et du nombre de satellites approchant un
+rapport cible pour un élément fixe donné
+
+Tous les couples (soleil, satellite) sont engendrés en une grille; la
+couronne découle de la coaxialité (Nr = Ns + 2·Np). Le rapport ne dépend
+que de (Ns, Nr) : les couples hors tolérance sont écartés avant de
+diffuser sur les nombres de satellites, où sont vérifiés l'équirépartition
+((Ns + Nr) divisible par n) et le jeu entre satellites voisins.
+"""
+import math
+from typing import Dict, Any, List, Optional
+import numpy as np
+
+from .train_solver import DEFAULT_MAX_TEETH, DEFAULT_MIN_TEETH
+from .validation import GearValidator
+
+# Nombres de satellites explorés par défaut
+DEFAULT_MIN_PLANETS = 3
+DEFAULT_MAX_PLANETS = 8
+
+# Jeu minimal entre cercles de tête de deux satellites voisins (en modules)
+DEFAULT_PLANET_GAP = 0.5
+
+# Entrée et sortie par défaut pour chaque élément fixe
+DEFAULT_MEMBERS = {
+    'ring': ('sun', 'carrier'),
+    'sun': ('ring', 'carrier'),
+    'carrier': ('sun', 'ring'),
+}
+
+
+def planetary_ratio(sun, ring, fixed: str = 'ring', input_: Optional[str] = None,
+                    output: Optional[str] = None):
+    """
+    Rapport ω_entrée / ω_sortie d'un train planétaire simple (formule de Willis)
+
+    ω_soleil - ω_porte = -(Nr/Ns)·(ω_couronne - ω_porte); accepte des
+    tableaux de nombres de dents.
+    """
+    if fixed not in DEFAULT_MEMBERS:
+        raise ValueError(f"Élément fixe inconnu: {fixed} (sun, ring ou carrier)")
+    default_input, default_output = DEFAULT_MEMBERS[fixed]
+    input_ = input_ or default_input
+    output = output or default_output
+    if {input_, output} != {default_input, default_output}:
+        raise ValueError(f"Combinaison non supportée: {(fixed, input_, output)}")
+
+    sun = np.asarray(sun, dtype=float)
+    ring = np.asarray(ring, dtype=float)
+    if fixed == 'ring':
+        ratio = 1 + ring / sun
+    elif fixed == 'sun':
+        ratio = 1 + sun / ring
+    else:
+        ratio = -ring / sun
+    return ratio if input_ == default_input else 1 / ratio
+
+
+class PlanetarySolver:
+    """Recherche vectorisée de trains planétaires simples"""
+
+    def __init__(self, module: float = 1.0,
+                 pressure_angle: float = 20.0,
+                 min_teeth: int = DEFAULT_MIN_TEETH,
+                 max_teeth: int = DEFAULT_MAX_TEETH,
+                 max_ring_teeth: Optional[int] = None,
+                 min_planets: int = DEFAULT_MIN_PLANETS,
+                 max_planets: int = DEFAULT_MAX_PLANETS,
+                 planet_gap: float = DEFAULT_PLANET_GAP,
+                 check_undercut: bool = True):
+        if module <= 0:
+            raise ValueError(f"Module doit être > 0, got {module}")
+        if not 2 <= min_planets <= max_planets:
+            raise ValueError(
+                f"Nombre de satellites invalide: {min_planets} à {max_planets} (minimum 2)"
+            )
+        if planet_gap < 0:
+            raise ValueError(f"Jeu entre satellites doit être >= 0, got {planet_gap}")
+
+        self.module = module
+        self.pressure_angle = pressure_angle
+        self.max_ring_teeth = max_ring_teeth
+        self.min_planets = min_planets
+        self.max_planets = max_planets
+        self.planet_gap = planet_gap
+
+        # Soleil et satellites extérieurs : même limite de taillage que
+        # GearTrainSolver
+        if check_undercut:
+            undercut_limit = float(GearValidator.min_teeth_no_undercut(pressure_angle))
+            min_teeth = max(min_teeth, math.ceil(undercut_limit - 1e-9))
+        self.min_teeth = min_teeth
+        self.max_teeth = max_teeth
+        if min_teeth > max_teeth:
+            raise ValueError(
+                f"Aucun nombre de dents admissible entre {min_teeth} et {max_teeth}"
+            )
+
+    @staticmethod
+    def conditions(sun, planet, ring, planets, planet_gap: float = 0.0) -> Dict[str, np.ndarray]:
+        """
+        Conditions de montage d'un train planétaire simple (tableaux diffusés)
+
+        - coaxial : Nr = Ns + 2·Np (même module, sans déport)
+        - equal_spacing : (Ns + Nr) divisible par le nombre de satellites
+        - clearance : entraxe de deux satellites voisins, m·(Ns + Np)·sin(π/n),
+          supérieur au diamètre de tête m·(Np + 2) plus planet_gap modules
+        """
+        sun, planet, ring, planets = np.broadcast_arrays(sun, planet, ring, planets)
+        spacing = (sun + planet) * np.sin(math.pi / planets)
+        return {
+            'coaxial': ring == sun + 2 * planet,
+            'equal_spacing': (sun + ring) % planets == 0,
+            'clearance': spacing - (planet + 2) >= planet_gap - 1e-9,
+        }
+
+    def solve(self, target_ratio: float,
+              fixed: str = 'ring',
+              input_: Optional[str] = None,
+              output: Optional[str] = None,
+              tolerance: float = 1e-3,
+              max_solutions: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Énumérer les trains (Ns, Np, Nr, n) approchant target_ratio
+
+        Args:
+            target_ratio: rapport ω_entrée / ω_sortie (négatif si le sens
+                s'inverse, porte-satellites fixe)
+            fixed: élément fixe ('sun', 'ring', 'carrier')
+            input_, output: éléments d'entrée et de sortie (par défaut
+                DEFAULT_MEMBERS[fixed])
+            tolerance: écart relatif admissible sur le rapport
+            max_solutions: nombre maximal de solutions (toutes si None)
+
+        Returns:
+            Solutions triées par écart, taille de couronne puis nombre de
+            satellites décroissant
+        """
+        if target_ratio == 0:
+            raise ValueError("Rapport cible doit être non nul")
+        if tolerance < 0:
+            raise ValueError(f"Tolérance doit être >= 0, got {tolerance}")
+
+        teeth = np.arange(self.min_teeth, self.max_teeth + 1)
+        sun, planet = (axis.ravel() for axis in np.meshgrid(teeth, teeth, indexing='ij'))
+        ring = sun + 2 * planet
+        if self.max_ring_teeth is not None:
+            inside = ring <= self.max_ring_teeth
+            sun, planet, ring = sun[inside], planet[inside], ring[inside]
+
+        # Filtre sur le rapport avant de diffuser sur les nombres de satellites
+        ratio = planetary_ratio(sun, ring, fixed, input_, output)
+        error = ratio / target_ratio - 1
+        close = np.abs(error) <= tolerance + 1e-12
+        sun, planet, ring = sun[close], planet[close], ring[close]
+        ratio, error = ratio[close], error[close]
+
+        planets = np.arange(self.min_planets, self.max_planets + 1)
+        checks = self.conditions(sun[:, None], planet[:, None], ring[:, None],
+                                 planets[None, :], self.planet_gap)
+        valid = checks['coaxial'] & checks['equal_spacing'] & checks['clearance']
+        rows, columns = np.nonzero(valid)
+
+        order = np.lexsort((-planets[columns], ring[rows], np.round(np.abs(error[rows]), 12)))
+        if max_solutions is not None:
+            order = order[:max_solutions]
+        return [self._describe(int(sun[rows[i]]), int(planet[rows[i]]), int(ring[rows[i]]),
+                               int(planets[columns[i]]), float(ratio[rows[i]]),
+                               float(error[rows[i]]))
+                for i in order]
+
+    def _describe(self, sun: int, planet: int, ring: int, planets: int,
+                  ratio: float, error: float) -> Dict[str, Any]:
+        """Dictionnaire de solution"""
+        center_distance = self.module * (sun + planet) / 2
+        spacing = 2 * center_distance * math.sin(math.pi / planets)
+        return {
+            'sun_teeth': sun,
+            'planet_teeth': planet,
+            'ring_teeth': ring,
+            'num_planets': planets,
+            'ratio': ratio,
+            'error': error,
+            'module': self.module,
+            'center_distance': center_distance,
+            'ring_pitch_diameter': self.module * ring,
+            'planet_gap': spacing - self.module * (planet + 2),
+        }
+
+    @staticmethod
+    def solve_request(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Résoudre une requête JSON (API)
+
+        Clés: target_ratio (obligatoire), fixed, input, output, tolerance,
+        max_solutions, module, pressure_angle, min_teeth, max_teeth,
+        max_ring_teeth, min_planets, max_planets, planet_gap, check_undercut
+        """
+        if 'target_ratio' not in data:
+            raise ValueError('target_ratio requis')
+        solver = PlanetarySolver(
+            module=data.get('module', 1.0),
+            pressure_angle=data.get('pressure_angle', 20.0),
+            min_teeth=data.get('min_teeth', DEFAULT_MIN_TEETH),
+            max_teeth=data.get('max_teeth', DEFAULT_MAX_TEETH),
+            max_ring_teeth=data.get('max_ring_teeth'),
+            min_planets=data.get('min_planets', DEFAULT_MIN_PLANETS),
+            max_planets=data.get('max_planets', DEFAULT_MAX_PLANETS),
+            planet_gap=data.get('planet_gap', DEFAULT_PLANET_GAP),
+            check_undercut=data.get('check_undercut', True),
+        )
+        fixed = data.get('fixed', 'ring')
+        solutions = solver.solve(
+            float(data['target_ratio']),
+            fixed=fixed,
+            input_=data.get('input'),
+            output=data.get('output'),
+            tolerance=data.get('tolerance', 1e-3),
+            max_solutions=data.get('max_solutions', 50),
+        )
+        return {
+            'target_ratio': float(data['target_ratio']),
+            'fixed': fixed,
+            'min_teeth': solver.min_teeth,
+            'solutions': solutions,
+            'count': len(solutions),
+        }
@@ -0,0 +1,511 @@
+"""
+Moteur de règles vectorisé : contrôle de tableaux d'engrenages et de paires
+
+Chaque règle est déclarée par un code stable, une gravité et une fonction
+évaluée sur toutes les lignes à la fois ; elle retourne le masque des
+lignes fautives, la valeur en cause et la limite franchie. Les résultats
+sont regroupés dans un tableau structuré (ISSUE_DTYPE) trié par ligne.
+
+Les limites de sous-dépouille et d'interférence sont calculées (taillage
+par crémaillère, point d'interférence sur la ligne d'action, entraxe de
+fonctionnement avec déports) et non lues dans une table.
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from profiles.involute import inverse_involute
+
+from .base_gear import Gear, GearParams
+from .gear_kernel import (TYPE_CODES, TYPE_NAMES, _column,
+                          effective_profile_shift, kernel_type, type_codes)
+from .validation import GearValidator
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# Résultat d'un contrôle : une ligne par anomalie
+ISSUE_DTYPE = np.dtype([
+    ('index', np.int64),
+    ('code', 'U32'),
+    ('severity', 'U8'),
+    ('value', np.float64),
+    ('limit', np.float64),
+])
+
+# Limites reprises de GearParams.validate / GearValidator
+MIN_PRESSURE_ANGLE = 14.0
+MAX_PRESSURE_ANGLE = 25.0
+MAX_HELIX_ANGLE = 45.0
+LOW_TEETH = 12
+MIN_CONTACT_RATIO = 1.0
+RECOMMENDED_CONTACT_RATIO = 1.2
+# Écart minimal de dents couronne - pignon (interférence de tête, denture normale)
+MIN_INTERNAL_TEETH_DIFFERENCE = 10
+
+# Paires admises par les méthodes mesh_with (symétriques)
+COMPATIBLE_PAIRS = {
+    ('spur', 'spur'), ('helical', 'helical'), ('bevel', 'bevel'),
+    ('cycloidal', 'cycloidal'), ('worm', 'spur'), ('rack', 'spur'),
+    ('internal', 'spur'),
+}
+
+_INVOLUTE_EXTERNAL = (TYPE_CODES['spur'], TYPE_CODES['helical'])
+
+Check = Callable[[Dict[str, np.ndarray]], Tuple[np.ndarray, np.ndarray, Any]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Règle déclarative : code, gravité, message et contrôle vectorisé"""
+    code: str
+    severity: str
+    message: str
+    check: Check
+
+
+def _compatibility_matrix() -> np.ndarray:
+    matrix = np.zeros((len(TYPE_NAMES), len(TYPE_NAMES)), dtype=bool)
+    for first, second in COMPATIBLE_PAIRS:
+        matrix[TYPE_CODES[first], TYPE_CODES[second]] = True
+        matrix[TYPE_CODES[second], TYPE_CODES[first]] = True
+    return matrix
+
+
+_COMPATIBLE = _compatibility_matrix()
+
+
+# ----------------------------------------------------------------------
+# Règles par engrenage
+# ----------------------------------------------------------------------
+
+def _pressure_angle_limit(c):
+    alpha = c['pressure_angle']
+    return (~((alpha >= MIN_PRESSURE_ANGLE) & (alpha <= MAX_PRESSURE_ANGLE)), alpha,
+            np.where(alpha < MIN_PRESSURE_ANGLE, MIN_PRESSURE_ANGLE, MAX_PRESSURE_ANGLE))
+
+
+def _virtual_teeth(c):
+    """Engrenages coniques : nombre de dents virtuel z / cos δ (Tredgold)"""
+    is_bevel = c['codes'] == TYPE_CODES['bevel']
+    return np.where(is_bevel, c['teeth'] / np.cos(np.radians(c['pitch_angle'])), c['teeth'])
+
+
+def _undercut(c):
+    is_bevel = c['codes'] == TYPE_CODES['bevel']
+    teeth = _virtual_teeth(c)
+    limit = GearValidator.min_teeth_no_undercut(c['pressure_angle'], c['profile_shift'],
+                                                c['helix_angle'])
+    involute = np.isin(c['codes'], _INVOLUTE_EXTERNAL) | is_bevel
+    return involute & (teeth < limit), teeth, limit
+
+
+GEAR_RULES: List[Rule] = [
+    Rule('module.non_positive', ERROR, "Le module doit être positif",
+         lambda c: (~(c['module'] > 0), c['module'], 0.0)),
+    Rule('teeth.invalid', ERROR, "Le nombre de dents doit être un entier >= 1",
+         lambda c: (~(c['teeth'] >= 1) | (c['teeth'] != np.round(c['teeth'])), c['teeth'], 1.0)),
+    Rule('pressure_angle.out_of_range', ERROR,
+         "L'angle de pression doit être entre 14° et 25°", _pressure_angle_limit),
+    Rule('helix_angle.out_of_range', ERROR, "L'angle d'hélice doit être entre -45° et 45°",
+         lambda c: (~(np.abs(c['helix_angle']) <= MAX_HELIX_ANGLE), c['helix_angle'],
+                    MAX_HELIX_ANGLE)),
+    Rule('face_width.non_positive', ERROR, "La largeur de denture doit être positive",
+         lambda c: (~(c['face_width'] > 0), c['face_width'], 0.0)),
+    Rule('rolling_ratio.out_of_range', ERROR,
+         "Le rapport du cercle roulant doit être entre 0 et 1",
+         lambda c: ((c['codes'] == TYPE_CODES['cycloidal'])
+                    & ~((c['rolling_circle_ratio'] > 0) & (c['rolling_circle_ratio'] < 1)),
+                    c['rolling_circle_ratio'], 1.0)),
+    Rule('teeth.low', WARNING, "Peu de dents : risque d'interférence",
+         lambda c: (~np.isin(c['codes'], (TYPE_CODES['worm'], TYPE_CODES['rack']))
+                    & (c['teeth'] >= 1) & (c['teeth'] < LOW_TEETH), c['teeth'], float(LOW_TEETH))),
+    Rule('undercut', WARNING, "Sous-dépouille au taillage : augmenter le déport", _undercut),
+]
+
+
+# ----------------------------------------------------------------------
+# Règles par paire
+# ----------------------------------------------------------------------
+
+def _external_mesh(c) -> Dict[str, np.ndarray]:
+    """
+    Géométrie de fonctionnement des paires extérieures à développante
+    (plan apparent, entraxe de fonctionnement avec déports; engrenages
+    droits virtuels au grand bout pour les paires coniques)
+    """
+    if 'mesh' in c:
+        return c['mesh']
+    first, second = c['first'], c['second']
+    m = first['module']
+    beta = np.radians(first['helix_angle'])
+    alpha_t = np.arctan(np.tan(np.radians(first['pressure_angle'])) / np.cos(beta))
+    m_t = m / np.cos(beta)
+    z1, z2 = _virtual_teeth(first), _virtual_teeth(second)
+    x1, x2 = first['profile_shift'], second['profile_shift']
+    r1, r2 = m_t * z1 / 2, m_t * z2 / 2
+    rb1, rb2 = r1 * np.cos(alpha_t), r2 * np.cos(alpha_t)
+
+    inv_wt = np.tan(alpha_t) - alpha_t + \
+        2 * np.tan(np.radians(first['pressure_angle'])) * (x1 + x2) / (z1 + z2)
+    alpha_wt = inverse_involute(inv_wt)
+    a_w = (r1 + r2) * np.cos(alpha_t) / np.cos(alpha_wt)
+    line = a_w * np.sin(alpha_wt)
+
+    h_a = GearValidator.ADDENDUM_COEFFICIENT
+    ra1, ra2 = r1 + m * (h_a + x1), r2 + m * (h_a + x2)
+    mesh = {
+        'ra1': ra1, 'ra2': ra2,
+        # Rayon de tête limite : point d'interférence de la roue conjuguée
+        'ra1_max': np.sqrt(rb1**2 + line**2),
+        'ra2_max': np.sqrt(rb2**2 + line**2),
+        'contact_ratio': (np.sqrt(np.maximum(ra1**2 - rb1**2, 0))
+                          + np.sqrt(np.maximum(ra2**2 - rb2**2, 0)) - line)
+                         / (math.pi * m_t * np.cos(alpha_t)),
+    }
+    c['mesh'] = mesh
+    return mesh
+
+
+def _rack_mesh(c) -> Dict[str, np.ndarray]:
+    """Pignon (côté non crémaillère) engrenant avec une crémaillère"""
+    if 'rack_mesh' in c:
+        return c['rack_mesh']
+    first_is_rack = c['first']['codes'] == TYPE_CODES['rack']
+    pinion = {key: np.where(first_is_rack, c['second'][key], c['first'][key])
+              for key in ('module', 'teeth', 'pressure_angle', 'profile_shift')}
+    m, z, x = pinion['module'], pinion['teeth'], pinion['profile_shift']
+    alpha = np.radians(pinion['pressure_angle'])
+    r = m * z / 2
+    rb = r * np.cos(alpha)
+    ra = r + m * (GearValidator.ADDENDUM_COEFFICIENT + x)
+    # Longueur d'action : côté pignon + côté crémaillère (saillie h_a* - x)
+    approach = m * (GearValidator.ADDENDUM_COEFFICIENT - x) / np.sin(alpha)
+    length = np.sqrt(np.maximum(ra**2 - rb**2, 0)) - r * np.sin(alpha) + approach
+    mesh = {
+        'teeth': z,
+        'limit': GearValidator.min_teeth_no_undercut(pinion['pressure_angle'], x),
+        'contact_ratio': length / (math.pi * m * np.cos(alpha)),
+    }
+    c['rack_mesh'] = mesh
+    return mesh
+
+
+def _internal_mesh(c) -> Dict[str, np.ndarray]:
+    """
+    Couronne intérieure engrenant avec un pignon (denture normale, sans
+    déport) : les pieds des perpendiculaires T1 (pignon) et T2 (couronne)
+    sont du même côté du point primitif, T1T2 = (r2 - r1)·sin α. La tête
+    de la couronne ne doit pas dépasser T1 : r_a2 >= √(r_b2² + T1T2²).
+    """
+    if 'internal_mesh' in c:
+        return c['internal_mesh']
+    first_is_ring = c['first']['codes'] == TYPE_CODES['internal']
+    ring, pinion = ({key: np.where(first_is_ring, c[a][key], c[b][key])
+                     for key in ('module', 'teeth', 'pressure_angle')}
+                    for a, b in (('first', 'second'), ('second', 'first')))
+    m = ring['module']
+    alpha = np.radians(ring['pressure_angle'])
+    r1, r2 = m * pinion['teeth'] / 2, m * ring['teeth'] / 2
+    rb2 = r2 * np.cos(alpha)
+    line = (r2 - r1) * np.sin(alpha)
+    h_a = GearValidator.ADDENDUM_COEFFICIENT
+    mesh = {
+        'ra2': r2 - m * h_a,
+        'ra2_min': np.sqrt(rb2**2 + line**2),
+        'difference': ring['teeth'] - pinion['teeth'],
+    }
+    c['internal_mesh'] = mesh
+    return mesh
+
+
+def _is_internal_pair(c):
+    internal, spur = TYPE_CODES['internal'], TYPE_CODES['spur']
+    first, second = c['first']['codes'], c['second']['codes']
+    return ((first == internal) & (second == spur)) | ((first == spur) & (second == internal))
+
+
+def _is_external(c):
+    bevel = TYPE_CODES['bevel']
+    return (np.isin(c['first']['codes'], _INVOLUTE_EXTERNAL)
+            & np.isin(c['second']['codes'], _INVOLUTE_EXTERNAL)) | \
+        ((c['first']['codes'] == bevel) & (c['second']['codes'] == bevel))
+
+
+def _is_rack_pair(c):
+    rack, spur = TYPE_CODES['rack'], TYPE_CODES['spur']
+    first, second = c['first']['codes'], c['second']['codes']
+    return ((first == rack) & (second == spur)) | ((first == spur) & (second == rack))
+
+
+def _interference(c):
+    external = _is_external(c)
+    rack = _is_rack_pair(c)
+    mesh, rack_mesh = _external_mesh(c), _rack_mesh(c)
+    # Côté le plus en excès
+    first_worse = mesh['ra1'] - mesh['ra1_max'] >= mesh['ra2'] - mesh['ra2_max']
+    value = np.where(first_worse, mesh['ra1'], mesh['ra2'])
+    limit = np.where(first_worse, mesh['ra1_max'], mesh['ra2_max'])
+    mask = external & (value > limit * (1 + 1e-12))
+    rack_mask = rack & (rack_mesh['teeth'] < rack_mesh['limit'])
+    # Paire intérieure : tête de couronne au-delà du point d'interférence du pignon
+    internal = _is_internal_pair(c)
+    ring_mesh = _internal_mesh(c)
+    internal_mask = internal & (ring_mesh['ra2'] < ring_mesh['ra2_min'] * (1 - 1e-12))
+    return (mask | rack_mask | internal_mask,
+            np.where(rack, rack_mesh['teeth'], np.where(internal, ring_mesh['ra2'], value)),
+            np.where(rack, rack_mesh['limit'], np.where(internal, ring_mesh['ra2_min'], limit)))
+
+
+def _internal_teeth_difference(c):
+    difference = _internal_mesh(c)['difference']
+    return (_is_internal_pair(c) & (difference < MIN_INTERNAL_TEETH_DIFFERENCE),
+            difference, float(MIN_INTERNAL_TEETH_DIFFERENCE))
+
+
+def _rolling_circle_mismatch(c):
+    # Rayon du cercle roulant de chaque cycloïdal : ratio × m·z / 2
+    first, second = c['first'], c['second']
+    radius = [side['rolling_circle_ratio'] * side['module'] * side['teeth'] / 2
+              for side in (first, second)]
+    cycloidal = (first['codes'] == TYPE_CODES['cycloidal']) & \
+        (second['codes'] == TYPE_CODES['cycloidal'])
+    return cycloidal & (np.abs(radius[0] - radius[1]) > 0.001), radius[1], radius[0]
+
+
+def _contact_ratio(c):
+    return np.where(_is_rack_pair(c), _rack_mesh(c)['contact_ratio'],
+                    np.where(_is_external(c), _external_mesh(c)['contact_ratio'], np.nan))
+
+
+def _contact_ratio_rule(low, high):
+    def check(c):
+        ratio = _contact_ratio(c)
+        return (ratio >= low) & (ratio < high), ratio, high
+    return check
+
+
+PAIR_RULES: List[Rule] = [
+    Rule('pair.type_mismatch', ERROR, "Types d'engrenages incompatibles",
+         lambda c: (~_COMPATIBLE[c['first']['codes'], c['second']['codes']],
+                    c['second']['codes'].astype(float), np.nan)),
+    Rule('pair.module_mismatch', ERROR, "Les modules doivent être identiques",
+         lambda c: (np.abs(c['first']['module'] - c['second']['module']) > 0.001,
+                    c['second']['module'], c['first']['module'])),
+    Rule('pair.pressure_angle_mismatch', ERROR, "Les angles de pression doivent être identiques",
+         lambda c: (np.abs(c['first']['pressure_angle'] - c['second']['pressure_angle']) > 0.1,
+                    c['second']['pressure_angle'], c['first']['pressure_angle'])),
+    Rule('pair.rolling_circle_mismatch', ERROR,
+         "Cercles roulants non conjugués (rolling_circle_ratio × Z identiques)",
+         _rolling_circle_mismatch),
+    Rule('pair.helix_not_opposite', ERROR,
+         "Les angles d'hélice doivent être opposés pour un engrènement correct",
+         lambda c: (((c['first']['helix_angle'] != 0) | (c['second']['helix_angle'] != 0))
+                    & (np.abs(c['first']['helix_angle'] + c['second']['helix_angle']) > 0.1),
+                    c['second']['helix_angle'], -c['first']['helix_angle'])),
+    Rule('pair.interference', ERROR,
+         "Interférence de développante : tête au-delà du point d'interférence", _interference),
+    Rule('pair.internal_teeth_difference', ERROR,
+         "Écart de dents couronne - pignon insuffisant (interférence de tête)",
+         _internal_teeth_difference),
+    Rule('pair.contact_ratio_low', ERROR, "Rapport de conduite < 1 (engrènement discontinu)",
+         _contact_ratio_rule(-np.inf, MIN_CONTACT_RATIO)),
+    Rule('pair.contact_ratio_marginal', WARNING, "Rapport de conduite faible",
+         _contact_ratio_rule(MIN_CONTACT_RATIO, RECOMMENDED_CONTACT_RATIO)),
+]
+
+
+class RuleEngine:
+    """Évaluation des règles sur des colonnes d'engrenages ou de paires"""
+
+    @staticmethod
+    def register_rule(rule: Rule, scope: str = 'gear'):
+        """Ajouter une règle ('gear' ou 'pair'), remplaçant celle de même code"""
+        rules = {'gear': GEAR_RULES, 'pair': PAIR_RULES}.get(scope)
+        if rules is None:
+            raise ValueError(f"Portée '{scope}' invalide (gear ou pair)")
+        if rule.severity not in (ERROR, WARNING):
+            raise ValueError(f"Gravité '{rule.severity}' invalide")
+        rules[:] = [r for r in rules if r.code != rule.code] + [rule]
+
+    @staticmethod
+    def rules(scope: str = 'gear') -> List[Rule]:
+        """Règles déclarées pour une portée"""
+        return list(GEAR_RULES if scope == 'gear' else PAIR_RULES)
+
+    @staticmethod
+    def context(columns: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Colonnes normalisées pour les règles
+
+        Clés lues: gear_type (noms ou codes, 'spur' par défaut), module,
+        teeth, pressure_angle, helix_angle, profile_shift, face_width,
+        pitch_angle, mate_teeth, rolling_circle_ratio. Le déport
+        automatique des classes d'engrenages est appliqué.
+        """
+        module = np.atleast_1d(np.asarray(columns['module'], dtype=float))
+        size = module.shape[0]
+        codes = np.broadcast_to(type_codes(columns.get('gear_type', 'spur')), (size,))
+        teeth = _column(columns['teeth'], size)
+        shift = np.nan_to_num(_column(columns.get('profile_shift'), size, 0.0))
+        pitch_angle = _column(columns.get('pitch_angle'), size)
+        mate_teeth = _column(columns.get('mate_teeth'), size)
+        pitch_angle = np.where(np.isnan(pitch_angle),
+                               np.where(np.isnan(mate_teeth), 45.0,
+                                        np.degrees(np.arctan2(teeth, mate_teeth))),
+                               pitch_angle)
+        ratio = _column(columns.get('rolling_circle_ratio'), size)
+        return {
+            'codes': codes,
+            'module': module,
+            'teeth': teeth,
+            'pressure_angle': _column(columns.get('pressure_angle', 20.0), size),
+            'helix_angle': np.nan_to_num(_column(columns.get('helix_angle'), size, 0.0)),
+            'profile_shift': effective_profile_shift(codes, teeth, shift),
+            'face_width': _column(columns.get('face_width', 10.0), size),
+            'pitch_angle': pitch_angle,
+            'rolling_circle_ratio': np.where(np.isnan(ratio), 0.5, ratio),
+        }
+
+    @staticmethod
+    def _run(rules: Iterable[Rule], context: Dict[str, Any], size: int,
+             codes: Optional[Sequence[str]]) -> np.ndarray:
+        blocks = []
+        with np.errstate(all='ignore'):
+            for rule in rules:
+                if codes is not None and rule.code not in codes:
+                    continue
+                mask, value, limit = rule.check(context)
+                index = np.flatnonzero(np.broadcast_to(mask, (size,)))
+                block = np.empty(len(index), dtype=ISSUE_DTYPE)
+                block['index'] = index
+                block['code'] = rule.code
+                block['severity'] = rule.severity
+                block['value'] = np.broadcast_to(value, (size,))[index]
+                block['limit'] = np.broadcast_to(limit, (size,))[index]
+                blocks.append(block)
+        if not blocks:
+            return np.empty(0, dtype=ISSUE_DTYPE)
+        issues = np.concatenate(blocks)
+        return issues[np.argsort(issues['index'], kind='stable')]
+
+    @staticmethod
+    def check_gears(columns: Dict[str, Any],
+                    codes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Contrôler N engrenages donnés en colonnes (voir context)
+
+        Args:
+            codes: restreindre aux règles de ces codes
+
+        Returns:
+            Tableau structuré ISSUE_DTYPE ('index' = ligne)
+        """
+        context = RuleEngine.context(columns)
+        return RuleEngine._run(GEAR_RULES, context, len(context['module']), codes)
+
+    @staticmethod
+    def check_pairs(first: Dict[str, Any], second: Dict[str, Any],
+                    codes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Contrôler N paires : ligne i de first engrenant avec ligne i de second
+
+        Returns:
+            Tableau structuré ISSUE_DTYPE ('index' = paire)
+        """
+        context = {'first': RuleEngine.context(first), 'second': RuleEngine.context(second)}
+        size = len(context['first']['module'])
+        if len(context['second']['module']) != size:
+            raise ValueError(
+                f"Colonnes de tailles différentes: {size} et {len(context['second']['module'])}"
+            )
+        return RuleEngine._run(PAIR_RULES, context, size, codes)
+
+    @staticmethod
+    def params_columns(gear_types: Sequence[str],
+                       params: Sequence[GearParams]) -> Dict[str, Any]:
+        """Colonnes de contrôle à partir de GearParams"""
+        def field(name):
+            return [getattr(p, name) for p in params]
+
+        columns = {name: field(name) for name in (
+            'module', 'teeth', 'pressure_angle', 'helix_angle', 'profile_shift',
+            'face_width', 'pitch_angle', 'mate_teeth', 'rolling_circle_ratio')}
+        columns['gear_type'] = list(gear_types)
+        return columns
+
+    @staticmethod
+    def check_params(gear_types: Sequence[str], params: Sequence[GearParams],
+                     codes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Contrôler une liste de GearParams (types hors noyau traités comme droits)"""
+        if not params:
+            return np.empty(0, dtype=ISSUE_DTYPE)
+        gear_types = [t if t in TYPE_CODES else 'spur' for t in gear_types]
+        return RuleEngine.check_gears(RuleEngine.params_columns(gear_types, params), codes)
+
+    @staticmethod
+    def check_table(table, codes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Contrôler toutes les lignes d'une GearTable"""
+        columns = {name: table.column(name) for name in (
+            'module', 'teeth', 'pressure_angle', 'helix_angle', 'profile_shift',
+            'face_width', 'pitch_angle', 'mate_teeth', 'rolling_circle_ratio')}
+        # Types hors noyau : contrôles communs (traités comme droits)
+        types = table.column('gear_type')
+        columns['gear_type'] = np.where(np.isin(types, TYPE_NAMES), types, 'spur').astype(str) \
+            if len(table) else np.zeros(0, dtype=np.int8)
+        return RuleEngine.check_gears(columns, codes)
+
+    @staticmethod
+    def _gear_type(gear: Gear) -> str:
+        return kernel_type(gear) or 'spur'
+
+    @staticmethod
+    def check_gear_pair(first: Gear, second: Gear,
+                        codes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Contrôler une paire d'objets Gear"""
+        columns = [RuleEngine.params_columns([RuleEngine._gear_type(g)], [g.params])
+                   for g in (first, second)]
+        return RuleEngine.check_pairs(columns[0], columns[1], codes)
+
+    # ------------------------------------------------------------------
+    # Exploitation des résultats
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def mask(issues: np.ndarray, size: int, code: Optional[str] = None,
+             severity: Optional[str] = None) -> np.ndarray:
+        """Lignes ayant au moins une anomalie (filtrée par code et gravité)"""
+        selected = np.ones(len(issues), dtype=bool)
+        if code is not None:
+            selected &= issues['code'] == code
+        if severity is not None:
+            selected &= issues['severity'] == severity
+        mask = np.zeros(size, dtype=bool)
+        mask[issues['index'][selected]] = True
+        return mask
+
+    @staticmethod
+    def error_mask(issues: np.ndarray, size: int) -> np.ndarray:
+        """Lignes ayant au moins une anomalie de gravité 'error'"""
+        return RuleEngine.mask(issues, size, severity=ERROR)
+
+    @staticmethod
+    def summary(issues: np.ndarray) -> Dict[str, int]:
+        """Nombre d'anomalies par code"""
+        codes, counts = np.unique(issues['code'], return_counts=True)
+        return {str(code): int(count) for code, count in zip(codes, counts)}
+
+    @staticmethod
+    def to_records(issues: np.ndarray) -> List[Dict[str, Any]]:
+        """Anomalies en dictionnaires (JSON), avec le message de la règle"""
+        messages = {rule.code: rule.message for rule in GEAR_RULES + PAIR_RULES}
+        return [{
+            'index': int(issue['index']),
+            'code': str(issue['code']),
+            'severity': str(issue['severity']),
+            'value': None if np.isnan(issue['value']) else float(issue['value']),
+            'limit': None if np.isnan(issue['limit']) else float(issue['limit']),
+            'message': messages.get(str(issue['code']), ''),
+        } for issue in issues]
@@ -0,0 +1,252 @@
+"""
+Moteur de contraintes ISO 6336 évalué sur des spectres de charge
+
+La géométrie de la paire est calculée une seule fois ; les contraintes de
+pied de dent et de Hertz sont ensuite évaluées en bloc sur des tableaux de
+couples, vitesses et durées (un élément par classe du spectre).
+"""
+import math
+from typing import Dict, Any, Optional
+import numpy as np
+
+from .base_gear import Gear
+from standards.iso_6336 import ISO6336
+from standards.iso_21771 import ISO21771
+
+# Charge nominale par défaut des endpoints d'analyse (N·m, tr/min)
+DEFAULT_TORQUE = 100.0
+DEFAULT_SPEED = 1000.0
+
+# Types de dentures traités (cylindriques à développante)
+SUPPORTED_TYPES = ('spur', 'helical', 'internal', 'rack')
+
+
+class StressEngine:
+    """Contraintes de flexion et de contact d'une paire d'engrenages"""
+
+    def __init__(self, pinion: Gear, wheel: Optional[Gear] = None,
+                 application_factor: float = 1.0,
+                 face_load_factor: float = 1.0,
+                 transverse_load_factor: float = 1.0,
+                 accuracy_grade: int = 7):
+        pinion_type = pinion.get_info().get('gear_type')
+        if pinion_type not in ('spur', 'helical'):
+            raise ValueError(f"Le pignon doit être droit ou hélicoïdal, got {pinion_type}")
+        wheel_type = wheel.get_info().get('gear_type') if wheel is not None else pinion_type
+        if wheel_type not in SUPPORTED_TYPES:
+            raise ValueError(f"Type d'engrenage '{wheel_type}' non supporté pour ISO 6336")
+
+        self.application_factor = application_factor
+        self.face_load_factor = face_load_factor
+        self.transverse_load_factor = transverse_load_factor
+        self.accuracy_grade = accuracy_grade
+
+        p = pinion.params
+        self.z1 = p.teeth
+        self.z2 = self._mate_teeth(pinion, wheel)
+        self.is_internal = wheel_type == 'internal'
+        self.is_rack = wheel_type == 'rack'
+        self.normal_module = p.module
+        self.helix_angle = p.helix_angle
+        self.face_width = p.face_width if wheel is None else min(p.face_width,
+                                                                  wheel.params.face_width)
+
+        # Rapport de réduction signé (négatif pour une denture intérieure)
+        if self.is_rack:
+            self.gear_ratio = math.inf
+        else:
+            self.gear_ratio = (-1 if self.is_internal else 1) * self.z2 / self.z1
+
+        # Géométrie apparente (ISO 21771)
+        beta = math.radians(self.helix_angle)
+        self.transverse_pressure_angle = ISO21771.transverse_pressure_angle(
+            p.pressure_angle, self.helix_angle)
+        alpha_t = math.radians(self.transverse_pressure_angle)
+        self.base_helix_angle = math.degrees(math.atan(math.tan(beta) * math.cos(alpha_t)))
+        self.pitch_diameter = pinion.pitch_diameter
+        self.contact_ratio = self._transverse_contact_ratio(pinion, wheel)
+        self.overlap_ratio = abs(ISO21771.overlap_ratio(
+            self.face_width, self.helix_angle, self.normal_module))
+
+        # Matériaux
+        m1 = ISO6336.material(p.material)
+        m2 = ISO6336.material(wheel.params.material if wheel is not None else p.material)
+        self.sigma_h_lim = min(m1['sigma_h_lim'], m2['sigma_h_lim'])
+        self.sigma_f_lim = (m1['sigma_f_lim'], m2['sigma_f_lim'])
+
+        # Facteurs indépendants de la charge
+        self.z_h = float(ISO6336.zone_factor(self.transverse_pressure_angle,
+                                             self.base_helix_angle))
+        self.z_e = float(ISO6336.elasticity_factor(m1['E'], m1['poisson'],
+                                                   m2['E'], m2['poisson']))
+        self.z_eps = float(ISO6336.contact_ratio_factor(self.contact_ratio,
+                                                        self.overlap_ratio))
+        self.z_beta = float(ISO6336.helix_factor_contact(self.helix_angle))
+        self.y_eps = float(ISO6336.bending_contact_ratio_factor(self.contact_ratio,
+                                                                self.base_helix_angle))
+        self.y_beta = float(ISO6336.helix_factor_bending(self.overlap_ratio,
+                                                         self.helix_angle))
+        zn1 = ISO21771.equivalent_spur_gear_teeth(self.z1, self.helix_angle)
+        zn2 = math.inf if (self.is_rack or self.is_internal) else \
+            ISO21771.equivalent_spur_gear_teeth(self.z2, self.helix_angle)
+        self.y_fs = (float(ISO6336.form_stress_factor(zn1, p.profile_shift)),
+                     float(ISO6336.form_stress_factor(
+                         zn2, wheel.params.profile_shift if wheel is not None else 0.0)))
+
+    @staticmethod
+    def _mate_teeth(pinion: Gear, wheel: Optional[Gear]) -> int:
+        """Nombre de dents de la roue (conjuguée ou identique par défaut)"""
+        if wheel is not None:
+            return wheel.params.teeth
+        return pinion.params.mate_teeth or pinion.params.teeth
+
+    def _transverse_contact_ratio(self, pinion: Gear, wheel: Optional[Gear]) -> float:
+        """Rapport de conduite apparent ε_α à l'entraxe de référence"""
+        alpha_t = math.radians(self.transverse_pressure_angle)
+        m_t = self.normal_module / math.cos(math.radians(self.helix_angle))
+        p_bt = math.pi * m_t * math.cos(alpha_t)
+        r1 = pinion.pitch_diameter / 2
+        ra1 = pinion.outside_diameter / 2
+        path1 = math.sqrt(ra1**2 - (r1 * math.cos(alpha_t))**2)
+
+        if self.is_rack:
+            addendum = wheel.addendum if wheel is not None else self.normal_module
+            path = path1 - r1 * math.sin(alpha_t) + addendum / math.sin(alpha_t)
+            return path / p_bt
+
+        r2 = self.z2 * m_t / 2 if wheel is None else wheel.pitch_diameter / 2
+        ra2 = r2 + self.normal_module if wheel is None else wheel.outside_diameter / 2
+        path2 = math.sqrt(max(ra2**2 - (r2 * math.cos(alpha_t))**2, 0.0))
+        if self.is_internal:
+            a = r2 - r1
+            return (path1 - path2 + a * math.sin(alpha_t)) / p_bt
+        a = r1 + r2
+        return (path1 + path2 - a * math.sin(alpha_t)) / p_bt
+
+    def evaluate(self, torque, speed=0.0, hours=None) -> Dict[str, np.ndarray]:
+        """
+        Contraintes pour chaque classe de charge (vectorisé)
+
+        Args:
+            torque: couple sur le pignon (N·m), scalaire ou tableau
+            speed: vitesse du pignon (tr/min), scalaire ou tableau
+            hours: durée de chaque classe (h) ; active le cumul de dommage
+
+        Returns:
+            Dictionnaire de tableaux (MPa pour les contraintes)
+        """
+        torque = np.asarray(torque, dtype=float)
+        speed = np.asarray(speed, dtype=float)
+        b = self.face_width
+        d1 = self.pitch_diameter
+
+        tangential_force = 2000 * np.abs(torque) / d1
+        velocity = math.pi * d1 * speed / 60000
+        k_v = ISO6336.dynamic_factor(
+            self.z1, velocity, self.gear_ratio, tangential_force / b,
+            self.application_factor, self.helix_angle != 0, self.accuracy_grade
+        )
+        load_factor = (self.application_factor * k_v * self.face_load_factor *
+                       self.transverse_load_factor)
+
+        nominal_bending = tangential_force / (b * self.normal_module)
+        bending = nominal_bending * self.y_eps * self.y_beta * load_factor
+        bending_pinion = bending * self.y_fs[0]
+        bending_wheel = bending * self.y_fs[1]
+
+        u = self.gear_ratio
+        ratio_term = 1.0 if math.isinf(u) else (u + 1) / u
+        contact = (self.z_h * self.z_e * self.z_eps * self.z_beta *
+                   np.sqrt(tangential_force / (d1 * b) * ratio_term * load_factor))
+
+        sigma_fe = (self.sigma_f_lim[0] * ISO6336.Y_ST, self.sigma_f_lim[1] * ISO6336.Y_ST)
+        result = {
+            'tangential_force': tangential_force,
+            'pitch_line_velocity': velocity,
+            'dynamic_factor': k_v,
+            'bending_stress_pinion': bending_pinion,
+            'bending_stress_wheel': bending_wheel,
+            'contact_stress': contact,
+            'safety_bending_pinion': sigma_fe[0] / bending_pinion,
+            'safety_bending_wheel': sigma_fe[1] / bending_wheel,
+            'safety_contact': self.sigma_h_lim / contact,
+        }
+
+        if hours is not None:
+            cycles = speed * 60 * np.asarray(hours, dtype=float)
+            wheel_cycles = cycles if math.isinf(u) else cycles / abs(u)
+            result['cycles'] = cycles
+            result['damage_bending_pinion'] = self._damage(
+                bending_pinion, sigma_fe[0], cycles,
+                ISO6336.BENDING_REFERENCE_CYCLES, ISO6336.BENDING_SN_EXPONENT)
+            result['damage_bending_wheel'] = self._damage(
+                bending_wheel, sigma_fe[1], wheel_cycles,
+                ISO6336.BENDING_REFERENCE_CYCLES, ISO6336.BENDING_SN_EXPONENT)
+            result['damage_contact'] = self._damage(
+                contact, self.sigma_h_lim, cycles,
+                ISO6336.CONTACT_REFERENCE_CYCLES, ISO6336.CONTACT_SN_EXPONENT)
+
+        return result
+
+    @staticmethod
+    def _damage(stress, limit, cycles, reference_cycles, exponent) -> float:
+        """Somme de Miner sur le spectre"""
+        allowable = ISO6336.cycles_to_failure(stress, limit, reference_cycles, exponent)
+        return float(np.sum(np.broadcast_to(cycles, allowable.shape) / allowable))
+
+    def allowable_torque(self) -> Dict[str, float]:
+        """Couples admissibles (S = 1) en statique, sans facteur dynamique"""
+        b = self.face_width
+        d1 = self.pitch_diameter
+        k = self.application_factor * self.face_load_factor * self.transverse_load_factor
+        unit_bending = 2000 / d1 / (b * self.normal_module) * self.y_eps * self.y_beta * k
+        bending = min(self.sigma_f_lim[i] * ISO6336.Y_ST / (unit_bending * self.y_fs[i])
+                      for i in range(2))
+        u = self.gear_ratio
+        ratio_term = 1.0 if math.isinf(u) else (u + 1) / u
+        z = self.z_h * self.z_e * self.z_eps * self.z_beta
+        contact = (self.sigma_h_lim / z) ** 2 * d1 * b / (ratio_term * k) * d1 / 2000
+        return {'bending': bending, 'contact': contact}
+
+    @staticmethod
+    def performances(gear: Gear, load: Optional[Dict[str, Any]] = None,
+                     mate: Optional[Gear] = None) -> Dict[str, Any]:
+        """
+        Bloc 'performances' des endpoints d'analyse
+
+        load accepte {'torque', 'speed'} ou {'spectrum': [{'torque', 'speed',
+        'hours'}, ...]} ; sans charge, DEFAULT_TORQUE et DEFAULT_SPEED.
+        """
+        load = load or {}
+        try:
+            engine = StressEngine(gear, mate)
+        except ValueError as e:
+            return {'bending_stress': None, 'contact_stress': None, 'note': str(e)}
+
+        if 'spectrum' in load:
+            spectrum = load['spectrum']
+            torque = [row['torque'] for row in spectrum]
+            speed = [row.get('speed', 0.0) for row in spectrum]
+            hours = [row.get('hours', 0.0) for row in spectrum]
+        else:
+            torque = load.get('torque', DEFAULT_TORQUE)
+            speed = load.get('speed', DEFAULT_SPEED)
+            hours = load.get('hours')
+
+        result = engine.evaluate(torque, speed, hours)
+        bending = np.maximum(result['bending_stress_pinion'], result['bending_stress_wheel'])
+        performances = {
+            'bending_stress': float(np.max(bending)),
+            'bending_stress_pinion': float(np.max(result['bending_stress_pinion'])),
+            'bending_stress_wheel': float(np.max(result['bending_stress_wheel'])),
+            'contact_stress': float(np.max(result['contact_stress'])),
+            'safety_bending': float(np.min(np.minimum(result['safety_bending_pinion'],
+                                                      result['safety_bending_wheel']))),
+            'safety_contact': float(np.min(result['safety_contact'])),
+            'allowable_torque': engine.allowable_torque(),
+            'unit': 'MPa',
+        }
+        for key in ('damage_bending_pinion', 'damage_bending_wheel', 'damage_contact'):
+            if key in result:
+                performances[key] = result[key]
+        return performances
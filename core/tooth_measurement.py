@@ -0,0 +1,142 @@
+"""
+Cotes de contrôle de la denture (ISO 21771): épaisseur, cote sur k dents,
+cote sur billes/piges et angle de pression de fonctionnement.
+
+Toutes les fonctions acceptent des scalaires ou des tableaux NumPy
+(diffusion standard) et retournent un float ou un tableau.
+"""
+import math
+import numpy as np
+
+from profiles.involute import involute, inverse_involute, _as_scalar
+
+
+def _transverse_angles(pressure_angle, helix_angle):
+    """Angles normal et apparent (radians) à partir des angles en degrés"""
+    alpha_n = np.radians(np.asarray(pressure_angle, dtype=float))
+    beta = np.radians(np.asarray(helix_angle, dtype=float))
+    alpha_t = np.arctan(np.tan(alpha_n) / np.cos(beta))
+    return alpha_n, alpha_t, beta
+
+
+class ToothMeasurement:
+    """Calculs vectorisés des cotes de contrôle d'engrenages en développante"""
+    
+    @staticmethod
+    def thickness_at_radius(module, teeth, radius, pressure_angle=20.0,
+                            profile_shift=0.0, helix_angle=0.0):
+        """
+        Épaisseur circulaire apparente de la dent au(x) rayon(s) donné(s)
+        
+        s_y = d_y * (s_t / d + inv α_t - inv α_yt), nulle sous le cercle
+        de base et négative au-delà du rayon de dent pointue.
+        """
+        module = np.asarray(module, dtype=float)
+        teeth = np.asarray(teeth, dtype=float)
+        radius = np.asarray(radius, dtype=float)
+        alpha_n, alpha_t, beta = _transverse_angles(pressure_angle, helix_angle)
+        
+        d = teeth * module / np.cos(beta)
+        rb = d / 2 * np.cos(alpha_t)
+        s_t = module * (math.pi / 2 + 2 * np.asarray(profile_shift) * np.tan(alpha_n)) / np.cos(beta)
+        
+        below_base = radius < rb
+        alpha_y = np.arccos(np.minimum(rb / np.where(below_base, rb, radius), 1.0))
+        thickness = 2 * radius * (s_t / d + involute(alpha_t) - involute(alpha_y))
+        return _as_scalar(np.where(below_base, 0.0, thickness))
+    
+    @staticmethod
+    def span_teeth(teeth, pressure_angle=20.0, profile_shift=0.0, helix_angle=0.0):
+        """
+        Nombre de dents k pour la cote sur k dents (contact proche du primitif)
+        
+        k = z/π (tan α_x / cos² β_b - 2 x tan α_n / z - inv α_t) + 0.5,
+        avec sin β_b = sin β cos α_n (DIN 3960).
+        """
+        teeth = np.asarray(teeth, dtype=float)
+        x = np.asarray(profile_shift, dtype=float)
+        alpha_n, alpha_t, beta = _transverse_angles(pressure_angle, helix_angle)
+        
+        # Angle de pression apparent au diamètre de mesure visé (d + 2xm)
+        cos_beta_b2 = 1 - (np.sin(beta) * np.cos(alpha_n)) ** 2
+        cos_alpha_x = np.clip(teeth * np.cos(alpha_t) / (teeth + 2 * x * np.cos(beta)), -1, 1)
+        alpha_x = np.arccos(cos_alpha_x)
+        k = teeth / math.pi * (np.tan(alpha_x) / cos_beta_b2 - 2 * x * np.tan(alpha_n) / teeth
+                               - involute(alpha_t)) + 0.5
+        k = np.maximum(np.rint(k), 1).astype(int)
+        return int(k) if k.ndim == 0 else k
+    
+    @staticmethod
+    def span_width(module, teeth, span_teeth=None, pressure_angle=20.0,
+                   profile_shift=0.0, helix_angle=0.0):
+        """
+        Cote sur k dents (Wildhaber), mesurée dans le plan normal
+        
+        W_k = m_n cos α_n [(k - 0.5) π + z inv α_t] + 2 x m_n sin α_n
+        """
+        module = np.asarray(module, dtype=float)
+        teeth = np.asarray(teeth, dtype=float)
+        if span_teeth is None:
+            span_teeth = ToothMeasurement.span_teeth(teeth, pressure_angle,
+                                                     profile_shift, helix_angle)
+        k = np.asarray(span_teeth, dtype=float)
+        alpha_n, alpha_t, _ = _transverse_angles(pressure_angle, helix_angle)
+        
+        width = module * np.cos(alpha_n) * ((k - 0.5) * math.pi + teeth * involute(alpha_t)) \
+            + 2 * np.asarray(profile_shift) * module * np.sin(alpha_n)
+        return _as_scalar(width)
+    
+    @staticmethod
+    def over_balls(module, teeth, ball_diameter, pressure_angle=20.0,
+                   profile_shift=0.0, helix_angle=0.0):
+        """
+        Cote sur billes (ou piges) M_dK
+        
+        inv α_M = inv α_t + D_M / (z m_n cos α_n) - π / (2z) + 2 x tan α_n / z
+        d_M = d cos α_t / cos α_M ; M = d_M + D_M (z pair)
+        ou d_M cos(90°/z) + D_M (z impair).
+        """
+        module = np.asarray(module, dtype=float)
+        teeth = np.asarray(teeth, dtype=float)
+        ball_diameter = np.asarray(ball_diameter, dtype=float)
+        alpha_n, alpha_t, beta = _transverse_angles(pressure_angle, helix_angle)
+        
+        inv_m = (involute(alpha_t) + ball_diameter / (teeth * module * np.cos(alpha_n))
+                 - math.pi / (2 * teeth)
+                 + 2 * np.asarray(profile_shift) * np.tan(alpha_n) / teeth)
+        alpha_m = inverse_involute(inv_m)
+        d = teeth * module / np.cos(beta)
+        d_m = d * np.cos(alpha_t) / np.cos(alpha_m)
+        
+        odd = np.mod(teeth, 2) == 1
+        center_span = np.where(odd, d_m * np.cos(math.pi / (2 * teeth)), d_m)
+        return _as_scalar(center_span + ball_diameter)
+    
+    @staticmethod
+    def operating_pressure_angle(teeth1, teeth2, profile_shift1=0.0,
+                                 profile_shift2=0.0, pressure_angle=20.0,
+                                 helix_angle=0.0):
+        """
+        Angle de pression apparent de fonctionnement (degrés) d'une paire déportée
+        
+        inv α_wt = 2 (x1 + x2) tan α_n / (z1 + z2) + inv α_t
+        """
+        z_sum = np.asarray(teeth1, dtype=float) + np.asarray(teeth2, dtype=float)
+        x_sum = np.asarray(profile_shift1, dtype=float) + np.asarray(profile_shift2, dtype=float)
+        alpha_n, alpha_t, _ = _transverse_angles(pressure_angle, helix_angle)
+        
+        inv_w = 2 * x_sum * np.tan(alpha_n) / z_sum + involute(alpha_t)
+        return _as_scalar(np.degrees(inverse_involute(inv_w)))
+    
+    @staticmethod
+    def operating_center_distance(module, teeth1, teeth2, profile_shift1=0.0,
+                                  profile_shift2=0.0, pressure_angle=20.0,
+                                  helix_angle=0.0):
+        """Entraxe de fonctionnement a_w = a cos α_t / cos α_wt"""
+        _, alpha_t, beta = _transverse_angles(pressure_angle, helix_angle)
+        a = (np.asarray(teeth1, dtype=float) + np.asarray(teeth2, dtype=float)) \
+            * np.asarray(module, dtype=float) / (2 * np.cos(beta))
+        alpha_w = np.radians(ToothMeasurement.operating_pressure_angle(
+            teeth1, teeth2, profile_shift1, profile_shift2, pressure_angle, helix_angle
+        ))
+        return _as_scalar(a * np.cos(alpha_t) / np.cos(alpha_w))
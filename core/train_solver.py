@@ -0,0 +1,375 @@
+"""
+Solveur de trains d'engrenages : recherche des nombres de dents d'un train
+de 1 à 4 étages approchant un rapport cible
+
+Les rapports d'étage admissibles sont précalculés une fois (tables en
+logarithme), puis les trains de 2 à 4 étages sont assemblés par
+rencontre au milieu : table triée des demi-trains droits, parcourue par
+recherche dichotomique de la fenêtre de tolérance pour chaque demi-train
+gauche. Les demi-trains gauches sont traités par blocs et les tables de
+deux étages construites par blocs : aucune table de toutes les paires
+n'est allouée d'un seul tenant.
+"""
+import math
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+
+from .validation import GearValidator
+
+# Limites par défaut
+DEFAULT_MIN_TEETH = 12
+DEFAULT_MAX_TEETH = 100
+DEFAULT_MAX_STAGE_RATIO = 8.0
+MAX_STAGES = 4
+
+# Limites des requêtes JSON (API / CLI) : taille des tables et des réponses
+REQUEST_MAX_TEETH = DEFAULT_MAX_TEETH
+REQUEST_MAX_SOLUTIONS = 1000
+
+# Nombre d'éléments (demi-trains gauches, paires d'étages) traités par bloc
+CHUNK_SIZE = 1 << 18
+
+# Nombre maximal de correspondances développées par nombre d'étages, et
+# nombre de demi-trains gauches retenus par solution demandée
+MAX_MATCHES = 1_000_000
+MATCH_FACTOR = 64
+
+# Écart de log-rapport considéré comme nul (arrondi des sommes)
+RATIO_EPSILON = 1e-12
+
+
+class GearTrainSolver:
+    """Recherche de trains d'engrenages par tables de rapports"""
+
+    def __init__(self, module: float = 1.0,
+                 pressure_angle: float = 20.0,
+                 min_teeth: int = DEFAULT_MIN_TEETH,
+                 max_teeth: int = DEFAULT_MAX_TEETH,
+                 max_stage_ratio: float = DEFAULT_MAX_STAGE_RATIO,
+                 center_distance: Optional[float] = None,
+                 coaxial: bool = False,
+                 check_undercut: bool = True):
+        if module <= 0:
+            raise ValueError(f"Module doit être > 0, got {module}")
+        if max_stage_ratio < 1:
+            raise ValueError(f"Rapport d'étage maximal doit être >= 1, got {max_stage_ratio}")
+
+        self.module = module
+        self.pressure_angle = pressure_angle
+        self.max_stage_ratio = max_stage_ratio
+        self.center_distance = center_distance
+        self.coaxial = coaxial
+
+        # Sous-dépouille : plus petit nombre entier de dents au-dessus de la
+        # limite de taillage (GearValidator.check_undercut, sans déport)
+        if check_undercut:
+            undercut_limit = float(GearValidator.min_teeth_no_undercut(pressure_angle))
+            min_teeth = max(min_teeth, math.ceil(undercut_limit - 1e-9))
+        self.min_teeth = min_teeth
+        self.max_teeth = max_teeth
+        if min_teeth > max_teeth:
+            raise ValueError(
+                f"Aucun nombre de dents admissible entre {min_teeth} et {max_teeth}"
+            )
+
+        self._stage_table = self._build_stage_table()
+        self._half_tables: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _build_stage_table(self) -> Dict[str, np.ndarray]:
+        """Table des étages admissibles (menante, menée, log du rapport, entraxe)"""
+        teeth = np.arange(self.min_teeth, self.max_teeth + 1)
+        driver, driven = (axis.ravel() for axis in np.meshgrid(teeth, teeth, indexing='ij'))
+        ratio = driven / driver
+        keep = (ratio <= self.max_stage_ratio) & (ratio >= 1 / self.max_stage_ratio)
+
+        if self.center_distance is not None:
+            teeth_sum = 2 * self.center_distance / self.module
+            keep &= np.isclose(driver + driven, teeth_sum)
+
+        driver, driven = driver[keep], driven[keep]
+        # Tri par rapport puis par encombrement : le premier de chaque rapport
+        # est le plus petit
+        order = np.lexsort((driver + driven, np.round(np.log(driven / driver), 12)))
+        driver, driven = driver[order], driven[order]
+        return {
+            'driver': driver,
+            'driven': driven,
+            'log_ratio': np.log(driven / driver),
+            'teeth_sum': driver + driven,
+        }
+
+    @staticmethod
+    def _unique_ratios(table: Dict[str, np.ndarray], mask=None) -> np.ndarray:
+        """Indices d'un représentant (le plus petit) par rapport distinct"""
+        indices = np.arange(len(table['driver'])) if mask is None else np.flatnonzero(mask)
+        keys = np.round(table['log_ratio'][indices], 12)
+        _, first = np.unique(keys, return_index=True)
+        return indices[np.sort(first)]
+
+    def solve(self, target_ratio: float,
+              tolerance: float = 1e-3,
+              min_stages: int = 1,
+              max_stages: int = MAX_STAGES,
+              max_solutions: int = 20) -> List[Dict[str, Any]]:
+        """
+        Trouver les trains approchant target_ratio
+
+        Args:
+            target_ratio: rapport global (vitesse d'entrée / vitesse de sortie)
+            tolerance: écart relatif admissible sur le rapport
+            min_stages, max_stages: nombre d'étages (1 à 4)
+
+        Returns:
+            Solutions triées par nombre d'étages, écart puis nombre total de dents
+        """
+        if target_ratio <= 0:
+            raise ValueError(f"Rapport cible doit être > 0, got {target_ratio}")
+        if not 1 <= min_stages <= max_stages <= MAX_STAGES:
+            raise ValueError(f"Nombre d'étages doit être entre 1 et {MAX_STAGES}")
+        if tolerance < 0:
+            raise ValueError(f"Tolérance doit être >= 0, got {tolerance}")
+
+        log_target = math.log(target_ratio)
+        window = math.log1p(tolerance)
+
+        # Entraxe commun : un sous-problème par somme de dents
+        if self.coaxial:
+            groups = [(int(s), self._stage_table['teeth_sum'] == s)
+                      for s in np.unique(self._stage_table['teeth_sum'])]
+        else:
+            groups = [(None, None)]
+
+        solutions = []
+        for stages in range(min_stages, max_stages + 1):
+            for group_key, group in groups:
+                rows = self._unique_ratios(self._stage_table, group)
+                combos = self._search(rows, stages, log_target, window,
+                                      max_solutions, group_key)
+                solutions.extend(self._describe(combo, target_ratio) for combo in combos)
+
+        solutions.sort(key=lambda s: (len(s['stages']), abs(s['error']), s['total_teeth']))
+        return solutions[:max_solutions]
+
+    def _search(self, rows: np.ndarray, stages: int, log_target: float,
+                window: float, limit: int, group_key=None) -> np.ndarray:
+        """
+        Meilleures combinaisons d'étages (indices de table, tableau (M, stages))
+        dans la fenêtre de tolérance, au plus limit
+        """
+        table = self._stage_table
+        # Aucun étage admissible (entraxe impossible) : pas de solution
+        if len(rows) == 0:
+            return np.empty((0, stages), dtype=int)
+        if stages == 1:
+            combos = rows[np.abs(table['log_ratio'][rows] - log_target) <= window][:, None]
+            return self._best(combos, log_target, limit)
+
+        right_count = stages // 2
+        left_idx, left_val = self._half_train(rows, stages - right_count, group_key)
+        right_idx, right_sorted = self._half_train(rows, right_count, group_key)
+
+        # Rencontre au milieu, par blocs de demi-trains gauches : fenêtre
+        # [cible - gauche ± tolérance] cherchée dans la table droite triée.
+        # La fenêtre se resserre à l'écart de la limit-ième meilleure
+        # solution déjà trouvée.
+        best = np.empty((0, stages), dtype=int)
+        for start in range(0, len(left_val), CHUNK_SIZE):
+            need = log_target - left_val[start:start + CHUNK_SIZE]
+            lo, hi, window = self._matches(right_sorted, need, window, limit)
+            counts = hi - lo
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            left_rep = np.repeat(np.arange(len(counts)), counts) + start
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            right_rep = np.repeat(lo, counts) + offsets
+            combos = np.vstack((best, np.hstack((left_idx[left_rep], right_idx[right_rep]))))
+            best = self._best(combos, log_target, limit)
+            if len(best) == limit:
+                error = np.abs(table['log_ratio'][best[-1]].sum() - log_target)
+                window = min(window, float(error) + RATIO_EPSILON)
+        return best
+
+    @staticmethod
+    def _matches(right_sorted: np.ndarray, need: np.ndarray, window: float,
+                 limit: int) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Bornes [lo, hi[ des demi-trains droits à moins de window de need
+
+        Au-delà de MAX_MATCHES correspondances, la fenêtre est réduite à
+        l'écart des MATCH_FACTOR × limit meilleurs demi-trains gauches (seules
+        les limit meilleures solutions sont utiles), puis divisée par deux.
+        """
+        lo = np.searchsorted(right_sorted, need - window, side='left')
+        hi = np.searchsorted(right_sorted, need + window, side='right')
+        if int((hi - lo).sum()) <= MAX_MATCHES:
+            return lo, hi, window
+
+        nearest = np.searchsorted(right_sorted, need)
+        below = np.abs(need - right_sorted[np.maximum(nearest - 1, 0)])
+        above = np.abs(right_sorted[np.minimum(nearest, len(right_sorted) - 1)] - need)
+        closest = np.minimum(below, above)
+        keep = min(len(closest), MATCH_FACTOR * limit) - 1
+        window = min(window, float(np.partition(closest, keep)[keep]) + RATIO_EPSILON)
+        while True:
+            lo = np.searchsorted(right_sorted, need - window, side='left')
+            hi = np.searchsorted(right_sorted, need + window, side='right')
+            if int((hi - lo).sum()) <= MAX_MATCHES or window <= RATIO_EPSILON:
+                return lo, hi, window
+            window /= 2
+
+    def _best(self, combos: np.ndarray, log_target: float, limit: int) -> np.ndarray:
+        """limit meilleures combinaisons distinctes (écart puis encombrement)"""
+        if len(combos) == 0:
+            return combos
+        table = self._stage_table
+        # Les permutations d'un même ensemble d'étages sont équivalentes
+        combos = np.unique(np.sort(combos, axis=1), axis=0)
+        error = np.abs(table['log_ratio'][combos].sum(axis=1) - log_target)
+        size = table['teeth_sum'][combos].sum(axis=1)
+        return combos[np.lexsort((size, np.round(error, 12)))[:limit]]
+
+    def _half_train(self, rows: np.ndarray, stages: int,
+                    group_key=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Table triée d'un demi-train (1 ou 2 étages) : indices d'étages
+        (M, stages) et log du rapport, un représentant par rapport distinct
+
+        Les paires sont limitées aux indices croissants, les permutations
+        d'étages donnant le même rapport, et engendrées par blocs de lignes
+        dédoublonnés au fur et à mesure. Les tables sont précalculées une
+        fois par solveur et réutilisées d'un appel à l'autre.
+        """
+        cache_key = (group_key, stages)
+        if cache_key in self._half_tables:
+            return self._half_tables[cache_key]
+
+        log_ratio = self._stage_table['log_ratio'][rows]
+        if stages == 1:
+            table = self._distinct(rows[:, None], log_ratio)
+        else:
+            count = len(rows)
+            step = max(1, CHUNK_SIZE // count)
+            table = np.empty((0, 2), dtype=np.int32), np.empty(0)
+            pending, pending_size = [], 0
+            for first in range(0, count, step):
+                # Paires (i, j), j >= i, pour les lignes i du bloc
+                i = np.arange(first, min(first + step, count))
+                lengths = count - i
+                i = np.repeat(i, lengths)
+                j = i + np.arange(len(i)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+                block = self._distinct(np.column_stack((rows[i], rows[j])).astype(np.int32),
+                                       log_ratio[i] + log_ratio[j])
+                pending.append(self._absent(table, block))
+                pending_size += len(pending[-1][1])
+                # Fusion amortie dans la table triée, quand l'attente en
+                # atteint la moitié
+                if pending_size >= max(len(table[1]) // 2, CHUNK_SIZE) or \
+                        first + step >= count:
+                    block = self._distinct(np.vstack([p[0] for p in pending]),
+                                           np.concatenate([p[1] for p in pending]))
+                    block = self._absent(table, block)
+                    at = np.searchsorted(table[1], block[1])
+                    table = (np.insert(table[0], at, block[0], axis=0),
+                             np.insert(table[1], at, block[1]))
+                    pending, pending_size = [], 0
+        self._half_tables[cache_key] = table
+        return table
+
+    @staticmethod
+    def _absent(table: Tuple[np.ndarray, np.ndarray],
+                block: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Demi-trains du bloc dont le rapport est absent de la table triée"""
+        values = table[1]
+        if len(values) == 0:
+            return block
+        at = np.minimum(np.searchsorted(values, block[1]), len(values) - 1)
+        new = values[at] != block[1]
+        return block[0][new], block[1][new]
+
+    @staticmethod
+    def _distinct(combos: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Premier représentant de chaque rapport distinct, trié ; le log du
+        rapport est arrondi (clé de dédoublonnage et de recherche)
+        """
+        values, first = np.unique(np.round(values, 11), return_index=True)
+        return combos[first], values
+
+    def _describe(self, combo: Tuple[int, ...], target_ratio: float) -> Dict[str, Any]:
+        """Dictionnaire de solution"""
+        table = self._stage_table
+        stages = []
+        ratio = 1.0
+        total_teeth = 0
+        for index in combo:
+            driver = int(table['driver'][index])
+            driven = int(table['driven'][index])
+            ratio *= driven / driver
+            total_teeth += driver + driven
+            stages.append({
+                'driver_teeth': driver,
+                'driven_teeth': driven,
+                'ratio': driven / driver,
+                'center_distance': self.module * (driver + driven) / 2,
+            })
+        return {
+            'ratio': ratio,
+            'error': ratio / target_ratio - 1,
+            'total_teeth': total_teeth,
+            'module': self.module,
+            'stages': stages,
+        }
+
+    @staticmethod
+    def solve_request(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Résoudre une requête JSON (API / CLI)
+
+        Clés: target_ratio (obligatoire), tolerance, min_stages, max_stages,
+        max_solutions, module, pressure_angle, min_teeth, max_teeth,
+        max_stage_ratio, center_distance, coaxial, check_undercut
+        """
+        if 'target_ratio' not in data:
+            raise ValueError('target_ratio requis')
+        # Bornes des requêtes : la taille des tables croît comme max_teeth⁴
+        max_teeth = _request_int(data, 'max_teeth', DEFAULT_MAX_TEETH, 1, REQUEST_MAX_TEETH)
+        min_teeth = _request_int(data, 'min_teeth', DEFAULT_MIN_TEETH, 1, max_teeth)
+        max_stages = _request_int(data, 'max_stages', MAX_STAGES, 1, MAX_STAGES)
+        min_stages = _request_int(data, 'min_stages', 1, 1, max_stages)
+        max_solutions = _request_int(data, 'max_solutions', 20, 1, REQUEST_MAX_SOLUTIONS)
+        solver = GearTrainSolver(
+            module=data.get('module', 1.0),
+            pressure_angle=data.get('pressure_angle', 20.0),
+            min_teeth=min_teeth,
+            max_teeth=max_teeth,
+            max_stage_ratio=data.get('max_stage_ratio', DEFAULT_MAX_STAGE_RATIO),
+            center_distance=data.get('center_distance'),
+            coaxial=data.get('coaxial', False),
+            check_undercut=data.get('check_undercut', True),
+        )
+        solutions = solver.solve(
+            float(data['target_ratio']),
+            tolerance=data.get('tolerance', 1e-3),
+            min_stages=min_stages,
+            max_stages=max_stages,
+            max_solutions=max_solutions,
+        )
+        return {
+            'target_ratio': float(data['target_ratio']),
+            'min_teeth': solver.min_teeth,
+            'solutions': solutions,
+            'count': len(solutions),
+        }
+
+
+def _request_int(data: Dict[str, Any], key: str, default: int, low: int, high: int) -> int:
+    """Entier d'une requête JSON, borné à [low, high] (ValueError sinon)"""
+    value = data.get(key, default)
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{key} doit être un entier, got {value!r}")
+    if not low <= value <= high:
+        raise ValueError(f"{key} doit être entre {low} et {high}, got {value}")
+    return value
@@ -1,9 +1,27 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 from .base_gear import Gear, GearParams
 
 class GearValidator:
     """Validation des engrenages et des paires"""
     
+    # Coefficient de saillie de la crémaillère de référence (ISO 53)
+    ADDENDUM_COEFFICIENT = 1.0
+    
+    @staticmethod
+    def min_teeth_no_undercut(pressure_angle, profile_shift=0.0, helix_angle=0.0,
+                              addendum_coefficient: float = ADDENDUM_COEFFICIENT):
+        """
+        Nombre de dents limite de taillage par crémaillère sans sous-dépouille
+        
+        z_min = 2 (h_a* - x) cos β / sin² α_t ; il y a sous-dépouille si z < z_min.
+        Accepte des scalaires ou des tableaux NumPy.
+        """
+        beta = np.radians(helix_angle)
+        alpha_t = np.arctan(np.tan(np.radians(pressure_angle)) / np.cos(beta))
+        return 2 * (addendum_coefficient - np.asarray(profile_shift, dtype=float)) * \
+            np.cos(beta) / np.sin(alpha_t)**2
+    
     @staticmethod
     def validate_gear_params(params: GearParams) -> List[str]:
         """Valider les paramètres d'un engrenage"""
@@ -50,23 +68,34 @@ class GearValidator:
         return errors
     
     @staticmethod
-    def check_interference(gear: Gear) -> Tuple[bool, str]:
-        """Vérifier l'interférence"""
-        if gear.params.teeth < 17 and gear.params.profile_shift == 0:
+    def check_interference(gear: Gear, mate: Optional[Gear] = None) -> Tuple[bool, str]:
+        """
+        Vérifier l'interférence de développante
+        
+        Sans roue conjuguée, le cas le plus défavorable (crémaillère) est
+        retenu ; avec une roue conjuguée, la tête de chaque roue est comparée
+        au rayon limite du point d'interférence (RuleEngine).
+        """
+        if mate is not None:
+            from .rule_engine import RuleEngine
+            issues = RuleEngine.check_gear_pair(gear, mate, codes=('pair.interference',))
+            if len(issues):
+                return (True,
+                       f"Interférence en tête: rayon {issues['value'][0]:.3f} mm "
+                       f"> limite {issues['limit'][0]:.3f} mm. Utiliser un déport de profil.")
+            return (False, "Pas d'interférence détectée")
+        
+        limit = float(GearValidator.min_teeth_no_undercut(
+            gear.params.pressure_angle, gear.params.profile_shift, gear.params.helix_angle))
+        if gear.params.teeth < limit:
             return (True, 
-                   f"Interférence possible avec {gear.params.teeth} dents. "
-                   f"Utiliser un déport de profil.")
+                   f"Interférence possible avec {gear.params.teeth} dents "
+                   f"(limite {limit:.2f}). Utiliser un déport de profil.")
         return (False, "Pas d'interférence détectée")
     
     @staticmethod
     def check_undercut(gear: Gear) -> bool:
-        """Vérifier le sous-dépouille"""
-        min_teeth_no_undercut = {
-            14.5: 32,
-            20: 18,
-            25: 12
-        }
-        min_teeth = min_teeth_no_undercut.get(
-            round(gear.params.pressure_angle), 17
-        )
-        return gear.params.teeth < min_teeth
\ No newline at end of file
+        """Vérifier la sous-dépouille (limite de taillage, déport compris)"""
+        limit = GearValidator.min_teeth_no_undercut(
+            gear.params.pressure_angle, gear.params.profile_shift, gear.params.helix_angle)
+        return bool(gear.params.teeth < limit)
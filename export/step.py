@@ -2,6 +2,7 @@
 Export STEP (ISO 10303) pour les engrenages
 """
 from typing import List, Tuple, Optional
+import math
 import numpy as np
 
 class STEPExporter:
@@ -19,13 +20,14 @@ class STEPExporter:
         self.entity_counter += 1
         return f"#{self.entity_counter - 1}"
     
-    def export_gear(self, gear, filename: str = "gear.step"):
-        """Exporter un engrenage en STEP"""
+    def export_gear(self, gear, filename: str = "gear.step",
+                    tolerance: Optional[float] = None):
+        """Exporter un engrenage en STEP (tolerance: flèche maximale du contour, mm)"""
         # En-tête STEP
         header = self._create_header()
         
         # Données géométriques
-        data_section = self._create_gear_geometry(gear)
+        data_section = self._create_gear_geometry(gear, tolerance)
         
         # Écrire le fichier
         with open(filename, 'w') as f:
@@ -46,7 +48,7 @@ FILE_SCHEMA(('CONFIG_CONTROL_DESIGN'));
 ENDSEC;
 """
     
-    def _create_gear_geometry(self, gear) -> list:
+    def _create_gear_geometry(self, gear, tolerance: Optional[float] = None) -> list:
         """Créer la géométrie STEP pour un engrenage"""
         # Points pour le cercle de base
         center = self._add_entity('CARTESIAN_POINT', ['', (0.0, 0.0, 0.0)])
@@ -58,9 +60,15 @@ ENDSEC;
         axis_placement = self._add_entity('AXIS2_PLACEMENT_3D', 
                                          ['', center, axis, dir_x])
         
-        # Cercle primitif
-        circle = self._add_entity('CIRCLE', 
-                                 ['', axis_placement, gear.pitch_diameter / 2])
+        # Cercle primitif (absent pour une crémaillère, de rayon infini)
+        profile = None
+        if math.isfinite(gear.pitch_diameter):
+            profile = self._add_entity('CIRCLE', 
+                                       ['', axis_placement, gear.pitch_diameter / 2])
+        
+        # Contour complet des dents (partagé avec les autres exportateurs)
+        if hasattr(gear, 'get_outline'):
+            profile = self._add_polyline(gear.get_outline(tolerance=tolerance))
         
         # Extrusion pour créer le solide
         if hasattr(gear, 'params') and hasattr(gear.params, 'face_width'):
@@ -69,10 +77,19 @@ ENDSEC;
             height = 10.0
         
         extruded_solid = self._add_entity('EXTRUDED_AREA_SOLID', 
-                                         ['', circle, axis, height])
+                                         ['', profile, axis, height])
         
         return [extruded_solid]
     
+    def _add_polyline(self, points: np.ndarray) -> str:
+        """Ajouter une polyligne fermée à partir d'un tableau (N, 2)"""
+        point_refs = [
+            self._add_entity('CARTESIAN_POINT', ['', (x, y, 0.0)])
+            for x, y in np.asarray(points, dtype=float)[:, :2].tolist()
+        ]
+        point_refs.append(point_refs[0])
+        return self._add_entity('POLYLINE', ['', '(' + ','.join(point_refs) + ')'])
+    
     def export_mesh_pair(self, gear1, gear2, filename: str = "mesh_pair.step"):
         """Exporter une paire d'engrenages en STEP"""
         # Distancer les engrenages
@@ -3,20 +3,33 @@ Export STL pour impression 3D
 """
 import struct
 import numpy as np
-from typing import List, Tuple
+from typing import Optional, Tuple
 
 class STLExporter:
     """Exportateur de fichiers STL (binaire)"""
     
+    # Enregistrement binaire d'une facette: normale, 3 sommets, attribut
+    FACET_DTYPE = np.dtype([
+        ('normal', '<f4', (3,)),
+        ('vertices', '<f4', (3, 3)),
+        ('attribute', '<u2'),
+    ])
+    
     @staticmethod
-    def write_binary_stl(faces: List[Tuple], filename: str):
+    def write_binary_stl(faces, filename: str):
         """
         Écrire un fichier STL binaire
         
         Args:
-            faces: Liste de faces, chaque face est un tuple de 3 points (9 floats)
+            faces: Tableau (F, 3, 3) de faces (ou liste de triplets de points)
             filename: Nom du fichier de sortie
         """
+        faces = np.asarray(faces, dtype=float).reshape(-1, 3, 3)
+        
+        records = np.zeros(len(faces), dtype=STLExporter.FACET_DTYPE)
+        records['normal'] = STLExporter._calculate_normals(faces)
+        records['vertices'] = faces
+        
         with open(filename, 'wb') as f:
             # En-tête (80 bytes)
             header = b'Binary STL - Gear Model' + b' ' * (80 - 23)
@@ -25,58 +38,84 @@ class STLExporter:
             # Nombre de faces (4 bytes, little endian)
             f.write(struct.pack('<I', len(faces)))
             
-            # Écrire chaque face
-            for face in faces:
-                # Normale (calculée à partir des points)
-                p1, p2, p3 = face
-                normal = STLExporter._calculate_normal(p1, p2, p3)
-                
-                # Écrire la normale
-                f.write(struct.pack('<3f', *normal))
-                
-                # Écrire les 3 vertices
-                for vertex in [p1, p2, p3]:
-                    f.write(struct.pack('<3f', *vertex))
-                
-                # Attribut byte count (2 bytes, généralement 0)
-                f.write(struct.pack('<H', 0))
+            # Toutes les faces en une seule écriture
+            f.write(records.tobytes())
+    
+    @staticmethod
+    def write_binary_stl_chunks(chunks, filename: str) -> int:
+        """
+        Écrire un fichier STL binaire à partir de paquets de faces
+        
+        Le nombre de faces est inscrit dans l'en-tête une fois le dernier
+        paquet écrit; un seul paquet est en mémoire à la fois.
+        
+        Returns:
+            Nombre de faces écrites
+        """
+        count = 0
+        with open(filename, 'wb') as f:
+            header = b'Binary STL - Gear Model' + b' ' * (80 - 23)
+            f.write(header)
+            f.write(struct.pack('<I', 0))
+            
+            for faces in chunks:
+                faces = np.asarray(faces, dtype=float).reshape(-1, 3, 3)
+                records = np.zeros(len(faces), dtype=STLExporter.FACET_DTYPE)
+                records['normal'] = STLExporter._calculate_normals(faces)
+                records['vertices'] = faces
+                f.write(records.tobytes())
+                count += len(faces)
+            
+            f.seek(80)
+            f.write(struct.pack('<I', count))
+        return count
     
     @staticmethod
     def _calculate_normal(p1: Tuple, p2: Tuple, p3: Tuple) -> Tuple:
         """Calculer la normale d'une face"""
-        v1 = np.array(p2) - np.array(p1)
-        v2 = np.array(p3) - np.array(p1)
-        normal = np.cross(v1, v2)
-        norm = np.linalg.norm(normal)
-        if norm > 0:
-            normal = normal / norm
+        normal = STLExporter._calculate_normals(np.array([[p1, p2, p3]], dtype=float))[0]
         return tuple(normal)
     
     @staticmethod
-    def gear_to_faces(gear, resolution: int = 32) -> List[Tuple]:
+    def _calculate_normals(faces: np.ndarray) -> np.ndarray:
+        """Calculer les normales unitaires d'un tableau (F, 3, 3) de faces"""
+        normals = np.cross(faces[:, 1] - faces[:, 0], faces[:, 2] - faces[:, 0])
+        norms = np.linalg.norm(normals, axis=1, keepdims=True)
+        return np.divide(normals, norms, out=np.zeros_like(normals),
+                         where=norms > 0)
+    
+    @staticmethod
+    def gear_to_faces(gear, resolution: int = 32,
+                      tolerance: Optional[float] = None) -> np.ndarray:
         """
         Convertir un engrenage en faces STL
         
         Args:
             gear: Objet engrenage
             resolution: Résolution angulaire
+            tolerance: Flèche maximale (mm); si fournie, l'échantillonnage
+                du contour suit la courbure au lieu de la résolution
             
         Returns:
-            Liste de faces pour l'STL
+            Tableau (F, 3, 3) de faces pour l'STL
         """
-        faces = []
+        # Solide propre au type (denture vrillée, conique, ...)
+        if hasattr(gear, 'get_solid'):
+            return gear.get_solid(max(4, resolution // 4), tolerance=tolerance)
         
         # Générer les points du profil
-        if hasattr(gear, 'get_tooth_points'):
-            tooth_points = gear.get_tooth_points(resolution)
+        if hasattr(gear, 'get_outline'):
+            # Résolution répartie sur les segments d'une dent
+            tooth_points = gear.get_outline(max(4, resolution // 4),
+                                            tolerance=tolerance)
+        elif hasattr(gear, 'get_tooth_points'):
+            tooth_points = np.asarray(gear.get_tooth_points(resolution), dtype=float)
         else:
             # Profil par défaut (cercle)
-            tooth_points = []
-            for i in range(resolution):
-                angle = 2 * np.pi * i / resolution
-                x = gear.pitch_diameter / 2 * np.cos(angle)
-                y = gear.pitch_diameter / 2 * np.sin(angle)
-                tooth_points.append((x, y, 0))
+            angles = 2 * np.pi * np.arange(resolution) / resolution
+            tooth_points = gear.pitch_diameter / 2 * np.column_stack(
+                (np.cos(angles), np.sin(angles))
+            )
         
         # Hauteur de l'engrenage
         if hasattr(gear.params, 'face_width'):
@@ -84,32 +123,45 @@ class STLExporter:
         else:
             height = 10.0
         
-        # Créer les faces latérales
-        for i in range(len(tooth_points)):
-            p1 = tooth_points[i]
-            p2 = tooth_points[(i + 1) % len(tooth_points)]
-            
-            # Face basse
-            p1_low = (p1[0], p1[1], 0)
-            p2_low = (p2[0], p2[1], 0)
-            center_low = (0, 0, 0)
-            faces.append((p1_low, p2_low, center_low))
-            
-            # Face haute
-            p1_high = (p1[0], p1[1], height)
-            p2_high = (p2[0], p2[1], height)
-            center_high = (0, 0, height)
-            faces.append((p2_high, p1_high, center_high))
-            
-            # Face latérale
-            faces.append((p1_low, p1_high, p2_low))
-            faces.append((p2_low, p1_high, p2_high))
+        return STLExporter.extrude_outline(tooth_points[:, :2], height)
+    
+    @staticmethod
+    def extrude_outline(outline: np.ndarray, height: float) -> np.ndarray:
+        """
+        Extruder un contour fermé (N, 2) en faces (4N, 3, 3)
+        
+        Les faces haute et basse sont triangulées en éventail vers l'axe.
+        """
+        n = len(outline)
+        zeros = np.zeros((n, 1))
+        low = np.hstack((outline, zeros))
+        high = np.hstack((outline, zeros + height))
+        low_next = np.roll(low, -1, axis=0)
+        high_next = np.roll(high, -1, axis=0)
+        center_low = np.zeros((n, 3))
+        center_high = np.zeros((n, 3))
+        center_high[:, 2] = height
+        
+        # Normales sortantes pour un contour trigonométrique
+        faces = np.stack((
+            np.stack((low_next, low, center_low), axis=1),      # Face basse
+            np.stack((high, high_next, center_high), axis=1),   # Face haute
+            np.stack((low, low_next, high), axis=1),            # Face latérale
+            np.stack((low_next, high_next, high), axis=1),
+        ), axis=1)
         
-        return faces
+        return faces.reshape(-1, 3, 3)
     
     @staticmethod
-    def export_gear(gear, filename: str = "gear.stl", resolution: int = 64):
-        """Exporter un engrenage en STL"""
-        faces = STLExporter.gear_to_faces(gear, resolution)
-        STLExporter.write_binary_stl(faces, filename)
-        print(f"Engrenage exporté vers {filename} ({len(faces)} faces)")
\ No newline at end of file
+    def export_gear(gear, filename: str = "gear.stl", resolution: int = 64,
+                    tolerance: Optional[float] = None):
+        """Exporter un engrenage en STL (en flux si le type le permet)"""
+        if hasattr(gear, 'iter_solid'):
+            count = STLExporter.write_binary_stl_chunks(
+                gear.iter_solid(max(4, resolution // 4), tolerance=tolerance), filename
+            )
+        else:
+            faces = STLExporter.gear_to_faces(gear, resolution, tolerance)
+            STLExporter.write_binary_stl(faces, filename)
+            count = len(faces)
+        print(f"Engrenage exporté vers {filename} ({count} faces)")
\ No newline at end of file
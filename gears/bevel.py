@@ -1,45 +1,35 @@
 from core.base_gear import Gear, GearParams
 from core.math_utils import GearMath
-from typing import Dict, Any, Tuple
+from profiles.outline import tile_teeth, tooth_polar_profile
+from profiles.sweep import sections_to_faces
+from typing import Dict, Any, Optional, Tuple
 import math
+import numpy as np
 
 class BevelGear(Gear):
     """Engrenage conique"""
     
     def __init__(self, params: GearParams):
         # Initialiser pitch_angle avant d'appeler super().__init__()
-        self.shaft_angle = params.shaft_angle or 90.0
+        self.shaft_angle = GearMath.bevel_shaft_angle(params.shaft_angle)
         
-        # Calcul de l'angle primitif
-        if params.pitch_angle is not None:
-            self.pitch_angle = params.pitch_angle
-        else:
-            # Par défaut, pour un engrenage conique à axes orthogonaux
-            if params.mate_teeth is not None:
-                self.pitch_angle = math.degrees(
-                    math.atan(params.teeth / params.mate_teeth)
-                )
-            else:
-                # Angle par défaut pour 45 degrés (1:1)
-                self.pitch_angle = 45.0
+        # Angle primitif donné, sinon à axes orthogonaux d'après le conjugué
+        self.pitch_angle = GearMath.bevel_pitch_angle(
+            params.pitch_angle, params.teeth, params.mate_teeth
+        )
         
-        self.back_angle = self.shaft_angle - self.pitch_angle
+        self.back_angle = GearMath.back_angle(self.shaft_angle, self.pitch_angle)
         
         super().__init__(params)
     
     def _calculate_geometry(self):
         """Calculer la géométrie spécifique aux engrenages coniques"""
         # Rayon primitif moyen (pour les calculs)
-        self.mean_pitch_radius = self.pitch_diameter / 2 * math.cos(
-            math.radians(self.pitch_angle)
-        )
+        self.mean_pitch_radius = GearMath.mean_pitch_radius(self.pitch_diameter,
+                                                            self.pitch_angle)
         
         # Hauteur du cône (distance du sommet à la ligne primitive)
-        sin_pitch = math.sin(math.radians(self.pitch_angle))
-        if sin_pitch > 0:
-            self.cone_distance = self.pitch_diameter / (2 * sin_pitch)
-        else:
-            self.cone_distance = float('inf')
+        self.cone_distance = GearMath.cone_distance(self.pitch_diameter, self.pitch_angle)
     
     def mesh_with(self, other: Gear) -> Tuple[float, float]:
         """Calculer les paramètres d'engrènement"""
@@ -53,45 +43,93 @@ class BevelGear(Gear):
         # Distance entre centres (approximation)
         center_distance = (self.cone_distance + other.cone_distance) / 2
         
-        # Rapport de contact simplifié mais cohérent
-        contact_ratio = 1.2 + 0.02 * min(
-        self.params.teeth,
-        other.params.teeth
-    )
+        # Rapport de conduite des engrenages droits virtuels (Tredgold)
+        contact_ratio = self.virtual_contact_ratio(other)
         
         return center_distance, contact_ratio
     
+    @property
+    def virtual_teeth(self) -> float:
+        """Nombre de dents virtuel sur le cône complémentaire : z / cos δ"""
+        return self.params.teeth / math.cos(math.radians(self.pitch_angle))
+    
+    def virtual_contact_ratio(self, other: 'BevelGear') -> float:
+        """
+        Rapport de conduite de la paire d'engrenages droits virtuels
+        
+        Approximation de Tredgold : chaque roue est remplacée au grand bout
+        par un engrenage droit de rayon primitif r / cos δ (génératrice du
+        cône complémentaire), de même module et de même saillie.
+        """
+        module = self.params.module
+        alpha = math.radians(self.params.pressure_angle)
+        radii = [module * gear.virtual_teeth / 2 for gear in (self, other)]
+        shifts = [gear.params.profile_shift for gear in (self, other)]
+        path = sum(
+            math.sqrt((r + module * (1 + x)) ** 2 - (r * math.cos(alpha)) ** 2)
+            for r, x in zip(radii, shifts)
+        ) - sum(radii) * math.sin(alpha)
+        return path / (math.pi * module * math.cos(alpha))
+    
     @property
     def outside_diameter(self) -> float:
         """Diamètre extérieur (au grand bout)"""
-        addendum = self.params.module
-        return self.pitch_diameter + 2 * addendum * math.cos(
-            math.radians(self.pitch_angle)
-        )
+        return GearMath.bevel_outside_diameter(self.pitch_diameter, self.params.module,
+                                               self.pitch_angle)
     
     @property
     def root_diameter(self) -> float:
         """Diamètre de pied (au grand bout)"""
-        dedendum = 1.25 * self.params.module
-        return self.pitch_diameter - 2 * dedendum * math.cos(
-            math.radians(self.pitch_angle)
-        )
+        return GearMath.bevel_root_diameter(self.pitch_diameter, self.params.module,
+                                            self.pitch_angle)
     
     @property
     def face_angle(self) -> float:
         """Angle de la face"""
-        addendum_angle = math.degrees(math.atan(
-            self.params.module / self.cone_distance
-        ))
-        return self.pitch_angle + addendum_angle
+        return GearMath.face_angle(self.pitch_angle, self.params.module, self.cone_distance)
     
     @property
     def root_angle(self) -> float:
         """Angle de pied"""
-        dedendum_angle = math.degrees(math.atan(
-            1.25 * self.params.module / self.cone_distance
-        ))
-        return self.pitch_angle - dedendum_angle
+        return GearMath.root_angle(self.pitch_angle, self.params.module, self.cone_distance)
+    
+    def get_solid(self, num_points: int = 16,
+                  tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Solide denté conique en facettes (F, 3, 3)
+        
+        Le profil de l'engrenage droit virtuel (z / cos δ dents) est tracé
+        sur le cône complémentaire au grand bout, puis ramené vers le sommet
+        du cône primitif sur la largeur de denture : flancs et faces sont des
+        surfaces réglées passant par le sommet, exactes avec deux sections.
+        Le grand bout est dans le plan z = 0 au cercle primitif, l'axe selon +z.
+        """
+        delta = math.radians(self.pitch_angle)
+        if not 0 < delta < math.pi / 2:
+            raise ValueError("L'angle primitif doit être entre 0° et 90° pour le solide")
+        scale = 1 - self.params.face_width / self.cone_distance
+        if scale <= 0:
+            raise ValueError("La largeur de denture doit être inférieure à la génératrice")
+        cos_d, sin_d = math.cos(delta), math.sin(delta)
+        r = self.pitch_diameter / 2
+        
+        # Une dent virtuelle (rayon ρ sur le cône complémentaire, angle
+        # développé φ), enroulée sur le cône : ψ = φ / cos δ
+        radius, theta = tooth_polar_profile(
+            self.params.module, self.virtual_teeth, self.params.pressure_angle,
+            self.params.profile_shift, self.params.backlash, num_points, tolerance
+        )
+        planar = tile_teeth(radius, theta / cos_d, self.params.teeth)
+        rho = np.tile(radius, self.params.teeth)
+        back_apex = np.array([0.0, 0.0, -r * sin_d / cos_d])
+        heel = np.column_stack((planar * cos_d, back_apex[2] + rho * sin_d))
+        
+        # Homothétie de centre le sommet du cône primitif
+        apex = np.array([0.0, 0.0, r * cos_d / sin_d])
+        scales = np.array([1.0, scale])
+        sections = apex + scales[:, None, None] * (heel - apex)
+        centers = apex + scales[:, None] * (back_apex - apex)
+        return sections_to_faces(sections, centers)
     
     def get_info(self) -> Dict[str, Any]:
         """Informations spécifiques aux engrenages coniques"""
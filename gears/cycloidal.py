@@ -0,0 +1,78 @@
+from core.base_gear import Gear
+from core.math_utils import GearMath
+from profiles.cycloidal import CycloidalProfile, cycloidal_roll_limit
+from typing import Dict, Any, Optional, Tuple
+import math
+import numpy as np
+
+class CycloidalGear(Gear):
+    """Engrenage à denture cycloïdale (horlogerie, réducteurs cycloïdaux)"""
+    
+    DEFAULT_ROLLING_RATIO = 0.5
+    
+    def _calculate_geometry(self):
+        """Calculer la géométrie spécifique aux engrenages cycloïdaux"""
+        ratio = GearMath.rolling_circle_ratio(self.params.rolling_circle_ratio,
+                                              self.DEFAULT_ROLLING_RATIO)
+        self.profile = CycloidalProfile(ratio)
+        
+        # Rayon du cercle roulant (épicycloïde de tête et hypocycloïde de pied)
+        self.rolling_radius = GearMath.rolling_radius(ratio, self.pitch_diameter)
+    
+    def mesh_with(self, other: Gear) -> Tuple[float, float]:
+        """Calculer les paramètres d'engrènement"""
+        if not isinstance(other, CycloidalGear):
+            raise ValueError("Un engrenage cycloïdal ne peut s'engrener qu'avec un autre engrenage cycloïdal")
+        if abs(self.params.module - other.params.module) > 0.001:
+            raise ValueError("Les modules doivent être identiques")
+        # Profils conjugués : l'épicycloïde de tête de l'un et l'hypocycloïde
+        # de pied de l'autre sont engendrées par le même cercle roulant
+        if abs(self.rolling_radius - other.rolling_radius) > 0.001:
+            raise ValueError(
+                f"Cercles roulants non conjugués: {self.rolling_radius:g} et "
+                f"{other.rolling_radius:g} mm (rolling_circle_ratio × Z identiques)"
+            )
+        
+        # Distance entre centres
+        center_distance = (self.pitch_diameter + other.pitch_diameter) / 2
+        
+        # Arcs d'approche et de retraite parcourus sur le cercle primitif
+        contact_arc = self.addendum_roll_arc + other.addendum_roll_arc
+        contact_ratio = contact_arc / (math.pi * self.params.module)
+        
+        return center_distance, contact_ratio
+    
+    @property
+    def addendum_roll_arc(self) -> float:
+        """Arc primitif parcouru par le cercle roulant jusqu'au cercle de tête"""
+        pitch_radius = self.pitch_diameter / 2
+        return pitch_radius * cycloidal_roll_limit(
+            pitch_radius, self.rolling_radius, self.outside_diameter / 2, outer=True
+        )
+    
+    @property
+    def circular_pitch(self) -> float:
+        """Pas circonférentiel"""
+        return GearMath.circular_pitch(self.params.module)
+    
+    def get_outline(self, num_points: int = 16,
+                    tolerance: Optional[float] = None) -> np.ndarray:
+        """Contour fermé complet de toutes les dents (tableau (N, 2))"""
+        return self.profile.generate_tooth_outline(
+            self.params.module,
+            self.params.teeth,
+            self.params.backlash,
+            num_points,
+            tolerance
+        )
+    
+    def get_info(self) -> Dict[str, Any]:
+        """Informations spécifiques aux engrenages cycloïdaux"""
+        info = super().get_info()
+        info.update({
+            'circular_pitch': self.circular_pitch,
+            'rolling_circle_ratio': self.profile.rolling_ratio,
+            'rolling_radius': self.rolling_radius,
+            'gear_type': 'cycloidal'
+        })
+        return info
@@ -1,12 +1,19 @@
 from core.base_gear import Gear, GearParams
 from core.math_utils import GearMath
 from profiles.involute import InvoluteProfile
-from typing import Dict, Any, Tuple
+from profiles.outline import gear_outline
+from standards.iso_21771 import ISO21771
+from profiles.sweep import herringbone_twist, sections_to_faces, sweep_sections, twist_steps
+from typing import Dict, Any, Optional, Tuple
 import math
+import numpy as np
 
 class HelicalGear(Gear):
     """Engrenage cylindrique à denture hélicoïdale"""
     
+    # Denture en chevrons (deux demi-largeurs d'hélices opposées)
+    herringbone = False
+    
     def _calculate_geometry(self):
         """Calculer la géométrie spécifique aux engrenages hélicoïdaux"""
         self.profile = InvoluteProfile(self.params.pressure_angle)
@@ -37,9 +44,9 @@ class HelicalGear(Gear):
         transverse_ratio = GearMath.contact_ratio_base_path(
             self, other, self.params.pressure_angle
         )
-        overlap_ratio = self.params.face_width * math.tan(
-            math.radians(self.params.helix_angle)
-        ) / (math.pi * self.params.module)
+        overlap_ratio = ISO21771.overlap_ratio(
+            self.params.face_width, self.params.helix_angle, self.params.module
+        )
         
         total_contact_ratio = transverse_ratio + overlap_ratio
         
@@ -48,15 +55,13 @@ class HelicalGear(Gear):
     @property
     def pitch_diameter(self) -> float:
         """Diamètre primitif (utilise le module apparent)"""
-        return self.transverse_module * self.params.teeth
+        return GearMath.pitch_diameter(self.transverse_module, self.params.teeth)
     
     @property
     def transverse_pressure_angle(self) -> float:
         """Angle de pression apparent"""
-        alpha_n = math.radians(self.params.pressure_angle)
-        beta = math.radians(self.params.helix_angle)
-        alpha_t = math.atan(math.tan(alpha_n) / math.cos(beta))
-        return math.degrees(alpha_t)
+        return ISO21771.transverse_pressure_angle(self.params.pressure_angle,
+                                                  self.params.helix_angle)
     
     @property
     def normal_pitch(self) -> float:
@@ -66,18 +71,59 @@ class HelicalGear(Gear):
     @property
     def lead(self) -> float:
         """Pas de l'hélice"""
-        if self.params.helix_angle == 0:
-            return float('inf')
-        return math.pi * self.pitch_diameter / math.tan(math.radians(self.params.helix_angle))
+        return GearMath.lead(self.pitch_diameter, self.params.helix_angle)
+    
+    @property
+    def twist_rate(self) -> float:
+        """Rotation de la section apparente par mm d'avance axiale (rad/mm)"""
+        return 2 * math.pi / self.lead
+    
+    def get_outline(self, num_points: int = 16,
+                    tolerance: Optional[float] = None) -> np.ndarray:
+        """Section apparente fermée de toutes les dents (tableau (N, 2))"""
+        return gear_outline(
+            self.params.module,
+            self.params.teeth,
+            self.params.pressure_angle,
+            self.params.profile_shift,
+            self.params.backlash,
+            num_points,
+            tolerance,
+            self.params.helix_angle
+        )
+    
+    def get_solid(self, num_points: int = 16,
+                  tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Solide denté en facettes (F, 3, 3) par extrusion vrillée
+        
+        La section apparente est balayée le long de l'hélice (rotation
+        z·2π/lead). Le nombre de pas en z suit la rotation totale : flèche
+        de la tête inférieure à tolerance, ou sinon un pas angulaire de
+        2π/(z·num_points).
+        """
+        outline = self.get_outline(num_points, tolerance)
+        height = self.params.face_width
+        rate = self.twist_rate
+        length = height / 2 if self.herringbone else height
+        steps = twist_steps(self.outside_diameter / 2, rate * length, tolerance,
+                            None if tolerance is not None
+                            else 2 * math.pi / (self.params.teeth * num_points))
+        z = np.linspace(0.0, length, steps + 1)
+        if self.herringbone:
+            z = np.concatenate((z, height - z[-2::-1]))
+            angles = herringbone_twist(z, height, rate)
+        else:
+            angles = rate * z
+        return sections_to_faces(sweep_sections(outline, z, angles))
     
     @property
     def contact_ratio(self) -> float:
         """Rapport de contact total"""
-        transverse_ratio = 1.4 + (self.params.teeth / 100)
-        overlap_ratio = self.params.face_width * math.tan(
-            math.radians(self.params.helix_angle)
-        ) / (math.pi * self.params.module)
-        return transverse_ratio + overlap_ratio
+        overlap_ratio = ISO21771.overlap_ratio(
+            self.params.face_width, self.params.helix_angle, self.params.module
+        )
+        return GearMath.helical_contact_ratio(self.params.teeth, overlap_ratio)
     
     def get_info(self) -> Dict[str, Any]:
         """Informations spécifiques aux engrenages hélicoïdaux"""
@@ -91,4 +137,22 @@ class HelicalGear(Gear):
             'lead': self.lead,
             'gear_type': 'helical'
         })
-        return info
\ No newline at end of file
+        return info
+
+
+class HerringboneGear(HelicalGear):
+    """
+    Engrenage à chevrons
+    
+    Deux demi-largeurs hélicoïdales de sens opposés, symétriques par
+    rapport au plan médian : les poussées axiales s'annulent. La géométrie
+    d'engrènement est celle de la denture hélicoïdale de même angle.
+    """
+    
+    herringbone = True
+    
+    def get_info(self) -> Dict[str, Any]:
+        """Informations spécifiques aux engrenages à chevrons"""
+        info = super().get_info()
+        info['herringbone'] = True
+        return info
@@ -1,8 +1,14 @@
 from core.base_gear import Gear, GearParams
 from core.math_utils import GearMath
 from profiles.involute import InvoluteProfile
-from typing import Dict, Any, Tuple
+from profiles.outline import internal_gear_outline
+from profiles.sweep import ring_faces
+from typing import Dict, Any, Optional, Tuple
 import math
+import numpy as np
+
+# Épaisseur de jante par défaut sous le pied des dents (en modules)
+RIM_FACTOR = 3.0
 
 class InternalGear(Gear):
     """Engrenage intérieur"""
@@ -11,10 +17,11 @@ class InternalGear(Gear):
         """Calculer la géométrie spécifique aux engrenages intérieurs"""
         self.profile = InvoluteProfile(self.params.pressure_angle)
         
-        # Pour engrenages intérieurs, certaines formules sont inversées
-        if self.params.teeth < 32:
-            # Déport recommandé pour éviter l'interférence
-            self.params.profile_shift = 0.5
+        # Déport recommandé des petites couronnes pour éviter l'interférence
+        profile_shift = GearMath.internal_profile_shift(self.params.teeth,
+                                                        self.params.profile_shift)
+        if profile_shift != self.params.profile_shift:
+            self.params = self.params.derive(profile_shift=profile_shift)
     
     def mesh_with(self, other: Gear) -> Tuple[float, float]:
         """Calculer les paramètres d'engrènement avec un pignon extérieur"""
@@ -41,12 +48,19 @@ class InternalGear(Gear):
     @property
     def outside_diameter(self) -> float:
         """Diamètre extérieur (intérieur de la couronne)"""
-        return self.pitch_diameter - 2 * self.params.module
+        return GearMath.internal_outside_diameter(self.pitch_diameter, self.addendum)
     
     @property
     def root_diameter(self) -> float:
         """Diamètre de pied (extérieur de la couronne)"""
-        return self.pitch_diameter + 2 * 1.25 * self.params.module
+        return GearMath.internal_root_diameter(self.pitch_diameter, self.dedendum)
+    
+    @property
+    def rim_diameter(self) -> float:
+        """Diamètre extérieur de la jante (par défaut pied + 2·RIM_FACTOR·m)"""
+        if self.params.rim_diameter is not None:
+            return self.params.rim_diameter
+        return self.root_diameter + 2 * RIM_FACTOR * self.params.module
     
     @property
     def base_diameter(self) -> float:
@@ -64,6 +78,34 @@ class InternalGear(Gear):
         
         return pinion_teeth < z1_min
     
+    def get_outline(self, num_points: int = 16,
+                    tolerance: Optional[float] = None) -> np.ndarray:
+        """Contour fermé des dents, tournées vers le centre (tableau (N, 2))"""
+        return internal_gear_outline(
+            self.params.module,
+            self.params.teeth,
+            self.params.pressure_angle,
+            self.params.backlash,
+            num_points,
+            tolerance
+        )
+    
+    def get_solid(self, num_points: int = 16,
+                  tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Couronne dentée en facettes (F, 3, 3)
+        
+        Anneau extrudé entre le contour des dents et la jante : les faces
+        d'extrémité sont triangulées en bande entre les deux boucles.
+        """
+        if self.rim_diameter <= self.root_diameter:
+            raise ValueError(
+                f"Le diamètre de jante ({self.rim_diameter}) doit dépasser "
+                f"le diamètre de pied ({self.root_diameter})"
+            )
+        return ring_faces(self.get_outline(num_points, tolerance), self.rim_diameter / 2,
+                          np.array([0.0, self.params.face_width]))
+    
     def get_info(self) -> Dict[str, Any]:
         """Informations spécifiques aux engrenages intérieurs"""
         info = super().get_info()
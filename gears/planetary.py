@@ -31,16 +31,16 @@ class PlanetaryGearset:
     
     def _check_assembly_condition(self) -> bool:
         """Vérifier la condition d'assemblage des planétaires"""
-        N_sun = self.sun.params.teeth
-        N_ring = self.ring.params.teeth
-        
-        # Condition pour un train simple
-        condition = (N_sun + N_ring) % self.num_planets == 0
-        
-        # Condition d'entier pour les distances
-        condition_center = (N_sun + self.planets[0].params.teeth) % 1 == 0
+        from core.planetary_solver import PlanetarySolver
         
-        return condition and condition_center
+        # Coaxialité, équirépartition et non-interférence des satellites
+        checks = PlanetarySolver.conditions(
+            self.sun.params.teeth,
+            self.planets[0].params.teeth,
+            self.ring.params.teeth,
+            self.num_planets
+        )
+        return all(bool(condition) for condition in checks.values())
     
     def _calculate_ratios(self):
         """Calculer les rapports de transmission"""
@@ -1,8 +1,14 @@
 from core.base_gear import Gear, GearParams
 from core.math_utils import GearMath
 from profiles.involute import InvoluteProfile
-from typing import Dict, Any, Tuple, List
+from profiles.rack import CHUNK_TEETH, rack_profile, rack_tooth_template
+from profiles.sweep import slab_faces
+from typing import Dict, Any, Iterator, Optional, Tuple, List
 import math
+import numpy as np
+
+# Épaisseur du dos par défaut sous le pied des dents (en modules)
+BACK_FACTOR = 3.0
 
 class RackGear(Gear):
     """Crémaillère"""
@@ -38,31 +44,86 @@ class RackGear(Gear):
     @property
     def tooth_height(self) -> float:
         """Hauteur totale de la dent"""
-        return 2.25 * self.params.module
+        return GearMath.tooth_height(self.params.module)
     
     @property
     def tooth_thickness(self) -> float:
         """Épaisseur de la dent sur la ligne primitive"""
-        return math.pi * self.params.module / 2
+        return GearMath.tooth_thickness(self.params.module)
+    
+    @property
+    def length(self) -> float:
+        """Longueur de la crémaillère (par défaut dents × pas)"""
+        if self.params.rack_length is not None:
+            return self.params.rack_length
+        return self.params.teeth * math.pi * self.params.module
+    
+    @property
+    def height(self) -> float:
+        """Hauteur totale, du dos à la ligne de tête (par défaut dent + dos)"""
+        if self.params.rack_height is not None:
+            return self.params.rack_height
+        return self.tooth_height + BACK_FACTOR * self.params.module
     
     def get_tooth_profile(self) -> List[Tuple[float, float]]:
-        """Profil de dent de crémaillère (trapézoïdal)"""
-        # Points pour une dent de crémaillère
-        p = self.params.module * math.pi  # Pas
-        h_a = self.params.module  # Hauteur de tête
-        h_f = 1.25 * self.params.module  # Hauteur de pied
+        """Profil de dent de crémaillère (trapézoïdal, fermé, centré en x = 0)"""
+        x, y = rack_tooth_template(self.params.module, self.params.pressure_angle,
+                                   self.params.backlash)
+        x = x - math.pi * self.params.module / 2
+        points = list(zip(x[1:].tolist(), y[1:].tolist()))
+        return points + points[:1]
+    
+    def get_outline(self, num_points: int = 16,
+                    tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Contour fermé de la crémaillère entière (tableau (N, 2))
         
-        points = [
-            (-p/4, -h_f),           # Point bas gauche
-            (-p/4 + self.tooth_thickness, -h_f),  # Point bas droit
-            (-p/4 + self.tooth_thickness + h_a * math.tan(
-                math.radians(self.params.pressure_angle)), h_a),  # Point haut droit
-            (-p/4 - h_a * math.tan(
-                math.radians(self.params.pressure_angle)), h_a),   # Point haut gauche
-            (-p/4, -h_f)            # Retour au point bas gauche
-        ]
+        Dos en y = addendum - hauteur, de x = 0 à x = longueur; parcours
+        trigonométrique. Les flancs étant droits, num_points et tolerance
+        sont sans effet.
+        """
+        floor = self._floor()
+        profile = rack_profile(self.params.module, 0.0, self.length,
+                               self.params.pressure_angle, self.params.backlash)
+        return np.concatenate(([[0.0, floor], [self.length, floor]], profile[::-1]))
+    
+    def iter_solid(self, num_points: int = 16, tolerance: Optional[float] = None,
+                   chunk_size: int = CHUNK_TEETH) -> Iterator[np.ndarray]:
+        """
+        Facettes (F, 3, 3) de la crémaillère par paquets de chunk_size dents
         
-        return points
+        Le gabarit d'une dent est translaté le long de x et chaque portion
+        est extrudée sur face_width (z) jusqu'au dos : la mémoire reste
+        bornée quelle que soit la longueur. Les portions contiguës partagent
+        leurs sommets; seules la première et la dernière ferment les
+        extrémités.
+        """
+        floor = self._floor()
+        length = self.length
+        span = chunk_size * math.pi * self.params.module
+        count = max(1, math.ceil(length / span - 1e-9))
+        for index in range(count):
+            start, stop = index * span, min((index + 1) * span, length)
+            profile = rack_profile(self.params.module, start, stop,
+                                   self.params.pressure_angle, self.params.backlash)
+            yield slab_faces(profile, floor, self.params.face_width,
+                             start=index == 0, end=index == count - 1)
+    
+    def get_solid(self, num_points: int = 16,
+                  tolerance: Optional[float] = None) -> np.ndarray:
+        """Solide de la crémaillère en facettes (F, 3, 3)"""
+        return np.concatenate(list(self.iter_solid(num_points, tolerance)))
+    
+    def _floor(self) -> float:
+        """Cote du dos (la ligne primitive est en y = 0)"""
+        if self.length <= 0:
+            raise ValueError(f"La longueur de la crémaillère doit être > 0, got {self.length}")
+        if self.height <= self.tooth_height:
+            raise ValueError(
+                f"La hauteur de la crémaillère ({self.height}) doit dépasser "
+                f"la hauteur de dent ({self.tooth_height})"
+            )
+        return self.params.module - self.height
     
     def get_info(self) -> Dict[str, Any]:
         """Informations spécifiques aux crémaillères"""
@@ -70,7 +131,7 @@ class RackGear(Gear):
         info.update({
             'tooth_height': self.tooth_height,
             'tooth_thickness': self.tooth_thickness,
-            'circular_pitch': math.pi * self.params.module,
+            'circular_pitch': GearMath.circular_pitch(self.params.module),
             'gear_type': 'rack'
         })
         return info
\ No newline at end of file
@@ -1,8 +1,10 @@
 from core.base_gear import Gear, GearParams
 from core.math_utils import GearMath
 from profiles.involute import InvoluteProfile
-from typing import Dict, Any, Tuple
+from profiles.outline import gear_outline
+from typing import Dict, Any, Optional, Tuple
 import math
+import numpy as np
 
 class SpurGear(Gear):
     """Engrenage cylindrique à denture droite"""
@@ -11,11 +13,12 @@ class SpurGear(Gear):
         """Calculer la géométrie spécifique aux engrenages droits"""
         self.profile = InvoluteProfile(self.params.pressure_angle)
         
-        # Calcul du déport si nécessaire
-        if self.params.teeth < 17 and self.params.profile_shift == 0:
-            self.params.profile_shift = GearMath.profile_shift_coefficient(
-                self.params.teeth, self.params.pressure_angle
-            )
+        # Calcul du déport si nécessaire (copie : les paramètres sont partagés)
+        profile_shift = GearMath.auto_profile_shift(
+            self.params.teeth, self.params.profile_shift, self.params.pressure_angle
+        )
+        if profile_shift != self.params.profile_shift:
+            self.params = self.params.derive(profile_shift=profile_shift)
     
     def mesh_with(self, other: Gear) -> Tuple[float, float]:
         """Calculer les paramètres d'engrènement"""
@@ -38,16 +41,22 @@ class SpurGear(Gear):
     @property
     def circular_pitch(self) -> float:
         """Pas circonférentiel"""
-        return math.pi * self.params.module
+        return GearMath.circular_pitch(self.params.module)
     
     @property
     def contact_ratio(self) -> float:
         """Rapport de contact estimé"""
         # Valeur par défaut pour un engrenage droit standard
-        return 1.4 + (self.params.teeth / 100)
+        return GearMath.estimated_contact_ratio(self.params.teeth)
     
-    def get_tooth_points(self, num_points: int = 50) -> list:
-        """Générer les points d'une dent"""
+    def get_tooth_points(self, num_points: int = 50,
+                         tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Générer les points d'une dent (tableau (N, 2))
+        
+        Si tolerance (flèche maximale en mm) est fournie, le nombre de points
+        est déterminé par la courbure de la développante.
+        """
         base_radius = self.base_diameter / 2
         pitch_radius = self.pitch_diameter / 2
         
@@ -56,11 +65,25 @@ class SpurGear(Gear):
             base_radius,
             start_angle=0,
             end_angle=60,
-            num_points=num_points
+            num_points=num_points,
+            tolerance=tolerance
         )
         
         return points
     
+    def get_outline(self, num_points: int = 16,
+                    tolerance: Optional[float] = None) -> np.ndarray:
+        """Contour fermé complet de toutes les dents (tableau (N, 2))"""
+        return gear_outline(
+            self.params.module,
+            self.params.teeth,
+            self.params.pressure_angle,
+            self.params.profile_shift,
+            self.params.backlash,
+            num_points,
+            tolerance
+        )
+    
     def get_info(self) -> Dict[str, Any]:
         """Informations spécifiques aux engrenages droits"""
         info = super().get_info()
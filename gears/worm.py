@@ -1,28 +1,36 @@
 from core.base_gear import Gear, GearParams
-from typing import Dict, Any, Tuple
+from core.math_utils import GearMath
+from profiles.sampling import arc_angles
+from profiles.sweep import CHUNK_SECTIONS, iter_solid_faces, sweep_sections, twist_steps
+from profiles.worm import wheel_tooth_profiles, worm_section
+from typing import Dict, Any, Iterator, Optional, Tuple
 import math
+import numpy as np
 
 class WormGear(Gear):
     """Vis sans fin"""
     
     def __init__(self, params: GearParams, worm_diameter: float = None):
         # Initialiser leads avant super().__init__() pour l'utiliser dans _calculate_geometry
-        self.leads = params.leads if params.leads is not None else 1
-        self.worm_diameter = worm_diameter or (params.module * 10)
+        self.leads = GearMath.worm_leads(params.leads)
+        self._worm_diameter = worm_diameter
+        self.worm_diameter = GearMath.worm_diameter(params.module, worm_diameter)
         super().__init__(params)
     
+    def derive(self, **changes) -> 'WormGear':
+        """Copie aux paramètres modifiés, diamètre de vis imposé conservé"""
+        return WormGear(self.params.derive(**changes), self._worm_diameter)
+    
     def _calculate_geometry(self):
         """Calculer la géométrie spécifique aux vis sans fin"""
         # Pas axial
-        self.axial_pitch = math.pi * self.params.module
+        self.axial_pitch = GearMath.circular_pitch(self.params.module)
         
         # Pas de la vis
-        self.lead = self.leads * self.axial_pitch
+        self.lead = GearMath.worm_lead(self.leads, self.axial_pitch)
         
         # Angle d'hélice de la vis
-        self.lead_angle = math.degrees(math.atan(
-            self.lead / (math.pi * self.worm_diameter)
-        ))
+        self.lead_angle = GearMath.lead_angle(self.lead, self.worm_diameter)
     
     def mesh_with(self, other: Gear) -> Tuple[float, float]:
         """Calculer les paramètres d'engrènement avec une roue"""
@@ -47,12 +55,12 @@ class WormGear(Gear):
     @property
     def outside_diameter(self) -> float:
         """Diamètre extérieur de la vis"""
-        return self.worm_diameter + 2 * self.params.module
+        return GearMath.outside_diameter(self.worm_diameter, self.addendum)
     
     @property
     def root_diameter(self) -> float:
         """Diamètre de pied de la vis"""
-        return self.worm_diameter - 2 * 1.25 * self.params.module
+        return GearMath.root_diameter(self.worm_diameter, self.dedendum)
     
     def sliding_velocity(self, rpm: float) -> float:
         """Vitesse de glissement"""
@@ -69,6 +77,108 @@ class WormGear(Gear):
         
         return max(0, min(1, efficiency))
     
+    @property
+    def throat_radius(self) -> float:
+        """Rayon de gorge de la roue (tore centré sur l'axe de la vis)"""
+        return self.worm_diameter / 2 - self.params.module
+    
+    def transverse_section(self, num_points: int = 16,
+                           tolerance: Optional[float] = None) -> np.ndarray:
+        """Section droite fermée de la vis, tous filets (tableau (N, 2))"""
+        return worm_section(
+            self.params.module,
+            self.leads,
+            self.worm_diameter,
+            self.params.pressure_angle,
+            self.params.backlash,
+            num_points,
+            tolerance
+        )
+    
+    def iter_solid(self, num_points: int = 16, tolerance: Optional[float] = None,
+                   chunk_size: int = CHUNK_SECTIONS) -> Iterator[np.ndarray]:
+        """
+        Facettes de la vis par paquets de chunk_size sections
+        
+        La section droite est balayée le long de l'hélice sur la longueur
+        face_width (rotation 2π·z/lead). Le nombre de pas suit la flèche de
+        l'hélice de tête, ou sans tolérance un pas angulaire de
+        2π/(4·num_points); seul un paquet de sections est en mémoire.
+        """
+        section = self.transverse_section(num_points, tolerance)
+        length = self.params.face_width
+        rate = 2 * math.pi / self.lead
+        steps = twist_steps(self.outside_diameter / 2, rate * length, tolerance,
+                            None if tolerance is not None
+                            else 2 * math.pi / (4 * num_points))
+        
+        def chunks():
+            for start in range(0, steps + 1, chunk_size):
+                z = np.arange(start, min(start + chunk_size, steps + 1)) * (length / steps)
+                yield sweep_sections(section, z, rate * z)
+        
+        return iter_solid_faces(chunks())
+    
+    def get_solid(self, num_points: int = 16,
+                  tolerance: Optional[float] = None) -> np.ndarray:
+        """Solide de la vis en facettes (F, 3, 3)"""
+        return np.concatenate(list(self.iter_solid(num_points, tolerance)))
+    
+    def iter_wheel_solid(self, wheel: Gear, num_points: int = 16,
+                         tolerance: Optional[float] = None,
+                         chunk_size: int = CHUNK_SECTIONS) -> Iterator[np.ndarray]:
+        """
+        Facettes de la roue globique conjuguée, par paquets de tranches
+        
+        La roue (nombre de dents, largeur, jeu de wheel) est taillée par
+        enveloppe de la vis (profiles.worm.wheel_tooth_profiles), son axe
+        selon z et son plan médian en z = 0. Les tranches suivent la gorge
+        et la torsion des dents (angle d'hélice égal à l'angle de filet).
+        """
+        from .spur import SpurGear
+        
+        if not isinstance(wheel, SpurGear):
+            raise ValueError("Une vis sans fin s'engrène avec une roue droite")
+        if abs(wheel.params.module - self.params.module) > 0.001:
+            raise ValueError("Les modules doivent être identiques")
+        half_width = wheel.params.face_width / 2
+        if half_width >= self.throat_radius:
+            raise ValueError("La largeur de la roue doit rester dans la gorge (r_vis - m)")
+        
+        # Tranches : torsion des dents au sommet et courbure de la gorge
+        teeth = wheel.params.teeth
+        tip = wheel.pitch_diameter / 2 + self.params.module
+        twist = 2 * half_width * math.tan(math.radians(self.lead_angle)) / (tip - self.params.module)
+        gorge = math.asin(half_width / self.throat_radius)
+        if tolerance is None:
+            steps = max(twist_steps(tip, twist, None, 2 * math.pi / (teeth * num_points)),
+                        max(2, num_points // 4))
+        else:
+            steps = max(twist_steps(tip, twist, tolerance),
+                        len(arc_angles(self.throat_radius, -gorge, gorge, tolerance)) - 1)
+        steps += steps % 2
+        heights = np.linspace(-half_width, half_width, steps + 1)
+        pitch_angles = 2 * math.pi * np.arange(teeth) / teeth
+        
+        def chunks():
+            for start in range(0, steps + 1, chunk_size):
+                h = heights[start:start + chunk_size]
+                radius, theta = wheel_tooth_profiles(
+                    self.params.module, teeth, self.leads, self.worm_diameter, h,
+                    self.params.pressure_angle, wheel.params.backlash, num_points, tolerance
+                )
+                angles = (theta[:, None, :] + pitch_angles[None, :, None]).reshape(len(h), -1)
+                radii = np.tile(radius, teeth)
+                yield np.stack((radii * np.cos(angles), radii * np.sin(angles),
+                                np.broadcast_to(h[:, None], radii.shape)), axis=-1)
+        
+        return iter_solid_faces(chunks())
+    
+    def wheel_solid(self, wheel: Gear, num_points: int = 16,
+                    tolerance: Optional[float] = None) -> np.ndarray:
+        """Solide de la roue globique en facettes (F, 3, 3)"""
+        return np.concatenate(list(self.iter_wheel_solid(wheel, num_points, tolerance)))
+    
     def get_info(self) -> Dict[str, Any]:
         """Informations spécifiques aux vis sans fin"""
         info = super().get_info()
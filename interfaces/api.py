@@ -6,20 +6,12 @@ import json
 from typing import Dict, Any
 from core.gear_factory import GearFactory
 from core.base_gear import GearParams
-from gears.spur import SpurGear
-from gears.helical import HelicalGear
-from gears.bevel import BevelGear
-from gears.worm import WormGear
-from gears.rack import RackGear
-from gears.internal import InternalGear
-
-# Enregistrer les types d'engrenages
-GearFactory.register_gear('spur', SpurGear)
-GearFactory.register_gear('helical', HelicalGear)
-GearFactory.register_gear('bevel', BevelGear)
-GearFactory.register_gear('worm', WormGear)
-GearFactory.register_gear('rack', RackGear)
-GearFactory.register_gear('internal', InternalGear)
+
+# Déclarer les types d'engrenages (modules importés au premier usage)
+GearFactory.register_builtin_types()
+
+# Cache LRU des engrenages (GEAR_CACHE_SIZE, désactivé par défaut)
+GearFactory.configure_cache_from_env()
 
 app = Flask(__name__)
 
@@ -53,7 +45,7 @@ def create_gear():
         gear = GearFactory.create_gear(gear_type, params)
         
         # Retourner les informations
-        info = gear.get_info()
+        info = GearFactory.get_info(gear)
         
         return jsonify({
             'success': True,
@@ -73,15 +65,16 @@ def analyze_gear():
             return jsonify({'error': 'Configuration d\'engrenage requise'}), 400
         
         gear = GearFactory.from_dict(data['gear'])
-        info = gear.get_info()
+        info = GearFactory.get_info(gear)
+        
+        # Contraintes ISO 6336 (charge et roue conjuguée optionnelles)
+        from core.stress_engine import StressEngine
+        mate = GearFactory.from_dict(data['mate']) if 'mate' in data else None
         
         # Ajouter des analyses supplémentaires
         analysis = {
             'basic_info': info,
-            'performances': {
-                'bending_stress': 'N/A',
-                'contact_stress': 'N/A'
-            },
+            'performances': StressEngine.performances(gear, data.get('load'), mate),
             'validations': []
         }
         
@@ -117,8 +110,8 @@ def mesh_gears():
                 'center_distance': center_distance,
                 'contact_ratio': contact_ratio,
                 'transmission_ratio': transmission_ratio,
-                'gear1_info': gear1.get_info(),
-                'gear2_info': gear2.get_info()
+                'gear1_info': GearFactory.get_info(gear1),
+                'gear2_info': GearFactory.get_info(gear2)
             }
         })
         
@@ -137,13 +130,57 @@ def validate_gear():
         params = GearParams(**data['params'])
         
         from core.validation import GearValidator
+        from core.rule_engine import RuleEngine
         errors = GearValidator.validate_gear_params(params)
+        gear_type = data.get('type', 'spur').lower()
+        issues = RuleEngine.check_params([gear_type], [params])
         
         return jsonify({
             'success': True,
             'valid': len(errors) == 0,
             'errors': errors,
-            'warnings': [] if len(errors) == 0 else ['Vérifiez les paramètres']
+            'warnings': [] if len(errors) == 0 else ['Vérifiez les paramètres'],
+            'issues': RuleEngine.to_records(issues)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/train/solve', methods=['POST'])
+def solve_train():
+    """Rechercher les nombres de dents d'un train pour un rapport cible"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({'error': 'Données JSON requises'}), 400
+        
+        from core.train_solver import GearTrainSolver
+        result = GearTrainSolver.solve_request(data)
+        
+        return jsonify({
+            'success': True,
+            'train': result
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/planetary/solve', methods=['POST'])
+def solve_planetary():
+    """Rechercher les trains planétaires (Ns, Np, Nr, n) pour un rapport cible"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({'error': 'Données JSON requises'}), 400
+        
+        from core.planetary_solver import PlanetarySolver
+        result = PlanetarySolver.solve_request(data)
+        
+        return jsonify({
+            'success': True,
+            'planetary': result
         })
         
     except Exception as e:
@@ -175,6 +212,27 @@ def export_step():
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+@app.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    """Compteurs du cache d'engrenages"""
+    return jsonify(GearFactory.cache_info())
+
+@app.route('/api/cache/invalidate', methods=['POST'])
+def cache_invalidate():
+    """Vider le cache (tout, un type, ou un engrenage)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        params = GearParams(**data['params']) if 'params' in data else None
+        if params is not None and 'type' not in data:
+            return jsonify({'error': 'type requis avec params'}), 400
+        removed = GearFactory.invalidate(data.get('type'), params)
+        
+        return jsonify({'success': True, 'removed': removed})
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
 # Documentation de l'API
 @app.route('/api/docs', methods=['GET'])
 def api_docs():
@@ -184,10 +242,14 @@ def api_docs():
             '/api/health': 'GET - Vérifier l\'état du service',
             '/api/gear/types': 'GET - Liste des types d\'engrenages',
             '/api/gear/create': 'POST - Créer un engrenage',
-            '/api/gear/analyze': 'POST - Analyser un engrenage',
+            '/api/gear/analyze': 'POST - Analyser un engrenage (load, mate optionnels)',
             '/api/gear/mesh': 'POST - Analyser un engrènement',
             '/api/gear/validate': 'POST - Valider des paramètres',
-            '/api/export/step': 'POST - Exporter en STEP'
+            '/api/train/solve': 'POST - Rechercher un train d\'engrenages (target_ratio)',
+            '/api/planetary/solve': 'POST - Rechercher un train planétaire (target_ratio, fixed)',
+            '/api/export/step': 'POST - Exporter en STEP',
+            '/api/cache/stats': 'GET - Compteurs du cache d\'engrenages',
+            '/api/cache/invalidate': 'POST - Vider le cache (type, params optionnels)'
         },
         'example_request': {
             'create_gear': {
@@ -5,22 +5,9 @@ import argparse
 import json
 from core.gear_factory import GearFactory
 from core.base_gear import GearParams
-from gears.spur import SpurGear
-from gears.helical import HelicalGear
-from gears.bevel import BevelGear
-from gears.worm import WormGear
-from gears.rack import RackGear
-from gears.internal import InternalGear
-from export.step import STEPExporter
-from export.stl import STLExporter
-
-# Enregistrer les types d'engrenages
-GearFactory.register_gear('spur', SpurGear)
-GearFactory.register_gear('helical', HelicalGear)
-GearFactory.register_gear('bevel', BevelGear)
-GearFactory.register_gear('worm', WormGear)
-GearFactory.register_gear('rack', RackGear)
-GearFactory.register_gear('internal', InternalGear)
+
+# Déclarer les types d'engrenages (modules importés au premier usage)
+GearFactory.register_builtin_types()
 
 
 class GearCLI:
@@ -36,6 +23,11 @@ class GearCLI:
             formatter_class=argparse.RawDescriptionHelpFormatter
         )
 
+        parser.add_argument('--cache-size', type=int, default=None,
+                            help='Taille du cache d\'engrenages (défaut: GEAR_CACHE_SIZE, 0 désactive)')
+        parser.add_argument('--cache-stats', action='store_true',
+                            help='Afficher les compteurs du cache en fin d\'exécution')
+
         subparsers = parser.add_subparsers(dest='command', help='Commandes')
 
         # Commande: créer un engrenage
@@ -78,6 +70,8 @@ class GearCLI:
                                    help='Format d\'export')
         export_parser.add_argument('--output', type=str,
                                    help='Fichier de sortie')
+        export_parser.add_argument('--tolerance', type=float, default=None,
+                                   help='Flèche maximale du contour (mm)')
 
         # Commande: liste
         subparsers.add_parser('list', help='Lister les types d\'engrenages')
@@ -89,12 +83,60 @@ class GearCLI:
         mesh_parser.add_argument('--gear2', type=str, required=True,
                                  help='Configuration engrenage 2 (JSON)')
 
+        # Commande: train
+        train_parser = subparsers.add_parser('train', help='Rechercher un train d\'engrenages')
+        train_parser.add_argument('--ratio', type=float, required=True,
+                                  help='Rapport de réduction cible')
+        train_parser.add_argument('--tolerance', type=float, default=1e-3,
+                                  help='Écart relatif admissible sur le rapport')
+        train_parser.add_argument('--min-stages', type=int, default=1,
+                                  help='Nombre minimal d\'étages')
+        train_parser.add_argument('--max-stages', type=int, default=4,
+                                  help='Nombre maximal d\'étages (4 au plus)')
+        train_parser.add_argument('--module', type=float, default=1.0,
+                                  help='Module commun (mm)')
+        train_parser.add_argument('--pressure-angle', type=float, default=20.0,
+                                  help='Angle de pression (degrés)')
+        train_parser.add_argument('--min-teeth', type=int, default=12,
+                                  help='Nombre de dents minimal')
+        train_parser.add_argument('--max-teeth', type=int, default=100,
+                                  help='Nombre de dents maximal')
+        train_parser.add_argument('--center-distance', type=float, default=None,
+                                  help='Entraxe imposé pour chaque étage (mm)')
+        train_parser.add_argument('--coaxial', action='store_true',
+                                  help='Même entraxe pour tous les étages')
+        train_parser.add_argument('--count', type=int, default=10,
+                                  help='Nombre de solutions affichées')
+
+        # Commande: ingest
+        ingest_parser = subparsers.add_parser('ingest', help='Charger un catalogue JSONL/CSV')
+        ingest_parser.add_argument('--input', type=str, required=True,
+                                   help='Catalogue (.jsonl, .ndjson ou .csv)')
+        ingest_parser.add_argument('--format', type=str, default=None,
+                                   choices=['jsonl', 'csv'],
+                                   help='Format (déduit de l\'extension par défaut)')
+        ingest_parser.add_argument('--chunk-size', type=int, default=1000,
+                                   help='Nombre de lignes par bloc')
+        ingest_parser.add_argument('--columns', action='store_true',
+                                   help='Calcul colonnaire (sans objets engrenages)')
+        ingest_parser.add_argument('--strict', action='store_true',
+                                   help='Refuser les colonnes inconnues')
+        ingest_parser.add_argument('--output', type=str, default=None,
+                                   help='Fichier JSONL des informations calculées')
+        ingest_parser.add_argument('--errors', type=str, default=None,
+                                   help='Fichier JSONL des lignes rejetées')
+
         return parser
 
     def run(self):
         """Exécuter l'interface CLI"""
         args = self.parser.parse_args()
 
+        if args.cache_size is None:
+            GearFactory.configure_cache_from_env()
+        else:
+            GearFactory.enable_cache(args.cache_size)
+
         if args.command == 'create':
             self._handle_create(args)
         elif args.command == 'analyze':
@@ -105,9 +147,18 @@ class GearCLI:
             self._handle_list()
         elif args.command == 'mesh':
             self._handle_mesh(args)
+        elif args.command == 'train':
+            self._handle_train(args)
+        elif args.command == 'ingest':
+            self._handle_ingest(args)
         else:
             self.parser.print_help()
 
+        if args.cache_stats:
+            stats = GearFactory.cache_info()
+            print(f"\nCache: {stats['hits']} hits, {stats['misses']} misses, "
+                  f"{stats['evictions']} évictions, {stats['size']}/{stats['maxsize']} entrées")
+
     def _handle_create(self, args):
         """Gérer la création d'engrenage"""
         try:
@@ -145,7 +196,7 @@ class GearCLI:
                 params = GearParams(**params_dict)
                 gear = GearFactory.create_gear(args.type, params)
 
-            info = gear.get_info()
+            info = GearFactory.get_info(gear)
 
             print("\n" + "="*50)
             print(f"ENGRENAGE CRÉÉ: {info['name']}")
@@ -171,7 +222,7 @@ class GearCLI:
             config = json.load(f)
 
         gear = GearFactory.from_dict(config)
-        info = gear.get_info()
+        info = GearFactory.get_info(gear)
 
         print("\nANALYSE D'ENGRENAGE")
         print("="*50)
@@ -195,10 +246,12 @@ class GearCLI:
             output_file = f"{gear.params.name.lower()}.{args.format}"
 
         if args.format == 'step':
+            from export.step import STEPExporter
             exporter = STEPExporter()
-            exporter.export_gear(gear, output_file)
+            exporter.export_gear(gear, output_file, tolerance=args.tolerance)
         elif args.format == 'stl':
-            STLExporter.export_gear(gear, output_file)
+            from export.stl import STLExporter
+            STLExporter.export_gear(gear, output_file, tolerance=args.tolerance)
 
         print(f"Engrenage exporté vers: {output_file}")
 
@@ -245,6 +298,89 @@ class GearCLI:
         except Exception as e:
             print(f"Erreur d'engrènement: {e}")
 
+    def _handle_train(self, args):
+        """Rechercher un train d'engrenages"""
+        from core.train_solver import GearTrainSolver
+
+        try:
+            result = GearTrainSolver.solve_request({
+                'target_ratio': args.ratio,
+                'tolerance': args.tolerance,
+                'min_stages': args.min_stages,
+                'max_stages': args.max_stages,
+                'module': args.module,
+                'pressure_angle': args.pressure_angle,
+                'min_teeth': args.min_teeth,
+                'max_teeth': args.max_teeth,
+                'center_distance': args.center_distance,
+                'coaxial': args.coaxial,
+                'max_solutions': args.count,
+            })
+        except Exception as e:
+            print(f"Erreur: {e}")
+            return
+
+        print("\nRECHERCHE DE TRAIN D'ENGRENAGES")
+        print("="*50)
+        print(f"Rapport cible: {result['target_ratio']:.6f}")
+
+        if not result['solutions']:
+            print("Aucune solution dans la tolérance")
+            return
+
+        for i, solution in enumerate(result['solutions'], 1):
+            stages = "  ".join(f"{s['driver_teeth']}/{s['driven_teeth']}"
+                               for s in solution['stages'])
+            print(f"{i:2}. i={solution['ratio']:.6f} "
+                  f"(écart {solution['error'] * 100:+.4f}%)  {stages}")
+
+    def _handle_ingest(self, args):
+        """Charger un catalogue en flux"""
+        from contextlib import ExitStack
+        from core.bulk_loader import BulkLoader
+        from core.gear_kernel import GearKernel
+
+        loaded = rejected = 0
+        first_errors = []
+        try:
+            with ExitStack() as stack:
+                output = stack.enter_context(open(args.output, 'w')) if args.output else None
+                errors = stack.enter_context(open(args.errors, 'w')) if args.errors else None
+
+                if args.columns:
+                    chunks = BulkLoader.iter_columns(args.input, args.format,
+                                                     args.chunk_size, args.strict)
+                else:
+                    chunks = BulkLoader.iter_gears(args.input, args.format,
+                                                   args.chunk_size, args.strict)
+
+                for chunk in chunks:
+                    if args.columns:
+                        infos = (GearKernel.row_info(chunk['columns'], i, name)
+                                 for i, name in enumerate(chunk['names']))
+                    else:
+                        infos = (GearFactory.get_info(gear) for gear in chunk['gears'])
+                    for row, info in zip(chunk['rows'], infos):
+                        loaded += 1
+                        if output:
+                            output.write(json.dumps({'row': int(row), **info}) + '\n')
+                    for error in chunk['errors']:
+                        if errors:
+                            errors.write(json.dumps(error) + '\n')
+                        rejected += 1
+                        if len(first_errors) < 10:
+                            first_errors.append(error)
+        except Exception as e:
+            print(f"Erreur: {e}")
+            return
+
+        print("\nCHARGEMENT DE CATALOGUE")
+        print("="*50)
+        print(f"Engrenages chargés: {loaded}")
+        print(f"Lignes rejetées:    {rejected}")
+        for error in first_errors:
+            print(f"  ligne {error['row']}: {error['error']}")
+
 
 def main():
     """Point d'entrée principal"""
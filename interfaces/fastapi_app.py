@@ -7,16 +7,23 @@ import os
 from core.gear_factory import GearFactory
 from core.base_gear import GearParams
 from core import export_db
-from core import auth
 from interfaces import task_runner
 
 REQUIRE_AUTH = os.environ.get('REQUIRE_AUTH', 'false').lower() == 'true'
 
 export_db.init_db()
+GearFactory.register_builtin_types()
+GearFactory.configure_cache_from_env()
 
 app = FastAPI(title="Gear Engine API (FastAPI)")
 
 
+def _auth():
+    """Module d'authentification (passlib/jwt), importé au premier usage"""
+    from core import auth
+    return auth
+
+
 @app.get('/health')
 def health():
     return {'status': 'healthy', 'service': 'gear_engine_fastapi'}
@@ -29,7 +36,7 @@ def register(payload: Dict[str, Any]):
         password = payload.get('password')
         if not username or not password:
             raise ValueError('username and password required')
-        token = auth.register_user(username, password)
+        token = _auth().register_user(username, password)
         return {'success': True, 'token': token}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -42,7 +49,7 @@ def login(payload: Dict[str, Any]):
         password = payload.get('password')
         if not username or not password:
             raise ValueError('username and password required')
-        token = auth.authenticate_user(username, password)
+        token = _auth().authenticate_user(username, password)
         if not token:
             raise HTTPException(status_code=401, detail='Invalid credentials')
         return {'success': True, 'token': token}
@@ -63,7 +70,7 @@ def create_gear(payload: Dict[str, Any]):
         params_dict = payload.get('params', payload)
         params = GearParams(**params_dict)
         gear = GearFactory.create_gear(gear_type, params)
-        return {'success': True, 'gear': gear.get_info()}
+        return {'success': True, 'gear': GearFactory.get_info(gear)}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -74,10 +81,12 @@ def analyze_gear(payload: Dict[str, Any]):
         if 'gear' not in payload:
             raise ValueError('Configuration d\'engrenage requise')
         gear = GearFactory.from_dict(payload['gear'])
-        info = gear.get_info()
+        info = GearFactory.get_info(gear)
+        from core.stress_engine import StressEngine
+        mate = GearFactory.from_dict(payload['mate']) if 'mate' in payload else None
         analysis = {
             'basic_info': info,
-            'performances': {'bending_stress': 'N/A', 'contact_stress': 'N/A'},
+            'performances': StressEngine.performances(gear, payload.get('load'), mate),
             'validations': []
         }
         return {'success': True, 'analysis': analysis}
@@ -100,25 +109,61 @@ def mesh_gears(payload: Dict[str, Any]):
                 'center_distance': center_distance,
                 'contact_ratio': contact_ratio,
                 'transmission_ratio': transmission_ratio,
-                'gear1_info': gear1.get_info(),
-                'gear2_info': gear2.get_info()
+                'gear1_info': GearFactory.get_info(gear1),
+                'gear2_info': GearFactory.get_info(gear2)
             }
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-def _do_export(format: str, gear_dict: Dict[str, Any], filename: str, job_id: str):
+@app.post('/train/solve')
+def solve_train(payload: Dict[str, Any]):
+    try:
+        from core.train_solver import GearTrainSolver
+        return {'success': True, 'train': GearTrainSolver.solve_request(payload)}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post('/planetary/solve')
+def solve_planetary(payload: Dict[str, Any]):
+    try:
+        from core.planetary_solver import PlanetarySolver
+        return {'success': True, 'planetary': PlanetarySolver.solve_request(payload)}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get('/cache/stats')
+def cache_stats():
+    return GearFactory.cache_info()
+
+
+@app.post('/cache/invalidate')
+def cache_invalidate(payload: Dict[str, Any] = None):
+    try:
+        payload = payload or {}
+        params = GearParams(**payload['params']) if 'params' in payload else None
+        if params is not None and 'type' not in payload:
+            raise ValueError('type requis avec params')
+        return {'success': True, 'removed': GearFactory.invalidate(payload.get('type'), params)}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _do_export(format: str, gear_dict: Dict[str, Any], filename: str, job_id: str,
+               tolerance: float = None):
     try:
         gear = GearFactory.from_dict(gear_dict)
         if format.lower() == 'step':
             from export.step import STEPExporter
             exporter = STEPExporter()
-            exporter.export_gear(gear, filename)
+            exporter.export_gear(gear, filename, tolerance=tolerance)
         elif format.lower() == 'stl':
             from export.stl import STLExporter
             exporter = STLExporter()
-            exporter.export_gear(gear, filename)
+            exporter.export_gear(gear, filename, tolerance=tolerance)
         else:
             raise ValueError('Format non supporté')
         export_db.update_job_status(job_id, 'done', None)
@@ -131,6 +176,7 @@ def export_gear(payload: Dict[str, Any], background_tasks: BackgroundTasks, requ
     try:
         fmt = payload.get('format', 'step')
         gear = payload.get('gear')
+        tolerance = payload.get('tolerance')
         filename = payload.get('filename') or f"gear_{uuid.uuid4().hex}.{fmt}"
         # ensure directory exists
         os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
@@ -142,19 +188,19 @@ def export_gear(payload: Dict[str, Any], background_tasks: BackgroundTasks, requ
             if not auth_header or not auth_header.lower().startswith('bearer '):
                 raise HTTPException(status_code=401, detail='Authorization required')
             jwt_token = auth_header.split(None, 1)[1]
-            username = auth.verify_token(jwt_token)
+            username = _auth().verify_token(jwt_token)
             if not username:
                 raise HTTPException(status_code=401, detail='Invalid token')
             export_db.add_job(job_id, filename, fmt, None, username)
             # submit task
-            task_runner.submit_task(_do_export, fmt, gear, filename, job_id)
+            task_runner.submit_task(_do_export, fmt, gear, filename, job_id, tolerance)
             return {'success': True, 'job_id': job_id, 'filename': filename}
         else:
             # legacy mode: return a download token
             client_token = payload.get('token')
             token = client_token or uuid.uuid4().hex
             export_db.add_job(job_id, filename, fmt, token, None)
-            task_runner.submit_task(_do_export, fmt, gear, filename, job_id)
+            task_runner.submit_task(_do_export, fmt, gear, filename, job_id, tolerance)
             return {'success': True, 'job_id': job_id, 'filename': filename, 'token': token}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -175,7 +221,7 @@ def list_my_jobs(request: Request):
         if not auth_header or not auth_header.lower().startswith('bearer '):
             raise HTTPException(status_code=401, detail='Authorization required')
         jwt_token = auth_header.split(None, 1)[1]
-        username = auth.verify_token(jwt_token)
+        username = _auth().verify_token(jwt_token)
         if not username:
             raise HTTPException(status_code=401, detail='Invalid token')
         jobs = export_db.list_jobs(username)
@@ -196,7 +242,7 @@ def revoke_job(job_id: str, request: Request, payload: Dict[str, Any] = None):
         if not auth_header or not auth_header.lower().startswith('bearer '):
             raise HTTPException(status_code=401, detail='Authorization required')
         jwt_token = auth_header.split(None, 1)[1]
-        username = auth.verify_token(jwt_token)
+        username = _auth().verify_token(jwt_token)
         if not username:
             raise HTTPException(status_code=401, detail='Invalid token')
         if job.get('username') != username:
@@ -223,7 +269,7 @@ def download_file(job_id: str, token: str = None, request: Request = None):
         if not auth_header or not auth_header.lower().startswith('bearer '):
             raise HTTPException(status_code=401, detail='Authorization required')
         jwt_token = auth_header.split(None, 1)[1]
-        username = auth.verify_token(jwt_token)
+        username = _auth().verify_token(jwt_token)
         if not username:
             raise HTTPException(status_code=403, detail='Invalid token')
         if job.get('username') != username:
@@ -3,7 +3,9 @@ from tkinter import ttk, messagebox, filedialog
 import json
 from core.gear_factory import GearFactory
 from core.base_gear import GearParams
-from export.step import STEPExporter
+
+# Déclarer les types d'engrenages (modules importés au premier usage)
+GearFactory.register_builtin_types()
 
 
 def _create_gear_from_fields(fields):
@@ -36,7 +38,7 @@ def run_gui():
     labels = ['Type', 'Name', 'Module', 'Teeth', 'Pressure angle', 'Face width', 'Leads']
     entries = {}
 
-    gear_types = ['spur', 'helical', 'bevel', 'worm', 'rack', 'internal']
+    gear_types = GearFactory.get_available_types()
     ttk.Label(frame, text='Type').grid(row=0, column=0, sticky=tk.W)
     type_cb = ttk.Combobox(frame, values=gear_types)
     type_cb.set('spur')
@@ -81,20 +83,6 @@ def run_gui():
             params_dict = _create_gear_from_fields(fields)
             gear_type = fields['type'].get()
             params = GearParams(**params_dict)
-            # ensure types registered
-            from gears.spur import SpurGear
-            from gears.helical import HelicalGear
-            from gears.bevel import BevelGear
-            from gears.worm import WormGear
-            from gears.rack import RackGear
-            from gears.internal import InternalGear
-            GearFactory.register_gear('spur', SpurGear)
-            GearFactory.register_gear('helical', HelicalGear)
-            GearFactory.register_gear('bevel', BevelGear)
-            GearFactory.register_gear('worm', WormGear)
-            GearFactory.register_gear('rack', RackGear)
-            GearFactory.register_gear('internal', InternalGear)
-
             gear = GearFactory.create_gear(gear_type, params)
             info = gear.get_info()
             append('Engrenage créé: ' + info.get('name', ''))
@@ -112,6 +100,7 @@ def run_gui():
             filename = filedialog.asksaveasfilename(defaultextension='.step', filetypes=[('STEP','*.step')])
             if not filename:
                 return
+            from export.step import STEPExporter
             exporter = STEPExporter()
             exporter.export_gear(gear, filename)
             append(f'Fichier STEP généré: {filename}')
@@ -1,8 +1,19 @@
 # profiles/cycloidal.py - Version corrigée
 import math
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 import numpy as np
 
+from profiles.outline import KEY_DECIMALS, tile_teeth
+from profiles.sampling import arc_angles, resample_by_curvature
+
+# Échantillonnage dense avant rééchantillonnage adaptatif
+DENSE_POINTS = 1024
+
+# Proportions de denture (coefficients du module)
+ADDENDUM_COEFF = 1.0
+DEDENDUM_COEFF = 1.25
+
 class CycloidalProfile:
     """Profil cycloïdal (pour engrenages spéciaux)"""
     
@@ -11,25 +22,41 @@ class CycloidalProfile:
     
     def generate_points(self, pitch_radius: float,
                        rolling_radius: float = None,
-                       num_points: int = 100) -> List[Tuple[float, float]]:
+                       num_points: int = 100,
+                       tolerance: Optional[float] = None) -> np.ndarray:
         """
         Générer des points de profil cycloïdal
+        
+        Si tolerance (flèche maximale en mm) est fournie, les points sont
+        répartis selon la courbure au lieu d'un nombre fixe.
+        
+        Returns:
+            Tableau (N, 2) de points (x, y)
         """
         if rolling_radius is None:
             rolling_radius = pitch_radius * self.rolling_ratio
         
-        points = []
+        if tolerance is not None:
+            dense = np.linspace(0, 2 * math.pi, DENSE_POINTS)
+            theta = resample_by_curvature(
+                dense, self._epicycloid(pitch_radius, rolling_radius, dense),
+                tolerance
+            )
+        else:
+            theta = np.linspace(0, 2 * math.pi, num_points)
         
-        for theta in np.linspace(0, 2 * math.pi, num_points):
-            # Coordonnées du point sur la cycloïde
-            x = (pitch_radius + rolling_radius) * math.cos(theta) - \
-                rolling_radius * math.cos((pitch_radius + rolling_radius) * theta / rolling_radius)
-            y = (pitch_radius + rolling_radius) * math.sin(theta) - \
-                rolling_radius * math.sin((pitch_radius + rolling_radius) * theta / rolling_radius)
-            
-            points.append((x, y))
-        
-        return points
+        return self._epicycloid(pitch_radius, rolling_radius, theta)
+    
+    @staticmethod
+    def _epicycloid(pitch_radius: float, rolling_radius: float,
+                    theta: np.ndarray) -> np.ndarray:
+        """Coordonnées de l'épicycloïde pour les angles theta (vectorisé)"""
+        ratio = (pitch_radius + rolling_radius) / rolling_radius
+        x = (pitch_radius + rolling_radius) * np.cos(theta) - \
+            rolling_radius * np.cos(ratio * theta)
+        y = (pitch_radius + rolling_radius) * np.sin(theta) - \
+            rolling_radius * np.sin(ratio * theta)
+        return np.column_stack((x, y))
     
     def curvature_radius(self, pitch_radius: float,
                         rolling_radius: float,
@@ -37,4 +64,151 @@ class CycloidalProfile:
         """
         Rayon de courbure du profil
         """
-        return 4 * rolling_radius * abs(math.sin(angle / 2))
\ No newline at end of file
+        return 4 * rolling_radius * abs(math.sin(angle / 2))
+    
+    def generate_tooth_outline(self, module: float, teeth: int,
+                               backlash: float = 0.0,
+                               num_points: int = 16,
+                               tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Contour fermé de toutes les dents cycloïdales
+        
+        Tête en épicycloïde, pied en hypocycloïde, les deux engendrés par un
+        cercle roulant de rayon rolling_ratio × rayon primitif (0.5 donne
+        des flancs de pied radiaux).
+        
+        Args:
+            module: Module (mm)
+            teeth: Nombre de dents
+            backlash: Réduction d'épaisseur circulaire au primitif (mm)
+            num_points: Nombre de points par flanc
+            tolerance: Flèche maximale (mm); remplace num_points si fournie
+            
+        Returns:
+            Tableau (teeth * K, 2) en lecture seule, sens trigonométrique
+        """
+        return cycloidal_outline(module, teeth, self.rolling_ratio, backlash,
+                                 num_points, tolerance)
+
+
+def cycloidal_outline(module: float, teeth: int, rolling_ratio: float = 0.5,
+                      backlash: float = 0.0, num_points: int = 16,
+                      tolerance: Optional[float] = None) -> np.ndarray:
+    """Contour cycloïdal complet, mémorisé par clé canonique"""
+    if not 0 < rolling_ratio < 1:
+        raise ValueError(f"Le rapport du cercle roulant doit être entre 0 et 1, got {rolling_ratio}")
+    return _cached_cycloidal_outline(
+        round(float(module), KEY_DECIMALS),
+        int(teeth),
+        round(float(rolling_ratio), KEY_DECIMALS),
+        round(float(backlash), KEY_DECIMALS) + 0.0,
+        int(num_points),
+        None if tolerance is None else round(float(tolerance), KEY_DECIMALS),
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_cycloidal_outline(module, teeth, rolling_ratio, backlash,
+                              num_points, tolerance) -> np.ndarray:
+    radius, theta = cycloidal_tooth_polar_profile(module, teeth, rolling_ratio,
+                                                  backlash, num_points, tolerance)
+    outline = tile_teeth(radius, theta, teeth)
+    outline.setflags(write=False)
+    return outline
+
+
+def cycloidal_roll_limit(pitch_radius: float, rolling_radius: float,
+                         radius: float, outer: bool = True) -> float:
+    """
+    Angle de roulement (autour de la roue) pour atteindre un rayon donné
+    
+    outer=True pour l'épicycloïde (tête), False pour l'hypocycloïde (pied).
+    """
+    if outer:
+        center = pitch_radius + rolling_radius
+        cos_arg = (center ** 2 + rolling_radius ** 2 - radius ** 2) / (2 * center * rolling_radius)
+    else:
+        center = pitch_radius - rolling_radius
+        cos_arg = (radius ** 2 - center ** 2 - rolling_radius ** 2) / (2 * center * rolling_radius)
+    return rolling_radius / pitch_radius * math.acos(min(max(cos_arg, -1.0), 1.0))
+
+
+def cycloidal_tooth_polar_profile(module: float, teeth: int,
+                                  rolling_ratio: float = 0.5,
+                                  backlash: float = 0.0,
+                                  num_points: int = 16,
+                                  tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Profil polaire (rayon, angle) d'une dent cycloïdale centrée sur l'axe x
+    
+    Même convention que profiles.outline.tooth_polar_profile: de -π/z
+    inclus à +π/z exclu.
+    """
+    R = module * teeth / 2
+    rolling = rolling_ratio * R
+    ra = R + ADDENDUM_COEFF * module
+    rf = R - DEDENDUM_COEFF * module
+    half_pitch = math.pi / teeth
+    theta0 = (math.pi * module / 2 - backlash) / (2 * R)
+    
+    def epicycloid(phi):
+        k = (R + rolling) / rolling
+        return np.column_stack(((R + rolling) * np.cos(phi) - rolling * np.cos(k * phi),
+                                (R + rolling) * np.sin(phi) - rolling * np.sin(k * phi)))
+    
+    def hypocycloid(phi):
+        k = (R - rolling) / rolling
+        return np.column_stack(((R - rolling) * np.cos(phi) + rolling * np.cos(k * phi),
+                                (R - rolling) * np.sin(phi) - rolling * np.sin(k * phi)))
+    
+    def sample(curve, phi_end):
+        if tolerance is not None:
+            dense = np.linspace(0.0, phi_end, DENSE_POINTS)
+            return curve(resample_by_curvature(dense, curve(dense), tolerance))
+        return curve(np.linspace(0.0, phi_end, num_points))
+    
+    # Flanc de tête: l'épicycloïde se rapproche de l'axe de la dent
+    head = sample(epicycloid, cycloidal_roll_limit(R, rolling, ra, outer=True))
+    head_radius = np.hypot(head[:, 0], head[:, 1])
+    head_theta = theta0 - np.arctan2(head[:, 1], head[:, 0])
+    
+    # Dent pointue: arrêter le flanc à l'axe de la dent
+    pointed = head_theta < 0
+    if pointed.any():
+        stop = int(np.argmax(pointed))
+        head_radius = np.append(head_radius[:stop],
+                                np.interp(0.0, head_theta[stop - 1:stop + 1][::-1],
+                                          head_radius[stop - 1:stop + 1][::-1]))
+        head_theta = np.append(head_theta[:stop], 0.0)
+    
+    # Flanc de pied: l'hypocycloïde s'écarte de l'axe (radiale si rapport 0.5)
+    foot = sample(hypocycloid, cycloidal_roll_limit(R, rolling, rf, outer=False))
+    foot_radius = np.hypot(foot[:, 0], foot[:, 1])
+    foot_theta = np.minimum(theta0 + np.arctan2(foot[:, 1], foot[:, 0]), half_pitch)
+    
+    # Arcs de tête et de pied
+    tip_edge = head_theta[-1]
+    if tolerance is not None:
+        tip_theta = arc_angles(head_radius[-1], -tip_edge, tip_edge, tolerance)[1:-1]
+        root_theta = arc_angles(foot_radius[-1], foot_theta[-1], half_pitch, tolerance)[1:]
+    else:
+        tip_theta = np.linspace(-tip_edge, tip_edge, max(2, num_points // 2))[1:-1]
+        root_theta = np.linspace(foot_theta[-1], half_pitch, max(2, num_points // 4) + 1)[1:]
+    if tip_edge <= 0:
+        tip_theta = np.empty(0)
+    if foot_theta[-1] >= half_pitch:
+        root_theta = np.empty(0)
+    
+    # Demi-dent côté +θ, de la tête vers le milieu de l'entredent
+    half_radius = np.concatenate((head_radius[::-1], foot_radius[1:],
+                                  np.full(len(root_theta), foot_radius[-1])))
+    half_theta = np.concatenate((head_theta[::-1], foot_theta[1:], root_theta))
+    if half_theta[-1] < half_pitch:
+        half_radius = np.append(half_radius, foot_radius[-1])
+        half_theta = np.append(half_theta, half_pitch)
+    
+    start = 1 if half_theta[0] == 0 else 0
+    radius = np.concatenate((half_radius[::-1], np.full(len(tip_theta), half_radius[0]),
+                             half_radius[start:-1]))
+    theta = np.concatenate((-half_theta[::-1], tip_theta, half_theta[start:-1]))
+    return radius, theta
\ No newline at end of file
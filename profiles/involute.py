@@ -1,7 +1,67 @@
 import math
-from typing import List, Tuple
+from typing import Optional, Tuple
 import numpy as np
 
+from profiles.sampling import involute_roll_angles
+
+def involute(alpha):
+    """Fonction développante inv(α) = tan(α) - α (radians, vectorisée)"""
+    alpha = np.asarray(alpha, dtype=float)
+    return _as_scalar(np.tan(alpha) - alpha)
+
+
+def inverse_involute(inv, iterations: int = 5):
+    """
+    Fonction développante inverse: α tel que tan(α) - α = inv (vectorisée)
+    
+    Estimation initiale de Laczik pour les petites valeurs, borne supérieure
+    atan(inv + π/2) au-delà, puis itérations de Newton (précision ~1e-12
+    rad dès 5 itérations jusqu'à 85°).
+    
+    Args:
+        inv: Valeur(s) de la fonction développante (>= 0)
+        iterations: Nombre d'itérations de Newton
+        
+    Returns:
+        Angle(s) en radians
+    """
+    inv = np.asarray(inv, dtype=float)
+    alpha = np.where(inv < 0.5,
+                     1.441 * np.cbrt(inv) - 0.374 * inv,
+                     np.arctan(inv + math.pi / 2))
+    for _ in range(iterations):
+        tan_a = np.tan(alpha)
+        step = np.divide(tan_a - alpha - inv, tan_a * tan_a,
+                         out=np.zeros_like(alpha), where=tan_a != 0)
+        alpha = alpha - step
+    return _as_scalar(alpha)
+
+
+def _as_scalar(value):
+    """Retourner un float pour une entrée scalaire, le tableau sinon"""
+    value = np.asarray(value)
+    return float(value) if value.ndim == 0 else value
+
+
+def involute_points(base_radius, roll_angle) -> np.ndarray:
+    """
+    Coordonnées de la développante pour des angles de roulement donnés
+    
+    Args:
+        base_radius: Rayon(s) de base, diffusable avec roll_angle
+        roll_angle: Angle(s) de roulement (radians)
+        
+    Returns:
+        Tableau (..., 2) de points (x, y)
+    """
+    t = np.asarray(roll_angle, dtype=float)
+    cos_t = np.cos(t)
+    sin_t = np.sin(t)
+    x = base_radius * (cos_t + t * sin_t)
+    y = base_radius * (sin_t - t * cos_t)
+    return np.stack(np.broadcast_arrays(x, y), axis=-1)
+
+
 class InvoluteProfile:
     """Profil en développante de cercle (norme ISO)"""
     
@@ -12,7 +72,8 @@ class InvoluteProfile:
     def generate_points(self, base_radius: float, 
                        start_angle: float = 0,
                        end_angle: float = 60,
-                       num_points: int = 100) -> List[Tuple[float, float]]:
+                       num_points: int = 100,
+                       tolerance: Optional[float] = None) -> np.ndarray:
         """
         Générer des points de la développante
         
@@ -21,33 +82,62 @@ class InvoluteProfile:
             start_angle: Angle de départ (degrés)
             end_angle: Angle de fin (degrés)
             num_points: Nombre de points
+            tolerance: Flèche maximale (mm); si fournie, remplace num_points
             
         Returns:
-            Liste de points (x, y)
+            Tableau (N, 2) de points (x, y)
         """
-        points = []
+        return self.generate_points_batch(
+            np.asarray([base_radius], dtype=float),
+            start_angle, end_angle, num_points, tolerance
+        )[0]
+    
+    def generate_points_batch(self, base_radii,
+                              start_angle: float = 0,
+                              end_angle: float = 60,
+                              num_points: int = 100,
+                              tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Générer les développantes de plusieurs rayons de base en une passe
+        
+        Args:
+            base_radii: Rayons de base (G,)
+            start_angle: Angle de départ (degrés)
+            end_angle: Angle de fin (degrés)
+            num_points: Nombre de points par développante
+            tolerance: Flèche maximale (mm); l'échantillonnage est calculé
+                pour le plus grand rayon et vaut donc pour tous
+            
+        Returns:
+            Tableau (G, N, 2) de points (x, y)
+        """
+        base_radii = np.asarray(base_radii, dtype=float).reshape(-1, 1)
         start_rad = math.radians(start_angle)
         end_rad = math.radians(end_angle)
-        
-        for t in np.linspace(start_rad, end_rad, num_points):
-            x = base_radius * (math.cos(t) + t * math.sin(t))
-            y = base_radius * (math.sin(t) - t * math.cos(t))
-            points.append((x, y))
-        
-        return points
+        if tolerance is not None:
+            t = involute_roll_angles(float(base_radii.max()), start_rad,
+                                     end_rad, tolerance)
+        else:
+            t = np.linspace(start_rad, end_rad, num_points)
+        return involute_points(base_radii, t)
     
-    def pressure_angle_at_radius(self, base_radius: float, 
-                                radius: float) -> float:
-        """Calculer l'angle de pression à un rayon donné"""
-        if radius <= base_radius:
-            return 0
-        alpha = math.acos(base_radius / radius)
-        return math.degrees(alpha)
+    def pressure_angle_at_radius(self, base_radius, radius):
+        """
+        Calculer l'angle de pression à un rayon donné (degrés)
+        
+        Accepte des scalaires ou des tableaux; 0 sous le cercle de base.
+        """
+        base_radius = np.asarray(base_radius, dtype=float)
+        radius = np.asarray(radius, dtype=float)
+        ratio = np.divide(base_radius, radius, out=np.ones(np.broadcast(base_radius, radius).shape),
+                          where=radius > base_radius)
+        alpha = np.degrees(np.arccos(np.minimum(ratio, 1.0)))
+        return _as_scalar(alpha)
     
-    def thickness_at_radius(self, base_radius: float, 
-                           pitch_radius: float,
-                           thickness_at_pitch: float,
-                           radius: float) -> float:
+    def thickness_at_radius(self, base_radius, 
+                           pitch_radius,
+                           thickness_at_pitch,
+                           radius):
         """
         Épaisseur de la dent à un rayon donné
         
@@ -55,26 +145,25 @@ class InvoluteProfile:
             base_radius: Rayon de base
             pitch_radius: Rayon primitif
             thickness_at_pitch: Épaisseur au primitif
-            radius: Rayon où calculer l'épaisseur
+            radius: Rayon(s) où calculer l'épaisseur (scalaire ou tableau)
             
         Returns:
-            Épaisseur de la dent au rayon spécifié
+            Épaisseur de la dent au(x) rayon(s) spécifié(s), 0 sous le
+            cercle de base
         """
-        if radius < base_radius:
-            return 0
-        
-        # Angle d'involute au primitif
-        inv_alpha = math.tan(self.alpha_rad) - self.alpha_rad
+        base_radius = np.asarray(base_radius, dtype=float)
+        radius = np.asarray(radius, dtype=float)
         
         # Angle d'involute au rayon spécifié
-        alpha_r = math.acos(base_radius / radius)
-        inv_alpha_r = math.tan(alpha_r) - alpha_r
+        below_base = radius < base_radius
+        alpha_r = np.arccos(np.clip(base_radius / np.where(below_base, base_radius, radius),
+                                    -1.0, 1.0))
         
         # Épaisseur au rayon spécifié
-        thickness = radius * (thickness_at_pitch / pitch_radius + 
-                             2 * (inv_alpha - inv_alpha_r))
+        thickness = radius * (np.asarray(thickness_at_pitch) / pitch_radius +
+                              2 * (involute(self.alpha_rad) - involute(alpha_r)))
         
-        return thickness
+        return _as_scalar(np.where(below_base, 0.0, thickness))
     
     @staticmethod
     def contact_point(pitch_point1: Tuple[float, float],
@@ -0,0 +1,306 @@
+"""
+Contour 2D complet d'un engrenage en développante
+
+Le contour est engendré par la crémaillère de référence ISO 53: flanc en
+développante, raccordement trochoïdal au pied (arrondi de tête de l'outil),
+arc de pied et arc de tête. Le déport de profil et le jeu sont pris en compte.
+Les contours sont mémorisés par clé canonique afin que chaque exportateur
+réutilise la même géométrie. Pour une denture hélicoïdale, le contour est la
+section apparente (plan normal à l'axe) engendrée par la crémaillère normale.
+"""
+import math
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+
+from standards.iso_53 import ISO53
+from profiles.involute import involute
+from profiles.sampling import arc_angles, involute_roll_angles, resample_by_curvature
+
+# Précision des clés canoniques (évite les doublons dus aux flottants)
+KEY_DECIMALS = 9
+
+# Échantillonnage dense du raccordement avant rééchantillonnage adaptatif
+DENSE_FILLET_POINTS = 256
+
+
+def outline_key(module: float, teeth: int, pressure_angle: float = 20.0,
+                profile_shift: float = 0.0, backlash: float = 0.0,
+                num_points: int = 16, tolerance: Optional[float] = None,
+                helix_angle: float = 0.0) -> Tuple:
+    """Clé canonique (module, dents, angle, déport, jeu, résolution, tolérance, hélice)"""
+    return (
+        round(float(module), KEY_DECIMALS),
+        int(teeth),
+        round(float(pressure_angle), KEY_DECIMALS),
+        round(float(profile_shift), KEY_DECIMALS) + 0.0,
+        round(float(backlash), KEY_DECIMALS) + 0.0,
+        int(num_points),
+        None if tolerance is None else round(float(tolerance), KEY_DECIMALS),
+        round(float(helix_angle), KEY_DECIMALS) + 0.0,
+    )
+
+
+def gear_outline(module: float, teeth: int, pressure_angle: float = 20.0,
+                 profile_shift: float = 0.0, backlash: float = 0.0,
+                 num_points: int = 16,
+                 tolerance: Optional[float] = None,
+                 helix_angle: float = 0.0) -> np.ndarray:
+    """
+    Contour fermé de toutes les dents d'un engrenage extérieur
+    
+    Args:
+        module: Module (mm), normal pour une denture hélicoïdale
+        teeth: Nombre de dents
+        pressure_angle: Angle de pression (degrés)
+        profile_shift: Coefficient de déport x
+        backlash: Réduction d'épaisseur circulaire au primitif (mm)
+        num_points: Nombre de points par flanc en développante
+        tolerance: Flèche maximale (mm); si fournie, l'échantillonnage de
+            chaque segment suit sa courbure et num_points est ignoré
+        helix_angle: Angle d'hélice (degrés); le contour est alors la
+            section apparente
+        
+    Returns:
+        Tableau (teeth * K, 2) en lecture seule, parcouru dans le sens
+        trigonométrique, sans point dupliqué (le contour est implicitement fermé)
+    """
+    key = outline_key(module, teeth, pressure_angle, profile_shift,
+                      backlash, num_points, tolerance, helix_angle)
+    return _cached_outline(*key)
+
+
+def internal_gear_outline(module: float, teeth: int, pressure_angle: float = 20.0,
+                          backlash: float = 0.0, num_points: int = 16,
+                          tolerance: Optional[float] = None) -> np.ndarray:
+    """
+    Contour fermé des dents d'une couronne intérieure (bord intérieur de la matière)
+    
+    Les dents pointent vers le centre : tête au rayon r - m, pied au rayon
+    r + 1,25·m (diamètres de InternalGear). Mêmes conventions et même
+    mémorisation que gear_outline.
+    """
+    key = outline_key(module, teeth, pressure_angle, 0.0, backlash, num_points, tolerance)
+    return _cached_internal_outline(*key[:-2], key[-2])
+
+
+def outline_cache_info():
+    """Statistiques du cache des contours"""
+    return _cached_outline.cache_info()
+
+
+def outline_cache_clear():
+    """Vider le cache des contours"""
+    _cached_outline.cache_clear()
+    _cached_internal_outline.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _cached_outline(module, teeth, pressure_angle, profile_shift,
+                    backlash, num_points, tolerance, helix_angle) -> np.ndarray:
+    radius, theta = tooth_polar_profile(module, teeth, pressure_angle,
+                                        profile_shift, backlash, num_points,
+                                        tolerance, helix_angle)
+    outline = tile_teeth(radius, theta, teeth)
+    outline.setflags(write=False)
+    return outline
+
+
+@lru_cache(maxsize=64)
+def _cached_internal_outline(module, teeth, pressure_angle, profile_shift,
+                             backlash, num_points, tolerance) -> np.ndarray:
+    radius, theta = internal_tooth_polar_profile(module, teeth, pressure_angle,
+                                                 backlash, num_points, tolerance)
+    outline = tile_teeth(radius, theta, teeth)
+    outline.setflags(write=False)
+    return outline
+
+
+def tile_teeth(radius: np.ndarray, theta: np.ndarray, teeth: int) -> np.ndarray:
+    """Répéter le profil polaire d'une dent sur tout le tour en une passe"""
+    pitch_angles = 2 * math.pi * np.arange(teeth) / teeth
+    angles = (theta[None, :] + pitch_angles[:, None]).ravel()
+    radii = np.tile(radius, teeth)
+    return np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+
+
+def tooth_polar_profile(module: float, teeth: int, pressure_angle: float = 20.0,
+                        profile_shift: float = 0.0, backlash: float = 0.0,
+                        num_points: int = 16,
+                        tolerance: Optional[float] = None,
+                        helix_angle: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Profil polaire (rayon, angle) d'une dent centrée sur l'axe x
+    
+    La dent s'étend de -π/z à +π/z (milieux des entredents), le dernier
+    point est exclu pour permettre la répétition sans doublon.
+    
+    Avec un angle d'hélice β, la crémaillère apparente a pour module
+    m / cos β et pour angle de pression atan(tan α / cos β); les hauteurs
+    de tête et de pied et le déport restent ceux de la crémaillère normale.
+    """
+    rack = ISO53.basic_rack_profile(module, pressure_angle)
+    alpha = math.radians(pressure_angle)
+    x_m = profile_shift * module
+    half_pitch = math.pi / teeth
+    if helix_angle:
+        cos_beta = math.cos(math.radians(helix_angle))
+        alpha = math.atan(math.tan(alpha) / cos_beta)
+        module = module / cos_beta
+        rack = dict(rack, tooth_thickness=math.pi * module / 2,
+                    space_width=math.pi * module / 2)
+    
+    r = module * teeth / 2
+    rb = r * math.cos(alpha)
+    ra = r + rack['addendum'] + x_m
+    rf = r - rack['dedendum'] + x_m
+    
+    # Demi-épaisseur angulaire au primitif
+    thickness = rack['tooth_thickness'] + 2 * x_m * math.tan(alpha) - backlash
+    psi = thickness / (2 * r) + float(involute(alpha))
+    
+    # Demi-largeur de la dent d'outil sur sa ligne de tête (rayon rf)
+    tool_tip_half_width = (rack['space_width'] / 2 + backlash / 2
+                           - rack['dedendum'] * math.tan(alpha))
+    fillet_radius, fillet_theta = _trochoid_fillet(
+        r, rf, alpha, rack['root_radius'], tool_tip_half_width,
+        half_pitch, num_points, tolerance
+    )
+    
+    # Flanc en développante entre le début de profil et la tête
+    form_radius = max(rb, fillet_radius[-1])
+    if tolerance is not None:
+        roll = involute_roll_angles(rb, math.sqrt((form_radius / rb) ** 2 - 1),
+                                    math.sqrt((ra / rb) ** 2 - 1), tolerance)
+        flank_radius = rb * np.sqrt(1 + roll[::-1] ** 2)
+    else:
+        flank_radius = np.linspace(ra, form_radius, num_points)
+    flank_theta = psi - involute(np.arccos(np.minimum(rb / flank_radius, 1.0)))
+    
+    # Arc de tête (symétrique) et arc de pied jusqu'au milieu de l'entredent
+    if tolerance is not None:
+        tip_theta = arc_angles(ra, -flank_theta[0], flank_theta[0], tolerance)[1:-1]
+        root_theta = arc_angles(rf, fillet_theta[0], half_pitch, tolerance)[1:]
+    else:
+        tip_points = max(2, num_points // 2)
+        tip_theta = np.linspace(-flank_theta[0], flank_theta[0], tip_points)[1:-1]
+        root_points = max(2, num_points // 4)
+        root_theta = np.linspace(fillet_theta[0], half_pitch, root_points + 1)[1:]
+    
+    # Demi-dent côté +θ, de la tête vers le milieu de l'entredent
+    half_radius = np.concatenate((flank_radius, fillet_radius[::-1][1:],
+                                  np.full(len(root_theta), rf)))
+    half_theta = np.concatenate((flank_theta, fillet_theta[::-1][1:], root_theta))
+    
+    radius = np.concatenate((half_radius[::-1], np.full(len(tip_theta), ra),
+                             half_radius[:-1]))
+    theta = np.concatenate((-half_theta[::-1], tip_theta, half_theta[:-1]))
+    
+    # Du milieu de l'entredent (-π/z) inclus à +π/z exclu
+    return radius, theta
+
+
+def _trochoid_fillet(r: float, rf: float, alpha: float, tool_radius: float,
+                     tip_half_width: float, half_pitch: float,
+                     num_points: int,
+                     tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Raccordement trochoïdal engendré par l'arrondi de tête de l'outil
+    
+    L'outil (crémaillère conjuguée) roule sur le cercle primitif; son arrondi
+    de rayon tool_radius enveloppe le pied de la dent. Les points vont du
+    cercle de pied vers le début du flanc en développante.
+    
+    Returns:
+        (rayons, angles) relatifs à l'axe de la dent
+    """
+    tan_a = math.tan(alpha)
+    
+    # Rayon d'arrondi limité par la largeur de tête de l'outil
+    rho = min(tool_radius,
+              max(tip_half_width, 0.0) * math.cos(alpha) / (1 - math.sin(alpha)))
+    yc = rf + rho
+    xc = max(tip_half_width + rho * tan_a - rho / math.cos(alpha), 0.0)
+    
+    # Rotation de la roue: contact au pied (φ0) puis au début du flanc (φ1)
+    phi0 = xc / r
+    phi1 = (xc - (r - yc) / tan_a) / r
+    
+    def contact_points(phi):
+        # Centre de l'arrondi dans le repère fixe, point de contact sur la
+        # normale passant par le point de roulement (0, r)
+        cx = xc - r * phi
+        dy = yc - r
+        norm = np.hypot(cx, dy)
+        px = cx + rho * cx / norm
+        py = yc + rho * dy / norm
+        
+        # Retour dans le repère de la roue (rotation -φ), entredent centré sur +y
+        cos_p = np.cos(phi)
+        sin_p = np.sin(phi)
+        return cos_p * px + sin_p * py, -sin_p * px + cos_p * py
+    
+    if tolerance is not None:
+        dense = np.linspace(phi0, phi1, DENSE_FILLET_POINTS)
+        phi = resample_by_curvature(dense, np.column_stack(contact_points(dense)),
+                                    tolerance)
+    else:
+        phi = np.linspace(phi0, phi1, num_points)
+    gx, gy = contact_points(phi)
+    
+    radius = np.hypot(gx, gy)
+    theta = half_pitch - (math.pi / 2 - np.arctan2(gy, gx))
+    return radius, theta
+
+
+def internal_tooth_polar_profile(module: float, teeth: int, pressure_angle: float = 20.0,
+                                 backlash: float = 0.0, num_points: int = 16,
+                                 tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Profil polaire (rayon, angle) d'une dent intérieure centrée sur l'axe x
+    
+    La dent intérieure occupe l'entredent de l'engrenage extérieur de mêmes
+    module et nombre de dents : sa demi-épaisseur angulaire au rayon ρ vaut
+    s / 2r - inv α + inv α_ρ et croît vers le pied. Sous le cercle de base
+    (peu de dents), le flanc est prolongé radialement. Même convention que
+    tooth_polar_profile : de -π/z (milieu de l'entredent, au pied) inclus
+    à +π/z exclu.
+    """
+    alpha = math.radians(pressure_angle)
+    half_pitch = math.pi / teeth
+    r = module * teeth / 2
+    rb = r * math.cos(alpha)
+    ra = r - ISO53.addendum(module)
+    rf = r + ISO53.dedendum(module)
+    thickness = math.pi * module / 2 - backlash
+    
+    def half_thickness(radius):
+        pressure = np.arccos(np.minimum(rb / np.maximum(radius, rb), 1.0))
+        return thickness / (2 * r) - float(involute(alpha)) + involute(pressure)
+    
+    # Flanc du pied vers la tête (rayons décroissants)
+    if tolerance is not None:
+        start = math.sqrt((max(ra, rb) / rb) ** 2 - 1)
+        roll = involute_roll_angles(rb, start, math.sqrt((rf / rb) ** 2 - 1), tolerance)
+        flank_radius = rb * np.sqrt(1 + roll[::-1] ** 2)
+        if ra < rb:
+            flank_radius = np.append(flank_radius, ra)
+    else:
+        flank_radius = np.linspace(rf, ra, num_points)
+    flank_theta = half_thickness(flank_radius)
+    if flank_theta[0] >= half_pitch:
+        raise ValueError("Entredents fermés au pied de la couronne intérieure")
+    
+    if tolerance is not None:
+        tip_theta = arc_angles(ra, -flank_theta[-1], flank_theta[-1], tolerance)[1:-1]
+        root_theta = arc_angles(rf, flank_theta[0], half_pitch, tolerance)[1:-1]
+    else:
+        tip_theta = np.linspace(-flank_theta[-1], flank_theta[-1], max(2, num_points // 2))[1:-1]
+        root_theta = np.linspace(flank_theta[0], half_pitch, max(2, num_points // 4) + 1)[1:-1]
+    
+    radius = np.concatenate(([rf], np.full(len(root_theta), rf), flank_radius,
+                             np.full(len(tip_theta), ra), flank_radius[::-1],
+                             np.full(len(root_theta), rf)))
+    theta = np.concatenate(([-half_pitch], -root_theta[::-1], -flank_theta, tip_theta,
+                            flank_theta[::-1], root_theta))
+    return radius, theta
@@ -0,0 +1,69 @@
+"""
+Profil denté d'une crémaillère droite
+
+La denture est le trapèze de la crémaillère de référence ISO 53 (flancs
+droits inclinés de l'angle de pression), répété par translation du pas
+p = π·m le long de x. La ligne primitive est en y = 0, les dents pointent
+vers +y et x = 0 est le milieu d'un entredent. Une portion [début, fin] du
+profil est produite sans boucle par dent, ce qui permet d'assembler les
+crémaillères longues par paquets de dents.
+"""
+import math
+from typing import Tuple
+import numpy as np
+
+from standards.iso_53 import ISO53
+
+# Nombre de dents par paquet pour les crémaillères produites en flux
+CHUNK_TEETH = 256
+
+
+def rack_tooth_template(module: float, pressure_angle: float = 20.0,
+                        backlash: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sommets (x, y) d'une période du profil, de x = 0 inclus à x = p exclu
+
+    Milieu d'entredent au pied, flanc gauche, tête, flanc droit : la dent
+    est centrée en x = p/2, d'épaisseur πm/2 - jeu sur la ligne primitive.
+    """
+    rack = ISO53.basic_rack_profile(module, pressure_angle)
+    pitch = math.pi * module
+    tan_a = math.tan(math.radians(pressure_angle))
+    half = (rack['tooth_thickness'] - backlash) / 2
+    tip = half - rack['addendum'] * tan_a
+    root = half + rack['dedendum'] * tan_a
+    if tip <= 0:
+        raise ValueError("Dent de crémaillère pointue : épaisseur de tête nulle")
+    if root >= pitch / 2:
+        raise ValueError("Entredents de crémaillère fermés au pied")
+    x = pitch / 2 + np.array([-pitch / 2, -root, -tip, tip, root])
+    y = np.array([-rack['dedendum'], -rack['dedendum'], rack['addendum'],
+                  rack['addendum'], -rack['dedendum']])
+    return x, y
+
+
+def rack_profile(module: float, start: float, stop: float,
+                 pressure_angle: float = 20.0, backlash: float = 0.0) -> np.ndarray:
+    """
+    Profil ouvert (N, 2) de la crémaillère entre les abscisses start et stop
+
+    Le gabarit d'une dent est translaté de k·p pour les dents touchant
+    l'intervalle (une seule opération diffusée); les extrémités sont
+    interpolées sur le profil, de sorte que deux portions contiguës
+    partagent exactement leur sommet commun. Abscisses strictement
+    croissantes.
+    """
+    pitch = math.pi * module
+    x, y = rack_tooth_template(module, pressure_angle, backlash)
+    first, last = math.floor(start / pitch), math.ceil(stop / pitch)
+    offsets = pitch * np.arange(first, last)
+    tiled_x = (x[None, :] + offsets[:, None]).ravel()
+    tiled_y = np.tile(y, len(offsets))
+    margin = 1e-9 * pitch
+    inside = (tiled_x > start + margin) & (tiled_x < stop - margin)
+    ends = np.array([start, stop])
+    ends_y = np.interp(np.mod(ends, pitch), np.append(x, pitch), np.append(y, y[0]))
+    return np.column_stack((
+        np.concatenate(([start], tiled_x[inside], [stop])),
+        np.concatenate((ends_y[:1], tiled_y[inside], ends_y[1:])),
+    ))
@@ -0,0 +1,90 @@
+"""
+Échantillonnage adaptatif des profils par tolérance de corde
+
+Le nombre de points suit l'écart maximal admissible entre la corde et la
+courbe (flèche, en mm) au lieu d'un nombre fixe: une flèche δ sur un arc de
+rayon de courbure ρ autorise une rotation de tangente Δψ = 2·sqrt(2δ/ρ).
+"""
+import math
+import numpy as np
+
+# Garde-fous sur le nombre de segments par courbe
+MIN_SEGMENTS = 1
+MAX_SEGMENTS = 10000
+
+
+def _segment_count(value: float) -> int:
+    return int(min(max(math.ceil(value - 1e-9), MIN_SEGMENTS), MAX_SEGMENTS))
+
+
+def involute_roll_angles(base_radius: float, start: float, end: float,
+                         tolerance: float) -> np.ndarray:
+    """
+    Angles de roulement (radians) d'une développante pour une flèche donnée
+    
+    Le rayon de courbure de la développante vaut ρ = r_b·t; la densité de
+    points dn/dt = sqrt(r_b·t / 8δ) s'intègre en n(t) ∝ t^(3/2), d'où une
+    répartition uniforme en t^(3/2).
+    
+    Args:
+        base_radius: Rayon de base
+        start: Angle de roulement de départ (radians, >= 0)
+        end: Angle de roulement de fin (radians)
+        tolerance: Flèche maximale (mm)
+    """
+    if tolerance <= 0:
+        raise ValueError(f"La tolérance doit être > 0, got {tolerance}")
+    u0 = max(start, 0.0) ** 1.5
+    u1 = max(end, 0.0) ** 1.5
+    scale = math.sqrt(base_radius / (8 * tolerance)) * 2 / 3
+    count = _segment_count(abs(u1 - u0) * scale)
+    return np.linspace(u0, u1, count + 1) ** (2 / 3)
+
+
+def arc_angles(radius: float, start: float, end: float,
+               tolerance: float) -> np.ndarray:
+    """Angles (radians) d'un arc de cercle pour une flèche donnée"""
+    if tolerance <= 0:
+        raise ValueError(f"La tolérance doit être > 0, got {tolerance}")
+    if radius <= tolerance:
+        count = MIN_SEGMENTS
+    else:
+        step = 2 * math.acos(1 - tolerance / radius)
+        count = _segment_count(abs(end - start) / step)
+    return np.linspace(start, end, count + 1)
+
+
+def resample_by_curvature(param: np.ndarray, points: np.ndarray,
+                          tolerance: float) -> np.ndarray:
+    """
+    Nouvelles valeurs de paramètre d'une courbe échantillonnée finement
+    
+    La courbure locale est estimée sur l'échantillonnage dense (rotation de
+    tangente par segment); la densité requise sqrt(Δψ²/(8δ·κ)) est cumulée
+    puis inversée pour répartir les points.
+    
+    Args:
+        param: Paramètres de l'échantillonnage dense (M,)
+        points: Points correspondants (M, 2)
+        tolerance: Flèche maximale (mm)
+    """
+    if tolerance <= 0:
+        raise ValueError(f"La tolérance doit être > 0, got {tolerance}")
+    seg = np.diff(points, axis=0)
+    length = np.hypot(seg[:, 0], seg[:, 1])
+    heading = np.unwrap(np.arctan2(seg[:, 1], seg[:, 0]))
+    
+    # Rotation de tangente de chaque sommet répartie sur ses deux segments
+    turn = np.abs(np.diff(heading))
+    turn_per_segment = np.zeros_like(length)
+    turn_per_segment[:-1] += turn / 2
+    turn_per_segment[1:] += turn / 2
+    
+    # Points nécessaires par segment: Δψ / (2·sqrt(2δ/ρ)) avec ρ = ds / Δψ
+    needed = np.sqrt(turn_per_segment * length / (8 * tolerance))
+    cumulative = np.concatenate(([0.0], np.cumsum(needed)))
+    if cumulative[-1] == 0:
+        return np.array([param[0], param[-1]], dtype=float)
+    count = _segment_count(cumulative[-1])
+    targets = np.linspace(0.0, cumulative[-1], count + 1)
+    return np.interp(targets, cumulative, param)
@@ -0,0 +1,237 @@
+"""
+Balayage de contours 2D en solides triangulés
+
+Un contour fermé (N, 2) est placé dans S sections le long de l'axe z, chaque
+section tournée de son angle propre (hélice) : les sommets (S, N, 3) sont
+obtenus par une seule opération diffusée, puis les facettes latérales et
+les faces d'extrémité sont indexées sans boucle par section. Les solides
+longs sont assemblés par paquets de sections (iter_solid_faces).
+"""
+import math
+from typing import Iterable, Iterator, Optional
+import numpy as np
+
+from profiles.sampling import MAX_SEGMENTS, MIN_SEGMENTS
+
+# Nombre de sections par paquet pour les solides produits en flux
+CHUNK_SECTIONS = 64
+
+
+def twist_steps(radius: float, twist: float, tolerance: Optional[float] = None,
+                max_angle: Optional[float] = None) -> int:
+    """
+    Nombre de pas en z pour une rotation totale twist (radians)
+
+    Entre deux sections, un point de rayon radius parcourt un arc d'hélice
+    dont la projection est un arc de cercle : la flèche de la corde vaut
+    radius·(1 - cos(Δφ/2)). Sans tolérance, le pas angulaire vaut max_angle.
+
+    Args:
+        radius: Rayon le plus grand du contour (tête)
+        twist: Rotation totale du contour (radians)
+        tolerance: Flèche maximale (mm)
+        max_angle: Pas angulaire maximal (radians)
+    """
+    if tolerance is not None:
+        if tolerance <= 0:
+            raise ValueError(f"La tolérance doit être > 0, got {tolerance}")
+        step = 2 * math.acos(1 - tolerance / radius) if radius > tolerance else math.pi
+        if max_angle is not None:
+            step = min(step, max_angle)
+    elif max_angle is not None:
+        step = max_angle
+    else:
+        return MIN_SEGMENTS
+    return int(min(max(math.ceil(abs(twist) / step - 1e-9), MIN_SEGMENTS), MAX_SEGMENTS))
+
+
+def herringbone_twist(z: np.ndarray, height: float, rate: float) -> np.ndarray:
+    """Rotation en chevron : croissante jusqu'à mi-largeur puis symétrique"""
+    return rate * np.minimum(z, height - z)
+
+
+def sweep_sections(outline: np.ndarray, z: np.ndarray,
+                   angles: np.ndarray) -> np.ndarray:
+    """
+    Sections tournées d'un contour (une seule opération diffusée)
+
+    Args:
+        outline: Contour fermé (N, 2)
+        z: Cotes des sections (S,)
+        angles: Rotation de chaque section (S,) en radians
+
+    Returns:
+        Sommets (S, N, 3)
+    """
+    outline = np.asarray(outline, dtype=float)
+    z = np.asarray(z, dtype=float)
+    angles = np.asarray(angles, dtype=float)
+    cos_a = np.cos(angles)[:, None]
+    sin_a = np.sin(angles)[:, None]
+    x = outline[None, :, 0]
+    y = outline[None, :, 1]
+    return np.stack((cos_a * x - sin_a * y,
+                     sin_a * x + cos_a * y,
+                     np.broadcast_to(z[:, None], (len(z), len(outline)))), axis=-1)
+
+
+def sections_to_faces(sections: np.ndarray,
+                      centers: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Facettes (F, 3, 3) d'un solide défini par ses sections (S, N, 3)
+
+    Les faces latérales relient deux sections successives (deux triangles
+    par arête du contour); les extrémités sont triangulées en éventail vers
+    l'axe, comme STLExporter.extrude_outline. Normales sortantes pour un
+    contour parcouru dans le sens trigonométrique.
+
+    Args:
+        centers: Sommets (2, 3) des éventails des première et dernière
+            sections (par défaut sur l'axe, à la cote de la section)
+    """
+    if centers is None:
+        centers = [None, None]
+    return np.concatenate((cap_faces(sections[0], centers[0]),
+                           cap_faces(sections[-1], centers[1], top=True),
+                           side_faces(sections)))
+
+
+def iter_solid_faces(chunks: Iterable[np.ndarray],
+                     centers: Optional[np.ndarray] = None) -> Iterator[np.ndarray]:
+    """
+    Facettes d'un solide dont les sections arrivent par paquets (S_i, N, 3)
+
+    Seuls deux paquets consécutifs sont en mémoire : la dernière section
+    d'un paquet est reliée à la première du suivant. Les paquets produits
+    sont le fond, les faces latérales de chaque paquet, puis le dessus.
+    """
+    if centers is None:
+        centers = [None, None]
+    previous = None
+    for sections in chunks:
+        if previous is None:
+            yield cap_faces(sections[0], centers[0])
+        else:
+            sections = np.concatenate((previous[None], sections))
+        if len(sections) > 1:
+            yield side_faces(sections)
+        previous = sections[-1]
+    if previous is None:
+        raise ValueError("Aucune section à assembler")
+    yield cap_faces(previous, centers[1], top=True)
+
+
+def side_faces(sections: np.ndarray) -> np.ndarray:
+    """Faces latérales (2·(S-1)·N, 3, 3) entre sections successives"""
+    count, size = sections.shape[:2]
+    vertices = sections.reshape(-1, 3)
+    point = np.arange(size)
+    following = np.roll(point, -1)
+    low = (np.arange(count - 1)[:, None] * size + point).ravel()
+    low_next = (np.arange(count - 1)[:, None] * size + following).ravel()
+    high = low + size
+    high_next = low_next + size
+    side = np.stack((
+        np.stack((low, low_next, high), axis=1),
+        np.stack((low_next, high_next, high), axis=1),
+    ), axis=1).reshape(-1, 3)
+    return vertices[side]
+
+
+def cap_faces(section: np.ndarray, center: Optional[np.ndarray] = None,
+              top: bool = False) -> np.ndarray:
+    """Éventail (N, 3, 3) d'une section vers center (par défaut sur l'axe)"""
+    if center is None:
+        center = np.array([0.0, 0.0, section[0, 2]])
+    following = np.roll(section, -1, axis=0)
+    first, second = (section, following) if top else (following, section)
+    return np.stack((first, second, np.broadcast_to(center, section.shape)), axis=1)
+
+
+def ring_faces(inner: np.ndarray, radius: float, z: np.ndarray) -> np.ndarray:
+    """
+    Anneau extrudé (F, 3, 3) entre un contour intérieur (N, 2) et une jante
+
+    Le contour, trigonométrique et d'angle polaire croissant (segments
+    radiaux admis), est projeté sur le cercle de jante : un sommet de jante
+    par angle distinct. Les faces d'extrémité sont une bande fusionnant les
+    arrivées sur les deux boucles dans l'ordre des indices du contour. Le
+    sommet de jante d'un segment radial montant arrive après le segment;
+    pour un segment descendant, celui de l'angle suivant arrive avant, ce
+    qui évite tout triangle dégénéré ou retourné. La paroi intérieure est
+    orientée vers l'axe, la jante vers l'extérieur.
+    """
+    inner = np.asarray(inner, dtype=float)
+    distance = np.hypot(inner[:, 0], inner[:, 1])
+    # Départ au fond d'un entredent (sommet isolé, loin des segments radiaux)
+    start = int(np.argmax(distance))
+    inner, distance = np.roll(inner, -start, axis=0), np.roll(distance, -start)
+    count = len(inner)
+    angles = np.unwrap(np.arctan2(inner[:, 1], inner[:, 0]))
+    first = np.flatnonzero(np.diff(angles, prepend=-np.inf) > 1e-12)
+    last = np.append(first[1:], count) - 1
+    descending = distance[last] < distance[first]
+    keys = np.where(descending, first - 0.5, last + 0.5)
+    keys = np.minimum(keys, np.roll(np.where(descending, first - 0.5, np.inf), 1))
+    rim = radius * np.column_stack((np.cos(angles[first]), np.sin(angles[first])))
+    size = len(rim)
+
+    # Fusion des arrivées sur le contour (clé i) et sur la jante
+    events = np.argsort(np.concatenate((np.arange(1, count + 1), keys)), kind='stable')
+    is_inner = events < count
+    inner_index = np.cumsum(is_inner)
+    current = np.cumsum(~is_inner) - 1
+    cap = np.where(is_inner[:, None],
+                   np.stack(((inner_index - 1) % count, inner_index % count,
+                             count + current % size), axis=1),
+                   np.stack((count + current % size, count + (current - 1) % size,
+                             inner_index % count), axis=1))
+
+    zeros = np.zeros(len(z))
+    inner_sections = sweep_sections(inner, z, zeros)
+    outer_sections = sweep_sections(rim, z, zeros)
+    bottom = np.concatenate((inner_sections[0], outer_sections[0]))
+    top = np.concatenate((inner_sections[-1], outer_sections[-1]))
+    return np.concatenate((
+        bottom[cap],
+        top[cap][:, ::-1],
+        side_faces(outer_sections),
+        side_faces(inner_sections)[:, ::-1],
+    ))
+
+
+def slab_faces(profile: np.ndarray, floor: float, width: float,
+               start: bool = True, end: bool = True) -> np.ndarray:
+    """
+    Facettes (F, 3, 3) du prisme sous un profil ouvert (N, 2) d'abscisses croissantes
+
+    Chaque arête du profil donne un quadrilatère jusqu'au plancher y = floor
+    sur les faces z = 0 et z = width, une bande de la face supérieure et une
+    de la face inférieure; les parois x = début et x = fin ne sont ajoutées
+    que sur demande, afin d'assembler un long prisme par portions contiguës.
+    Normales sortantes.
+    """
+    profile = np.asarray(profile, dtype=float)
+    count = len(profile)
+    top = np.column_stack((profile, np.zeros(count)))
+    bottom = top.copy()
+    bottom[:, 1] = floor
+    lift = np.array([0.0, 0.0, width])
+    p, p_next = top[:-1], top[1:]
+    q, q_next = bottom[:-1], bottom[1:]
+
+    def quads(a, b, c, d):
+        # Quadrilatère a, b, c, d parcouru dans le sens direct de sa normale
+        return np.concatenate((np.stack((a, b, c), axis=1), np.stack((a, c, d), axis=1)))
+
+    faces = [
+        quads(q, p, p_next, q_next),
+        quads(q + lift, q_next + lift, p_next + lift, p + lift),
+        quads(p, p + lift, p_next + lift, p_next),
+        quads(q, q_next, q_next + lift, q + lift),
+    ]
+    if start:
+        faces.append(quads(bottom[:1], bottom[:1] + lift, top[:1] + lift, top[:1]))
+    if end:
+        faces.append(quads(bottom[-1:], top[-1:], top[-1:] + lift, bottom[-1:] + lift))
+    return np.concatenate(faces)
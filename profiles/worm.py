@@ -0,0 +1,242 @@
+"""
+Géométrie des vis sans fin et des roues globiques
+
+La vis a un profil axial à flancs droits (vis ZA) : dans le demi-plan axial
+d'azimut ψ, le rayon du filet est une fonction périodique R(x - ψ·L/2π) de
+la position axiale (pas axial p = π·m, pas de l'hélice L = filets·p). La
+section droite est donc une courbe fixe tournée de 2π·z/L le long de l'axe :
+la vis est une extrusion vrillée de cette section.
+
+La roue est taillée par la vis utilisée comme fraise-mère (saillie 1,25·m,
+comme la crémaillère génératrice ISO 53). Dans chaque tranche parallèle au
+plan médian, un point de la roue est enlevé s'il est dans le filet pour
+l'une des positions échantillonnées de la vis : l'enveloppe est évaluée en
+une passe vectorisée sur (tranche, rayon, angle, position).
+"""
+import math
+from typing import Optional, Tuple
+import numpy as np
+
+from profiles.sampling import MAX_SEGMENTS, arc_angles
+
+# Saillie de la vis génératrice (en modules), égale au creux de la roue
+HOB_ADDENDUM = 1.25
+
+# Raffinements (fausse position) des bords de dent de la roue
+EDGE_ITERATIONS = 6
+
+# Bissections du rayon de pointe des dents tronquées aux bords de la roue
+POINT_ITERATIONS = 24
+
+
+def thread_radius(u, pitch: float, half_thickness: float, pitch_radius: float,
+                  pressure_angle: float, addendum: float, dedendum: float) -> np.ndarray:
+    """
+    Rayon du filet à la position axiale u (profil axial trapézoïdal)
+
+    Le filet est centré sur u = 0, de demi-épaisseur half_thickness au
+    rayon primitif, et se répète avec la période pitch.
+    """
+    u = np.mod(np.asarray(u, dtype=float) + pitch / 2, pitch) - pitch / 2
+    radius = pitch_radius + (half_thickness - np.abs(u)) / math.tan(math.radians(pressure_angle))
+    return np.clip(radius, pitch_radius - dedendum, pitch_radius + addendum)
+
+
+def worm_section(module: float, leads: int, worm_diameter: float,
+                 pressure_angle: float = 20.0, backlash: float = 0.0,
+                 num_points: int = 16, tolerance: Optional[float] = None) -> np.ndarray:
+    """
+    Section droite fermée d'une vis sans fin (tableau (N, 2))
+
+    Une période du profil axial (creux, flanc, sommet, flanc, creux) est
+    échantillonnée puis répétée pour chaque filet; l'angle polaire vaut
+    -2π·u/L. Parcours trigonométrique, sans point dupliqué.
+
+    Args:
+        tolerance: Flèche maximale (mm); si fournie, le nombre de points de
+            chaque segment suit son étendue angulaire et num_points est ignoré
+    """
+    pitch = math.pi * module
+    lead = leads * pitch
+    r = worm_diameter / 2
+    ra, rf = r + module, r - 1.25 * module
+    tan_a = math.tan(math.radians(pressure_angle))
+    half = pitch / 4 - backlash / 2
+    tip = max(half - module * tan_a, 0.0)
+    root = min(half + 1.25 * module * tan_a, pitch / 2)
+    to_angle = 2 * math.pi / lead
+
+    def count(radius, start, end, default):
+        if tolerance is None:
+            return default
+        return len(arc_angles(radius, start * to_angle, end * to_angle, tolerance)) - 1
+
+    segments = [
+        (-pitch / 2, -root, count(rf, -pitch / 2, -root, max(2, num_points // 4))),
+        (-root, -tip, count(ra, -root, -tip, num_points)),
+        (-tip, tip, count(ra, -tip, tip, max(2, num_points // 2))),
+        (tip, root, count(ra, tip, root, num_points)),
+        (root, pitch / 2, count(rf, root, pitch / 2, max(2, num_points // 4))),
+    ]
+    u = np.concatenate([np.linspace(start, end, steps + 1)[:-1]
+                        for start, end, steps in segments if end - start > 1e-12])
+    u = (u[None, :] + pitch * np.arange(leads)[:, None]).ravel()[::-1]
+    radius = thread_radius(u, pitch, half, r, pressure_angle, module, 1.25 * module)
+    theta = -u * to_angle
+    return np.column_stack((radius * np.cos(theta), radius * np.sin(theta)))
+
+
+def wheel_tooth_profiles(module: float, wheel_teeth: int, leads: int,
+                         worm_diameter: float, heights,
+                         pressure_angle: float = 20.0, backlash: float = 0.0,
+                         num_points: int = 16,
+                         tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Profils polaires (rayon, angle) d'une dent de roue globique par tranche
+
+    La vis est sur l'axe x à l'entraxe a = r_vis + r_roue; la tranche de
+    cote h est parallèle au plan médian. Pour la position s de la vis, la
+    roue a tourné de s / r_roue (roulement du primitif sur la ligne
+    primitive de la vis); le point de la roue (ρ, θ) est enlevé si
+    R(u) >= ρ_vis pour une position s. Chaque position est repérée par
+    l'angle ω = θ + s / r_roue du point dans le repère fixe, échantillonné
+    là où la vis peut atteindre le cercle ρ. Pour chaque rayon, les bords
+    de la dent sont encadrés sur une grille d'angles puis affinés.
+
+    Le sommet de la roue est le tore de gorge (rayon r_vis - m autour de
+    l'axe de la vis), le fond est atteint par le sommet de la fraise. Vers
+    les bords d'une roue large, les flancs se rejoignent sous le tore : la
+    tête y est tronquée au rayon de pointe (encadré par bissection).
+
+    Args:
+        heights: Cotes des tranches (H,), |h| < r_vis - m
+
+    Returns:
+        Tableaux (H, n) de rayons et d'angles, même convention que
+        profiles.outline.tooth_polar_profile (du milieu de l'entredent
+        à gauche, dernier point exclu)
+    """
+    heights = np.asarray(heights, dtype=float)
+    pitch = math.pi * module
+    lead = leads * pitch
+    period = 2 * math.pi / wheel_teeth
+    r_worm = worm_diameter / 2
+    r_wheel = module * wheel_teeth / 2
+    center = r_worm + r_wheel
+    throat = r_worm - module
+    if throat <= 0 or np.any(np.abs(heights) >= throat):
+        raise ValueError("La largeur de la roue doit rester dans la gorge (r_vis - m)")
+    hob_tip = r_worm + HOB_ADDENDUM * module
+    half = pitch / 4 + backlash / 2
+
+    h = heights[:, None]
+    bottom = center - np.sqrt(hob_tip**2 - h**2)
+    tip = center - np.sqrt(throat**2 - h**2)
+
+    # Niveaux de rayon sur les flancs
+    if tolerance is None:
+        levels = num_points
+        positions = 8 * num_points + 1
+    else:
+        if tolerance <= 0:
+            raise ValueError(f"La tolérance doit être > 0, got {tolerance}")
+        curvature = r_wheel * math.sin(math.radians(pressure_angle))
+        levels = math.ceil(float(np.max(tip - bottom)) / math.sqrt(8 * tolerance * curvature)) + 1
+        positions = None
+    levels = int(min(max(levels, 2), MAX_SEGMENTS))
+    fixed_positions = positions
+
+    def build(rho):
+        # Enveloppe de la fraise aux rayons rho (H, L) : > 0 si le point est enlevé
+        omega_max = np.arccos(np.clip(bottom / rho, -1.0, 1.0))
+        count = fixed_positions
+        if count is None:
+            step = math.sqrt(8 * tolerance * module) / r_wheel
+            count = 2 * math.ceil(float(omega_max.max()) / step) + 1
+        count = int(min(count, MAX_SEGMENTS)) | 1
+        # Positions de la vis : ω tel que le sommet de la fraise atteigne ρ
+        omega = omega_max[:, :, None, None] * np.linspace(-1.0, 1.0, count)
+        rho4 = rho[:, :, None, None]
+        h4 = h[:, :, None, None]
+        distance = center - rho4 * np.cos(omega)
+        worm_radius = np.hypot(distance, h4)
+        psi = np.arctan2(-h4, distance)
+        base = (rho4 * np.sin(omega) - r_wheel * omega - psi * lead / (2 * math.pi)
+                + pitch / 2)
+
+        def envelope(theta):
+            radius = thread_radius(base + r_wheel * theta, pitch, half, r_worm,
+                                   pressure_angle, hob_tip - r_worm, 1.25 * module)
+            return (radius - worm_radius).max(axis=-1)
+        return envelope
+
+    def levels_between(tip):
+        rho = bottom + (tip - bottom) * np.linspace(0.0, 1.0, levels)
+        rho[:, 0] += 1e-9 * module
+        return rho
+
+    samples = 4 * num_points if tolerance is None else \
+        max(32, math.ceil(r_wheel * period / math.sqrt(8 * tolerance * module)))
+    grid = -period / 2 + period * np.arange(samples) / samples
+    rho = levels_between(tip)
+    envelope = build(rho)
+    values = envelope(grid[:, None])
+    material = values < 0
+
+    # Dents pointues sous le tore de gorge (tranches éloignées du plan
+    # médian) : la tête est tronquée au rayon où les flancs se rejoignent
+    empty = ~material.any(axis=-1)
+    if np.any(empty):
+        if np.any(empty[:, 0]):
+            raise ValueError("Profil de roue non résolu : entredents fermés au pied")
+        pointed = empty.any(axis=-1)
+        first_empty = np.where(pointed, empty.argmax(axis=-1), levels - 1)
+        low = np.take_along_axis(rho, (first_empty - 1)[:, None], axis=-1)
+        high = np.take_along_axis(rho, first_empty[:, None], axis=-1)
+        for _ in range(POINT_ITERATIONS):
+            middle = (low + high) / 2
+            solid = (build(middle)(grid[:, None]) < 0).any(axis=-1)
+            low, high = np.where(solid, middle, low), np.where(solid, high, middle)
+        tip = np.where(pointed[:, None], low, tip)
+        rho = levels_between(tip)
+        envelope = build(rho)
+        values = envelope(grid[:, None])
+        material = values < 0
+
+    following = np.roll(material, -1, axis=-1)
+    entering = following & ~material
+    leaving = material & ~following
+    if np.any(entering.sum(axis=-1) != 1) or np.any(leaving.sum(axis=-1) != 1):
+        raise ValueError("Profil de roue non résolu : plusieurs dents par période")
+
+    # Bords gauche (entrée dans la dent) et droit, affinés par fausse position
+    edges = []
+    for mask in (entering, leaving):
+        index = mask.argmax(axis=-1)
+        low = grid[index]
+        high = low + period / samples
+        g_low = np.take_along_axis(values, index[..., None], axis=-1)[..., 0]
+        g_high = np.take_along_axis(values, ((index + 1) % samples)[..., None], axis=-1)[..., 0]
+        for _ in range(EDGE_ITERATIONS):
+            middle = low - g_low * (high - low) / (g_high - g_low)
+            g_middle = envelope(middle[..., None, None])[..., 0]
+            same = np.sign(g_middle) == np.sign(g_low)
+            low, g_low = np.where(same, middle, low), np.where(same, g_middle, g_low)
+            high, g_high = np.where(same, high, middle), np.where(same, g_high, g_middle)
+        edges.append(middle)
+    left, right = edges
+    right = np.where(right < left, right + period, right)
+    shift = np.round((left + right) / 2 / period) * period
+    left, right = left - shift, right - shift
+
+    # Milieu d'entredent au fond, flanc gauche, arc de tête, flanc droit
+    width = float(np.max(right[:, -1] - left[:, -1]))
+    tip_points = max(2, num_points // 2) if tolerance is None else \
+        len(arc_angles(float(tip.max()), 0.0, width, tolerance))
+    fraction = np.linspace(0.0, 1.0, tip_points)[1:-1]
+    tip_theta = left[:, -1:] + (right[:, -1:] - left[:, -1:]) * fraction
+    radius = np.concatenate((bottom, rho, np.broadcast_to(tip, tip_theta.shape),
+                             rho[:, ::-1]), axis=1)
+    theta = np.concatenate(((left[:, :1] + right[:, :1] - period) / 2, left,
+                            tip_theta, right[:, ::-1]), axis=1)
+    return radius, theta
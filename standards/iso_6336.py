@@ -0,0 +1,139 @@
+"""
+Norme ISO 6336:2019 - Calcul de la capacité de charge des engrenages cylindriques
+
+Facteurs de la méthode B/C (simplifiés) pour la contrainte de pied de dent
+(ISO 6336-3) et la pression de Hertz (ISO 6336-2). Toutes les fonctions
+acceptent des scalaires ou des tableaux NumPy (diffusion).
+"""
+import math
+import numpy as np
+
+class ISO6336:
+    """Implémentation de la norme ISO 6336 (méthodes simplifiées)"""
+
+    # Matériaux : module d'Young (MPa), coefficient de Poisson,
+    # limites d'endurance en pression (σHlim) et en flexion (σFlim) en MPa,
+    # masse volumique (kg/m³)
+    MATERIALS = {
+        'steel': {'E': 206000.0, 'poisson': 0.3, 'sigma_h_lim': 1500.0, 'sigma_f_lim': 460.0,
+                  'density': 7850.0},
+        'cast_iron': {'E': 173000.0, 'poisson': 0.3, 'sigma_h_lim': 600.0, 'sigma_f_lim': 230.0,
+                      'density': 7200.0},
+        'aluminum': {'E': 70000.0, 'poisson': 0.33, 'sigma_h_lim': 300.0, 'sigma_f_lim': 110.0,
+                     'density': 2700.0},
+        'bronze': {'E': 110000.0, 'poisson': 0.34, 'sigma_h_lim': 350.0, 'sigma_f_lim': 120.0,
+                   'density': 8800.0},
+        'plastic': {'E': 2800.0, 'poisson': 0.35, 'sigma_h_lim': 40.0, 'sigma_f_lim': 30.0,
+                    'density': 1400.0},
+    }
+
+    # Facteur de correction de contrainte de l'éprouvette de référence
+    Y_ST = 2.0
+
+    # Courbes de Wöhler (ISO 6336-6, aciers) : cycles de référence et pentes
+    BENDING_REFERENCE_CYCLES = 3e6
+    CONTACT_REFERENCE_CYCLES = 5e7
+    BENDING_SN_EXPONENT = 8.74
+    CONTACT_SN_EXPONENT = 13.22
+
+    # Coefficient K1 du facteur dynamique par classe de qualité ISO 1328
+    K1_SPUR = {3: 2.1, 4: 3.9, 5: 7.5, 6: 14.9, 7: 26.8, 8: 39.1,
+               9: 52.8, 10: 76.6, 11: 102.6, 12: 146.3}
+    K1_HELICAL = {3: 1.9, 4: 3.5, 5: 6.7, 6: 13.3, 7: 23.9, 8: 34.8,
+                  9: 47.0, 10: 68.2, 11: 91.4, 12: 130.3}
+    K2_SPUR = 0.0193
+    K2_HELICAL = 0.0087
+
+    @classmethod
+    def material(cls, name: str) -> dict:
+        """Propriétés d'un matériau (acier par défaut si inconnu)"""
+        return cls.MATERIALS.get((name or 'steel').lower(), cls.MATERIALS['steel'])
+
+    @staticmethod
+    def zone_factor(transverse_pressure_angle, base_helix_angle,
+                    working_pressure_angle=None):
+        """Facteur de zone Z_H (ISO 6336-2 Éq. 10)"""
+        alpha_t = np.radians(transverse_pressure_angle)
+        alpha_wt = alpha_t if working_pressure_angle is None else \
+            np.radians(working_pressure_angle)
+        beta_b = np.radians(base_helix_angle)
+        return np.sqrt(2 * np.cos(beta_b) * np.cos(alpha_wt) /
+                       (np.cos(alpha_t)**2 * np.sin(alpha_wt)))
+
+    @staticmethod
+    def elasticity_factor(e1, nu1, e2, nu2):
+        """Facteur d'élasticité Z_E en √MPa (ISO 6336-2 Éq. 21)"""
+        return np.sqrt(1 / (math.pi * ((1 - nu1**2) / e1 + (1 - nu2**2) / e2)))
+
+    @staticmethod
+    def contact_ratio_factor(eps_alpha, eps_beta):
+        """Facteur de conduite Z_ε (ISO 6336-2 Éq. 27/28)"""
+        eps_alpha = np.asarray(eps_alpha, dtype=float)
+        eps_beta = np.minimum(np.asarray(eps_beta, dtype=float), 1.0)
+        return np.sqrt((4 - eps_alpha) / 3 * (1 - eps_beta) + eps_beta / eps_alpha)
+
+    @staticmethod
+    def helix_factor_contact(helix_angle):
+        """Facteur d'inclinaison Z_β (ISO 6336-2 Éq. 29)"""
+        return np.sqrt(np.cos(np.radians(helix_angle)))
+
+    @staticmethod
+    def form_stress_factor(virtual_teeth, profile_shift=0.0):
+        """
+        Facteur combiné de forme et de concentration Y_FS = Y_F·Y_S
+
+        Approximation pour le profil de référence ISO 53 (α = 20°) ;
+        virtual_teeth = inf donne la valeur de la crémaillère.
+        """
+        zn = np.asarray(virtual_teeth, dtype=float)
+        x = np.asarray(profile_shift, dtype=float)
+        with np.errstate(divide='ignore'):
+            inv_zn = np.where(np.isinf(zn), 0.0, 1.0 / zn)
+        return 3.47 + 13.17 * inv_zn - 27.9 * x * inv_zn + 0.092 * x**2
+
+    @staticmethod
+    def bending_contact_ratio_factor(eps_alpha, base_helix_angle):
+        """Facteur de conduite Y_ε (ISO 6336-3 Éq. 11)"""
+        cos_beta_b = np.cos(np.radians(base_helix_angle))
+        eps_alpha_n = np.asarray(eps_alpha, dtype=float) / cos_beta_b**2
+        return 0.25 + 0.75 / eps_alpha_n
+
+    @staticmethod
+    def helix_factor_bending(eps_beta, helix_angle):
+        """Facteur d'inclinaison Y_β (ISO 6336-3 Éq. 12)"""
+        eps_beta = np.minimum(np.asarray(eps_beta, dtype=float), 1.0)
+        beta = np.minimum(np.abs(np.asarray(helix_angle, dtype=float)), 30.0)
+        return 1 - eps_beta * beta / 120
+
+    @classmethod
+    def dynamic_factor(cls, pinion_teeth, velocity, gear_ratio, unit_load,
+                       application_factor=1.0, helical=False, accuracy_grade=7):
+        """
+        Facteur dynamique K_v (ISO 6336-1 méthode B, domaine sous-critique)
+
+        Args:
+            velocity: vitesse tangentielle (m/s)
+            gear_ratio: rapport u (inf pour une crémaillère)
+            unit_load: Ft / b (N/mm)
+        """
+        table = cls.K1_HELICAL if helical else cls.K1_SPUR
+        if accuracy_grade not in table:
+            raise ValueError(f"Classe de qualité doit être entre 3 et 12, got {accuracy_grade}")
+        k1 = table[accuracy_grade]
+        k2 = cls.K2_HELICAL if helical else cls.K2_SPUR
+        u = np.abs(np.asarray(gear_ratio, dtype=float))
+        u_term = np.where(np.isinf(u), 1.0, np.sqrt(u**2 / (1 + u**2)))
+        load = np.maximum(application_factor * np.asarray(unit_load, dtype=float), 100.0)
+        return 1 + (k1 / load + k2) * pinion_teeth * np.asarray(velocity) / 100 * u_term
+
+    @classmethod
+    def cycles_to_failure(cls, stress, limit, reference_cycles, exponent):
+        """
+        Nombre de cycles admissible sur la droite de Wöhler
+
+        inf si la contrainte ne dépasse pas la limite d'endurance.
+        """
+        stress = np.asarray(stress, dtype=float)
+        with np.errstate(divide='ignore'):
+            cycles = reference_cycles * (limit / stress) ** exponent
+        return np.where(stress > limit, cycles, np.inf)
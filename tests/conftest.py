@@ -0,0 +1,23 @@
+"""
+Outils partagés des tests de solides en facettes (F, 3, 3)
+"""
+import numpy as np
+
+
+def directed_edges(faces):
+    """Arêtes orientées indexées sur les sommets uniques"""
+    _, inverse = np.unique(faces.reshape(-1, 3).round(9), axis=0, return_inverse=True)
+    index = inverse.reshape(-1, 3)
+    return np.concatenate([index[:, [0, 1]], index[:, [1, 2]], index[:, [2, 0]]])
+
+
+def assert_closed_solid(faces):
+    """Solide fermé et orienté : chaque arête orientée apparaît une fois, son opposée aussi"""
+    edges = directed_edges(faces)
+    assert len(np.unique(edges, axis=0)) == len(edges)
+    assert {tuple(e) for e in edges} == {tuple(e) for e in edges[:, ::-1]}
+
+
+def solid_volume(faces):
+    """Volume signé (positif pour des normales sortantes)"""
+    return np.einsum('ij,ij->i', faces[:, 0], np.cross(faces[:, 1], faces[:, 2])).sum() / 6
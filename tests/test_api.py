@@ -40,6 +40,7 @@ def test_api_endpoints(tmp_path):
     data = r.get_json()
     assert data.get('success') is True
     assert 'analysis' in data
+    assert isinstance(data['analysis']['performances']['bending_stress'], float)
 
     # Mesh two gears
     gear1 = {'type': 'spur', 'params': gear_params}
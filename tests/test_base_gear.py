@@ -53,6 +53,43 @@ class TestGearParams(unittest.TestCase):
         )
         with self.assertRaises(ValueError):
             params.validate()
+    
+    def test_params_frozen(self):
+        """Les paramètres ne sont pas modifiables"""
+        params = GearParams(name="Frozen", module=2.0, teeth=20)
+        with self.assertRaises(AttributeError):
+            params.teeth = 30
+        self.assertFalse(hasattr(params, '__dict__'))
+    
+    def test_params_canonical_hash(self):
+        """Paramètres égaux -> même hachage (20 == 20.0, -0.0 == 0.0)"""
+        a = GearParams(name="G", module=2, teeth=20.0, helix_angle=-0.0)
+        b = GearParams(name="G", module=2.0, teeth=20, helix_angle=0.0)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertIsInstance(a.teeth, int)
+        self.assertIsInstance(a.module, float)
+        self.assertEqual(len({a, b}), 1)
+    
+    def test_derive(self):
+        """derive() retourne une copie modifiée"""
+        params = GearParams(name="Base", module=2.0, teeth=20)
+        derived = params.derive(teeth=40, face_width=15)
+        self.assertEqual(params.teeth, 20)
+        self.assertEqual(derived.teeth, 40)
+        self.assertEqual(derived.face_width, 15.0)
+        with self.assertRaises(ValueError):
+            params.derive(diameter=10)
+    
+    def test_shared_params_not_mutated(self):
+        """Le déport automatique ne modifie pas les paramètres partagés"""
+        from concurrent.futures import ThreadPoolExecutor
+        params = GearParams(name="Shared", module=2.0, teeth=14)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            gears = list(pool.map(lambda _: SpurGear(params), range(16)))
+        self.assertEqual(params.profile_shift, 0.0)
+        for gear in gears:
+            self.assertGreater(gear.params.profile_shift, 0)
 
 
 class TestSpurGear(unittest.TestCase):
@@ -3,8 +3,20 @@ Tests spécifiques pour BevelGear (Test 13)
 """
 import unittest
 import math
+import numpy as np
 from core.base_gear import GearParams
+from core.rule_engine import RuleEngine
+from export.stl import STLExporter
 from gears.bevel import BevelGear
+from tests.conftest import assert_closed_solid, solid_volume
+
+
+def bevel_pair(z1, z2, face_width=12.0):
+    """Paire conique à axes orthogonaux"""
+    return (BevelGear(GearParams(name="Pinion", module=2.0, teeth=z1, mate_teeth=z2,
+                                 face_width=face_width)),
+            BevelGear(GearParams(name="Wheel", module=2.0, teeth=z2, mate_teeth=z1,
+                                 face_width=face_width)))
 
 
 class TestBevelGear(unittest.TestCase):
@@ -268,6 +280,67 @@ class TestBevelGear(unittest.TestCase):
         self.assertIsInstance(gear, BevelGear)
         self.assertEqual(gear.params.name, "CLIBevelGear")
 
+    
+    def test_bevel_gear_virtual_contact_ratio(self):
+        """Test le rapport de conduite des engrenages droits virtuels"""
+        pinion, wheel = bevel_pair(20, 40)
+        self.assertAlmostEqual(pinion.virtual_teeth, 20 * math.sqrt(5) / 2)
+        
+        # Paire droite virtuelle : z_v = z / cos δ, même module
+        alpha = math.radians(20.0)
+        r1, r2 = pinion.virtual_teeth, wheel.virtual_teeth
+        path = (math.sqrt((r1 + 2) ** 2 - (r1 * math.cos(alpha)) ** 2)
+                + math.sqrt((r2 + 2) ** 2 - (r2 * math.cos(alpha)) ** 2)
+                - (r1 + r2) * math.sin(alpha))
+        expected = path / (2 * math.pi * math.cos(alpha))
+        _, contact_ratio = pinion.mesh_with(wheel)
+        self.assertAlmostEqual(contact_ratio, expected)
+        self.assertAlmostEqual(wheel.mesh_with(pinion)[1], expected)
+        
+        # Le moteur de règles utilise la même paire virtuelle
+        from core.rule_engine import _contact_ratio
+        columns = [RuleEngine.params_columns(['bevel'], [g.params]) for g in (pinion, wheel)]
+        context = {'first': RuleEngine.context(columns[0]),
+                   'second': RuleEngine.context(columns[1])}
+        self.assertAlmostEqual(float(_contact_ratio(context)[0]), expected)
+        
+        # Plus de dents, conduite plus longue
+        self.assertGreater(bevel_pair(30, 60)[0].mesh_with(bevel_pair(30, 60)[1])[1],
+                           contact_ratio)
+    
+    def test_bevel_gear_solid(self):
+        """Test le solide conique (Tredgold)"""
+        gear, _ = bevel_pair(20, 30, face_width=10.0)
+        faces = gear.get_solid(8)
+        
+        # Solide fermé, normales sortantes
+        assert_closed_solid(faces)
+        self.assertGreater(solid_volume(faces), 0)
+        
+        # Grand bout : tête au diamètre extérieur; petit bout : homothétie
+        points = faces.reshape(-1, 3)
+        radius = np.hypot(points[:, 0], points[:, 1])
+        self.assertAlmostEqual(radius.max(), gear.outside_diameter / 2)
+        scale = 1 - 10.0 / gear.cone_distance
+        self.assertAlmostEqual(radius[radius > 1e-9].min(),
+                               scale * gear.root_diameter / 2)
+        
+        # Chaque arête latérale passe par le sommet du cône primitif
+        apex = np.array([0.0, 0.0, gear.pitch_diameter / 2 / math.tan(
+            math.radians(gear.pitch_angle))])
+        count = len(faces) // 4
+        side = faces[2 * count:].reshape(-1, 2, 3, 3)[:, 0]
+        heel, toe = side[:, 0], side[:, 2]
+        cross = np.cross(heel - apex, toe - apex)
+        self.assertLess(np.abs(cross).max(), 1e-9)
+        
+        # L'export STL utilise le solide
+        exported = STLExporter.gear_to_faces(gear, resolution=32)
+        self.assertAlmostEqual(np.hypot(exported[..., 0], exported[..., 1]).max(),
+                               gear.outside_diameter / 2)
+        with self.assertRaises(ValueError):
+            bevel_pair(20, 30, face_width=100.0)[0].get_solid()
+
 
 if __name__ == '__main__':
     unittest.main()
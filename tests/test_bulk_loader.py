@@ -0,0 +1,183 @@
+"""
+Tests du chargement en flux de catalogues (JSONL / CSV)
+"""
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from core.bulk_loader import BulkLoader
+from core.gear_factory import GearFactory
+from core.gear_kernel import GearKernel
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+from gears.worm import WormGear
+
+
+@pytest.fixture(autouse=True)
+def registered_types():
+    GearFactory.register_gear('spur', SpurGear)
+    GearFactory.register_gear('helical', HelicalGear)
+    GearFactory.register_gear('worm', WormGear)
+
+
+CSV_TEXT = (
+    "type,name,module,teeth,pressure_angle,helix_angle,sku\n"
+    "spur,a,2,20,20,,X1\n"
+    "helical,b,2,25.0,20,15,X2\n"
+    "spur,c,-1,20,,,X3\n"
+    "spur,d,2,20.5,,,X4\n"
+    "spur,e,abc,20,,,X5\n"
+    "foo,f,1,10,,,X6\n"
+)
+
+JSONL_TEXT = "\n".join([
+    json.dumps({'type': 'spur', 'name': 'a', 'module': 2, 'teeth': 20}),
+    json.dumps({'type': 'worm', 'params': {'name': 'w', 'module': 2, 'teeth': 1, 'leads': 2}}),
+    '',
+    'pas du json',
+    json.dumps([1, 2]),
+    json.dumps({'name': 'sans_dents', 'module': 2}),
+    json.dumps({'module': 1.5, 'teeth': 30, 'pressure_angle': 40}),
+]) + "\n"
+
+
+def test_csv_gears_and_errors():
+    chunks = list(BulkLoader.iter_gears(io.StringIO(CSV_TEXT), 'csv', chunk_size=4))
+    assert len(chunks) == 2
+
+    gears = [g for chunk in chunks for g in chunk['gears']]
+    assert [g.params.name for g in gears] == ['a', 'b']
+    assert isinstance(gears[1], HelicalGear)
+    assert gears[1].params.helix_angle == 15.0
+    assert gears[0].params.teeth == 20 and isinstance(gears[0].params.teeth, int)
+    assert chunks[0]['rows'].tolist() == [2, 3]
+
+    errors = {e['row']: e['error'] for chunk in chunks for e in chunk['errors']}
+    assert sorted(errors) == [4, 5, 6, 7]
+    assert 'Module' in errors[4]
+    assert 'teeth doit être un entier' in errors[5]
+    assert 'module doit être un nombre' in errors[6]
+    assert 'foo' in errors[7]
+
+
+def test_jsonl_gears_and_errors():
+    chunks = list(BulkLoader.iter_gears(io.StringIO(JSONL_TEXT), 'jsonl'))
+    assert len(chunks) == 1
+    chunk = chunks[0]
+    assert [g.params.name for g in chunk['gears']] == ['a', 'w']
+    assert chunk['gears'][1].params.leads == 2
+
+    errors = {e['row']: e for e in chunk['errors']}
+    assert sorted(errors) == [4, 5, 6, 7]
+    assert errors[4]['record'] is None and 'JSON invalide' in errors[4]['error']
+    assert 'Objet JSON attendu' in errors[5]['error']
+    assert "'teeth' requis" in errors[6]['error']
+    assert errors[7]['record']['pressure_angle'] == 40
+
+
+def test_columns_match_gear_objects():
+    gear_chunks = list(BulkLoader.iter_gears(io.StringIO(CSV_TEXT), 'csv', chunk_size=3))
+    column_chunks = list(BulkLoader.iter_columns(io.StringIO(CSV_TEXT), 'csv', chunk_size=3))
+    assert len(gear_chunks) == len(column_chunks)
+
+    for gear_chunk, column_chunk in zip(gear_chunks, column_chunks):
+        assert gear_chunk['rows'].tolist() == column_chunk['rows'].tolist()
+        assert [e['row'] for e in gear_chunk['errors']] == \
+            [e['row'] for e in column_chunk['errors']]
+        for i, gear in enumerate(gear_chunk['gears']):
+            info = GearKernel.row_info(column_chunk['columns'], i, column_chunk['names'][i])
+            assert info == pytest.approx(gear.get_info())
+
+
+@pytest.mark.parametrize('text, format', [(CSV_TEXT, 'csv'), (JSONL_TEXT, 'jsonl')])
+def test_column_errors_match_gear_errors(text, format):
+    def errors(chunks):
+        # Types admis propres à chaque voie (noyau ou registre)
+        return [(e['row'], e['error'].split('. Types disponibles')[0])
+                for chunk in chunks for e in chunk['errors']]
+
+    assert errors(BulkLoader.iter_columns(io.StringIO(text), format)) == \
+        errors(BulkLoader.iter_gears(io.StringIO(text), format))
+
+
+def test_columns_throughput():
+    import time
+    lines = [json.dumps({'type': ('spur', 'helical')[i % 2], 'name': f'g{i}',
+                         'module': 1 + i % 4, 'teeth': 17 + i % 60,
+                         'helix_angle': 15.0 * (i % 2)}) for i in range(50_000)]
+    start = time.perf_counter()
+    rows = sum(len(chunk['rows'])
+               for chunk in BulkLoader.iter_columns(lines, 'jsonl', rules=True))
+    assert rows == 50_000
+    assert time.perf_counter() - start < 1.5
+
+
+def test_empty_chunk_has_empty_columns():
+    text = "type,name,module,teeth\nspur,x,0,20\n"
+    chunk = next(BulkLoader.iter_columns(io.StringIO(text), 'csv'))
+    assert chunk['names'] == []
+    assert chunk['columns']['pitch_diameter'].shape == (0,)
+    assert len(chunk['errors']) == 1
+
+
+def test_strict_rejects_unknown_columns():
+    chunk = next(BulkLoader.iter_gears(io.StringIO(CSV_TEXT), 'csv', strict=True))
+    assert chunk['gears'] == []
+    assert len(chunk['errors']) == 6
+    assert all("Paramètres inconnus: ['sku']" in e['error'] for e in chunk['errors'])
+
+
+def test_format_from_extension(tmp_path):
+    path = tmp_path / 'catalogue.csv'
+    path.write_text(CSV_TEXT)
+    names = [g.params.name for chunk in BulkLoader.iter_gears(path) for g in chunk['gears']]
+    assert names == ['a', 'b']
+
+    with pytest.raises(ValueError):
+        list(BulkLoader.records(tmp_path / 'catalogue.txt'))
+
+
+def test_streaming_memory_is_flat():
+    def lines(count):
+        for i in range(count):
+            yield json.dumps({'type': 'spur', 'name': f'g{i}', 'module': 1 + i % 4,
+                              'teeth': 17 + i % 60})
+
+    def peak(count):
+        tracemalloc.start()
+        rows = 0
+        for chunk in BulkLoader.iter_columns(lines(count), 'jsonl', chunk_size=500):
+            rows += len(chunk['rows'])
+        _, top = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert rows == count
+        return top
+
+    small, large = peak(2000), peak(20000)
+    assert large < 2 * small
+
+
+def test_cli_ingest(tmp_path):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    catalogue = tmp_path / 'catalogue.jsonl'
+    catalogue.write_text(JSONL_TEXT)
+    output = tmp_path / 'out.jsonl'
+    errors = tmp_path / 'errors.jsonl'
+
+    repo_root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, str(repo_root / 'main.py'), 'ingest', '--input', str(catalogue),
+         '--output', str(output), '--errors', str(errors)],
+        capture_output=True, text=True, cwd=repo_root
+    )
+    assert result.returncode == 0, result.stderr
+    assert 'Engrenages chargés: 2' in result.stdout
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r['name'] for r in rows] == ['a', 'w']
+    assert len(errors.read_text().splitlines()) == 4
@@ -0,0 +1,90 @@
+import struct
+import pytest
+import numpy as np
+from core.base_gear import GearParams
+from core.gear_factory import GearFactory
+from gears.cycloidal import CycloidalGear
+from gears.spur import SpurGear
+from export.stl import STLExporter
+from profiles.cycloidal import CycloidalProfile, cycloidal_outline
+
+
+class TestCycloidalGear:
+    def test_cycloidal_creation(self):
+        params = GearParams(name='Cyc1', module=1.0, teeth=40)
+        gear = CycloidalGear(params)
+        info = gear.get_info()
+        assert info['type'] == 'CycloidalGear'
+        assert info['gear_type'] == 'cycloidal'
+        assert info['rolling_circle_ratio'] == pytest.approx(0.5)
+        assert gear.rolling_radius == pytest.approx(10.0)
+
+    def test_invalid_rolling_ratio(self):
+        params = GearParams(name='Cyc2', module=1.0, teeth=40, rolling_circle_ratio=1.2)
+        with pytest.raises(ValueError):
+            CycloidalGear(params)
+
+    def test_outline_radii(self):
+        gear = CycloidalGear(GearParams(name='Cyc3', module=2.0, teeth=24))
+        outline = gear.get_outline()
+        assert outline.ndim == 2 and outline.shape[1] == 2
+        radii = np.hypot(outline[:, 0], outline[:, 1])
+        assert radii.max() == pytest.approx(gear.outside_diameter / 2)
+        assert radii.min() == pytest.approx(gear.root_diameter / 2)
+        theta = np.unwrap(np.arctan2(outline[:, 1], outline[:, 0]))
+        assert np.all(np.diff(theta) > -1e-12)
+
+    def test_outline_tolerance_and_cache(self):
+        coarse = cycloidal_outline(1.0, 30, tolerance=0.05)
+        fine = cycloidal_outline(1.0, 30, tolerance=0.001)
+        assert len(coarse) < len(fine)
+        assert cycloidal_outline(1.0, 30, tolerance=0.05) is coarse
+        assert not coarse.flags.writeable
+
+    def test_generate_points_epicycloid(self):
+        profile = CycloidalProfile(0.5)
+        points = profile.generate_points(10.0, num_points=50)
+        assert points.shape == (50, 2)
+        radii = np.hypot(points[:, 0], points[:, 1])
+        assert radii[0] == pytest.approx(10.0)
+        assert radii[-1] == pytest.approx(10.0)
+        # Sommet de l'arche à pitch_radius + 2 × rolling_radius
+        assert radii.max() == pytest.approx(20.0, rel=1e-2)
+
+    def test_mesh(self):
+        # Même cercle roulant (2.5 mm) pour les deux profils
+        wheel = CycloidalGear(GearParams(name='Wheel', module=1.0, teeth=60,
+                                         rolling_circle_ratio=1 / 12))
+        pinion = CycloidalGear(GearParams(name='Pinion', module=1.0, teeth=10))
+        center_distance, contact_ratio = wheel.mesh_with(pinion)
+        assert center_distance == pytest.approx(35.0)
+        assert contact_ratio > 1.0
+        assert pinion.mesh_with(wheel)[1] == pytest.approx(contact_ratio)
+
+    def test_mesh_mismatch_raises(self):
+        wheel = CycloidalGear(GearParams(name='Wheel', module=1.0, teeth=60))
+        pinion = CycloidalGear(GearParams(name='Pinion', module=1.0, teeth=20))
+        with pytest.raises(ValueError, match='conjugués'):
+            wheel.mesh_with(pinion)
+        other = CycloidalGear(GearParams(name='Other', module=2.0, teeth=30))
+        with pytest.raises(ValueError, match='modules'):
+            wheel.mesh_with(other)
+
+    def test_mesh_with_spur_raises(self):
+        gear = CycloidalGear(GearParams(name='Cyc4', module=1.0, teeth=30))
+        spur = SpurGear(GearParams(name='Spur', module=1.0, teeth=30))
+        with pytest.raises(ValueError):
+            gear.mesh_with(spur)
+
+    def test_factory_and_stl(self, tmp_path):
+        GearFactory.register_gear('cycloidal', CycloidalGear)
+        gear = GearFactory.from_dict({'type': 'cycloidal', 'name': 'Cyc5',
+                                      'module': 1.0, 'teeth': 20,
+                                      'rolling_circle_ratio': 0.4})
+        assert isinstance(gear, CycloidalGear)
+        out = tmp_path / 'cyc.stl'
+        STLExporter().export_gear(gear, str(out), resolution=32)
+        data = out.read_bytes()
+        count = struct.unpack('<I', data[80:84])[0]
+        assert count > 0
+        assert len(data) == 84 + 50 * count
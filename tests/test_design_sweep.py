@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+from core.base_gear import GearParams
+from core.design_sweep import DesignSweep
+from core.validation import GearValidator
+from gears.spur import SpurGear
+
+
+class TestDesignSweep:
+    def test_grid_size_and_defaults(self):
+        candidates = DesignSweep.grid(module=[1.0, 2.0], teeth=range(20, 30))
+        assert len(candidates['module']) == 20
+        assert np.all(candidates['pressure_angle'] == 20.0)
+        with pytest.raises(ValueError):
+            DesignSweep.grid(diameter=[10.0])
+
+    def test_random_bounds(self):
+        candidates = DesignSweep.random(1000, {'teeth': (12, 40), 'module': (1.0, 3.0)}, seed=0)
+        assert candidates['teeth'].min() >= 12 and candidates['teeth'].max() <= 40
+        assert np.all(candidates['teeth'] == np.round(candidates['teeth']))
+        assert candidates['module'].min() >= 1.0 and candidates['module'].max() <= 3.0
+
+    def test_checks_match_validator(self):
+        candidates = DesignSweep.grid(teeth=[10, 14, 17, 30], pressure_angle=[14.5, 20.0, 25.0])
+        columns = DesignSweep.evaluate(candidates)
+        for i in range(len(candidates['teeth'])):
+            gear = SpurGear(GearParams(name='g', module=2.0, teeth=int(candidates['teeth'][i]),
+                                       pressure_angle=float(candidates['pressure_angle'][i])))
+            assert columns['undercut'][i] == GearValidator.check_undercut(gear)
+            mate = SpurGear(GearParams(name='m', module=2.0, teeth=int(candidates['teeth'][i]),
+                                       pressure_angle=float(candidates['pressure_angle'][i])))
+            assert columns['interference'][i] == GearValidator.check_interference(gear, mate)[0]
+
+    def test_invalid_rows_rejected(self):
+        candidates = DesignSweep.grid(module=[-1.0, 2.0], helix_angle=[0.0, 50.0])
+        columns = DesignSweep.evaluate(candidates)
+        assert columns['valid'].tolist() == [False, False, True, False]
+
+    def test_pareto_front_bruteforce(self):
+        rng = np.random.default_rng(3)
+        for k in (2, 3):
+            points = rng.random((300, k))
+            front = DesignSweep.pareto_front(points)
+            expected = [i for i in range(len(points))
+                        if not any(np.all(points[j] <= points[i]) and np.any(points[j] < points[i])
+                                   for j in range(len(points)))]
+            assert front.tolist() == expected
+
+    def test_run_front(self):
+        candidates = DesignSweep.grid(module=[1.0, 2.0, 3.0], teeth=range(18, 60),
+                                      helix_angle=[0.0, 10.0, 20.0],
+                                      face_width=[10.0, 20.0, 30.0])
+        front = DesignSweep.run(candidates, {'volume': 'min', 'contact_ratio': 'max'},
+                                ratio=2.0, chunk_size=500)
+        assert len(front['index']) > 0
+        order = np.argsort(front['volume'])
+        # Sur un front à deux objectifs, le rapport de conduite croît avec le volume
+        assert np.all(np.diff(front['contact_ratio'][order]) > 0)
+        full = DesignSweep.run(candidates, {'volume': 'min', 'contact_ratio': 'max'}, ratio=2.0)
+        assert sorted(front['index'].tolist()) == sorted(full['index'].tolist())
@@ -140,6 +140,8 @@ class TestGearFactoryCreation(unittest.TestCase):
         
         self.assertEqual(gear.params.pressure_angle, 25.0)
         self.assertEqual(gear.params.face_width, 15.0)
+        # Les paramètres d'origine ne sont pas modifiés
+        self.assertEqual(params.pressure_angle, 20.0)
 
 
 class TestGearFactoryFromDict(unittest.TestCase):
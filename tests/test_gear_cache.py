@@ -0,0 +1,118 @@
+"""
+Tests du cache LRU de GearFactory
+"""
+import unittest
+from core.gear_factory import GearFactory
+from core.base_gear import GearParams
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+
+
+class TestGearFactoryCache(unittest.TestCase):
+    """Interning des engrenages et compteurs du cache"""
+
+    def setUp(self):
+        GearFactory.register_gear('spur', SpurGear)
+        GearFactory.register_gear('helical', HelicalGear)
+        GearFactory.enable_cache(2)
+        GearFactory.reset_cache_stats()
+
+    def tearDown(self):
+        GearFactory.disable_cache()
+        GearFactory.reset_cache_stats()
+
+    def test_disabled_by_default_builds_new_gears(self):
+        GearFactory.disable_cache()
+        params = GearParams(name='G', module=2.0, teeth=20)
+        first = GearFactory.create_gear('spur', params)
+        second = GearFactory.create_gear('spur', params)
+        self.assertIsNot(first, second)
+        self.assertFalse(GearFactory.cache_info()['enabled'])
+        self.assertEqual(GearFactory.cache_info()['misses'], 0)
+
+    def test_equal_params_share_instance(self):
+        first = GearFactory.create_gear('spur', GearParams(name='G', module=2.0, teeth=20))
+        second = GearFactory.from_dict({'type': 'SPUR', 'name': 'G', 'module': 2, 'teeth': 20.0})
+        self.assertIs(first, second)
+        stats = GearFactory.cache_info()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (1, 1, 1))
+
+    def test_kwargs_overrides_are_part_of_key(self):
+        params = GearParams(name='G', module=2.0, teeth=20)
+        plain = GearFactory.create_gear('spur', params)
+        wide = GearFactory.create_gear('spur', params, face_width=30.0)
+        self.assertIsNot(plain, wide)
+        self.assertEqual(wide.params.face_width, 30.0)
+
+    def test_info_is_memoized_and_copied(self):
+        gear = GearFactory.create_gear('spur', GearParams(name='G', module=2.0, teeth=20))
+        info = GearFactory.get_info(gear)
+        self.assertEqual(info, gear.get_info())
+        info['name'] = 'modifié'
+        self.assertEqual(GearFactory.get_info(gear)['name'], 'G')
+
+    def test_info_of_uncached_gear(self):
+        gear = SpurGear(GearParams(name='Libre', module=1.0, teeth=30))
+        self.assertEqual(GearFactory.get_info(gear), gear.get_info())
+
+    def test_lru_eviction(self):
+        a = GearFactory.create_gear('spur', GearParams(name='A', module=1.0, teeth=20))
+        GearFactory.create_gear('spur', GearParams(name='B', module=1.0, teeth=20))
+        # A redevient le plus récent : B est évincé
+        self.assertIs(GearFactory.create_gear('spur', GearParams(name='A', module=1.0, teeth=20)), a)
+        GearFactory.create_gear('spur', GearParams(name='C', module=1.0, teeth=20))
+        stats = GearFactory.cache_info()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['size'], 2)
+        self.assertIs(GearFactory.create_gear('spur', GearParams(name='A', module=1.0, teeth=20)), a)
+
+    def test_invalidate(self):
+        params = GearParams(name='G', module=2.0, teeth=20)
+        spur = GearFactory.create_gear('spur', params)
+        GearFactory.create_gear('helical', params.derive(helix_angle=15.0))
+
+        self.assertEqual(GearFactory.invalidate('spur', params.derive(teeth=21)), 0)
+        self.assertEqual(GearFactory.invalidate('spur', params), 1)
+        self.assertIsNot(GearFactory.create_gear('spur', params), spur)
+        self.assertEqual(GearFactory.invalidate('helical'), 1)
+        self.assertEqual(GearFactory.invalidate(), 1)
+        self.assertEqual(GearFactory.cache_info()['size'], 0)
+
+    def test_register_new_class_invalidates_type(self):
+        params = GearParams(name='G', module=2.0, teeth=20)
+        GearFactory.create_gear('spur', params)
+
+        class CustomSpur(SpurGear):
+            pass
+
+        try:
+            GearFactory.register_gear('spur', CustomSpur)
+            self.assertIsInstance(GearFactory.create_gear('spur', params), CustomSpur)
+        finally:
+            GearFactory.register_gear('spur', SpurGear)
+
+
+def test_api_cache_endpoints():
+    from interfaces.api import app
+
+    client = app.test_client()
+    GearFactory.enable_cache(16)
+    GearFactory.reset_cache_stats()
+    try:
+        payload = {'type': 'spur', 'params': {'name': 'cat', 'module': 2.0, 'teeth': 20}}
+        for _ in range(3):
+            assert client.post('/api/gear/create', json=payload).status_code == 200
+
+        stats = client.get('/api/cache/stats').get_json()
+        assert stats['enabled'] is True
+        assert (stats['hits'], stats['misses'], stats['size']) == (2, 1, 1)
+
+        r = client.post('/api/cache/invalidate', json={'params': payload['params']})
+        assert r.status_code == 400
+
+        r = client.post('/api/cache/invalidate', json=payload)
+        assert r.get_json() == {'success': True, 'removed': 1}
+        assert client.get('/api/cache/stats').get_json()['size'] == 0
+    finally:
+        GearFactory.disable_cache()
+        GearFactory.reset_cache_stats()
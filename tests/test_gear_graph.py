@@ -0,0 +1,96 @@
+import pytest
+from core.base_gear import GearParams
+from core.gear_graph import GearGraph
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+from gears.bevel import BevelGear
+from gears.worm import WormGear
+from gears.rack import RackGear
+from gears.internal import InternalGear
+from gears.cycloidal import CycloidalGear
+
+GEAR_CLASSES = {
+    'spur': SpurGear,
+    'helical': HelicalGear,
+    'bevel': BevelGear,
+    'worm': WormGear,
+    'rack': RackGear,
+    'internal': InternalGear,
+    'cycloidal': CycloidalGear,
+}
+
+
+def _assert_info_equal(got, expected):
+    assert list(got) == list(expected)
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert got[key] == pytest.approx(value), key
+        else:
+            assert got[key] == value, key
+
+
+class TestGearGraph:
+    @pytest.mark.parametrize('gear_type', sorted(GEAR_CLASSES))
+    def test_matches_get_info(self, gear_type):
+        params = GearParams(name='g', module=2.0, teeth=24, helix_angle=12.0,
+                            mate_teeth=36, leads=2)
+        graph = GearGraph(gear_type, params)
+        _assert_info_equal(graph.get_info(), GEAR_CLASSES[gear_type](params).get_info())
+
+        changed = params.derive(teeth=14, face_width=22.0)
+        graph.update(teeth=14, face_width=22.0)
+        _assert_info_equal(graph.get_info(), GEAR_CLASSES[gear_type](changed).get_info())
+
+    @pytest.mark.parametrize('gear_type', sorted(GEAR_CLASSES))
+    def test_shares_gear_formulas(self, gear_type):
+        # Mêmes fonctions scalaires (GearMath) que les classes : valeurs identiques
+        params = GearParams(name='g', module=1.75, teeth=13, helix_angle=21.5,
+                            pressure_angle=22.5, face_width=17.0, mate_teeth=29,
+                            shaft_angle=75.0, rolling_circle_ratio=0.35)
+        graph = GearGraph(gear_type, params)
+        assert graph.get_info() == GEAR_CLASSES[gear_type](params).get_info()
+
+    def test_lazy_evaluation(self):
+        graph = GearGraph('spur', GearParams(name='g', module=2.0, teeth=20))
+        assert graph.evaluations == 0
+        graph.get('outside_diameter')
+        # pitch_diameter, addendum puis outside_diameter
+        assert graph.evaluations == 3
+        graph.get('outside_diameter')
+        assert graph.evaluations == 3
+
+    def test_only_downstream_recomputed(self):
+        graph = GearGraph('helical', GearParams(name='h', module=2.0, teeth=20,
+                                                helix_angle=15.0))
+        graph.get_info()
+        graph.get('contact_ratio')
+        before = graph.evaluations
+        delta = graph.update(face_width=30.0)
+        assert graph.evaluations - before == 2
+        assert set(delta) == {'face_width', 'overlap_ratio', 'contact_ratio'}
+        assert delta['overlap_ratio'] == pytest.approx(
+            30.0 * 0.2679491924311227 / (3.141592653589793 * 2.0))
+
+    def test_unchanged_value_not_in_delta(self):
+        graph = GearGraph('spur', GearParams(name='g', module=2.0, teeth=20))
+        graph.get_info()
+        # Le déport automatique ne dépend que des petits nombres de dents
+        delta = graph.update(teeth=30)
+        assert 'profile_shift' not in delta
+        assert delta['pitch_diameter'] == pytest.approx(60.0)
+        assert graph.update(teeth=30) == {}
+
+    def test_failed_update_rolls_back(self):
+        graph = GearGraph('cycloidal', GearParams(name='c', module=1.0, teeth=40))
+        graph.get_info()
+        with pytest.raises(ValueError):
+            graph.update(rolling_circle_ratio=1.5)
+        assert graph.params.rolling_circle_ratio is None
+        assert graph.get('rolling_radius') == pytest.approx(10.0)
+        with pytest.raises(ValueError):
+            graph.update(module=-1.0)
+        assert graph.params.module == 1.0
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            GearGraph('hypoid', GearParams(name='x', module=1.0, teeth=10))
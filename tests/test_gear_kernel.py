@@ -0,0 +1,83 @@
+import math
+import pytest
+import numpy as np
+from core.base_gear import GearParams
+from core.gear_kernel import GearKernel, TYPE_CODES, type_codes
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+from gears.bevel import BevelGear
+from gears.worm import WormGear
+from gears.rack import RackGear
+from gears.internal import InternalGear
+from gears.cycloidal import CycloidalGear
+
+GEAR_CLASSES = {
+    'spur': SpurGear,
+    'helical': HelicalGear,
+    'bevel': BevelGear,
+    'worm': WormGear,
+    'rack': RackGear,
+    'internal': InternalGear,
+    'cycloidal': CycloidalGear,
+}
+
+CASES = [
+    ('spur', dict(module=2.0, teeth=20)),
+    ('spur', dict(module=2.0, teeth=12)),
+    ('helical', dict(module=2.0, teeth=25, helix_angle=15.0)),
+    ('helical', dict(module=1.5, teeth=30, helix_angle=0.0)),
+    ('bevel', dict(module=3.0, teeth=20, mate_teeth=40)),
+    ('bevel', dict(module=3.0, teeth=20, pitch_angle=30.0, shaft_angle=80.0)),
+    ('worm', dict(module=2.0, teeth=1, leads=2)),
+    ('rack', dict(module=2.0, teeth=50)),
+    ('internal', dict(module=2.0, teeth=28)),
+    ('cycloidal', dict(module=1.0, teeth=40, rolling_circle_ratio=0.4)),
+]
+
+
+def _reference(gear_type, kwargs):
+    return GEAR_CLASSES[gear_type](GearParams(name='g', **kwargs)).get_info()
+
+
+class TestGearKernel:
+    def test_matches_get_info(self):
+        types = [t for t, _ in CASES]
+        params = [GearParams(name='g', **kw) for _, kw in CASES]
+        columns = GearKernel.from_params(types, params)
+        for index, (gear_type, kwargs) in enumerate(CASES):
+            expected = _reference(gear_type, kwargs)
+            row = GearKernel.row_info(columns, index, name='g')
+            assert list(row) == list(expected)
+            assert list(row) == GearKernel.fields(gear_type)
+            for key, value in expected.items():
+                if isinstance(value, float) and not math.isinf(value):
+                    assert row[key] == pytest.approx(value), (gear_type, key)
+                else:
+                    assert row[key] == value, (gear_type, key)
+
+    def test_not_applicable_is_nan(self):
+        columns = GearKernel.compute(['spur', 'rack'], [2.0, 2.0], [20, 50])
+        assert np.isnan(columns['cone_distance']).all()
+        assert np.isnan(columns['base_diameter'][1])
+        assert np.isinf(columns['pitch_diameter'][1])
+
+    def test_broadcast_scalars(self):
+        teeth = np.arange(17, 117)
+        columns = GearKernel.compute('spur', np.full(100, 2.0), teeth)
+        assert columns['pitch_diameter'] == pytest.approx(2.0 * teeth)
+        assert columns['base_diameter'] == pytest.approx(
+            2.0 * teeth * math.cos(math.radians(20.0)))
+
+    def test_type_codes(self):
+        assert type_codes(['Spur', 'internal']).tolist() == [
+            TYPE_CODES['spur'], TYPE_CODES['internal']]
+        with pytest.raises(ValueError):
+            type_codes(['hypoid'])
+        with pytest.raises(ValueError):
+            type_codes(np.array([42]))
+
+    def test_validation_reports_row(self):
+        with pytest.raises(ValueError, match='ligne 1'):
+            GearKernel.compute('spur', [2.0, -1.0], [20, 20])
+        with pytest.raises(ValueError):
+            GearKernel.compute('spur', 2.0, 20, pressure_angle=30.0)
@@ -0,0 +1,118 @@
+"""
+Tests du registre paresseux des types d'engrenages
+"""
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from core.base_gear import GearParams
+from core.gear_factory import GearFactory, BUILTIN_GEAR_TYPES
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+PLUGIN_SOURCE = textwrap.dedent('''
+    from gears.spur import SpurGear
+
+    class PluginGear(SpurGear):
+        """Type fourni par un paquet tiers"""
+''')
+
+
+@pytest.fixture
+def registry():
+    """Sauvegarder et restaurer l'état global du registre"""
+    saved = (dict(GearFactory._gear_types), dict(GearFactory._lazy_types),
+             list(GearFactory._pending_entry_points))
+    yield GearFactory
+    GearFactory._gear_types.clear()
+    GearFactory._gear_types.update(saved[0])
+    GearFactory._lazy_types.clear()
+    GearFactory._lazy_types.update(saved[1])
+    GearFactory._pending_entry_points[:] = saved[2]
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """Module tiers importable, retiré de sys.modules après le test"""
+    (tmp_path / 'probe_gear_plugin.py').write_text(PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield 'probe_gear_plugin'
+    sys.modules.pop('probe_gear_plugin', None)
+
+
+def test_lazy_type_imported_on_first_use(registry, plugin_module):
+    registry.register_lazy('probe', f'{plugin_module}:PluginGear')
+    assert 'probe' in registry.get_available_types()
+    assert plugin_module not in sys.modules
+
+    gear = registry.create_gear('PROBE', GearParams(name='p', module=2.0, teeth=20))
+    assert type(gear).__name__ == 'PluginGear'
+    assert plugin_module in sys.modules
+    assert registry._gear_types['probe'] is type(gear)
+    assert 'probe' not in registry._lazy_types
+    assert registry.get_type_name(gear) == 'probe'
+
+
+def test_register_gear_overrides_lazy_declaration(registry, plugin_module):
+    from gears.helical import HelicalGear
+
+    registry.register_lazy('probe', f'{plugin_module}:PluginGear')
+    registry.register_gear('probe', HelicalGear)
+    assert registry.get_gear_class('probe') is HelicalGear
+    assert plugin_module not in sys.modules
+
+
+def test_invalid_declarations(registry):
+    with pytest.raises(ValueError, match='module:Classe'):
+        registry.register_lazy('bad', 'no_colon_here')
+
+    registry.register_lazy('missing', 'module_qui_n_existe_pas:Gear')
+    with pytest.raises(ImportError, match='missing'):
+        registry.create_gear('missing', GearParams(name='m', module=1.0, teeth=20))
+
+    with pytest.raises(ValueError, match='non supporté'):
+        registry.get_gear_class('inconnu')
+
+
+def test_builtin_types_declared(registry):
+    registry._gear_types.clear()
+    registry._lazy_types.clear()
+    registry.register_builtin_types(entry_points=False)
+    assert registry.get_available_types() == list(BUILTIN_GEAR_TYPES)
+    assert registry._gear_types == {}
+
+    gear = registry.create_gear('worm', GearParams(name='w', module=2.0, teeth=1))
+    assert type(gear).__name__ == 'WormGear'
+    assert list(registry._gear_types) == ['worm']
+
+
+def test_entry_points(registry, plugin_module, tmp_path):
+    dist = tmp_path / 'probe_gear_plugin-1.0.dist-info'
+    dist.mkdir()
+    (dist / 'METADATA').write_text('Metadata-Version: 2.1\nName: probe-gear-plugin\nVersion: 1.0\n')
+    (dist / 'entry_points.txt').write_text(
+        f'[gear_engine.gear_types]\nprobe_ep = {plugin_module}:PluginGear\n')
+
+    registry.register_builtin_types()
+    assert 'probe_ep' in registry.get_available_types()
+    assert plugin_module not in sys.modules
+    gear = registry.create_gear('probe_ep', GearParams(name='e', module=1.0, teeth=30))
+    assert type(gear).__name__ == 'PluginGear'
+
+
+def test_cli_list_does_not_import_gears_or_numpy():
+    code = ("import sys, interfaces.cli; "
+            "print(sorted(m for m in ('numpy', 'gears.spur', 'export.step') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                            text=True, cwd=REPO_ROOT)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '[]'
+
+    result = subprocess.run([sys.executable, str(REPO_ROOT / 'main.py'), 'list'],
+                            capture_output=True, text=True, cwd=REPO_ROOT)
+    assert result.returncode == 0, result.stderr
+    for name in BUILTIN_GEAR_TYPES:
+        assert name in result.stdout
@@ -0,0 +1,181 @@
+"""
+Tests de GearTable (catalogue à colonnes NumPy)
+"""
+import gc
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from core.base_gear import GearParams
+from core.gear_factory import GearFactory
+from core.gear_table import GearTable
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+from gears.bevel import BevelGear
+from gears.worm import WormGear
+from gears.rack import RackGear
+from gears.internal import InternalGear
+from gears.cycloidal import CycloidalGear
+
+TYPES = {
+    'spur': SpurGear,
+    'helical': HelicalGear,
+    'bevel': BevelGear,
+    'worm': WormGear,
+    'rack': RackGear,
+    'internal': InternalGear,
+    'cycloidal': CycloidalGear,
+}
+
+
+@pytest.fixture(autouse=True)
+def registered_types():
+    for name, gear_class in TYPES.items():
+        GearFactory.register_gear(name, gear_class)
+
+
+def make_records(count, seed=0):
+    rng = np.random.default_rng(seed)
+    names = list(TYPES)
+    records = []
+    for i in range(count):
+        gear_type = names[i % len(names)]
+        record = {
+            'type': gear_type,
+            'name': f'g{i}',
+            'module': float(rng.choice([1.0, 1.5, 2.0, 3.0])),
+            'teeth': int(rng.integers(12, 80)),
+            'material': 'bronze' if i % 3 == 0 else 'steel',
+        }
+        if gear_type == 'helical':
+            record['helix_angle'] = 15.0
+        if gear_type == 'worm':
+            record['leads'] = 2
+        if gear_type == 'bevel':
+            record['mate_teeth'] = 40
+        records.append(record)
+    return records
+
+
+def test_rows_match_gear_objects():
+    records = make_records(70)
+    table = GearTable.from_records(records)
+    assert len(table) == 70
+
+    for i, record in enumerate(records):
+        gear = GearFactory.from_dict(record)
+        assert type(table[i]) is type(gear)
+        assert table[i].get_info() == gear.get_info()
+        assert table.info(i) == pytest.approx(gear.get_info())
+        assert table.gear_type(i) == record['type']
+        assert table.params(i).material == record['material']
+
+    assert table[-1].params.name == 'g69'
+    with pytest.raises(IndexError):
+        table[70]
+
+
+def test_derived_columns():
+    table = GearTable.from_records(make_records(70))
+    gears = list(table)
+    pitch = table['pitch_diameter']
+    assert pitch.shape == (70,)
+    for gear, value in zip(gears, pitch):
+        assert value == pytest.approx(gear.pitch_diameter)
+    assert np.isnan(table['lead_angle'][table['gear_type'] == 'spur']).all()
+    with pytest.raises(KeyError):
+        table['inconnue']
+
+
+def test_filter_sort_slice():
+    table = GearTable.from_records(make_records(200))
+
+    spur = table.filter(table['module'] >= 2, gear_type='spur')
+    assert len(spur) > 0
+    assert set(spur['gear_type']) == {'spur'}
+    assert (spur['module'] >= 2).all()
+    assert len(table.filter(gear_type='inexistant')) == 0
+    assert len(table.filter(material='bronze')) == sum(1 for i in range(200) if i % 3 == 0)
+
+    ordered = table.sort(['module', 'teeth'], descending=True)
+    keys = list(zip(ordered['module'], ordered['teeth']))
+    assert keys == sorted(keys, reverse=True)
+
+    part = table[10:20]
+    assert isinstance(part, GearTable)
+    assert list(part['name']) == [f'g{i}' for i in range(10, 20)]
+    picked = table[[5, 1]]
+    assert picked[0].params.name == 'g5'
+
+    # Les colonnes dérivées calculées suivent la sélection
+    _ = table['outside_diameter']
+    assert table[[3]]['outside_diameter'][0] == table['outside_diameter'][3]
+
+
+def test_validation_and_unknown_type():
+    with pytest.raises(ValueError, match='Module'):
+        GearTable.from_params(['spur'], [GearParams(name='x', module=0.0, teeth=20)])
+    with pytest.raises(ValueError, match='cercle roulant'):
+        GearTable.from_params(['cycloidal'], [GearParams(name='c', module=1.0, teeth=20,
+                                                         rolling_circle_ratio=1.5)])
+    with pytest.raises(ValueError, match='non supporté'):
+        GearTable.from_params(['inconnu'], [GearParams(name='x', module=1.0, teeth=20)])
+
+
+def test_registered_custom_type():
+    class CustomSpur(SpurGear):
+        def get_info(self):
+            info = super().get_info()
+            info['pitch_diameter'] = 2 * self.pitch_diameter
+            return info
+
+    GearFactory.register_gear('custom_spur', CustomSpur)
+    try:
+        table = GearTable.from_gears([
+            SpurGear(GearParams(name='a', module=2.0, teeth=20)),
+            CustomSpur(GearParams(name='b', module=2.0, teeth=20)),
+        ])
+        assert list(table['gear_type']) == ['spur', 'custom_spur']
+        assert isinstance(table[1], CustomSpur)
+        assert table['pitch_diameter'].tolist() == [40.0, 80.0]
+        assert table.info(1)['pitch_diameter'] == 80.0
+    finally:
+        GearFactory._gear_types.pop('custom_spur', None)
+
+
+def test_concat_and_load(tmp_path):
+    first = GearTable.from_records(make_records(5))
+    second = GearTable.from_records(make_records(3, seed=1))
+    merged = GearTable.concat([first, second])
+    assert len(merged) == 8
+    assert merged[6].params == second[1].params
+    assert merged['material'].tolist() == \
+        first['material'].tolist() + second['material'].tolist()
+
+    path = tmp_path / 'catalogue.csv'
+    path.write_text("type,name,module,teeth\nspur,a,2,20\nspur,b,0,20\nworm,w,2,1\n")
+    table, errors = GearTable.load(path, chunk_size=2)
+    assert list(table['name']) == ['a', 'w']
+    assert [e['row'] for e in errors] == [3]
+
+    empty = GearTable.concat([])
+    assert len(empty) == 0 and empty['pitch_diameter'].shape == (0,)
+
+
+def test_memory_fraction_of_gear_list():
+    records = make_records(3000)
+
+    def retained(build):
+        gc.collect()
+        tracemalloc.start()
+        obj = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert obj is not None
+        return size
+
+    as_list = retained(lambda: [GearFactory.from_dict(r) for r in records])
+    as_table = retained(lambda: GearTable.from_records(records))
+    assert as_table < as_list / 2
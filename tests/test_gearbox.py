@@ -0,0 +1,216 @@
+"""
+Tests du modèle de boîte de vitesses (graphe arbres / engrenages)
+"""
+import math
+import time
+
+import pytest
+
+from core.base_gear import GearParams
+from core.gearbox import Gearbox, MESH_EFFICIENCY, WORM_FRICTION
+from gears.helical import HelicalGear
+from gears.internal import InternalGear
+from gears.rack import RackGear
+from gears.spur import SpurGear
+from gears.worm import WormGear
+
+ETA = MESH_EFFICIENCY['spur']
+
+
+def spur(teeth, module=2.0):
+    return SpurGear(GearParams(name=f's{teeth}', module=module, teeth=teeth))
+
+
+def two_stage():
+    box = Gearbox()
+    box.add_gear('a', spur(20), 'input')
+    box.add_gear('b', spur(60), 'intermediate')
+    box.add_gear('c', spur(15), 'intermediate')
+    box.add_gear('d', spur(45), 'output')
+    box.add_mesh('a', 'b')
+    box.add_mesh('c', 'd')
+    box.set_input('input', speed=3000.0, torque=10.0)
+    return box
+
+
+def test_compound_stages():
+    box = two_stage()
+    results = box.solve()
+    assert results['intermediate']['speed'] == pytest.approx(-1000.0)
+    assert results['output']['speed'] == pytest.approx(3000.0 / 9)
+    assert results['output']['ratio'] == pytest.approx(9.0)
+    assert results['output']['efficiency'] == pytest.approx(ETA**2)
+    assert results['output']['torque'] == pytest.approx(10.0 * 9 * ETA**2)
+    assert results['output']['power'] == pytest.approx(results['input']['power'] * ETA**2)
+    assert box.get_info()['outputs'].keys() == {'output'}
+
+
+def test_idler_and_internal():
+    box = Gearbox()
+    box.add_gear('a', spur(20), 'input')
+    box.add_gear('idler', spur(37), 'idler')
+    box.add_gear('b', spur(20), 'output')
+    box.add_gear('pinion', spur(20), 'output')
+    box.add_gear('ring', InternalGear(GearParams(name='r', module=2.0, teeth=80)), 'ring')
+    box.add_mesh('a', 'idler')
+    box.add_mesh('idler', 'b')
+    box.add_mesh('pinion', 'ring')
+    box.set_input('input', 1200.0, 5.0)
+
+    # Le pignon fou inverse deux fois : même sens, même vitesse
+    assert box.shaft('output')['speed'] == pytest.approx(1200.0)
+    assert box.shaft('output')['efficiency'] == pytest.approx(ETA**2)
+    # Engrènement intérieur : pas d'inversion
+    assert box.shaft('ring')['speed'] == pytest.approx(300.0)
+    assert box.shaft('ring')['efficiency'] == pytest.approx(ETA**2 * MESH_EFFICIENCY['internal'])
+
+
+def test_worm_stage_uses_worm_efficiency():
+    worm = WormGear(GearParams(name='w', module=2.0, teeth=1, leads=2))
+    box = Gearbox()
+    box.add_gear('worm', worm, 'input')
+    box.add_gear('wheel', spur(40), 'output')
+    box.add_mesh('worm', 'wheel')
+    box.set_input('input', 1500.0, 2.0)
+
+    output = box.shaft('output')
+    efficiency = worm.efficiency(WORM_FRICTION)
+    assert output['speed'] == pytest.approx(75.0)
+    assert output['efficiency'] == pytest.approx(efficiency)
+    assert output['torque'] == pytest.approx(2.0 * 20 * efficiency)
+
+    # Entraînement par la roue : rendement inverse, nul si irréversible
+    box.set_input('output', 75.0, 40.0)
+    assert box.shaft('input')['speed'] == pytest.approx(1500.0)
+    assert 0 <= box.shaft('input')['efficiency'] < efficiency
+
+
+def test_reflected_inertia():
+    box = two_stage()
+    box.add_shaft('motor_rotor', inertia=0.0)
+    box.add_gear('e', spur(30), 'motor_rotor', inertia=0.02)
+    box.add_mesh('e', 'a')
+    box.set_input('input', 3000.0, 10.0)
+
+    expected = 0.0
+    results = box.solve()
+    for shaft, gears in {'input': ['a'], 'intermediate': ['b', 'c'],
+                         'output': ['d']}.items():
+        inertia = sum(Gearbox.gear_inertia(box._gears[g]) for g in gears)
+        assert results[shaft]['inertia'] == pytest.approx(inertia)
+        expected += inertia * (results[shaft]['speed'] / 3000.0) ** 2
+    expected += 0.02 * (20 / 30) ** 2
+    assert box.reflected_inertia() == pytest.approx(expected)
+
+    # Disque d'acier plein : ρ π b d⁴ / 32
+    gear = spur(50)
+    assert Gearbox.gear_inertia(gear) == pytest.approx(
+        7850 * math.pi * 0.010 * 0.100**4 / 32)
+
+
+def test_incremental_update_matches_rebuild():
+    box = two_stage()
+    box.solve()
+
+    evaluations = box.evaluations
+    box.update_gear('d', teeth=30)
+    results = box.solve()
+    assert box.evaluations - evaluations == 1
+    assert results['output']['speed'] == pytest.approx(-1000.0 * -15 / 30)
+
+    evaluations = box.evaluations
+    box.update_gear('a', teeth=30)
+    results = box.solve()
+    assert box.evaluations - evaluations == 2
+
+    # Aucun changement : rien n'est recalculé
+    evaluations = box.evaluations
+    box.solve()
+    assert box.evaluations == evaluations
+
+    fresh = two_stage()
+    fresh.update_gear('d', teeth=30)
+    fresh.update_gear('a', teeth=30)
+    fresh._stale = True
+    for shaft, values in fresh.solve().items():
+        assert results[shaft] == pytest.approx(values)
+    assert box.reflected_inertia() == pytest.approx(fresh.reflected_inertia())
+
+
+def test_update_keeps_worm_diameter_and_inertia():
+    box = Gearbox()
+    box.add_gear('worm', WormGear(GearParams(name='w', module=2.0, teeth=1), worm_diameter=30.0),
+                 'input', inertia=0.05)
+    box.add_gear('wheel', spur(40), 'output')
+    box.add_mesh('worm', 'wheel')
+    box.set_input('input', 1500.0, 5.0)
+    box.solve()
+
+    worm = box.update_gear('worm', leads=2)
+    assert worm.worm_diameter == pytest.approx(30.0)
+    assert worm.leads == 2
+    assert box.solve()['input']['inertia'] == pytest.approx(0.05)
+
+    # Diamètre par défaut : suit le module
+    default = WormGear(GearParams(name='w', module=2.0, teeth=1)).derive(module=3.0)
+    assert default.worm_diameter == pytest.approx(30.0)
+
+    box.replace_gear('worm', worm, inertia=0.08)
+    assert box.solve()['input']['inertia'] == pytest.approx(0.08)
+
+
+def test_loops():
+    box = Gearbox()
+    box.add_gear('a1', spur(20), 'input')
+    box.add_gear('a2', spur(30), 'input')
+    box.add_gear('b1', spur(40), 'output')
+    box.add_gear('b2', spur(60), 'output')
+    box.add_mesh('a1', 'b1')
+    box.add_mesh('a2', 'b2')
+    box.set_input('input', 600.0, 1.0)
+    assert box.shaft('output')['speed'] == pytest.approx(-300.0)
+
+    box.update_gear('b2', teeth=50)
+    with pytest.raises(ValueError, match='boucle'):
+        box.solve()
+
+
+def test_invalid_assemblies():
+    box = Gearbox()
+    with pytest.raises(ValueError, match='arbre tournant'):
+        box.add_gear('rack', RackGear(GearParams(name='r', module=2.0, teeth=30)), 's')
+    box.add_gear('a', spur(20), 'input')
+    box.add_gear('b', HelicalGear(GearParams(name='h', module=2.0, teeth=20,
+                                             helix_angle=15.0)), 'other')
+    box.add_gear('c', spur(20, module=3.0), 'third')
+    box.add_gear('d', spur(40), 'input')
+    with pytest.raises(ValueError, match="ne peuvent pas s'engrener"):
+        box.add_mesh('a', 'b')
+    with pytest.raises(ValueError, match='modules'):
+        box.add_mesh('a', 'c')
+    with pytest.raises(ValueError, match='même arbre'):
+        box.add_mesh('a', 'd')
+    with pytest.raises(ValueError, match="entrée"):
+        box.solve()
+
+
+def test_long_chain_is_linear_and_incremental():
+    def chain(stages):
+        box = Gearbox()
+        for stage in range(stages):
+            box.add_gear(f'p{stage}', spur(20), f's{stage}')
+            box.add_gear(f'w{stage}', spur(21), f's{stage + 1}')
+            box.add_mesh(f'p{stage}', f'w{stage}')
+        box.set_input('s0', 1000.0, 1.0)
+        return box
+
+    box = chain(2000)
+    start = time.perf_counter()
+    box.solve()
+    elapsed = time.perf_counter() - start
+    assert box.evaluations == 2001
+    assert elapsed < 1.0
+
+    box.update_gear('w1999', teeth=25)
+    box.solve()
+    assert box.evaluations == 2002
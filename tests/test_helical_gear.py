@@ -0,0 +1,121 @@
+"""
+Tests de la géométrie des engrenages hélicoïdaux et à chevrons
+"""
+import math
+import numpy as np
+import pytest
+
+from core.base_gear import GearParams
+from core.gear_factory import GearFactory
+from export.stl import STLExporter
+from gears.helical import HelicalGear, HerringboneGear
+from gears.spur import SpurGear
+from profiles.outline import gear_outline
+from tests.conftest import assert_closed_solid, solid_volume
+
+
+def helical(teeth=20, beta=15.0, face_width=10.0, kind=HelicalGear):
+    return kind(GearParams(name='h', module=2.0, teeth=teeth, helix_angle=beta,
+                           face_width=face_width))
+
+
+def polygon_area(outline):
+    x, y = outline[:, 0], outline[:, 1]
+    return 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+
+
+def test_transverse_outline():
+    gear = helical(beta=20.0)
+    outline = gear.get_outline()
+    radius = np.hypot(outline[:, 0], outline[:, 1])
+    # Cercle primitif apparent, hauteurs de la crémaillère normale
+    assert radius.max() == pytest.approx(gear.pitch_diameter / 2 + 2.0)
+    assert radius.min() == pytest.approx(gear.pitch_diameter / 2 - 2.5)
+    assert radius.max() == pytest.approx(gear.outside_diameter / 2)
+
+    # Sans hélice : contour de l'engrenage droit
+    spur = SpurGear(GearParams(name='s', module=2.0, teeth=20))
+    assert np.array_equal(helical(beta=0.0).get_outline(), spur.get_outline())
+    assert gear_outline(2.0, 20, helix_angle=0.0) is gear_outline(2.0, 20)
+
+
+@pytest.mark.parametrize('kind', [HelicalGear, HerringboneGear])
+def test_solid_is_closed_and_preserves_volume(kind):
+    gear = helical(beta=-25.0, kind=kind)
+    faces = gear.get_solid(8)
+    assert_closed_solid(faces)
+
+    area = polygon_area(gear.get_outline(8))
+    assert solid_volume(faces) == pytest.approx(area * gear.params.face_width, rel=1e-3)
+
+
+def test_sections_follow_helix():
+    gear = helical(beta=30.0, face_width=12.0)
+    outline = gear.get_outline(8)
+    faces = gear.get_solid(8)
+    top = faces[len(outline):2 * len(outline), 0]
+    twist = 12.0 * 2 * math.pi / gear.lead
+    rotated = outline @ np.array([[math.cos(twist), math.sin(twist)],
+                                  [-math.sin(twist), math.cos(twist)]])
+    assert np.allclose(top[:, :2], rotated)
+    assert np.allclose(top[:, 2], 12.0)
+    # Hélice à droite : rotation positive avec z
+    assert twist > 0
+
+
+def test_z_steps_follow_tolerance():
+    gear = helical(teeth=30, beta=30.0, face_width=20.0)
+    tip = gear.outside_diameter / 2
+    twist = gear.params.face_width * gear.twist_rate
+    counts = []
+    for tolerance in (0.05, 0.01, 0.002):
+        faces = gear.get_solid(tolerance=tolerance)
+        points = len(gear.get_outline(tolerance=tolerance))
+        steps = (len(faces) - 2 * points) // (2 * points)
+        counts.append(steps)
+        # Flèche de la corde d'hélice à la tête
+        assert tip * (1 - math.cos(twist / steps / 2)) <= tolerance
+    assert counts == sorted(counts) and counts[0] < counts[-1]
+
+    # Plus d'hélice, plus de pas; denture droite : une seule tranche
+    assert len(helical(beta=0.0).get_solid(8)) == 4 * len(helical(beta=0.0).get_outline(8))
+
+
+def test_herringbone_is_mirrored():
+    gear = helical(beta=20.0, face_width=16.0, kind=HerringboneGear)
+    points = len(gear.get_outline(8))
+    faces = gear.get_solid(8)
+    bottom = faces[:points, 1]
+    top = faces[points:2 * points, 0]
+    # Extrémités identiques, rotation maximale au plan médian
+    assert np.allclose(bottom[:, :2], top[:, :2])
+    side = faces[2 * points:].reshape(-1, 3)
+    middle = np.unique(side[np.isclose(side[:, 2], 8.0), :2].round(9), axis=0)
+    twist = 8.0 * gear.twist_rate
+    outline = gear.get_outline(8) @ np.array([[math.cos(twist), math.sin(twist)],
+                                              [-math.sin(twist), math.cos(twist)]])
+    assert np.allclose(middle, np.unique(outline.round(9), axis=0))
+    assert gear.get_info()['herringbone'] is True
+
+
+def test_stl_export_uses_solid():
+    gear = helical(teeth=24, beta=20.0)
+    faces = STLExporter.gear_to_faces(gear, resolution=32)
+    radius = np.hypot(faces[..., 0], faces[..., 1])
+    assert radius.max() == pytest.approx(gear.outside_diameter / 2)
+    assert radius[radius > 1e-9].min() == pytest.approx(gear.root_diameter / 2, rel=1e-6)
+    assert np.ptp(faces[..., 2]) == pytest.approx(gear.params.face_width)
+
+
+def test_herringbone_factory_and_stl(tmp_path):
+    gear = GearFactory.from_dict({'type': 'herringbone', 'name': 'Chevron',
+                                  'module': 2.0, 'teeth': 24, 'helix_angle': 25.0,
+                                  'face_width': 16.0})
+    assert isinstance(gear, HerringboneGear)
+    out = tmp_path / 'chevron.stl'
+    STLExporter().export_gear(gear, str(out), resolution=16)
+    data = out.read_bytes()
+    count = int.from_bytes(data[80:84], 'little')
+    assert count > 0 and len(data) == 84 + 50 * count
+    faces = STLExporter.gear_to_faces(gear, resolution=16)
+    assert_closed_solid(faces)
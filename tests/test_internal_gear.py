@@ -1,9 +1,13 @@
 import pytest
 import math
+import time
+import numpy as np
 from core.base_gear import GearParams
 from core.gear_factory import GearFactory
-from gears.internal import InternalGear
+from export.stl import STLExporter
+from gears.internal import InternalGear, RIM_FACTOR
 from gears.spur import SpurGear
+from tests.conftest import assert_closed_solid, solid_volume
 
 class TestInternalGear:
     def test_internal_creation(self):
@@ -39,3 +43,86 @@ class TestInternalGear:
         center_distance, contact_ratio = internal.mesh_with(spur)
         assert center_distance == pytest.approx((internal.pitch_diameter - spur.pitch_diameter) / 2)
         assert contact_ratio >= 0
+
+
+def ring(teeth=60, **kwargs):
+    params = GearParams(name='Ring', module=2.0, teeth=teeth, face_width=10.0, **kwargs)
+    return InternalGear(params)
+
+
+class TestInternalGearSolid:
+    def test_outline_points_inward(self):
+        gear = ring()
+        outline = gear.get_outline()
+        radius = np.hypot(outline[:, 0], outline[:, 1])
+        assert radius.min() == pytest.approx(gear.outside_diameter / 2)
+        assert radius.max() == pytest.approx(gear.root_diameter / 2)
+        # Dent centrée sur l'axe x : sommet au cercle de tête (côté centre)
+        assert radius[np.argmin(np.abs(np.arctan2(outline[:, 1], outline[:, 0])))] == \
+            pytest.approx(gear.outside_diameter / 2)
+        # Angle polaire croissant (parcours trigonométrique)
+        steps = np.diff(np.unwrap(np.arctan2(outline[:, 1], outline[:, 0])))
+        assert steps.min() > -1e-12 and steps.sum() < 2 * math.pi
+
+    @pytest.mark.parametrize('teeth, tolerance', [(60, None), (24, None), (80, 0.005)])
+    def test_solid_is_closed_ring(self, teeth, tolerance):
+        gear = ring(teeth)
+        faces = gear.get_solid(tolerance=tolerance)
+        assert_closed_solid(faces)
+
+        normals = np.cross(faces[:, 1] - faces[:, 0], faces[:, 2] - faces[:, 0])
+        assert np.linalg.norm(normals, axis=1).min() > 0
+        # Fond orienté vers -z sans triangle retourné
+        bottom = np.all(np.isclose(faces[..., 2], 0.0), axis=1)
+        assert np.all(normals[bottom, 2] < 0)
+
+        # Volume : disque de jante moins l'intérieur du contour
+        radius = np.hypot(faces[..., 0], faces[..., 1])
+        assert radius.max() == pytest.approx(gear.rim_diameter / 2)
+        assert radius.min() == pytest.approx(gear.outside_diameter / 2)
+        outline = gear.get_outline(tolerance=tolerance)
+        x, y = outline[:, 0], outline[:, 1]
+        hole = 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+        expected = (math.pi * gear.rim_diameter**2 / 4 - hole) * 10.0
+        assert solid_volume(faces) == pytest.approx(expected, rel=1e-4)
+
+    def test_rim_diameter(self):
+        gear = ring()
+        assert gear.rim_diameter == pytest.approx(gear.root_diameter + 2 * RIM_FACTOR * 2.0)
+        wide = ring(rim_diameter=160.0)
+        assert wide.rim_diameter == 160.0
+        assert np.hypot(*wide.get_solid()[..., :2].T).max() == pytest.approx(80.0)
+        with pytest.raises(ValueError, match='jante'):
+            ring(rim_diameter=120.0).get_solid()
+
+    def test_rim_travels_with_params(self):
+        from core.gearbox import Gearbox
+        gear = GearFactory.from_dict({'type': 'internal', 'name': 'Ring', 'module': 2.0,
+                                      'teeth': 60, 'rim_diameter': 200})
+        assert gear.rim_diameter == 200.0
+        assert gear.params == gear.params.derive(rim_diameter=200.0)
+        assert gear.params != gear.params.derive(rim_diameter=None)
+
+        # Une mise à jour sans changement conserve la jante et l'inertie
+        box = Gearbox()
+        box.add_gear('ring', gear, 'ring')
+        inertia = Gearbox.gear_inertia(gear)
+        updated = box.update_gear('ring', face_width=10.0)
+        assert updated.rim_diameter == 200.0
+        assert Gearbox.gear_inertia(updated) == pytest.approx(inertia)
+
+    def test_stl_export_is_ring(self):
+        gear = ring()
+        faces = STLExporter.gear_to_faces(gear, resolution=32)
+        radius = np.hypot(faces[..., 0], faces[..., 1])
+        # Aucun sommet sur l'axe : pas de disque plein
+        assert radius.min() == pytest.approx(gear.outside_diameter / 2)
+
+    def test_large_ring_is_fast(self):
+        gear = ring(240)
+        gear.get_solid()
+        start = time.perf_counter()
+        faces = gear.get_solid()
+        elapsed = time.perf_counter() - start
+        assert len(faces) > 240 * 100
+        assert elapsed < 0.05
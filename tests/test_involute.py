@@ -0,0 +1,59 @@
+"""
+Tests pour le profil en développante
+"""
+import math
+import numpy as np
+import pytest
+from profiles.involute import InvoluteProfile, involute, inverse_involute, involute_points
+
+
+class TestInvolutePoints:
+    def test_generate_points_shape(self):
+        profile = InvoluteProfile(20.0)
+        points = profile.generate_points(18.79, 0, 60, num_points=40)
+        assert points.shape == (40, 2)
+        # Le premier point est sur le cercle de base
+        assert points[0] == pytest.approx([18.79, 0.0])
+
+    def test_points_match_scalar_formula(self):
+        profile = InvoluteProfile(20.0)
+        rb = 10.0
+        points = profile.generate_points(rb, 0, 45, num_points=7)
+        for (x, y), t in zip(points, np.linspace(0, math.radians(45), 7)):
+            assert x == pytest.approx(rb * (math.cos(t) + t * math.sin(t)))
+            assert y == pytest.approx(rb * (math.sin(t) - t * math.cos(t)))
+
+    def test_batch_matches_single(self):
+        profile = InvoluteProfile(20.0)
+        radii = np.array([5.0, 12.5, 40.0])
+        batch = profile.generate_points_batch(radii, 0, 60, num_points=25)
+        assert batch.shape == (3, 25, 2)
+        for rb, points in zip(radii, batch):
+            np.testing.assert_allclose(points, profile.generate_points(rb, 0, 60, 25))
+
+    def test_radius_from_roll_angle(self):
+        t = np.linspace(0, 1.0, 11)
+        points = involute_points(7.0, t)
+        # r = rb * sqrt(1 + t²)
+        np.testing.assert_allclose(np.hypot(points[:, 0], points[:, 1]),
+                                   7.0 * np.sqrt(1 + t ** 2))
+
+
+class TestInvoluteFunction:
+    def test_inverse_round_trip(self):
+        alpha = np.linspace(1e-3, math.radians(80), 10001)
+        np.testing.assert_allclose(inverse_involute(involute(alpha)), alpha, atol=1e-10)
+
+    def test_scalar_values(self):
+        assert involute(math.radians(20)) == pytest.approx(0.014904383867336)
+        assert inverse_involute(0.014904383867336) == pytest.approx(math.radians(20))
+        assert isinstance(inverse_involute(0.01), float)
+
+    def test_thickness_at_radius_vectorized(self):
+        profile = InvoluteProfile(20.0)
+        rb = 20.0 * math.cos(math.radians(20))
+        radii = np.array([rb - 1, 20.0, 21.0])
+        batch = profile.thickness_at_radius(rb, 20.0, math.pi, radii)
+        assert batch[0] == 0
+        assert batch[1] == pytest.approx(math.pi)
+        assert batch[2] == pytest.approx(profile.thickness_at_radius(rb, 20.0, math.pi, 21.0))
@@ -0,0 +1,179 @@
+"""
+Tests de l'index de compatibilité d'engrènement
+"""
+import time
+
+import numpy as np
+import pytest
+
+from core.base_gear import GearParams
+from core.gear_factory import GearFactory
+from core.gear_table import GearTable
+from core.mate_index import MateIndex
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+from gears.bevel import BevelGear
+from gears.worm import WormGear
+from gears.rack import RackGear
+from gears.internal import InternalGear
+from gears.cycloidal import CycloidalGear
+
+TYPES = {
+    'spur': SpurGear,
+    'helical': HelicalGear,
+    'bevel': BevelGear,
+    'worm': WormGear,
+    'rack': RackGear,
+    'internal': InternalGear,
+    'cycloidal': CycloidalGear,
+}
+
+# Types appelant mesh_with face à un pignon droit
+_DRIVERS = (WormGear, RackGear, InternalGear)
+
+
+@pytest.fixture(autouse=True)
+def registered_types():
+    for name, gear_class in TYPES.items():
+        GearFactory.register_gear(name, gear_class)
+
+
+def make_records(count, seed=0):
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(count):
+        gear_type = list(TYPES)[i % len(TYPES)]
+        record = {'type': gear_type, 'name': f'g{i}',
+                  'module': float(rng.choice([1.0, 2.0])),
+                  'teeth': int(rng.integers(12, 60)),
+                  'pressure_angle': float(rng.choice([20.0, 25.0]))}
+        if gear_type == 'helical':
+            record['helix_angle'] = float(rng.choice([-15.0, 15.0]))
+        if gear_type == 'worm':
+            record['teeth'] = 1
+            record['leads'] = int(rng.integers(1, 4))
+        if gear_type == 'bevel':
+            record['teeth'] = int(rng.choice([20, 30, 40]))
+            record['mate_teeth'] = int(rng.choice([20, 30, 40]))
+        if gear_type == 'cycloidal':
+            record['rolling_circle_ratio'] = float(rng.choice([0.25, 0.5]))
+        records.append(record)
+    return records
+
+
+def ratio_teeth(gear):
+    if isinstance(gear, RackGear):
+        return np.nan
+    if isinstance(gear, WormGear):
+        return gear.leads
+    return gear.params.teeth
+
+
+def brute_force(gears, i, ratio=None, center_distance=None):
+    """Balayage de toutes les paires avec mesh_with"""
+    found = {}
+    gear = gears[i]
+    for j, other in enumerate(gears):
+        if j == i or gear.params.module != other.params.module or \
+                gear.params.pressure_angle != other.params.pressure_angle or \
+                gear.params.helix_angle + other.params.helix_angle != 0:
+            continue
+        caller, mate = gear, other
+        if isinstance(other, _DRIVERS) and type(gear) is SpurGear:
+            caller, mate = other, gear
+        if isinstance(caller, _DRIVERS) and type(mate) is not SpurGear:
+            continue
+        try:
+            distance, _ = caller.mesh_with(mate)
+        except ValueError:
+            continue
+        pair_ratio = ratio_teeth(other) / ratio_teeth(gear)
+        if ratio is not None and not ratio[0] <= pair_ratio <= ratio[1]:
+            continue
+        if center_distance is not None and \
+                not center_distance[0] <= distance <= center_distance[1]:
+            continue
+        found[j] = distance
+    return found
+
+
+def as_dict(result):
+    return dict(zip(result['index'].tolist(), result['center_distance'].tolist()))
+
+
+@pytest.mark.parametrize('ratio,center_distance', [
+    (None, None), ((1.0, 2.0), None), (None, (20.0, 45.0)), ((0.5, 1.5), (10.0, 60.0)),
+])
+def test_matches_brute_force(ratio, center_distance):
+    table = GearTable.from_records(make_records(210))
+    gears = list(table)
+    index = MateIndex.from_table(table)
+    total = 0
+    for i in range(len(gears)):
+        expected = brute_force(gears, i, ratio, center_distance)
+        found = as_dict(index.mates_of(i, ratio=ratio, center_distance=center_distance))
+        assert found.keys() == expected.keys(), (i, table.gear_type(i))
+        for j, distance in expected.items():
+            assert found[j] == pytest.approx(distance)
+        total += len(found)
+    assert total > 0
+
+
+def test_result_order_and_external_query():
+    index = MateIndex()
+    index.insert_many(['spur'] * 4, [GearParams(name=f's{z}', module=2.0, teeth=z)
+                                     for z in (40, 20, 30, 60)])
+    result = index.mates('spur', GearParams(name='q', module=2.0, teeth=20),
+                         ratio=(1.0, 2.0))
+    assert result['index'].tolist() == [1, 2, 0]
+    assert result['ratio'].tolist() == [1.0, 1.5, 2.0]
+    assert result['center_distance'].tolist() == [40.0, 50.0, 60.0]
+
+    # Module différent ou hélice de même sens : aucun conjugué
+    assert len(index.mates('spur', GearParams(name='q', module=2.5, teeth=20))['index']) == 0
+    index.insert('helical', GearParams(name='h', module=2.0, teeth=20, helix_angle=15.0))
+    assert len(index.mates('helical', GearParams(name='q', module=2.0, teeth=20,
+                                                 helix_angle=15.0))['index']) == 0
+    assert index.mates('helical', GearParams(name='q', module=2.0, teeth=20,
+                                             helix_angle=-15.0))['index'].tolist() == [4]
+    with pytest.raises(IndexError):
+        index.mates_of(5)
+
+
+def test_incremental_inserts_match_bulk_build():
+    records = make_records(140, seed=3)
+    table = GearTable.from_records(records)
+    bulk = MateIndex.from_table(table)
+
+    incremental = MateIndex(capacity=4)
+    for i in range(0, len(table), 25):
+        part = table[i:i + 25]
+        incremental.insert_many([part.gear_type(k) for k in range(len(part))],
+                                [part.params(k) for k in range(len(part))])
+        # Requête entre deux insertions : fusion des lignes en attente
+        incremental.mates_of(0, ratio=(0.5, 2.0))
+    assert len(incremental) == len(bulk) == len(table)
+
+    for i in range(len(table)):
+        assert as_dict(incremental.mates_of(i)) == as_dict(bulk.mates_of(i))
+
+
+def test_query_time_on_large_catalog():
+    size = 300_000
+    rng = np.random.default_rng(1)
+    types = rng.choice(['spur', 'helical', 'internal', 'rack', 'worm', 'cycloidal'], size)
+    index = MateIndex()
+    index.insert_columns({
+        'gear_type': types,
+        'module': rng.choice([1.0, 1.5, 2.0, 2.5, 3.0], size),
+        'teeth': rng.integers(12, 200, size),
+        'helix_angle': np.where(types == 'helical', rng.choice([-15.0, 15.0], size), 0.0),
+    })
+    index.mates_of(0)
+
+    timings = []
+    for query in range(1, 200):
+        start = time.perf_counter()
+        index.mates_of(query, ratio=(1.9, 2.1), center_distance=(40.0, 400.0))
+        timings.append(time.perf_counter() - start)
+    assert np.median(timings) < 1e-3
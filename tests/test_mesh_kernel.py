@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+from core.base_gear import GearParams
+from core.gear_kernel import GearKernel
+from core.mesh_kernel import MeshKernel
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+from gears.rack import RackGear
+from gears.internal import InternalGear
+from gears.bevel import BevelGear
+
+GEAR_CLASSES = {
+    'spur': SpurGear,
+    'helical': HelicalGear,
+    'rack': RackGear,
+    'internal': InternalGear,
+    'bevel': BevelGear,
+}
+
+PAIRS = [
+    (('spur', dict(module=2.0, teeth=20)), ('spur', dict(module=2.0, teeth=40))),
+    (('helical', dict(module=2.0, teeth=25, helix_angle=15.0)),
+     ('helical', dict(module=2.0, teeth=50, helix_angle=-15.0))),
+    (('internal', dict(module=2.0, teeth=60)), ('spur', dict(module=2.0, teeth=20))),
+    (('rack', dict(module=2.0, teeth=50)), ('spur', dict(module=2.0, teeth=20))),
+]
+
+
+def _columns(specs):
+    return GearKernel.from_params([t for t, _ in specs],
+                                  [GearParams(name='g', **kw) for _, kw in specs])
+
+
+class TestMeshKernel:
+    def test_matches_mesh_with(self):
+        first = _columns([p[0] for p in PAIRS])
+        second = _columns([p[1] for p in PAIRS])
+        result = MeshKernel.analyze(first, second)
+        assert result['valid'].all()
+        for index, ((t1, kw1), (t2, kw2)) in enumerate(PAIRS):
+            gear1 = GEAR_CLASSES[t1](GearParams(name='a', **kw1))
+            gear2 = GEAR_CLASSES[t2](GearParams(name='b', **kw2))
+            center_distance, contact_ratio = gear1.mesh_with(gear2)
+            assert result['center_distance'][index] == pytest.approx(center_distance)
+            assert result['contact_ratio'][index] == pytest.approx(contact_ratio)
+            assert result['transmission_ratio'][index] == pytest.approx(
+                kw2['teeth'] / kw1['teeth'])
+
+    def test_helical_overlap_ratio(self):
+        result = MeshKernel.analyze(_columns([PAIRS[1][0]]), _columns([PAIRS[1][1]]))
+        assert result['overlap_ratio'][0] > 0
+        assert result['contact_ratio'][0] == pytest.approx(
+            result['transverse_contact_ratio'][0] + result['overlap_ratio'][0])
+
+    def test_incompatible_pairs_invalid(self):
+        first = _columns([('spur', dict(module=2.0, teeth=20)),
+                          ('helical', dict(module=2.0, teeth=20, helix_angle=15.0)),
+                          ('internal', dict(module=2.0, teeth=40)),
+                          ('bevel', dict(module=2.0, teeth=20, mate_teeth=20))])
+        second = _columns([('helical', dict(module=2.0, teeth=20, helix_angle=15.0)),
+                           ('helical', dict(module=2.0, teeth=20, helix_angle=15.0)),
+                           ('spur', dict(module=2.0, teeth=50)),
+                           ('bevel', dict(module=2.0, teeth=20, mate_teeth=20))])
+        result = MeshKernel.analyze(first, second)
+        assert not result['valid'].any()
+        assert np.isnan(result['center_distance']).all()
+
+    def test_all_pairs(self):
+        columns = GearKernel.compute('spur', np.full(5, 2.0), np.arange(20, 25))
+        result = MeshKernel.all_pairs(columns)
+        assert len(result['center_distance']) == 20
+        i, j = result['first_index'][0], result['second_index'][0]
+        assert result['center_distance'][0] == pytest.approx(
+            (columns['pitch_diameter'][i] + columns['pitch_diameter'][j]) / 2)
+
+    def test_all_pairs_by_blocks(self):
+        columns = _columns([('spur', dict(module=2.0, teeth=20)),
+                            ('internal', dict(module=2.0, teeth=60)),
+                            ('rack', dict(module=2.0, teeth=30)),
+                            ('spur', dict(module=2.0, teeth=30)),
+                            ('helical', dict(module=2.0, teeth=20, helix_angle=15.0)),
+                            ('helical', dict(module=2.0, teeth=20, helix_angle=-15.0)),
+                            ('spur', dict(module=3.0, teeth=25))])
+        whole = MeshKernel.all_pairs(columns, chunk_size=len(columns['teeth']))
+        pairs = set(zip(whole['first_index'].tolist(), whole['second_index'].tolist()))
+        assert (1, 0) in pairs and (2, 3) in pairs and (4, 5) in pairs
+        assert (0, 1) not in pairs
+        for chunk_size in (1, 3):
+            blocks = list(MeshKernel.iter_pairs(columns, chunk_size=chunk_size))
+            assert len(blocks) == -(-7 // chunk_size)
+            chunked = MeshKernel.all_pairs(columns, chunk_size=chunk_size)
+            for key in whole:
+                np.testing.assert_array_equal(chunked[key], whole[key])
+        assert len(MeshKernel.all_pairs(columns, only_valid=False)['valid']) == 42
+        empty = MeshKernel.all_pairs(GearKernel.compute('spur', np.empty(0), np.empty(0)))
+        assert len(empty['center_distance']) == 0
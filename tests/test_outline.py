@@ -0,0 +1,65 @@
+"""
+Tests pour le contour complet des engrenages
+"""
+import math
+import numpy as np
+import pytest
+from core.base_gear import GearParams
+from gears.spur import SpurGear
+from profiles.outline import gear_outline, outline_cache_clear, outline_cache_info
+
+
+def polar(outline):
+    return np.hypot(outline[:, 0], outline[:, 1]), np.arctan2(outline[:, 1], outline[:, 0])
+
+
+class TestGearOutline:
+    def test_outline_radii_limits(self):
+        outline = gear_outline(2.0, 20, 20.0)
+        radius, _ = polar(outline)
+        # Tête: r + m, pied: r - 1.25 m
+        assert radius.max() == pytest.approx(22.0)
+        assert radius.min() == pytest.approx(17.5)
+
+    def test_outline_is_contiguous_for_all_teeth(self):
+        outline = gear_outline(2.0, 20, 20.0, num_points=10)
+        assert outline.ndim == 2 and outline.shape[1] == 2
+        assert len(outline) % 20 == 0
+        _, theta = polar(outline)
+        # Parcours trigonométrique sur un tour complet
+        assert np.all(np.diff(np.unwrap(theta)) > 0)
+        # Pas de point dupliqué entre deux dents
+        steps = np.hypot(*np.diff(outline, axis=0).T)
+        assert steps.min() > 0
+
+    def test_profile_shift_moves_tip_and_root(self):
+        radius, _ = polar(gear_outline(2.0, 14, 20.0, profile_shift=0.5))
+        assert radius.max() == pytest.approx(14 + 2.0 * 1.5)
+        assert radius.min() == pytest.approx(14 - 2.0 * 0.75)
+
+    def test_pitch_thickness_with_backlash(self):
+        m, z = 2.0, 30
+        r = m * z / 2
+        for backlash in (0.0, 0.1):
+            outline = gear_outline(m, z, 20.0, backlash=backlash, num_points=200)
+            radius, theta = polar(outline)
+            # Flanc côté +θ de la dent centrée sur l'axe x
+            mask = (theta > 0) & (theta < math.pi / z) & (radius > r - 0.5) & (radius < r + 0.5)
+            half_angle = np.interp(r, radius[mask][::-1], theta[mask][::-1])
+            expected = (math.pi * m / 2 - backlash) / (2 * r)
+            assert half_angle == pytest.approx(expected, abs=1e-4)
+
+    def test_outline_is_memoized(self):
+        outline_cache_clear()
+        first = gear_outline(3.0, 25, 20.0)
+        second = gear_outline(3, 25, 20, 0, 0)
+        assert first is second
+        assert outline_cache_info().hits == 1
+        assert not first.flags.writeable
+
+    def test_spur_gear_outline_uses_params(self):
+        gear = SpurGear(GearParams(name='Outline', module=2.0, teeth=14))
+        radius, _ = polar(gear.get_outline())
+        shift = gear.params.profile_shift
+        assert shift > 0
+        assert radius.max() == pytest.approx(14 + 2.0 * (1 + shift))
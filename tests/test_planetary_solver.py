@@ -0,0 +1,111 @@
+import itertools
+import math
+import time
+import pytest
+from core.base_gear import GearParams
+from core.planetary_solver import PlanetarySolver, planetary_ratio
+from gears.internal import InternalGear
+from gears.planetary import PlanetaryGearset
+from gears.spur import SpurGear
+
+
+def bruteforce(target, fixed, tolerance, min_teeth, max_teeth, planets, gap):
+    found = set()
+    for sun, planet, n in itertools.product(range(min_teeth, max_teeth + 1),
+                                            range(min_teeth, max_teeth + 1), planets):
+        ring = sun + 2 * planet
+        ratio = float(planetary_ratio(sun, ring, fixed))
+        if abs(ratio / target - 1) > tolerance + 1e-12:
+            continue
+        if (sun + ring) % n:
+            continue
+        if (sun + planet) * math.sin(math.pi / n) - (planet + 2) < gap:
+            continue
+        found.add((sun, planet, ring, n))
+    return found
+
+
+class TestPlanetarySolver:
+    @pytest.mark.parametrize('target, fixed', [(5.0, 'ring'), (1.3, 'sun'), (-3.0, 'carrier')])
+    def test_matches_bruteforce(self, target, fixed):
+        solver = PlanetarySolver(max_teeth=60, min_planets=3, max_planets=6)
+        solutions = solver.solve(target, fixed=fixed, tolerance=0.01)
+        found = {(s['sun_teeth'], s['planet_teeth'], s['ring_teeth'], s['num_planets'])
+                 for s in solutions}
+        assert found
+        assert found == bruteforce(target, fixed, 0.01, 18, 60, range(3, 7), 0.5)
+        errors = [round(abs(s['error']), 12) for s in solutions]
+        assert errors == sorted(errors)
+
+    def test_solutions_satisfy_constraints(self):
+        solver = PlanetarySolver(module=2.0, max_teeth=80)
+        solutions = solver.solve(4.0, tolerance=0.0)
+        assert solutions
+        for s in solutions:
+            assert s['ring_teeth'] == s['sun_teeth'] + 2 * s['planet_teeth']
+            assert (s['sun_teeth'] + s['ring_teeth']) % s['num_planets'] == 0
+            assert s['planet_gap'] >= 0.5 * 2.0 - 1e-9
+            assert s['ratio'] == pytest.approx(1 + s['ring_teeth'] / s['sun_teeth'])
+            assert s['center_distance'] == pytest.approx(
+                2.0 * (s['sun_teeth'] + s['planet_teeth']) / 2)
+        # Ns = Np donne 4 : (Ns + 3Ns) divisible par n
+        assert (20, 20, 60, 4) in {(s['sun_teeth'], s['planet_teeth'], s['ring_teeth'],
+                                    s['num_planets']) for s in solutions}
+
+    def test_input_output_and_limits(self):
+        solver = PlanetarySolver(max_teeth=50, max_ring_teeth=100)
+        forward = solver.solve(4.0, fixed='ring', tolerance=0.02)
+        reverse = solver.solve(0.25, fixed='ring', input_='carrier', output='sun',
+                               tolerance=0.02)
+        assert [s['sun_teeth'] for s in forward] == [s['sun_teeth'] for s in reverse]
+        assert all(s['ring_teeth'] <= 100 for s in forward)
+        assert len(solver.solve(4.0, tolerance=0.02, max_solutions=3)) == 3
+        # Jeu plus grand : moins de satellites admissibles
+        key = lambda s: (s['sun_teeth'], s['planet_teeth'], s['num_planets'])
+        loose = PlanetarySolver(max_teeth=50).solve(4.0, tolerance=0.02)
+        tight = PlanetarySolver(max_teeth=50, planet_gap=3.0).solve(4.0, tolerance=0.02)
+        assert {key(s) for s in tight} < {key(s) for s in loose}
+
+    def test_large_search_is_fast(self):
+        solver = PlanetarySolver(min_teeth=12, max_teeth=400, max_planets=12,
+                                 check_undercut=False)
+        start = time.perf_counter()
+        solutions = solver.solve(7.0, tolerance=1e-3)
+        assert time.perf_counter() - start < 0.5
+        assert solutions
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            PlanetarySolver(module=0)
+        with pytest.raises(ValueError):
+            PlanetarySolver(min_planets=1)
+        with pytest.raises(ValueError, match='Élément fixe'):
+            PlanetarySolver().solve(4.0, fixed='shaft')
+        with pytest.raises(ValueError, match='Combinaison'):
+            PlanetarySolver().solve(4.0, fixed='ring', input_='ring')
+        with pytest.raises(ValueError):
+            PlanetarySolver.solve_request({'fixed': 'ring'})
+
+    def test_gearset_assembly_condition(self):
+        def gearset(sun, planet, ring, planets):
+            gear = lambda kind, teeth: kind(GearParams(name=f'g{teeth}', module=2.0, teeth=teeth))
+            return PlanetaryGearset(gear(SpurGear, sun), [gear(SpurGear, planet)],
+                                    gear(InternalGear, ring), planets)
+
+        assert gearset(20, 20, 60, 4).get_info()['assembly_condition_met']
+        # Non coaxial, satellites inégalement répartis, satellites qui se touchent
+        for teeth in [(20, 20, 62, 4), (20, 20, 60, 3), (20, 40, 100, 6)]:
+            with pytest.raises(ValueError, match="assemblage"):
+                gearset(*teeth)
+
+    def test_api_endpoint(self):
+        from interfaces.api import app
+        client = app.test_client()
+        r = client.post('/api/planetary/solve',
+                        json={'target_ratio': 5.0, 'fixed': 'ring', 'max_solutions': 5})
+        assert r.status_code == 200
+        data = r.get_json()['planetary']
+        assert 0 < data['count'] <= 5
+        assert data['solutions'][0]['ratio'] == pytest.approx(5.0, rel=1e-3)
+        r = client.post('/api/planetary/solve', json={'fixed': 'ring'})
+        assert r.status_code == 400
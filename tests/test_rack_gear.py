@@ -1,8 +1,13 @@
 import pytest
 import math
+import struct
+import numpy as np
 from core.base_gear import GearParams
-from gears.rack import RackGear
+from export.step import STEPExporter
+from export.stl import STLExporter
+from gears.rack import RackGear, BACK_FACTOR
 from gears.spur import SpurGear
+from tests.conftest import assert_closed_solid, solid_volume
 
 class TestRackGear:
     def test_rack_creation(self):
@@ -34,3 +39,79 @@ class TestRackGear:
         center_distance, contact_ratio = rack.mesh_with(spur)
         assert center_distance == pytest.approx(spur.pitch_diameter / 2)
         assert contact_ratio > 0
+
+
+def rack(teeth=20, module=2.0, **kwargs):
+    params = GearParams(name='Rack', module=module, teeth=teeth, face_width=10.0, **kwargs)
+    return RackGear(params)
+
+
+class TestRackSolid:
+    def test_tooth_profile_is_iso_trapezoid(self):
+        profile = np.array(rack().get_tooth_profile())
+        assert len(profile) == 5 and np.allclose(profile[0], profile[-1])
+        assert profile[:, 1].max() == pytest.approx(2.0)
+        assert profile[:, 1].min() == pytest.approx(-2.5)
+        # Épaisseur πm/2 sur la ligne primitive (flancs droits, tête étroite)
+        root, tip = profile[3, 0], profile[2, 0]
+        assert 2 * (root - (root - tip) * 2.5 / 4.5) == pytest.approx(math.pi)
+        assert np.allclose(profile[:4, 0], -profile[3::-1, 0])
+        assert 0 < tip < root
+
+    @pytest.mark.parametrize('length', [None, 100.3])
+    def test_solid_is_closed(self, length):
+        gear = rack(rack_length=length)
+        faces = gear.get_solid()
+        assert_closed_solid(faces)
+        x, y = gear.get_outline().T
+        area = 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+        assert solid_volume(faces) == pytest.approx(area * 10.0)
+        assert np.ptp(faces[..., 0]) == pytest.approx(gear.length)
+        assert np.ptp(faces[..., 1]) == pytest.approx(gear.height)
+        assert gear.height == pytest.approx(gear.tooth_height + BACK_FACTOR * 2.0)
+
+    def test_chunks_join_without_gaps(self):
+        gear = rack(teeth=50, rack_length=50 * math.pi * 2.0 - 1.0)
+        chunks = list(gear.iter_solid(chunk_size=7))
+        assert len(chunks) == 8
+        faces = np.concatenate(chunks)
+        assert_closed_solid(faces)
+        assert solid_volume(faces) == pytest.approx(solid_volume(gear.get_solid()))
+
+    def test_long_rack_streams_in_bounded_chunks(self, tmp_path):
+        # Un mètre au module 0,5 : 637 dents
+        gear = rack(teeth=637, module=0.5)
+        assert gear.length > 1000.0
+        sizes = [len(chunk) for chunk in gear.iter_solid(chunk_size=64)]
+        assert max(sizes) <= 64 * 5 * 8 + 4
+        filename = tmp_path / 'rack.stl'
+        STLExporter.export_gear(gear, str(filename))
+        data = filename.read_bytes()
+        count = struct.unpack('<I', data[80:84])[0]
+        assert count == sum(sizes)
+        assert len(data) == 84 + 50 * count
+
+    def test_invalid_dimensions(self):
+        with pytest.raises(ValueError, match='hauteur'):
+            rack(rack_height=4.0).get_solid()
+        with pytest.raises(ValueError, match='longueur'):
+            rack(rack_length=0.0).get_solid()
+
+    def test_dimensions_travel_with_params(self, tmp_path):
+        from core.gear_factory import GearFactory
+        GearFactory.register_gear('rack', RackGear)
+        config = {'type': 'rack', 'name': 'Rack', 'module': 1.0, 'teeth': 10,
+                  'rack_length': 1000.0, 'rack_height': 20.0}
+        gear = GearFactory.from_dict(config)
+        assert (gear.length, gear.height) == (1000.0, 20.0)
+        faces = np.concatenate(list(gear.iter_solid()))
+        assert np.ptp(faces[..., 0]) == pytest.approx(1000.0)
+        assert np.ptp(faces[..., 1]) == pytest.approx(20.0)
+        derived = RackGear(gear.params.derive(face_width=12.0))
+        assert (derived.length, derived.height) == (1000.0, 20.0)
+
+    def test_step_export_has_no_infinite_circle(self, tmp_path):
+        filename = tmp_path / 'rack.step'
+        STEPExporter().export_gear(rack(), str(filename))
+        text = filename.read_text()
+        assert 'inf' not in text and 'POLYLINE' in text
@@ -0,0 +1,205 @@
+"""
+Tests du moteur de règles vectorisé
+"""
+import io
+import time
+
+import numpy as np
+import pytest
+
+from core.base_gear import GearParams
+from core.bulk_loader import BulkLoader
+from core.gear_factory import GearFactory
+from core.math_utils import GearMath
+from core.rule_engine import ERROR, WARNING, Rule, RuleEngine, GEAR_RULES
+from core.validation import GearValidator
+from gears.helical import HelicalGear
+from gears.internal import InternalGear
+from gears.rack import RackGear
+from gears.spur import SpurGear
+
+
+@pytest.fixture(autouse=True)
+def registered_types():
+    GearFactory.register_gear('spur', SpurGear)
+    GearFactory.register_gear('helical', HelicalGear)
+    GearFactory.register_gear('rack', RackGear)
+
+
+def spur(teeth, shift=0.0, pressure_angle=20.0):
+    return SpurGear(GearParams(name='g', module=2.0, teeth=teeth,
+                               pressure_angle=pressure_angle, profile_shift=shift))
+
+
+def test_undercut_limit_is_computed():
+    limits = GearValidator.min_teeth_no_undercut(np.array([14.5, 20.0, 25.0]))
+    assert limits == pytest.approx([31.90, 17.10, 11.20], abs=0.01)
+    # Le déport positif et l'hélice abaissent la limite
+    assert GearValidator.min_teeth_no_undercut(20.0, 0.3) < limits[1]
+    assert GearValidator.min_teeth_no_undercut(20.0, 0.0, 30.0) < limits[1]
+
+    assert GearValidator.check_undercut(spur(16, shift=0.01))
+    assert not GearValidator.check_undercut(spur(18))
+    assert not GearValidator.check_undercut(spur(12, shift=0.4))
+
+
+def test_gear_issues_are_structured():
+    columns = {
+        'gear_type': ['spur', 'spur', 'helical', 'cycloidal', 'spur'],
+        'module': [2.0, -1.0, 2.0, 1.0, 2.0],
+        'teeth': [30, 20, 20, 20, 10],
+        'pressure_angle': [20.0, 20.0, 30.0, 20.0, 20.0],
+        'helix_angle': [0.0, 0.0, 15.0, 0.0, 0.0],
+        'rolling_circle_ratio': [np.nan, np.nan, np.nan, 1.5, np.nan],
+    }
+    issues = RuleEngine.check_gears(columns)
+    assert list(issues['index']) == sorted(issues['index'])
+    by_row = {}
+    for issue in issues:
+        by_row.setdefault(int(issue['index']), set()).add(str(issue['code']))
+
+    assert 0 not in by_row
+    assert by_row[1] == {'module.non_positive'}
+    assert by_row[2] == {'pressure_angle.out_of_range'}
+    assert by_row[3] == {'rolling_ratio.out_of_range'}
+    # Le déport automatique (17 - z) / 17 reste juste sous la limite calculée
+    assert by_row[4] == {'teeth.low', 'undercut'}
+    undercut = issues[issues['code'] == 'undercut'][0]
+    assert undercut['severity'] == WARNING and undercut['limit'] > 10
+
+    angle = issues[issues['code'] == 'pressure_angle.out_of_range'][0]
+    assert (angle['value'], angle['severity']) == (30.0, ERROR)
+    assert RuleEngine.error_mask(issues, 5).tolist() == [False, True, True, True, False]
+    assert RuleEngine.summary(issues)['teeth.low'] == 1
+
+    record = RuleEngine.to_records(issues)[0]
+    assert set(record) == {'index', 'code', 'severity', 'value', 'limit', 'message'}
+    assert record['message']
+
+
+def test_contact_ratio_matches_gear_math():
+    for z1, z2, beta in [(20, 40, 0.0), (25, 60, 15.0), (18, 18, 0.0)]:
+        kind = HelicalGear if beta else SpurGear
+        first = kind(GearParams(name='a', module=2.0, teeth=z1, helix_angle=beta))
+        second = kind(GearParams(name='b', module=2.0, teeth=z2, helix_angle=-beta))
+        columns = [RuleEngine.params_columns(['helical' if beta else 'spur'], [g.params])
+                   for g in (first, second)]
+        context = {'first': RuleEngine.context(columns[0]),
+                   'second': RuleEngine.context(columns[1])}
+        from core.rule_engine import _contact_ratio
+        expected = GearMath.contact_ratio_base_path(first, second, 20.0)
+        if not beta:
+            assert _contact_ratio(context)[0] == pytest.approx(expected, rel=1e-9)
+        assert len(RuleEngine.check_gear_pair(first, second)) == 0
+
+
+def test_pair_interference():
+    # Pignon de 12 dents sans déport contre une grande roue : interférence
+    pinion = HelicalGear(GearParams(name='p', module=2.0, teeth=12))
+    wheel = HelicalGear(GearParams(name='w', module=2.0, teeth=60))
+    interfering, message = GearValidator.check_interference(pinion, wheel)
+    assert interfering and 'limite' in message
+
+    issues = RuleEngine.check_gear_pair(pinion, wheel, codes=('pair.interference',))
+    assert issues['value'][0] > issues['limit'][0]
+
+    shifted = HelicalGear(GearParams(name='p', module=2.0, teeth=12, profile_shift=0.4))
+    assert not GearValidator.check_interference(shifted, wheel)[0]
+
+    rack = RackGear(GearParams(name='r', module=2.0, teeth=30))
+    issues = RuleEngine.check_gear_pair(rack, spur(14, shift=0.01))
+    assert 'pair.interference' in set(issues['code'])
+    assert len(RuleEngine.check_gear_pair(rack, spur(30))) == 0
+
+
+def test_internal_pair_interference():
+    def ring(teeth):
+        return InternalGear(GearParams(name='r', module=2.0, teeth=teeth))
+
+    def codes(first, second):
+        return set(RuleEngine.check_gear_pair(first, second)['code'])
+
+    # Écart de 6 dents : interférence de tête, quel que soit l'ordre
+    assert 'pair.internal_teeth_difference' in codes(ring(40), spur(34))
+    assert 'pair.internal_teeth_difference' in codes(spur(34), ring(40))
+
+    # Petit pignon : tête de couronne au-delà du point T1 du pignon
+    issues = RuleEngine.check_gear_pair(ring(40), spur(10), codes=('pair.interference',))
+    r2, line = 40.0, 30.0 * np.sin(np.radians(20.0))
+    assert issues['value'][0] == pytest.approx(r2 - 2.0)
+    assert issues['limit'][0] == pytest.approx(np.hypot(r2 * np.cos(np.radians(20.0)), line))
+    assert issues['value'][0] < issues['limit'][0]
+    assert 'pair.interference' in codes(ring(40), spur(18))
+    assert 'pair.interference' not in codes(ring(40), spur(28))
+
+    assert not codes(ring(80), spur(20))
+
+
+def test_pair_mismatches():
+    first = {'gear_type': ['spur', 'spur', 'worm'], 'module': [2.0, 2.0, 2.0],
+             'teeth': [30, 30, 1]}
+    second = {'gear_type': ['spur', 'spur', 'helical'], 'module': [2.0, 3.0, 2.0],
+              'teeth': [40, 40, 40], 'pressure_angle': [20.0, 20.0, 25.0]}
+    issues = RuleEngine.check_pairs(first, second)
+    codes = {(int(i), str(c)) for i, c in zip(issues['index'], issues['code'])}
+    assert not any(i == 0 for i, _ in codes)
+    assert (1, 'pair.module_mismatch') in codes
+    assert (2, 'pair.type_mismatch') in codes
+    assert (2, 'pair.pressure_angle_mismatch') in codes
+
+
+def test_cycloidal_rolling_circles():
+    # Cercles roulants 15 et 5 mm, puis 5 et 5 mm (ratio 1/6 sur 60 dents)
+    first = {'gear_type': 'cycloidal', 'module': [1.0, 1.0], 'teeth': [60, 60],
+             'rolling_circle_ratio': [0.5, 1 / 6]}
+    second = {'gear_type': 'cycloidal', 'module': [1.0, 1.0], 'teeth': [20, 20]}
+    issues = RuleEngine.check_pairs(first, second, codes=('pair.rolling_circle_mismatch',))
+    assert issues['index'].tolist() == [0]
+    assert issues['value'][0] == pytest.approx(5.0)
+    assert issues['limit'][0] == pytest.approx(15.0)
+
+
+def test_register_rule():
+    saved = list(GEAR_RULES)
+    try:
+        RuleEngine.register_rule(Rule('teeth.prime', WARNING, "Nombre de dents premier",
+                                      lambda c: (np.isin(c['teeth'], (13, 17, 19)),
+                                                 c['teeth'], np.nan)))
+        issues = RuleEngine.check_gears({'module': [2.0, 2.0], 'teeth': [17, 18]},
+                                        codes=('teeth.prime',))
+        assert issues['index'].tolist() == [0]
+        with pytest.raises(ValueError):
+            RuleEngine.register_rule(Rule('x', 'fatal', '', lambda c: None))
+    finally:
+        GEAR_RULES[:] = saved
+
+
+def test_bulk_loader_rules():
+    text = ("type,name,module,teeth,helix_angle,face_width\n"
+            "spur,a,2,20,,\n"
+            "helical,b,2,20,60,\n"
+            "spur,c,2,20,,-1\n")
+    chunk = next(BulkLoader.iter_columns(io.StringIO(text), 'csv', rules=True))
+    assert chunk['names'] == ['a']
+    assert [(e['row'], e['code']) for e in chunk['errors']] == \
+        [(3, 'helix_angle.out_of_range'), (4, 'face_width.non_positive')]
+
+    chunk = next(BulkLoader.iter_columns(io.StringIO(text), 'csv'))
+    assert chunk['names'] == ['a', 'b', 'c']
+
+
+def test_throughput():
+    size = 200_000
+    rng = np.random.default_rng(0)
+    columns = {
+        'gear_type': rng.choice(['spur', 'helical', 'bevel', 'rack'], size),
+        'module': rng.uniform(0.5, 5.0, size),
+        'teeth': rng.integers(8, 120, size),
+        'pressure_angle': rng.choice([14.5, 20.0, 25.0], size),
+        'helix_angle': rng.uniform(0.0, 30.0, size),
+    }
+    start = time.perf_counter()
+    issues = RuleEngine.check_gears(columns)
+    elapsed = time.perf_counter() - start
+    assert len(issues) > 0
+    assert size / elapsed > 200_000
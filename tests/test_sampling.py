@@ -0,0 +1,81 @@
+"""
+Tests pour l'échantillonnage adaptatif par tolérance de corde
+"""
+import math
+import numpy as np
+import pytest
+from core.base_gear import GearParams
+from gears.spur import SpurGear
+from profiles.cycloidal import CycloidalProfile
+from profiles.involute import InvoluteProfile, involute_points
+from profiles.outline import gear_outline
+from profiles.sampling import arc_angles, involute_roll_angles
+
+
+def max_chord_deviation(curve, coarse):
+    """Écart maximal entre une courbe dense et la polyligne grossière"""
+    a = coarse[:-1]
+    ab = coarse[1:] - a
+    ap = curve[:, None, :] - a[None]
+    t = np.clip((ap * ab).sum(-1) / (ab * ab).sum(-1), 0, 1)
+    proj = a[None] + t[..., None] * ab[None]
+    return np.linalg.norm(curve[:, None] - proj, axis=-1).min(axis=1).max()
+
+
+class TestChordTolerance:
+    def test_involute_deviation_within_tolerance(self):
+        rb, tol = 50.0, 0.005
+        t = involute_roll_angles(rb, 0.0, 0.8, tol)
+        dense = involute_points(rb, np.linspace(0, 0.8, 4000))
+        assert max_chord_deviation(dense, involute_points(rb, t)) <= tol * 1.01
+
+    def test_point_count_tracks_size(self):
+        small = involute_roll_angles(2.0, 0.0, 0.8, 0.01)
+        large = involute_roll_angles(200.0, 0.0, 0.8, 0.01)
+        # Densité proportionnelle à sqrt(r_b)
+        assert len(large) > 5 * len(small)
+
+    def test_arc_angles(self):
+        angles = arc_angles(10.0, 0.0, math.pi, 0.01)
+        step = angles[1] - angles[0]
+        assert 10.0 * (1 - math.cos(step / 2)) <= 0.01
+
+    def test_invalid_tolerance(self):
+        with pytest.raises(ValueError):
+            involute_roll_angles(10.0, 0.0, 1.0, 0.0)
+
+    def test_generate_points_with_tolerance(self):
+        profile = InvoluteProfile(20.0)
+        coarse = profile.generate_points(18.8, 0, 60, tolerance=0.1)
+        fine = profile.generate_points(18.8, 0, 60, tolerance=0.001)
+        assert coarse.shape[1] == 2
+        assert len(fine) > len(coarse)
+
+    def test_cycloid_with_tolerance(self):
+        profile = CycloidalProfile(0.5)
+        points = profile.generate_points(20.0, tolerance=0.05)
+        dense = profile.generate_points(20.0, num_points=20000)
+        assert max_chord_deviation(dense, points) <= 0.05 * 1.05
+
+
+class TestOutlineTolerance:
+    def test_small_module_needs_fewer_points(self):
+        small = gear_outline(0.5, 20, tolerance=0.01)
+        large = gear_outline(20.0, 20, tolerance=0.01)
+        fixed = gear_outline(0.5, 20)
+        assert len(small) < len(fixed)
+        assert len(large) > len(small)
+
+    def test_outline_deviation_within_tolerance(self):
+        m, z, tol = 2.0, 20, 0.005
+        coarse = gear_outline(m, z, tolerance=tol)
+        dense = gear_outline(m, z, num_points=600)
+        tooth = len(dense) // z
+        closed = np.vstack((coarse, coarse[:1]))
+        assert max_chord_deviation(dense[:tooth], closed) <= tol * 1.05
+
+    def test_spur_tooth_points_with_tolerance(self):
+        gear = SpurGear(GearParams(name='Tol', module=1.0, teeth=30))
+        points = gear.get_tooth_points(tolerance=0.01)
+        assert points.shape[1] == 2
+        assert len(points) < 50
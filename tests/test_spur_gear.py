@@ -51,10 +51,8 @@ class TestSpurGearAdvanced(unittest.TestCase):
         points = gear.get_tooth_points(num_points=50)
         
         self.assertEqual(len(points), 50)
-        # Vérifier que les points sont des tuples (x, y)
-        for point in points:
-            self.assertIsInstance(point, tuple)
-            self.assertEqual(len(point), 2)
+        # Vérifier que les points forment un tableau (N, 2) de (x, y)
+        self.assertEqual(points.shape, (50, 2))
     
     def test_different_pressure_angles(self):
         """Tester des engrenages avec différents angles de pression"""
@@ -0,0 +1,93 @@
+import pytest
+import numpy as np
+from core.base_gear import GearParams
+from core.stress_engine import StressEngine
+from gears.spur import SpurGear
+from gears.helical import HelicalGear
+from gears.internal import InternalGear
+from gears.bevel import BevelGear
+from standards.iso_6336 import ISO6336
+
+
+def _spur(name, teeth, **kwargs):
+    return SpurGear(GearParams(name=name, module=2.0, teeth=teeth, face_width=20.0, **kwargs))
+
+
+class TestISO6336Factors:
+    def test_zone_factor_spur(self):
+        assert float(ISO6336.zone_factor(20.0, 0.0)) == pytest.approx(2.495, abs=1e-3)
+
+    def test_elasticity_factor_steel(self):
+        steel = ISO6336.material('steel')
+        z_e = ISO6336.elasticity_factor(steel['E'], steel['poisson'],
+                                        steel['E'], steel['poisson'])
+        assert float(z_e) == pytest.approx(189.8, abs=0.1)
+
+    def test_cycles_to_failure(self):
+        cycles = ISO6336.cycles_to_failure([100.0, 400.0], 200.0, 3e6, 8.74)
+        assert np.isinf(cycles[0])
+        assert cycles[1] == pytest.approx(3e6 * 0.5 ** 8.74)
+
+
+class TestStressEngine:
+    def test_vectorized_matches_loop(self):
+        engine = StressEngine(_spur('p', 20), _spur('w', 40))
+        torque = np.linspace(10, 300, 50)
+        speed = np.linspace(100, 3000, 50)
+        batch = engine.evaluate(torque, speed)
+        for i in (0, 17, 49):
+            single = engine.evaluate(torque[i], speed[i])
+            assert batch['contact_stress'][i] == pytest.approx(float(single['contact_stress']))
+            assert batch['bending_stress_pinion'][i] == pytest.approx(
+                float(single['bending_stress_pinion']))
+
+    def test_static_scaling(self):
+        engine = StressEngine(_spur('p', 20), _spur('w', 40))
+        result = engine.evaluate([100.0, 400.0], 0.0)
+        assert result['bending_stress_pinion'][1] == pytest.approx(
+            4 * result['bending_stress_pinion'][0])
+        assert result['contact_stress'][1] == pytest.approx(2 * result['contact_stress'][0])
+
+    def test_pinion_more_loaded_than_wheel(self):
+        engine = StressEngine(_spur('p', 20), _spur('w', 60))
+        result = engine.evaluate(100.0, 1000.0)
+        assert result['bending_stress_pinion'] > result['bending_stress_wheel']
+
+    def test_allowable_torque_gives_unit_safety(self):
+        engine = StressEngine(_spur('p', 20), _spur('w', 40))
+        limits = engine.allowable_torque()
+        result = engine.evaluate(limits['contact'], 0.0)
+        assert float(result['safety_contact']) == pytest.approx(1.0)
+
+    def test_spectrum_damage(self):
+        engine = StressEngine(_spur('p', 20), _spur('w', 40))
+        light = engine.evaluate([10.0, 20.0], [1000.0, 1000.0], [100.0, 100.0])
+        heavy = engine.evaluate([10.0, 400.0], [1000.0, 1000.0], [100.0, 100.0])
+        assert light['damage_contact'] == 0.0
+        assert heavy['damage_contact'] > 0.0
+
+    def test_helical_and_internal(self):
+        helical = HelicalGear(GearParams(name='h', module=2.0, teeth=20,
+                                         helix_angle=15.0, face_width=20.0))
+        engine = StressEngine(helical)
+        assert engine.overlap_ratio > 0
+        assert engine.y_beta < 1
+        ring = InternalGear(GearParams(name='r', module=2.0, teeth=60, face_width=20.0))
+        internal = StressEngine(_spur('p', 20), ring)
+        external = StressEngine(_spur('p', 20), _spur('w', 60))
+        assert internal.gear_ratio < 0
+        assert float(internal.evaluate(100.0)['contact_stress']) < \
+            float(external.evaluate(100.0)['contact_stress'])
+
+    def test_performances_unsupported(self):
+        bevel = BevelGear(GearParams(name='b', module=2.0, teeth=20))
+        performances = StressEngine.performances(bevel)
+        assert performances['bending_stress'] is None
+        assert 'note' in performances
+
+    def test_performances_spectrum(self):
+        load = {'spectrum': [{'torque': 50.0, 'speed': 1500.0, 'hours': 1000.0},
+                             {'torque': 150.0, 'speed': 1000.0, 'hours': 10.0}]}
+        performances = StressEngine.performances(_spur('p', 20), load, _spur('w', 40))
+        assert isinstance(performances['contact_stress'], float)
+        assert 'damage_contact' in performances
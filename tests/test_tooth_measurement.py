@@ -0,0 +1,65 @@
+"""
+Tests pour les cotes de contrôle de la denture
+"""
+import math
+import numpy as np
+import pytest
+from core.tooth_measurement import ToothMeasurement
+
+
+class TestSpanMeasurement:
+    def test_span_width_reference_value(self):
+        # m = 1, z = 20, α = 20°, k = 3 -> W = 7.6604 mm
+        assert ToothMeasurement.span_width(1.0, 20, 3) == pytest.approx(7.6604, abs=1e-4)
+
+    def test_span_teeth(self):
+        k = ToothMeasurement.span_teeth(np.array([10, 20, 40, 100]))
+        np.testing.assert_array_equal(k, [2, 3, 5, 12])
+
+    def test_span_teeth_helical(self):
+        assert ToothMeasurement.span_teeth(60, helix_angle=35.0) == 12
+        assert ToothMeasurement.span_teeth(30, helix_angle=30.0) == 5
+        # Le déport éloigne le contact : plus de dents dans la cote
+        assert ToothMeasurement.span_teeth(60, profile_shift=1.0, helix_angle=35.0) == 14
+
+    def test_span_width_profile_shift(self):
+        base = ToothMeasurement.span_width(2.0, 30, 4)
+        shifted = ToothMeasurement.span_width(2.0, 30, 4, profile_shift=0.5)
+        assert shifted - base == pytest.approx(2 * 0.5 * 2.0 * math.sin(math.radians(20)))
+
+    def test_span_width_batch_matches_scalar(self):
+        teeth = np.array([18, 27, 64])
+        batch = ToothMeasurement.span_width(2.5, teeth)
+        for z, w in zip(teeth, batch):
+            assert w == pytest.approx(ToothMeasurement.span_width(2.5, int(z)))
+
+
+class TestOverBalls:
+    def test_ball_centered_on_pitch_circle(self):
+        # D_M = m cos α π/2 place le centre de la bille sur le primitif
+        m, z = 2.0, 24
+        ball = m * math.cos(math.radians(20)) * math.pi / 2
+        assert ToothMeasurement.over_balls(m, z, ball) == pytest.approx(m * z + ball)
+
+    def test_odd_teeth_over_even_neighbour(self):
+        even = ToothMeasurement.over_balls(1.0, 20, 1.7)
+        odd = ToothMeasurement.over_balls(1.0, 21, 1.7)
+        assert odd < even + 1.0
+        assert odd > even
+
+
+class TestOperatingPressureAngle:
+    def test_unshifted_pair(self):
+        assert ToothMeasurement.operating_pressure_angle(20, 40) == pytest.approx(20.0)
+        assert ToothMeasurement.operating_center_distance(2.0, 20, 40) == pytest.approx(60.0)
+
+    def test_positive_shift_increases_center_distance(self):
+        alpha_w = ToothMeasurement.operating_pressure_angle(12, 24, 0.3, 0.2)
+        assert alpha_w > 20.0
+        a_w = ToothMeasurement.operating_center_distance(2.0, 12, 24, 0.3, 0.2)
+        assert a_w == pytest.approx(36.0 * math.cos(math.radians(20)) / math.cos(math.radians(alpha_w)))
+        assert a_w > 36.0
+
+    def test_thickness_at_pitch(self):
+        thickness = ToothMeasurement.thickness_at_radius(2.0, 20, np.array([20.0]))
+        assert thickness[0] == pytest.approx(math.pi)
@@ -0,0 +1,139 @@
+import itertools
+import subprocess
+import sys
+import numpy as np
+import pytest
+from core import train_solver
+from core.train_solver import GearTrainSolver
+
+
+class TestGearTrainSolver:
+    def test_single_stage_exact(self):
+        solver = GearTrainSolver(module=2.0, max_teeth=60)
+        solutions = solver.solve(2.5, tolerance=0.0, max_stages=1)
+        assert solutions
+        best = solutions[0]
+        assert best['error'] == pytest.approx(0.0)
+        stage = best['stages'][0]
+        assert stage['driven_teeth'] / stage['driver_teeth'] == pytest.approx(2.5)
+        # Plus petite paire : 18/45 (sous-dépouille à 20° -> 18 dents minimum)
+        assert (stage['driver_teeth'], stage['driven_teeth']) == (18, 45)
+        assert stage['center_distance'] == pytest.approx(2.0 * 63 / 2)
+
+    def test_undercut_raises_min_teeth(self):
+        assert GearTrainSolver(pressure_angle=20.0, min_teeth=12).min_teeth == 18
+        assert GearTrainSolver(pressure_angle=25.0, min_teeth=12).min_teeth == 12
+        assert GearTrainSolver(min_teeth=12, check_undercut=False).min_teeth == 12
+
+    def test_two_stages_match_bruteforce(self):
+        solver = GearTrainSolver(min_teeth=18, max_teeth=40, max_stage_ratio=3.0)
+        target = 4.3
+        best = min(
+            abs((b / a) * (d / c) / target - 1)
+            for a, b, c, d in itertools.product(range(18, 41), repeat=4)
+            if 1 / 3 <= b / a <= 3 and 1 / 3 <= d / c <= 3
+        )
+        solutions = solver.solve(target, tolerance=0.05, min_stages=2, max_stages=2)
+        assert abs(solutions[0]['error']) == pytest.approx(best, abs=1e-12)
+
+    @pytest.mark.parametrize('stages', [3, 4])
+    def test_meet_in_the_middle(self, stages):
+        solver = GearTrainSolver(max_teeth=60)
+        solutions = solver.solve(27.0, tolerance=1e-3, min_stages=stages, max_stages=stages)
+        assert solutions
+        for solution in solutions:
+            assert len(solution['stages']) == stages
+            assert abs(solution['error']) <= 1e-3
+            ratio = 1.0
+            for stage in solution['stages']:
+                assert 18 <= stage['driver_teeth'] <= 60
+                assert 18 <= stage['driven_teeth'] <= 60
+                ratio *= stage['driven_teeth'] / stage['driver_teeth']
+            assert ratio == pytest.approx(solution['ratio'])
+
+    @pytest.mark.parametrize('stages, max_teeth, target', [(3, 30, 3.7), (4, 24, 2.9)])
+    def test_meet_in_the_middle_matches_bruteforce(self, stages, max_teeth, target):
+        solver = GearTrainSolver(max_teeth=max_teeth)
+        teeth = np.arange(18, max_teeth + 1)
+        ratios = np.unique((teeth[None, :] / teeth[:, None]).ravel())
+        products = np.prod(np.meshgrid(*[ratios] * stages), axis=0)
+        best = np.min(np.abs(products / target - 1))
+        solutions = solver.solve(target, tolerance=0.05, min_stages=stages, max_stages=stages)
+        assert abs(solutions[0]['error']) == pytest.approx(best, abs=1e-12)
+
+    @pytest.mark.parametrize('stages', [3, 4])
+    def test_blocks_match_single_block(self, monkeypatch, stages):
+        kwargs = dict(tolerance=1e-3, min_stages=stages, max_stages=stages)
+        expected = GearTrainSolver(max_teeth=50).solve(27.0, **kwargs)
+        # Blocs minuscules : table des paires fusionnée et recherche par morceaux
+        monkeypatch.setattr(train_solver, 'CHUNK_SIZE', 97)
+        assert GearTrainSolver(max_teeth=50).solve(27.0, **kwargs) == expected
+
+    def test_center_distance_constraint(self):
+        solver = GearTrainSolver(module=2.0, center_distance=60.0)
+        solutions = solver.solve(5.0, tolerance=0.02, max_stages=2)
+        assert solutions
+        for solution in solutions:
+            for stage in solution['stages']:
+                assert stage['center_distance'] == pytest.approx(60.0)
+
+    def test_coaxial_constraint(self):
+        solver = GearTrainSolver(module=2.0, coaxial=True)
+        solutions = solver.solve(12.0, tolerance=1e-3, min_stages=2, max_stages=2)
+        assert solutions
+        for solution in solutions:
+            distances = {stage['center_distance'] for stage in solution['stages']}
+            assert len(distances) == 1
+
+    def test_impossible_center_distance(self):
+        # Aucune paire de 18 dents ou plus n'a un entraxe de 7 mm au module 1
+        result = GearTrainSolver.solve_request(
+            {'target_ratio': 9, 'max_stages': 4, 'module': 1.0, 'center_distance': 7.0})
+        assert result['solutions'] == [] and result['count'] == 0
+        solver = GearTrainSolver(module=1.0, center_distance=7.0, coaxial=True)
+        assert solver.solve(9.0, min_stages=2, max_stages=3) == []
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            GearTrainSolver(module=0)
+        with pytest.raises(ValueError):
+            GearTrainSolver().solve(10.0, max_stages=5)
+        with pytest.raises(ValueError):
+            GearTrainSolver.solve_request({'module': 2.0})
+
+    def test_api_endpoint(self):
+        from interfaces.api import app
+        client = app.test_client()
+        r = client.post('/api/train/solve', json={'target_ratio': 6.0, 'max_stages': 2})
+        assert r.status_code == 200
+        data = r.get_json()
+        assert data['success'] is True
+        assert data['train']['solutions'][0]['error'] == pytest.approx(0.0)
+
+    @pytest.mark.parametrize('request_data', [
+        {'max_teeth': 1000},
+        {'max_teeth': 'abc'},
+        {'min_teeth': 0},
+        {'max_stages': 5},
+        {'max_stages': 2.5},
+        {'min_stages': 3, 'max_stages': 2},
+        {'max_solutions': 10 ** 9},
+    ])
+    def test_request_limits(self, request_data):
+        with pytest.raises(ValueError):
+            GearTrainSolver.solve_request({'target_ratio': 6.0, **request_data})
+
+    def test_api_rejects_oversized_request(self):
+        from interfaces.api import app
+        client = app.test_client()
+        r = client.post('/api/train/solve', json={'target_ratio': 6.0, 'max_teeth': 1000})
+        assert r.status_code == 400
+        assert 'max_teeth' in r.get_json()['error']
+
+    def test_cli(self):
+        cmd = [sys.executable, "main.py", "train", "--ratio", "12", "--max-stages", "2",
+               "--coaxial", "--count", "3"]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        assert proc.returncode == 0, proc.stderr
+        assert "Rapport cible" in proc.stdout
+        assert "1. i=12.000000" in proc.stdout
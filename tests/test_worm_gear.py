@@ -2,6 +2,7 @@ import pytest
 from core.base_gear import GearParams
 from gears.worm import WormGear
 from gears.spur import SpurGear
+from tests.conftest import assert_closed_solid, solid_volume
 import math
 
 class TestWormGearCreation:
@@ -279,3 +280,116 @@ class TestWormGearCreation:
         
         with pytest.raises(ValueError):
             worm.mesh_with(other_worm)
+
+
+class TestWormGeometry:
+    """Tests de la géométrie de la vis et de la roue globique"""
+    
+    def worm(self, leads=1, length=30.0):
+        return WormGear(GearParams(name="W", module=2.0, teeth=1, leads=leads,
+                                   face_width=length))
+    
+    def test_worm_section_and_solid(self):
+        import numpy as np
+        worm = self.worm(leads=3)
+        section = worm.transverse_section(8)
+        radius = np.hypot(section[:, 0], section[:, 1])
+        assert radius.max() == pytest.approx(worm.outside_diameter / 2)
+        assert radius.min() == pytest.approx(worm.root_diameter / 2)
+        # Trois filets : symétrie d'ordre 3
+        angle = 2 * math.pi / 3
+        rotated = section @ np.array([[math.cos(angle), math.sin(angle)],
+                                      [-math.sin(angle), math.cos(angle)]])
+        assert np.allclose(np.sort(rotated.round(9), axis=0), np.sort(section.round(9), axis=0))
+        
+        faces = worm.get_solid(8)
+        assert_closed_solid(faces)
+        x, y = section[:, 0], section[:, 1]
+        area = 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+        assert solid_volume(faces) == pytest.approx(area * 30.0, rel=5e-3)
+        
+        # Dernière section : première tournée d'un tour par pas de l'hélice
+        top = faces[-len(section):, 0]
+        twist = 2 * math.pi * 30.0 / worm.lead
+        expected = section @ np.array([[math.cos(twist), math.sin(twist)],
+                                       [-math.sin(twist), math.cos(twist)]])
+        assert np.allclose(top[:, :2], expected)
+    
+    def test_solid_is_streamed_in_chunks(self, tmp_path):
+        import struct
+        import numpy as np
+        from export.stl import STLExporter
+        worm = self.worm(length=400.0)
+        section = len(worm.transverse_section(8))
+        chunks = list(worm.iter_solid(8, chunk_size=16))
+        assert len(chunks) > 4
+        # Un paquet : au plus chunk_size sections reliées
+        assert max(len(c) for c in chunks) <= 2 * 16 * section
+        assert np.array_equal(np.concatenate(chunks), worm.get_solid(8))
+        
+        out = tmp_path / 'worm.stl'
+        STLExporter.export_gear(worm, str(out), resolution=32)
+        with open(out, 'rb') as f:
+            f.seek(80)
+            count = struct.unpack('<I', f.read(4))[0]
+        assert count == len(worm.get_solid(8))
+        assert out.stat().st_size == 84 + 50 * count
+    
+    def test_wheel_midplane_is_involute(self):
+        import numpy as np
+        from profiles.involute import involute
+        from profiles.worm import wheel_tooth_profiles
+        radius, theta = wheel_tooth_profiles(2.0, 30, 1, 20.0, [0.0], num_points=24)
+        # Plan médian : crémaillère à flancs droits, flanc en développante
+        r = 30.0
+        alpha = math.radians(20.0)
+        rb = r * math.cos(alpha)
+        flank = slice(1, 25)
+        rho, left = radius[0, flank], theta[0, flank]
+        keep = rho > rb + 0.2
+        expected = -(math.pi / 60 + involute(alpha) - involute(np.arccos(rb / rho[keep])))
+        assert np.allclose(left[keep], expected, atol=1e-5)
+        # Fond : sommet de la fraise; tête : gorge
+        assert radius[0, 0] == pytest.approx(r - 2.5)
+        assert radius[0].max() == pytest.approx(r + 2.0)
+    
+    def test_wheel_solid(self):
+        import numpy as np
+        worm = self.worm(leads=2)
+        wheel = SpurGear(GearParams(name="R", module=2.0, teeth=40, face_width=12.0))
+        faces = worm.wheel_solid(wheel, 8)
+        assert_closed_solid(faces)
+        assert solid_volume(faces) > 0
+        
+        # Tête de la roue sur le tore de gorge
+        points = faces.reshape(-1, 3)
+        center = (worm.worm_diameter + wheel.pitch_diameter) / 2
+        radius = np.hypot(points[:, 0], points[:, 1])
+        for h in (-6.0, 0.0, 6.0):
+            level = np.isclose(points[:, 2], h)
+            assert radius[level].max() == pytest.approx(
+                center - math.sqrt(worm.throat_radius**2 - h**2))
+        
+        # Dents torsadées selon l'angle de filet (hors plan médian)
+        assert len(list(worm.iter_wheel_solid(wheel, 8, chunk_size=2))) > 3
+        with pytest.raises(ValueError):
+            worm.wheel_solid(SpurGear(GearParams(name="R", module=2.0, teeth=40,
+                                                 face_width=20.0)))
+    
+    def test_wide_wheel_has_truncated_tips(self):
+        import numpy as np
+        # Gorge de 8 mm : dents pointues sous le tore aux bords de la roue
+        worm = WormGear(GearParams(name="W", module=2.0, teeth=1, face_width=30.0),
+                        worm_diameter=20.0)
+        wheel = SpurGear(GearParams(name="R", module=2.0, teeth=30, face_width=12.0))
+        for tolerance in (None, 0.01):
+            faces = worm.wheel_solid(wheel, 8, tolerance)
+            assert_closed_solid(faces)
+            assert solid_volume(faces) > 0
+            points = faces.reshape(-1, 3)
+            radius = np.hypot(points[:, 0], points[:, 1])
+            edge = radius[np.isclose(points[:, 2], 6.0)].max()
+            assert 33.0 < edge < 40.0 - math.sqrt(8.0**2 - 6.0**2)
+            assert radius[np.isclose(points[:, 2], 0.0)].max() == pytest.approx(32.0)
+        with pytest.raises(ValueError):
+            worm.wheel_solid(SpurGear(GearParams(name="R", module=3.0, teeth=40)))